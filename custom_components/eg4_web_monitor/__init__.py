@@ -12,7 +12,7 @@ import homeassistant.helpers.entity_registry as er
 import homeassistant.helpers.issue_registry as ir
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry, ConfigEntryState
-from homeassistant.const import Platform
+from homeassistant.const import CONF_USERNAME, Platform
 from homeassistant.core import (
     CALLBACK_TYPE,
     HomeAssistant,
@@ -29,17 +29,23 @@ from ._config_flow.helpers import (
     find_config_entry_identity_conflicts,
     migrate_legacy_entry,
 )
+from .cloud_requests import CloudAccountKey, cloud_account_key
+from .cloud_session import get_cloud_session_cache
 from .const import (
+    CONF_BASE_URL,
     CONF_CONNECTION_TYPE,
     CONF_HTTP_POLLING_INTERVAL,
     CONF_LIBRARY_DEBUG,
     CONF_LOCAL_TRANSPORTS,
     CONF_PLANT_ID,
     CONF_SENSOR_UPDATE_INTERVAL,
+    CONF_VERIFY_SSL,
     CONNECTION_TYPE_HTTP,
     CONNECTION_TYPE_HYBRID,
+    DEFAULT_BASE_URL,
     DEFAULT_HTTP_POLLING_INTERVAL,
     DEFAULT_SENSOR_UPDATE_INTERVAL_HTTP,
+    DEFAULT_VERIFY_SSL,
     DOMAIN,
     HYBRID_EXCLUDED_SENSORS,
     INVERTER_FAMILY_EG4_HYBRID,
@@ -72,6 +78,14 @@ from .history_import import (
     async_import_historical_data,
 )
 from .endpoint_bus import get_endpoint_bus_registry
+from .event_log import EVENT_LOG_STORAGE_KEY, EVENT_LOG_STORAGE_VERSION
+from .registry_migrations import (
+    RegistryMigration,
+    async_load_applied_registry_migrations,
+    async_remove_registry_migration_state,
+    async_run_registry_migrations,
+    async_save_applied_registry_migrations,
+)
 from .services import (
     FETCH_EVENTS_SCHEMA,
     async_fetch_events,
@@ -628,6 +642,123 @@ async def _async_update_device_registry(
         )
 
 
+def _remove_stale_local_battery_entity(
+    entity_registry: er.EntityRegistry, entity: er.RegistryEntry
+) -> bool:
+    """Remove a stale local-format battery entity.
+
+    Old local keys used numeric-only battery indices (e.g., "0", "1"); the
+    current format uses "{serial}-{nn}" to match the HTTP key format.
+    """
+    parts = entity.unique_id.split("_")
+    # Match pattern: {serial}_{short_numeric_index}_{sensor_key}
+    # where serial is a long numeric string (10+ digits) and index is 1-2 digits
+    if not (
+        len(parts) >= 3
+        and parts[0].isdigit()
+        and len(parts[0]) >= 10
+        and parts[1].isdigit()
+        and len(parts[1]) <= 2
+    ):
+        return False
+    entity_registry.async_remove(entity.entity_id)
+    _LOGGER.info("Removed stale local-format battery entity: %s", entity.entity_id)
+    return True
+
+
+def _rename_power_output_entity(
+    entity_registry: er.EntityRegistry, entity: er.RegistryEntry
+) -> bool:
+    """Rename ``power_output`` to ``output_power`` for consistency.
+
+    HTTP mode used "power_output", local mode used "output_power"; both are
+    now standardized on "output_power" across all modes.
+    """
+    if "_power_output" not in entity.unique_id:
+        return False
+    new_unique_id = entity.unique_id.replace("_power_output", "_output_power")
+    existing = entity_registry.async_get_entity_id("sensor", DOMAIN, new_unique_id)
+    if existing:
+        # Target unique_id already exists — remove the stale power_output entity
+        entity_registry.async_remove(entity.entity_id)
+        _LOGGER.info(
+            "Removed stale power_output entity %s (target %s already exists)",
+            entity.entity_id,
+            existing,
+        )
+    else:
+        entity_registry.async_update_entity(
+            entity.entity_id, new_unique_id=new_unique_id
+        )
+        _LOGGER.info(
+            "Migrated entity %s: power_output -> output_power",
+            entity.entity_id,
+        )
+    return True
+
+
+def _remove_deprecated_charge_discharge_entity(
+    entity_registry: er.EntityRegistry, entity: er.RegistryEntry
+) -> bool:
+    """Remove a deprecated charge/discharge split sensor.
+
+    Consolidated into signed net sensors (battery_power, battery_bank_power,
+    etc.); see ``_DEPRECATED_CHARGE_DISCHARGE_SUFFIXES``.
+    """
+    if not any(
+        entity.unique_id.endswith(suffix)
+        for suffix in _DEPRECATED_CHARGE_DISCHARGE_SUFFIXES
+    ):
+        return False
+    entity_registry.async_remove(entity.entity_id)
+    _LOGGER.info("Removed deprecated sensor: %s", entity.entity_id)
+    return True
+
+
+def _remove_duplicate_runtime_data_entity(
+    entity_registry: er.EntityRegistry, entity: er.RegistryEntry
+) -> bool:
+    """Remove an orphaned entity of a retired duplicate sensor key."""
+    if not any(
+        entity.unique_id.endswith(suffix)
+        for suffix in _DEPRECATED_DUPLICATE_SENSOR_SUFFIXES
+    ):
+        return False
+    entity_registry.async_remove(entity.entity_id)
+    _LOGGER.info(
+        "Removed retired duplicate sensor (#253/#335): %s",
+        entity.entity_id,
+    )
+    return True
+
+
+_DUPLICATE_RUNTIME_DATA_MIGRATION = RegistryMigration(
+    "duplicate_runtime_data", _remove_duplicate_runtime_data_entity
+)
+
+# One-time registry migrations, recorded per config entry once applied.
+# Versions are permanent identities: never renumber or reuse one, append new
+# migrations with the next free version instead.  Versions 3 and 4 (the
+# retired-suffix purges below) are retired and must not be reused.
+_ONE_TIME_REGISTRY_MIGRATIONS: tuple[RegistryMigration, ...] = (
+    RegistryMigration(
+        "stale_local_battery_ids", _remove_stale_local_battery_entity, version=1
+    ),
+    RegistryMigration("power_output_rename", _rename_power_output_entity, version=2),
+)
+
+# Purges of retired sensor suffixes.  Their suffix sets grow as sensors are
+# retired, so a recorded version would skip every suffix added later; they
+# are idempotent and run on every setup within the same single pass.
+_RETIRED_SENSOR_CLEANUPS: tuple[RegistryMigration, ...] = (
+    RegistryMigration(
+        "charge_discharge_consolidation",
+        _remove_deprecated_charge_discharge_entity,
+    ),
+    _DUPLICATE_RUNTIME_DATA_MIGRATION,
+)
+
+
 def _async_cleanup_duplicate_runtime_data_entities(
     hass: HomeAssistant,
     entry: EG4ConfigEntry,
@@ -641,19 +772,9 @@ def _async_cleanup_duplicate_runtime_data_entities(
     The duplicate keys have been removed; purge their stale registry entries
     so the dead entities disappear without manual deletion.
     """
-    entity_registry = er.async_get(hass)
-    for entity in er.async_entries_for_config_entry(entity_registry, entry.entry_id):
-        if entity.domain != "sensor":
-            continue
-        if any(
-            entity.unique_id.endswith(suffix)
-            for suffix in _DEPRECATED_DUPLICATE_SENSOR_SUFFIXES
-        ):
-            entity_registry.async_remove(entity.entity_id)
-            _LOGGER.info(
-                "Removed retired duplicate sensor (#253/#335): %s",
-                entity.entity_id,
-            )
+    async_run_registry_migrations(
+        hass, entry.entry_id, (_DUPLICATE_RUNTIME_DATA_MIGRATION,)
+    )
 
 
 def _parallel_group_migration_matches(
@@ -937,12 +1058,11 @@ def _resolved_family_signature(
     )
 
 
-def _async_cleanup_family_excluded_entities(
+def _family_excluded_migrations(
     hass: HomeAssistant,
-    entry: EG4ConfigEntry,
     coordinator: EG4DataUpdateCoordinator,
-) -> None:
-    """Purge entities excluded for a positively resolved inverter family.
+) -> list[RegistryMigration]:
+    """Build the conditional rules purging family-excluded entities.
 
     Sensors match through the device-namespace allowlist
     (``_is_device_namespace_uid``) so battery/bank siblings with the same key
@@ -950,11 +1070,11 @@ def _async_cleanup_family_excluded_entities(
     ``_is_device_control_uid``. Both are gated on the family being positively
     RESOLVED — ``UNKNOWN`` is excluded, because pylxpweb emits it when a
     parameter fetch fails, and one transient read failure must not delete a
-    genuine entity irreversibly.
+    genuine entity irreversibly.  Each rule raises its Repairs issue per
+    affected serial once the pass finishes.
     """
     devices = coordinator.data.get("devices", {}) if coordinator.data else {}
-    entity_registry = er.async_get(hass)
-    entities = er.async_entries_for_config_entry(entity_registry, entry.entry_id)
+    migrations: list[RegistryMigration] = []
 
     for family, domain, excluded_keys, issue_key, log_message in (
         (
@@ -986,35 +1106,56 @@ def _async_cleanup_family_excluded_entities(
             if device_data.get("type") == "inverter"
             and (device_data.get("features") or {}).get("inverter_family") == family
         }
-        removed_serials: set[str] = set()
-        for entity in entities:
-            if entity.domain != domain:
-                continue
-            if domain == "sensor":
-                serial = entity.unique_id.partition("_")[0]
-                matched_serial = (
-                    serial
-                    if serial in family_models
-                    and any(
-                        _is_device_namespace_uid(entity.unique_id, serial, key)
-                        for key in excluded_keys
-                    )
-                    else None
-                )
-            else:
-                matched_serial = next(
-                    (
-                        s
-                        for s in family_models
-                        if _is_device_control_uid(entity.unique_id, s, excluded_keys)
-                    ),
-                    None,
+        if not family_models:
+            continue
+        migrations.append(
+            _family_excluded_migration(
+                hass, domain, family_models, excluded_keys, issue_key, log_message
+            )
+        )
+    return migrations
+
+
+def _family_excluded_migration(
+    hass: HomeAssistant,
+    domain: str,
+    family_models: dict[str, str],
+    excluded_keys: frozenset[str],
+    issue_key: str,
+    log_message: str,
+) -> RegistryMigration:
+    """Build one family-exclusion rule and its Repairs-issue finisher."""
+    removed_serials: set[str] = set()
+
+    def _apply(entity_registry: er.EntityRegistry, entity: er.RegistryEntry) -> bool:
+        if domain == "sensor":
+            serial = entity.unique_id.partition("_")[0]
+            matched_serial = (
+                serial
+                if serial in family_models
+                and any(
+                    _is_device_namespace_uid(entity.unique_id, serial, key)
+                    for key in excluded_keys
                 )
-            if matched_serial is not None:
-                entity_registry.async_remove(entity.entity_id)
-                removed_serials.add(matched_serial)
-                _LOGGER.info(log_message, entity.entity_id)
+                else None
+            )
+        else:
+            matched_serial = next(
+                (
+                    s
+                    for s in family_models
+                    if _is_device_control_uid(entity.unique_id, s, excluded_keys)
+                ),
+                None,
+            )
+        if matched_serial is None:
+            return False
+        entity_registry.async_remove(entity.entity_id)
+        removed_serials.add(matched_serial)
+        _LOGGER.info(log_message, entity.entity_id)
+        return True
 
+    def _finish() -> None:
         for serial in removed_serials:
             ir.async_create_issue(
                 hass,
@@ -1029,6 +1170,19 @@ def _async_cleanup_family_excluded_entities(
                 },
             )
 
+    return RegistryMigration(issue_key, _apply, domain=domain, finish=_finish)
+
+
+def _async_cleanup_family_excluded_entities(
+    hass: HomeAssistant,
+    entry: EG4ConfigEntry,
+    coordinator: EG4DataUpdateCoordinator,
+) -> None:
+    """Purge entities excluded for a positively resolved inverter family."""
+    async_run_registry_migrations(
+        hass, entry.entry_id, _family_excluded_migrations(hass, coordinator)
+    )
+
 
 def _async_cleanup_deprecated_battery_discharge_power_entities(
     hass: HomeAssistant,
@@ -1053,7 +1207,19 @@ def _async_cleanup_deprecated_battery_discharge_power_entities(
     reintroduced for that family, irreversibly.  Unresolved devices keep
     their entities; the family resolves on a later refresh.
     """
-    entity_registry = er.async_get(hass)
+    migration = _deprecated_battery_discharge_power_migration(coordinator)
+    if migration is not None:
+        async_run_registry_migrations(hass, entry.entry_id, (migration,))
+
+
+def _deprecated_battery_discharge_power_migration(
+    coordinator: EG4DataUpdateCoordinator,
+) -> RegistryMigration | None:
+    """Build the conditional #197 purge rule from the resolved families.
+
+    ``None`` when no inverter is resolved to a non-offgrid family, so a pass
+    without other pending rules does not scan the registry at all.
+    """
     offgrid_serials: set[str] = set()
     family_known_serials: set[str] = set()
     if coordinator.data and "devices" in coordinator.data:
@@ -1065,20 +1231,25 @@ def _async_cleanup_deprecated_battery_discharge_power_entities(
                 family_known_serials.add(serial)
                 if family == INVERTER_FAMILY_EG4_OFFGRID:
                     offgrid_serials.add(serial)
-    for entity in er.async_entries_for_config_entry(entity_registry, entry.entry_id):
-        if entity.domain != "sensor":
-            continue
+    if not family_known_serials - offgrid_serials:
+        return None
+
+    def _apply(entity_registry: er.EntityRegistry, entity: er.RegistryEntry) -> bool:
         serial = entity.unique_id.partition("_")[0]
         if not _is_device_namespace_uid(
             entity.unique_id, serial, "battery_discharge_power"
         ):
-            continue
-        if serial in family_known_serials and serial not in offgrid_serials:
-            entity_registry.async_remove(entity.entity_id)
-            _LOGGER.info(
-                "Removed deprecated sensor for non-offgrid device: %s",
-                entity.entity_id,
-            )
+            return False
+        if serial not in family_known_serials or serial in offgrid_serials:
+            return False
+        entity_registry.async_remove(entity.entity_id)
+        _LOGGER.info(
+            "Removed deprecated sensor for non-offgrid device: %s",
+            entity.entity_id,
+        )
+        return True
+
+    return RegistryMigration("offgrid_battery_discharge_power", _apply)
 
 
 def _async_cleanup_stale_smart_port_entities(
@@ -1111,8 +1282,19 @@ def _async_cleanup_stale_smart_port_entities(
         Serials of GridBOSS devices whose port data is not authoritative yet;
         their cleanup must be retried when real data arrives.
     """
-    entity_registry = er.async_get(hass)
+    migration, pending_serials = _stale_smart_port_migration(coordinator)
+    if migration is not None:
+        async_run_registry_migrations(hass, entry.entry_id, (migration,))
+    return pending_serials
+
+
+def _stale_smart_port_migration(
+    coordinator: EG4DataUpdateCoordinator,
+) -> tuple[RegistryMigration | None, set[str]]:
+    """Build the conditional smart-port purge rule and its pending serials.
 
+    The rule is ``None`` when no GridBOSS has authoritative port data yet.
+    """
     # Active keys are tracked PER GridBOSS serial: with two GridBOSS units a
     # global set would let a stale entity on unit A survive forever whenever
     # unit B has the same key active (codex r2 LOW).
@@ -1138,11 +1320,9 @@ def _async_cleanup_stale_smart_port_entities(
         }
 
     if not active_smart_port_keys_by_serial:
-        return pending_serials
+        return None, pending_serials
 
-    for entity in er.async_entries_for_config_entry(entity_registry, entry.entry_id):
-        if entity.domain != "sensor":
-            continue
+    def _apply(entity_registry: er.EntityRegistry, entity: er.RegistryEntry) -> bool:
         # Only GridBOSS entities are smart-port cleanup candidates.  The
         # aggregate "smart_load_power" key is SHARED with EG4_OFFGRID
         # inverters (cloud GEN-port smart load, #222) — a suffix-only match
@@ -1151,7 +1331,7 @@ def _async_cleanup_stale_smart_port_entities(
         # Unique IDs are "{serial}_{sensor_key}", so gate on the serial.
         entity_serial = entity.unique_id.split("_", 1)[0]
         if entity_serial not in active_smart_port_keys_by_serial:
-            continue
+            return False
         active_keys = active_smart_port_keys_by_serial[entity_serial]
         # Smart port unique IDs contain sensor keys like "smart_load1_power_l1"
         # Match by checking if any smart port key appears in the unique_id suffix
@@ -1163,9 +1343,10 @@ def _async_cleanup_stale_smart_port_entities(
                     entity.entity_id,
                     sp_key,
                 )
-                break
+                return True
+        return False
 
-    return pending_serials
+    return RegistryMigration("stale_smart_ports", _apply), pending_serials
 
 
 async def _async_cleanup_failed_entry_setup(
@@ -1307,6 +1488,10 @@ async def _async_setup_entry(hass: HomeAssistant, entry: EG4ConfigEntry) -> bool
             if domain == DOMAIN and identifier.startswith("parallel_group_"):
                 existing_pg_ids.add(identifier)
 
+    applied_migrations = await async_load_applied_registry_migrations(
+        hass, entry.entry_id
+    )
+
     # Initialize the coordinator
     coordinator = EG4DataUpdateCoordinator(hass, entry)
     coordinator._platform_setup_started = False
@@ -1322,57 +1507,6 @@ async def _async_setup_entry(hass: HomeAssistant, entry: EG4ConfigEntry) -> bool
     # first refresh, preserving shared devices and incomplete battery data.
     _async_cleanup_removed_registry_devices(hass, entry, coordinator)
 
-    # One-time migration: remove stale local-format battery entities
-    # Old local keys used numeric-only battery indices (e.g., "0", "1")
-    # New format uses "{serial}-{nn}" to match HTTP key format
-    entity_registry = er.async_get(hass)
-    entities = er.async_entries_for_config_entry(entity_registry, entry.entry_id)
-    for entity in entities:
-        if entity.domain != "sensor":
-            continue
-        parts = entity.unique_id.split("_")
-        # Match pattern: {serial}_{short_numeric_index}_{sensor_key}
-        # where serial is a long numeric string (10+ digits) and index is 1-2 digits
-        if (
-            len(parts) >= 3
-            and parts[0].isdigit()
-            and len(parts[0]) >= 10
-            and parts[1].isdigit()
-            and len(parts[1]) <= 2
-        ):
-            entity_registry.async_remove(entity.entity_id)
-            _LOGGER.info(
-                "Removed stale local-format battery entity: %s", entity.entity_id
-            )
-
-    # One-time migration: rename power_output to output_power for consistency
-    # HTTP mode used "power_output", local mode used "output_power"
-    # Now standardized on "output_power" across all modes
-    for entity in entities:
-        if entity.domain != "sensor":
-            continue
-        if "_power_output" in entity.unique_id:
-            new_unique_id = entity.unique_id.replace("_power_output", "_output_power")
-            existing = entity_registry.async_get_entity_id(
-                "sensor", DOMAIN, new_unique_id
-            )
-            if existing:
-                # Target unique_id already exists — remove the stale power_output entity
-                entity_registry.async_remove(entity.entity_id)
-                _LOGGER.info(
-                    "Removed stale power_output entity %s (target %s already exists)",
-                    entity.entity_id,
-                    existing,
-                )
-            else:
-                entity_registry.async_update_entity(
-                    entity.entity_id, new_unique_id=new_unique_id
-                )
-                _LOGGER.info(
-                    "Migrated entity %s: power_output -> output_power",
-                    entity.entity_id,
-                )
-
     # One-time migration: serial-based parallel group IDs → name-based IDs.
     # Migration is allowed only when the legacy serial occurs in exactly one
     # current group's authoritative member list and no second legacy ID claims
@@ -1382,31 +1516,49 @@ async def _async_setup_entry(hass: HomeAssistant, entry: EG4ConfigEntry) -> bool
         devices = coordinator.data["devices"]
         _migrate_parallel_group_registry_entries(hass, entry, existing_pg_ids, devices)
 
-    # One-time cleanup: remove deprecated charge/discharge split sensors
-    # Consolidated into signed net sensors (battery_power, battery_bank_power, etc.)
-    for entity in er.async_entries_for_config_entry(entity_registry, entry.entry_id):
-        if entity.domain != "sensor":
-            continue
-        if any(
-            entity.unique_id.endswith(suffix)
-            for suffix in _DEPRECATED_CHARGE_DISCHARGE_SUFFIXES
-        ):
-            entity_registry.async_remove(entity.entity_id)
-            _LOGGER.info("Removed deprecated sensor: %s", entity.entity_id)
-
-    # One-time cleanup: purge retired duplicate sensor keys — the "Has
-    # Runtime Data" twin (#253) and the fabricated EPS Load Power L1/L2
-    # aliases of EPS Power L1/L2 (#335).
-    _async_cleanup_duplicate_runtime_data_entities(hass, entry)
-
-    # Conditional cleanup: the reintroduced-for-offgrid
-    # "_battery_discharge_power" (#197) on resolved non-offgrid hardware.
-    _async_cleanup_deprecated_battery_discharge_power_entities(hass, entry, coordinator)
-
-    # Conditional cleanup for entities excluded on a resolved inverter family
-    # (#544 off-grid generator sensors, #548 hybrid EPS apparent-power sensors,
-    # #563 off-grid AC Charge switch).
-    _async_cleanup_family_excluded_entities(hass, entry, coordinator)
+    # Every entity-registry cleanup runs in ONE pass over the entry's rows
+    # (registry_migrations.py).  One-time migrations — stale local battery
+    # IDs and the power_output rename — are recorded per entry once applied
+    # and skipped afterwards.  Every other rule is evaluated every setup:
+    # - the charge/discharge consolidation and the #253/#335 duplicate
+    #   purge, whose suffix sets grow as sensors are retired;
+    # and the conditional rules, which depend on this first refresh:
+    # - the reintroduced-for-offgrid "_battery_discharge_power" (#197) on
+    #   resolved non-offgrid hardware;
+    # - entities excluded on a resolved inverter family (#544 off-grid
+    #   generator sensors, #548 hybrid EPS apparent-power sensors, #563
+    #   off-grid AC Charge switch);
+    # - stale smart port entities from previous versions that created
+    #   entities for all 4 ports.  Now only active ports get entities
+    #   (determined dynamically by _filter_unused_smart_port_sensors).  The
+    #   rule is gated on AUTHORITATIVE port data: the LOCAL-mode first
+    #   refresh returns static placeholder data without smart-port keys, and
+    #   running the cleanup against it deleted every smart-port registry
+    #   entry on each reboot — breaking automations pinned to the registry
+    #   entry ID (#217).  GridBOSS serials without real port data yet are
+    #   retried via a one-shot coordinator listener once the first real poll
+    #   lands.
+    smart_port_migration, pending_smart_port_serials = _stale_smart_port_migration(
+        coordinator
+    )
+    registry_migrations: list[RegistryMigration] = [
+        *_ONE_TIME_REGISTRY_MIGRATIONS,
+        *_RETIRED_SENSOR_CLEANUPS,
+        *_family_excluded_migrations(hass, coordinator),
+    ]
+    for conditional in (
+        _deprecated_battery_discharge_power_migration(coordinator),
+        smart_port_migration,
+    ):
+        if conditional is not None:
+            registry_migrations.append(conditional)
+    newly_applied = async_run_registry_migrations(
+        hass, entry.entry_id, registry_migrations, applied=applied_migrations
+    )
+    if not newly_applied <= applied_migrations:
+        await async_save_applied_registry_migrations(
+            hass, entry.entry_id, applied_migrations | newly_applied
+        )
 
     # The family can stay UNKNOWN at first refresh (a failed parameter fetch)
     # and resolve only on a LATER poll — after this one-shot cleanup ran and
@@ -1435,19 +1587,6 @@ async def _async_setup_entry(hass: HomeAssistant, entry: EG4ConfigEntry) -> bool
         coordinator.async_add_listener(_async_reclean_on_family_resolution)
     )
 
-    # One-time cleanup: remove stale smart port entities from previous versions
-    # that created entities for all 4 ports. Now only active ports get entities
-    # (determined dynamically by _filter_unused_smart_port_sensors).
-    #
-    # The cleanup is gated on AUTHORITATIVE port data: the LOCAL-mode first
-    # refresh returns static placeholder data without smart-port keys, and
-    # running the cleanup against it deleted every smart-port registry entry
-    # on each reboot — breaking automations pinned to the registry entry ID
-    # (#217).  GridBOSS serials without real port data yet are retried via a
-    # one-shot coordinator listener once the first real poll lands.
-    pending_smart_port_serials = _async_cleanup_stale_smart_port_entities(
-        hass, entry, coordinator
-    )
     if pending_smart_port_serials:
         unsub_smart_port_cleanup: CALLBACK_TYPE | None = None
 
@@ -1530,6 +1669,15 @@ async def async_unload_entry(hass: HomeAssistant, entry: EG4ConfigEntry) -> bool
     return bool(unload_ok)
 
 
+def _entry_cloud_account_key(entry: ConfigEntry) -> CloudAccountKey:
+    """Return the cloud account key an entry's coordinator would use."""
+    return cloud_account_key(
+        str(entry.data.get(CONF_USERNAME, "")),
+        entry.data.get(CONF_BASE_URL, DEFAULT_BASE_URL),
+        entry.data.get(CONF_VERIFY_SSL, DEFAULT_VERIFY_SSL),
+    )
+
+
 async def async_remove_entry(hass: HomeAssistant, entry: EG4ConfigEntry) -> None:
     """Handle removal of an entry.
 
@@ -1594,6 +1742,23 @@ async def async_remove_entry(hass: HomeAssistant, entry: EG4ConfigEntry) -> None
         PV_STRING_LIFETIME_STORAGE_VERSION,
         f"{PV_STRING_LIFETIME_STORAGE_KEY}_{entry.entry_id}",
     ).async_remove()
+    await Store(
+        hass,
+        EVENT_LOG_STORAGE_VERSION,
+        f"{EVENT_LOG_STORAGE_KEY}_{entry.entry_id}",
+    ).async_remove()
+    await async_remove_registry_migration_state(hass, entry.entry_id)
+
+    # The saved portal session belongs to the cloud account, which other
+    # entries may share; drop it only with the account's last entry.
+    if entry.data.get(CONF_USERNAME):
+        account_key = _entry_cloud_account_key(entry)
+        if not any(
+            _entry_cloud_account_key(other) == account_key
+            for other in hass.config_entries.async_entries(DOMAIN)
+            if other.entry_id != entry.entry_id
+        ):
+            await get_cloud_session_cache(hass).async_forget(account_key)
 
     # Removing the losing entry is the recovery this entry's duplicate Repair
     # asks the user to perform, so clear that Repair here (no-op when none exists).
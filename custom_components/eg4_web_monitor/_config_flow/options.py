@@ -23,12 +23,14 @@ from ..const import (
     BLOCK_SIZE_FAST,
     BRAND_NAME,
     CONF_CHARGE_CONTROL_MODE,
+    CONF_CLOUD_REQUEST_BUDGET,
     CONF_CONNECTION_TYPE,
     CONF_DATA_VALIDATION,
     CONF_DISCHARGE_CONTROL_MODE,
     CONF_MODBUS_BLOCK_SIZE,
     CONTROL_MODE_SOC,
     CONTROL_MODE_VOLTAGE,
+    DEFAULT_CLOUD_REQUEST_BUDGET,
     DEFAULT_MODBUS_BLOCK_SIZE,
     DEVICE_TYPE_INVERTER,
     PARAM_FUNC_BAT_CHARGE_CONTROL,
@@ -42,6 +44,7 @@ from ..const import (
     CONF_MODBUS_UPDATE_INTERVAL,
     CONF_PARAMETER_REFRESH_INTERVAL,
     CONF_SENSOR_UPDATE_INTERVAL,
+    CONF_WIRE_TRACE,
     CONNECTION_TYPE_DONGLE,
     CONNECTION_TYPE_HTTP,
     CONNECTION_TYPE_HYBRID,
@@ -55,6 +58,7 @@ from ..const import (
     DEFAULT_PARAMETER_REFRESH_INTERVAL,
     DEFAULT_SENSOR_UPDATE_INTERVAL_HTTP,
     DEFAULT_SENSOR_UPDATE_INTERVAL_LOCAL,
+    MAX_CLOUD_REQUEST_BUDGET,
     MAX_DONGLE_UPDATE_INTERVAL,
     MAX_HTTP_POLLING_INTERVAL,
     MAX_MODBUS_UPDATE_INTERVAL,
@@ -246,6 +250,19 @@ class EG4OptionsFlow(config_entries.OptionsFlow):
             placeholders["min_http_interval"] = str(MIN_HTTP_POLLING_INTERVAL)
             placeholders["max_http_interval"] = str(MAX_HTTP_POLLING_INTERVAL)
 
+            # Hourly request budget: 0 keeps the fixed interval above; any
+            # other value lets the coordinator stretch it under load.
+            current_budget = self._current_option(
+                CONF_CLOUD_REQUEST_BUDGET, DEFAULT_CLOUD_REQUEST_BUDGET
+            )
+            schema_fields[
+                vol.Optional(CONF_CLOUD_REQUEST_BUDGET, default=current_budget)
+            ] = vol.All(
+                vol.Coerce(int),
+                vol.Range(min=0, max=MAX_CLOUD_REQUEST_BUDGET),
+            )
+            placeholders["max_cloud_request_budget"] = str(MAX_CLOUD_REQUEST_BUDGET)
+
         if show_legacy_sensor:
             # Fallback: show generic sensor_update_interval for edge cases
             is_local = connection_type in (
@@ -294,6 +311,15 @@ class EG4OptionsFlow(config_entries.OptionsFlow):
             vol.Optional(CONF_LIBRARY_DEBUG, default=current_library_debug)
         ] = bool
 
+        # Wire trace: records each cycle's raw device data for offline
+        # replay (wire_trace.py). Debugging aid, off by default.
+        schema_fields[
+            vol.Optional(
+                CONF_WIRE_TRACE,
+                default=self.config_entry.options.get(CONF_WIRE_TRACE, False),
+            )
+        ] = bool
+
         # Data validation toggle: only shown when local transports are configured
         if show_modbus or show_dongle:
             current_data_validation = self.config_entry.options.get(
@@ -0,0 +1,64 @@
+"""Budget-aware stretching of the cloud polling cadence.
+
+The configured HTTP polling interval is a floor, not a promise. Each entry's
+pylxpweb client already counts its own portal calls (``api_requests_last_hour``);
+when that count approaches the user's hourly request budget, the controller
+stretches the HTTP interval — and, through ``scale``, the supplemental
+side-fetch throttles — and relaxes back toward the configured interval once
+headroom returns.
+
+Decisions are deliberately coarse and hysteretic: a rolling hour reacts
+slowly, so each cycle moves the scale by one bounded step, and the band
+between ``_RELAX_BELOW`` and ``_STRETCH_ABOVE`` holds the current cadence.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import math
+
+# Fractions of the hourly budget. Above _STRETCH_ABOVE the cadence slows by
+# _STRETCH_STEP per cycle; below _RELAX_BELOW it speeds up by _RELAX_STEP.
+_STRETCH_ABOVE = 0.9
+_RELAX_BELOW = 0.6
+_STRETCH_STEP = 1.5
+_RELAX_STEP = 1.25
+
+
+@dataclass(slots=True)
+class AdaptivePollingController:
+    """Per-entry controller mapping request pressure to a polling scale.
+
+    Attributes:
+        base_interval: Configured HTTP polling interval (seconds); never
+            shortened.
+        max_interval: Upper bound for the stretched interval (seconds).
+        budget: Hourly request budget for this entry's client.
+        scale: Current multiplier applied to the base interval and to the
+            side-fetch throttles (1.0 = configured cadence).
+    """
+
+    base_interval: int
+    max_interval: int
+    budget: int
+    scale: float = 1.0
+
+    @property
+    def interval(self) -> int:
+        """Return the HTTP polling interval for the current scale."""
+        return min(self.max_interval, math.ceil(self.base_interval * self.scale))
+
+    def update(self, requests_last_hour: int, *, breaker_open: bool) -> int:
+        """Fold one cycle's request count into the scale; return the interval.
+
+        While the side-fetch breaker is open the supplemental calls are being
+        skipped, so a low count says nothing about real demand: the cadence
+        may still stretch but never relaxes until the portal answers again.
+        """
+        pressure = requests_last_hour / self.budget
+        max_scale = self.max_interval / self.base_interval
+        if pressure > _STRETCH_ABOVE:
+            self.scale = min(max_scale, self.scale * _STRETCH_STEP)
+        elif pressure < _RELAX_BELOW and not breaker_open:
+            self.scale = max(1.0, self.scale / _RELAX_STEP)
+        return self.interval
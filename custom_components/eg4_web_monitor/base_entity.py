@@ -28,6 +28,7 @@ else:
         CoordinatorEntity,  # type: ignore[assignment]
     )
 
+from .battery_record import BatteryRecord, battery_field_index
 from .const import (
     DIAGNOSTIC_BATTERY_SENSOR_KEYS,
     DIAGNOSTIC_DEVICE_SENSOR_KEYS,
@@ -533,6 +534,8 @@ class EG4BaseBatterySensor(EG4BatteryEntity):
         # Also store as _serial for compatibility
         self._serial = serial
         self._sensor_key = sensor_key
+        # Fixed BatteryRecord slot for this key, resolved once.
+        self._field_index = battery_field_index(sensor_key)
         self._last_reported_value: float | None = None
 
         # Apply shared sensor config (unit, device_class, state_class, icon, precision, category)
@@ -560,7 +563,11 @@ class EG4BaseBatterySensor(EG4BatteryEntity):
             return None
 
         batteries = device_data.get("batteries", {})
-        battery_data = batteries.get(self._battery_key, {})
+        battery_data = batteries.get(self._battery_key)
+        if battery_data is None:
+            return None
+        if self._field_index is not None and type(battery_data) is BatteryRecord:
+            return battery_data.value_at(self._field_index)
         return battery_data.get(self._sensor_key)
 
     @property
@@ -0,0 +1,188 @@
+"""Compact per-battery sensor records.
+
+Every cycle each individual battery is mapped to about thirty sensor values,
+and the mapping is then held by the round-robin cache, the carry-forward
+cache and the published data. As a plain dict that is one hash table per
+battery per cycle; on a 16-battery plant with several inverters it is most
+of the per-cycle allocation of the battery path.
+
+``BatteryRecord`` keeps the same mapping in one list indexed by a fixed
+field table (``BATTERY_RECORD_FIELDS``) behind the full ``MutableMapping``
+interface, so every consumer that reads a battery mapping — entity
+discovery, bank statistics, carry-forward, lost-battery blanking,
+diagnostics — works unchanged. Battery entities resolve their field index
+once and read the slot directly.
+
+A field that was never written is absent, not ``None``, exactly like a
+missing dict key: entity creation keys off presence. Keys outside the field
+table go to a small overflow dict that is only created when needed.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping, MutableMapping
+from copy import deepcopy
+from typing import Any, Final
+
+# Fixed slot order: the keys _build_individual_battery_mapping writes, plus
+# the cloud metadata the HYBRID overlay adds.
+BATTERY_RECORD_FIELDS: Final = (
+    "battery_real_voltage",
+    "battery_real_current",
+    "battery_real_power",
+    "battery_rsoc",
+    "state_of_health",
+    "battery_max_cell_temp",
+    "battery_min_cell_temp",
+    "battery_max_cell_temp_num",
+    "battery_min_cell_temp_num",
+    "battery_max_cell_voltage",
+    "battery_min_cell_voltage",
+    "battery_max_cell_voltage_num",
+    "battery_min_cell_voltage_num",
+    "battery_cell_voltage_delta",
+    "battery_cell_temp_delta",
+    "battery_remaining_capacity",
+    "battery_full_capacity",
+    "battery_capacity_percentage",
+    "battery_max_charge_current",
+    "battery_charge_voltage_ref",
+    "cycle_count",
+    "battery_firmware_version",
+    "battery_type",
+    "battery_type_text",
+    "battery_serial_number",
+    "battery_model",
+    "battery_index",
+    "battery_last_polled",
+    "battery_last_seen",
+    "battery_charge_rate",
+    "battery_bms_model",
+)
+_FIELD_INDEX: Final = {name: index for index, name in enumerate(BATTERY_RECORD_FIELDS)}
+_FIELD_COUNT: Final = len(BATTERY_RECORD_FIELDS)
+_MISSING: Final = object()
+
+
+def battery_field_index(key: str) -> int | None:
+    """Return the fixed slot of a battery sensor key, or None if it has none."""
+    return _FIELD_INDEX.get(key)
+
+
+class BatteryRecord(MutableMapping[str, Any]):
+    """One battery's sensor values, stored by fixed field index."""
+
+    __slots__ = ("_extra", "_values")
+
+    def __init__(self, data: Mapping[str, Any] | None = None) -> None:
+        self._values: list[Any] = [_MISSING] * _FIELD_COUNT
+        self._extra: dict[str, Any] | None = None
+        if data:
+            self.update(data)
+
+    @classmethod
+    def from_fields(cls, **values: Any) -> BatteryRecord:
+        """Build a record from field values given by name.
+
+        Every name must be in ``BATTERY_RECORD_FIELDS``; fields not given stay
+        unset. Values go straight into their slots, so reordering or extending
+        the field table cannot move a value onto another sensor.
+        """
+        slots: list[Any] = [_MISSING] * _FIELD_COUNT
+        for name, value in values.items():
+            index = _FIELD_INDEX.get(name)
+            if index is None:
+                raise ValueError(f"{name!r} is not a BatteryRecord field")
+            slots[index] = value
+        record = cls.__new__(cls)
+        record._values = slots
+        record._extra = None
+        return record
+
+    def value_at(self, index: int) -> Any:
+        """Return the value in slot ``index``, or None when it is unset."""
+        value = self._values[index]
+        return None if value is _MISSING else value
+
+    def copy(self) -> BatteryRecord:
+        """Return a shallow copy."""
+        clone = BatteryRecord.__new__(BatteryRecord)
+        clone._values = list(self._values)
+        clone._extra = dict(self._extra) if self._extra else None
+        return clone
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> BatteryRecord:
+        clone = BatteryRecord.__new__(BatteryRecord)
+        clone._values = [
+            value if value is _MISSING else deepcopy(value, memo)
+            for value in self._values
+        ]
+        clone._extra = deepcopy(self._extra, memo) if self._extra else None
+        return clone
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the value for ``key`` without raising."""
+        index = _FIELD_INDEX.get(key)
+        if index is None:
+            return default if self._extra is None else self._extra.get(key, default)
+        value = self._values[index]
+        return default if value is _MISSING else value
+
+    def __getitem__(self, key: str) -> Any:
+        index = _FIELD_INDEX.get(key)
+        if index is not None:
+            value = self._values[index]
+            if value is not _MISSING:
+                return value
+        elif self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        index = _FIELD_INDEX.get(key)
+        if index is not None:
+            self._values[index] = value
+            return
+        if self._extra is None:
+            self._extra = {}
+        self._extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        index = _FIELD_INDEX.get(key)
+        if index is not None and self._values[index] is not _MISSING:
+            self._values[index] = _MISSING
+        elif index is None and self._extra is not None and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        index = _FIELD_INDEX.get(key) if isinstance(key, str) else None
+        if index is not None:
+            return self._values[index] is not _MISSING
+        return self._extra is not None and key in self._extra
+
+    def __iter__(self) -> Iterator[str]:
+        for name, value in zip(BATTERY_RECORD_FIELDS, self._values, strict=True):
+            if value is not _MISSING:
+                yield name
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        present = _FIELD_COUNT - self._values.count(_MISSING)
+        return present + (len(self._extra) if self._extra else 0)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, BatteryRecord):
+            return self._values == other._values and (self._extra or {}) == (
+                other._extra or {}
+            )
+        return super().__eq__(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"BatteryRecord({dict(self)!r})"
@@ -5,7 +5,9 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Awaitable, Callable
 from contextvars import ContextVar
-from typing import Any, Coroutine, TYPE_CHECKING
+import copy
+import time
+from typing import Any, Coroutine, NamedTuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -15,11 +17,97 @@ CloudRequest = Callable[..., Awaitable[dict[str, Any]]]
 FirmwareStatusFetch = Callable[[], Coroutine[Any, Any, Any]]
 CloudAccountKey = tuple[str, str, bool]
 FirmwareStatusKey = CloudAccountKey
+SessionCookieReader = Callable[[], str | None]
+SessionCookieWriter = Callable[[str], None]
+_ReadKey = tuple[str, str, tuple[tuple[str, str], ...]]
 
 _CLOUD_REQUEST_BUDGETS = "eg4_web_monitor_cloud_request_budgets"
 _FIRMWARE_STATUS_FLIGHTS = "eg4_web_monitor_firmware_status_flights"
+_CLOUD_ACCOUNTS = "eg4_web_monitor_cloud_accounts"
 _PYLXPWEB_LOGIN_ENDPOINT = "/WManage/api/login"
 _FIRMWARE_FLIGHT_CLOSE_TIMEOUT = 1.0
+# Idempotent portal reads coalesced at the limiter boundary, with how long a
+# completed response keeps answering identical requests (seconds). Station
+# refreshes, button refreshes, device-removal discovery, parameter refreshes
+# and side-fetches routinely issue the same read concurrently; callers with
+# the same (method, endpoint, body) share one wire request instead. The body
+# is part of the key, so a targeted plant-detail lookup never answers an
+# untargeted listing and one serial's runtime never answers another's.
+_COALESCED_READ_WINDOWS: dict[str, float] = {
+    # Role-selected plant listings read by account-level detection after
+    # every login; stable enough to serve a whole startup burst.
+    "/WManage/web/config/plant/list": 60.0,
+    "/WManage/web/config/plant/list/viewer": 60.0,
+    "/WManage/api/plantOverview/list/viewer": 1.0,
+    "/WManage/api/inverterOverview/list": 1.0,
+    "/WManage/api/inverterOverview/getParallelGroupDetails": 1.0,
+    "/WManage/api/inverter/getInverterInfo": 1.0,
+    "/WManage/api/inverter/getInverterRuntime": 1.0,
+    "/WManage/api/inverter/getInverterEnergyInfo": 1.0,
+    "/WManage/api/inverter/getInverterEnergyInfoParallel": 1.0,
+    "/WManage/api/battery/getBatteryInfo": 1.0,
+    "/WManage/api/battery/getBatteryInfoForSet": 1.0,
+    "/WManage/api/midbox/getMidboxRuntime": 1.0,
+    "/WManage/api/system/cluster/search/findOnlineDatalog": 1.0,
+    "/WManage/web/config/datalog/list": 1.0,
+    "/WManage/web/maintain/remoteRead/read": 1.0,
+    "/WManage/web/config/quickCharge/getStatusInfo": 1.0,
+    "/WManage/web/maintain/standardUpdate/checkUpdates": 1.0,
+}
+# Uncoalesced portal reads known not to change device or station state:
+# charts, energy columns, the event list, forecasts, locale lookups and
+# firmware status. Any other POST outside the coalesced set is treated as a
+# write (parameter and function writes, quick charge/discharge, plant edits
+# such as the DST switch, parallel-group sync, firmware runs) and drops every
+# coalesced read, so a read issued after it never receives a response
+# obtained before it.
+_READ_ONLY_ENDPOINT_PREFIXES = (
+    "/WManage/api/analyze/",
+    "/WManage/api/inverterChart/",
+    "/WManage/api/predict/",
+    "/WManage/api/weather/",
+    "/WManage/web/analyze/",
+    "/WManage/locale/",
+)
+_READ_ONLY_ENDPOINTS = frozenset(
+    {
+        "/WManage/web/maintain/remoteUpdate/info",
+        "/WManage/web/maintain/standardUpdate/check12KParallelStatus",
+    }
+)
+# Same-account entries start (and renew their two-hour sessions) within
+# seconds of each other; a login this recent is still the account's session.
+_LOGIN_REUSE_WINDOW = 120.0  # seconds
+
+
+class _SharedLogin(NamedTuple):
+    """One successful login response and the session cookie it issued."""
+
+    response: dict[str, Any]
+    cookie: str
+
+
+def _normalized_body(data: dict[str, Any] | None) -> tuple[tuple[str, str], ...]:
+    """Return an order-independent, hashable form of a form-encoded body."""
+    if not data:
+        return ()
+    return tuple(sorted((str(name), str(value)) for name, value in data.items()))
+
+
+def _may_mutate(method: str, endpoint: str) -> bool:
+    """Whether an uncoalesced request can change portal state."""
+    return (
+        method.upper() == "POST"
+        and endpoint not in _READ_ONLY_ENDPOINTS
+        and not endpoint.startswith(_READ_ONLY_ENDPOINT_PREFIXES)
+    )
+
+
+def cloud_account_key(
+    username: str, base_url: str, verify_ssl: bool
+) -> CloudAccountKey:
+    """Return the exact-account key shared by every account-scoped registry."""
+    return (username, base_url.rstrip("/"), verify_ssl)
 
 
 class SharedCloudRequestBudget:
@@ -145,8 +233,9 @@ class CloudRequestLimiter:
     slot each.
 
     Each client retains its own original request callable and re-entrancy
-    contexts, while clients for separate plants on the same account share only
-    the semaphore budget. The shared budget owns and cancels no request task.
+    contexts, while clients for separate plants on the same account share the
+    semaphore budget and, when given a ``SharedCloudAccount``, its login and
+    plant listing. Neither shared object owns or cancels a request task.
     """
 
     def __init__(
@@ -157,6 +246,9 @@ class CloudRequestLimiter:
         budget: SharedCloudRequestBudget | None = None,
         authentication_task_getter: Callable[[], asyncio.Task[Any] | None]
         | None = None,
+        account: SharedCloudAccount | None = None,
+        session_cookie: SessionCookieReader | None = None,
+        adopt_session_cookie: SessionCookieWriter | None = None,
     ) -> None:
         if budget is None:
             if limit is None:
@@ -167,6 +259,10 @@ class CloudRequestLimiter:
         self._request = request
         self._budget = budget
         self._authentication_task_getter = authentication_task_getter
+        self._account = account
+        self._reads = account.reads if account is not None else CoalescedReads()
+        self._session_cookie = session_cookie
+        self._adopt_session_cookie = adopt_session_cookie
         self._auth_task_leases: dict[asyncio.Task[Any], _CloudRequestLease] = {}
         self._closed = False
         self._request_owner: ContextVar[asyncio.Task[Any] | None] = ContextVar(
@@ -200,9 +296,9 @@ class CloudRequestLimiter:
         }
         current_task = asyncio.current_task()
         if current_task is not None and self._request_owner.get() is current_task:
-            return await self._request(method, endpoint, **kwargs)
+            return await self._send(method, endpoint, kwargs)
         if current_task is not None and self._auth_chain_owner.get() is current_task:
-            return await self._request(method, endpoint, **kwargs)
+            return await self._send(method, endpoint, kwargs)
 
         # pylxpweb's reactive authentication creates a child task after an
         # ordinary request receives an unauthenticated response. ContextVars
@@ -242,7 +338,7 @@ class CloudRequestLimiter:
             # finishes, otherwise canceled parents release all three slots and
             # later work can run alongside the still-live auth request.
             self._auth_chain_owner.set(current_task)
-            return await self._request(method, endpoint, **kwargs)
+            return await self._send(method, endpoint, kwargs)
 
         await self._budget.async_acquire()
         lease = _CloudRequestLease(self._budget)
@@ -256,7 +352,7 @@ class CloudRequestLimiter:
             owner_token = self._request_owner.set(current_task)
             lease_token = self._request_lease.set(lease)
             try:
-                return await self._request(method, endpoint, **kwargs)
+                return await self._send(method, endpoint, kwargs)
             except asyncio.CancelledError:
                 self._reserve_lease_for_auth_task(lease, current_task)
                 raise
@@ -266,6 +362,42 @@ class CloudRequestLimiter:
         finally:
             lease.release()
 
+    async def _send(
+        self, method: str, endpoint: str, kwargs: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Issue one admitted request, sharing identical reads and logins."""
+
+        def _fetch() -> Awaitable[dict[str, Any]]:
+            return self._request(method, endpoint, **kwargs)
+
+        window = _COALESCED_READ_WINDOWS.get(endpoint)
+        if window is not None:
+            return await self._reads.async_read(
+                method, endpoint, kwargs["data"], _fetch, window
+            )
+
+        account = self._account
+        if endpoint == _PYLXPWEB_LOGIN_ENDPOINT:
+            session_cookie = self._session_cookie
+            adopt_session_cookie = self._adopt_session_cookie
+            if (
+                account is not None
+                and session_cookie is not None
+                and adopt_session_cookie is not None
+            ):
+                return await account.async_login(
+                    _fetch, session_cookie, adopt_session_cookie
+                )
+        elif _may_mutate(method, endpoint):
+            self._reads.invalidate()
+            try:
+                return await self._request(method, endpoint, **kwargs)
+            finally:
+                # A read that reached the wire while the write was in flight
+                # may still describe the state before it.
+                self._reads.invalidate()
+        return await self._request(method, endpoint, **kwargs)
+
     def _reserve_lease_for_auth_task(
         self,
         lease: _CloudRequestLease,
@@ -304,8 +436,15 @@ def install_cloud_request_limiter(
     *,
     limit: int | None = None,
     budget: SharedCloudRequestBudget | None = None,
+    account: SharedCloudAccount | None = None,
+    session_cookie: SessionCookieReader | None = None,
+    adopt_session_cookie: SessionCookieWriter | None = None,
 ) -> CloudRequestLimiter:
-    """Install a per-client limiter at pylxpweb's common request boundary."""
+    """Install a per-client limiter at pylxpweb's common request boundary.
+
+    With ``account`` and the cookie hooks for the client's private jar, login
+    and plant-listing requests are shared with same-account sibling clients.
+    """
 
     def _authentication_task() -> asyncio.Task[Any] | None:
         task = getattr(client, "_authentication_task", None)
@@ -316,6 +455,9 @@ def install_cloud_request_limiter(
         limit=limit,
         budget=budget,
         authentication_task_getter=_authentication_task,
+        account=account,
+        session_cookie=session_cookie,
+        adopt_session_cookie=adopt_session_cookie,
     )
     # pylxpweb's endpoint objects resolve ``client._request`` dynamically, and
     # its retries recurse through the same attribute.  Binding on the instance
@@ -334,7 +476,7 @@ def acquire_shared_cloud_request_budget(
     limit: int,
 ) -> SharedCloudRequestBudget:
     """Acquire one HA-local raw request budget for an exact cloud account."""
-    key = (username, base_url.rstrip("/"), verify_ssl)
+    key = cloud_account_key(username, base_url, verify_ssl)
     registry: dict[CloudAccountKey, SharedCloudRequestBudget] = hass.data.setdefault(
         _CLOUD_REQUEST_BUDGETS, {}
     )
@@ -540,7 +682,7 @@ def acquire_shared_firmware_status(
     fetch: FirmwareStatusFetch,
 ) -> tuple[SharedFirmwareStatusFlight, object]:
     """Acquire one HA-local firmware flight for an exact cloud account."""
-    key = (username, base_url.rstrip("/"), verify_ssl)
+    key = cloud_account_key(username, base_url, verify_ssl)
     registry: dict[FirmwareStatusKey, SharedFirmwareStatusFlight] = (
         hass.data.setdefault(_FIRMWARE_STATUS_FLIGHTS, {})
     )
@@ -569,3 +711,211 @@ async def release_shared_firmware_status(
         if not registry:
             hass.data.pop(_FIRMWARE_STATUS_FLIGHTS, None)
     await flight.async_close()
+
+
+class CoalescedReads:
+    """Keyed single-flight for idempotent portal reads.
+
+    Generalizes ``SharedFirmwareStatusFlight`` to every endpoint in
+    ``_COALESCED_READ_WINDOWS``: concurrent callers with the same method,
+    endpoint and body join one in-flight request, and a successful response
+    keeps answering identical requests for that endpoint's short window. Each
+    caller receives its own copy, so pylxpweb's in-place model parsing cannot
+    leak between callers.
+
+    Failures are never shared: followers of a failed or cancelled flight
+    issue their own request, keeping per-caller error handling (breakers,
+    reauthentication) exactly as it was without coalescing.
+    """
+
+    def __init__(self) -> None:
+        self._results: dict[_ReadKey, tuple[float, float, dict[str, Any]]] = {}
+        self._flights: dict[_ReadKey, asyncio.Future[dict[str, Any] | None]] = {}
+        # pylxpweb replays a read after reauthentication by recursing through
+        # the same boundary with the same key. That replay must go to the wire,
+        # not wait on the flight it is itself completing.
+        self._leading: ContextVar[frozenset[_ReadKey]] = ContextVar(
+            f"eg4_cloud_read_leading_{id(self)}", default=frozenset()
+        )
+
+    def invalidate(self) -> None:
+        """Forget completed responses and stop new joins of running reads."""
+        self._results.clear()
+        self._flights.clear()
+
+    async def async_read(
+        self,
+        method: str,
+        endpoint: str,
+        data: dict[str, Any] | None,
+        fetch: Callable[[], Awaitable[dict[str, Any]]],
+        window: float,
+    ) -> dict[str, Any]:
+        """Return one shared response for an idempotent read."""
+        key = (method.upper(), endpoint, _normalized_body(data))
+        leading = self._leading.get()
+        if key in leading:
+            return await fetch()
+        cached = self._results.get(key)
+        if cached is not None:
+            stamp, ttl, response = cached
+            if time.monotonic() - stamp < ttl:
+                return copy.deepcopy(response)
+            self._results.pop(key, None)
+
+        flight = self._flights.get(key)
+        if flight is not None:
+            shared = await asyncio.shield(flight)
+            if shared is not None:
+                return copy.deepcopy(shared)
+            return await fetch()
+
+        future: asyncio.Future[dict[str, Any] | None] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._flights[key] = future
+        leading_token = self._leading.set(leading | {key})
+        result: dict[str, Any] | None = None
+        try:
+            response = await fetch()
+            if (
+                isinstance(response, dict)
+                and response.get("success", True) is not False
+            ):
+                result = copy.deepcopy(response)
+                # A write that invalidated this flight while it was on the
+                # wire also invalidates its result.
+                if self._flights.get(key) is future:
+                    self._results[key] = (time.monotonic(), window, result)
+            return response
+        finally:
+            self._leading.reset(leading_token)
+            if self._flights.get(key) is future:
+                self._flights.pop(key, None)
+            future.set_result(result)
+
+
+class SharedCloudAccount:
+    """Account-scoped login and plant-listing state for same-account entries.
+
+    Each config entry keeps its own ``LuxpowerClient`` and private cookie jar so
+    unloading one plant can never close a sibling's transport. What is shared
+    is what the portal itself treats as account-wide: the ``JSESSIONID`` issued
+    by a login, and the plant list that pylxpweb's account-level detection
+    reads after every login. Without this, N plants on one account performed N
+    logins (three portal requests each) at startup and again at every renewal.
+
+    Sharing happens inside each entry's ``CloudRequestLimiter`` admission, so
+    the account budget still bounds every raw request.
+    """
+
+    def __init__(self, hass: HomeAssistant, key: CloudAccountKey) -> None:
+        self._hass = hass
+        self.key = key
+        self.ref_count = 0
+        self._login_flight: asyncio.Future[_SharedLogin | None] | None = None
+        self._last_login: tuple[float, _SharedLogin] | None = None
+        self.reads = CoalescedReads()
+
+    def register(self) -> None:
+        """Register one config-entry owner."""
+        self.ref_count += 1
+
+    def release(self) -> bool:
+        """Release one owner; returns True when the final owner has left."""
+        if self.ref_count <= 0:
+            return False
+        self.ref_count -= 1
+        if self.ref_count:
+            return False
+        self._last_login = None
+        self.reads.invalidate()
+        return True
+
+    async def async_login(
+        self,
+        login: Callable[[], Awaitable[dict[str, Any]]],
+        session_cookie: SessionCookieReader,
+        adopt_session_cookie: SessionCookieWriter,
+    ) -> dict[str, Any]:
+        """Run one login POST, or adopt the session a sibling just obtained.
+
+        A follower joins a login already in flight, or reuses one completed
+        within ``_LOGIN_REUSE_WINDOW``. A cookie the caller already holds is
+        never handed back: that cookie is exactly what just failed for it, so
+        the caller logs in itself and becomes the account's new leader.
+        """
+        flight = self._login_flight
+        if flight is not None:
+            shared = await asyncio.shield(flight)
+            if shared is not None and session_cookie() != shared.cookie:
+                adopt_session_cookie(shared.cookie)
+                return copy.deepcopy(shared.response)
+
+        last = self._last_login
+        if last is not None:
+            stamp, shared = last
+            if (
+                time.monotonic() - stamp < _LOGIN_REUSE_WINDOW
+                and session_cookie() != shared.cookie
+            ):
+                adopt_session_cookie(shared.cookie)
+                return copy.deepcopy(shared.response)
+
+        future: asyncio.Future[_SharedLogin | None] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._login_flight = future
+        shared = None
+        try:
+            response = await login()
+            cookie = session_cookie()
+            if (
+                cookie is not None
+                and isinstance(response, dict)
+                and response.get("success", True) is not False
+            ):
+                shared = _SharedLogin(copy.deepcopy(response), cookie)
+                self._last_login = (time.monotonic(), shared)
+            return response
+        finally:
+            # Followers of a failed or cancelled login simply log in
+            # themselves; ``None`` carries no exception to leave unobserved.
+            if self._login_flight is future:
+                self._login_flight = None
+            future.set_result(shared)
+
+
+def acquire_shared_cloud_account(
+    hass: HomeAssistant,
+    *,
+    username: str,
+    base_url: str,
+    verify_ssl: bool,
+) -> SharedCloudAccount:
+    """Acquire the HA-local shared login/listing state for an exact account."""
+    key = cloud_account_key(username, base_url, verify_ssl)
+    registry: dict[CloudAccountKey, SharedCloudAccount] = hass.data.setdefault(
+        _CLOUD_ACCOUNTS, {}
+    )
+    account = registry.get(key)
+    if account is None:
+        account = SharedCloudAccount(hass, key)
+        registry[key] = account
+    account.register()
+    return account
+
+
+def release_shared_cloud_account(
+    hass: HomeAssistant, account: SharedCloudAccount
+) -> None:
+    """Release one entry owner, retiring the state after the last one leaves."""
+    if not account.release():
+        return
+    # In-flight followers keep their own reference and finish normally; a
+    # replacement entry starts from fresh state and logs in itself.
+    registry = hass.data.get(_CLOUD_ACCOUNTS)
+    if isinstance(registry, dict) and registry.get(account.key) is account:
+        registry.pop(account.key, None)
+        if not registry:
+            hass.data.pop(_CLOUD_ACCOUNTS, None)
@@ -1,13 +1,53 @@
-"""Cancellation-safe cleanup for cookie-bearing cloud sessions."""
+"""Cancellation-safe cleanup and restart persistence for cloud sessions.
+
+Every restart or entry reload creates a fresh private cookie jar, so the first
+cycle of every entry used to begin with a login (three portal requests).  With
+several plants on one account that burst landed all at once.
+``CloudSessionCache`` keeps the authenticated ``JSESSIONID`` and pylxpweb's
+local expiry guess per exact cloud account (``CloudAccountKey``), encrypted at
+rest, so a restarted entry can resume the existing portal session instead.
+
+A restored cookie is validated lazily: the first real request proves it.  An
+expired or revoked cookie comes back as a login page or HTTP 401, which
+pylxpweb's reactive renewal already answers with one single-flight login and
+a replay.
+"""
 
 from __future__ import annotations
 
 import asyncio
+import base64
 from collections.abc import Awaitable
+from datetime import datetime, timedelta
+import hashlib
 import inspect
-from typing import Any, cast
+import logging
+import os
+from typing import TYPE_CHECKING, Any, cast
 
 import aiohttp
+from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+from homeassistant.helpers.storage import Store
+from yarl import URL
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .cloud_requests import CloudAccountKey
+
+_LOGGER = logging.getLogger(__name__)
+
+CLOUD_SESSION_STORAGE_VERSION = 1
+CLOUD_SESSION_STORAGE_KEY = "eg4_web_monitor_cloud_sessions"
+_CLOUD_SESSION_CACHE = "eg4_web_monitor_cloud_session_cache"
+_SESSION_COOKIE = "JSESSIONID"
+_SESSION_SAVE_DELAY = 10  # seconds
+# A cookie this close to pylxpweb's local expiry guess would be renewed on
+# the very first request anyway; restoring it saves nothing.
+_SESSION_RESTORE_MARGIN = timedelta(minutes=5)
+_SESSION_KDF_INFO = b"eg4_web_monitor cloud session"
 
 
 async def _async_drain_awaitable(awaitable: Awaitable[Any]) -> None:
@@ -59,3 +99,170 @@ async def async_close_client_session(
         # account-private CookieJar after dependency-owned work has stopped.
         if session is not None and not session.closed:
             session.detach()
+
+
+def _session_expiry(client: object | None) -> datetime | None:
+    """Return pylxpweb's local session-expiry guess, if this client has one."""
+    expires = getattr(client, "_session_expires", None)
+    return expires if isinstance(expires, datetime) else None
+
+
+def read_session_cookie(session: aiohttp.ClientSession, base_url: str) -> str | None:
+    """Return the portal session cookie held in one private cookie jar."""
+    if session.closed:
+        return None
+    morsel = session.cookie_jar.filter_cookies(URL(base_url)).get(_SESSION_COOKIE)
+    if morsel is None or not morsel.value:
+        return None
+    return morsel.value
+
+
+def write_session_cookie(
+    session: aiohttp.ClientSession, base_url: str, value: str
+) -> None:
+    """Seed one private cookie jar with an existing portal session cookie."""
+    session.cookie_jar.update_cookies(
+        {_SESSION_COOKIE: value}, response_url=URL(base_url)
+    )
+
+
+def _record_id(key: CloudAccountKey) -> str:
+    """Return a stable, non-identifying storage id for an exact account."""
+    username, base_url, verify_ssl = key
+    material = "\0".join((username, base_url, "1" if verify_ssl else "0"))
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+def _fernet(password: str, salt: bytes) -> Fernet:
+    """Derive the per-record cipher from the account password.
+
+    The password already lives in the config entry, so a slow password KDF
+    buys nothing here; HKDF keeps derivation cheap on the event loop while the
+    random salt keeps every saved record under a distinct key.
+    """
+    key = HKDF(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=salt,
+        info=_SESSION_KDF_INFO,
+    ).derive(password.encode())
+    return Fernet(base64.urlsafe_b64encode(key))
+
+
+class CloudSessionCache:
+    """HA-local, encrypted-at-rest cache of authenticated portal sessions.
+
+    One instance lives in ``hass.data`` and owns one private ``Store``; every
+    config entry on the same exact account reads and refreshes the same
+    record.  Records are keyed by a hash of ``CloudAccountKey`` and hold the
+    cookie encrypted with a key derived from the account password, so a
+    password change (reauth) makes an old record undecryptable and it is
+    simply ignored.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._store = Store[dict[str, dict[str, str]]](
+            hass,
+            CLOUD_SESSION_STORAGE_VERSION,
+            CLOUD_SESSION_STORAGE_KEY,
+            private=True,
+        )
+        self._records: dict[str, dict[str, str]] | None = None
+        self._load_lock = asyncio.Lock()
+
+    async def _async_records(self) -> dict[str, dict[str, str]]:
+        """Load the stored records once per Home Assistant run."""
+        async with self._load_lock:
+            if self._records is None:
+                stored = await self._store.async_load()
+                self._records = stored if isinstance(stored, dict) else {}
+            return self._records
+
+    def _schedule_save(self) -> None:
+        """Coalesce record changes into one delayed private write."""
+        self._store.async_delay_save(lambda: self._records or {}, _SESSION_SAVE_DELAY)
+
+    async def async_restore(
+        self,
+        key: CloudAccountKey,
+        password: str,
+        client: object,
+        session: aiohttp.ClientSession,
+    ) -> bool:
+        """Seed a fresh client/cookie jar with the saved account session.
+
+        Returns True when a still-plausible session was restored.  Nothing is
+        restored when the installed pylxpweb does not expose its session
+        expiry, so an unknown client never skips its own login.
+        """
+        # Load even when nothing can be restored: ``remember`` only saves
+        # into an already loaded record set.
+        records = await self._async_records()
+        if not hasattr(client, "_session_expires"):
+            return False
+        record = records.get(_record_id(key))
+        if not isinstance(record, dict):
+            return False
+        try:
+            expires = datetime.fromisoformat(record["expires"])
+            salt = base64.b64decode(record["salt"])
+            cookie = (
+                _fernet(password, salt).decrypt(record["token"].encode()).decode()
+            )
+        except (KeyError, TypeError, ValueError, InvalidToken):
+            _LOGGER.debug("Ignoring unusable saved cloud session")
+            return False
+        if datetime.now(expires.tzinfo) + _SESSION_RESTORE_MARGIN >= expires:
+            return False
+
+        write_session_cookie(session, key[1], cookie)
+        setattr(client, "_session_expires", expires)
+        _LOGGER.debug("Restored saved cloud session valid until %s", expires)
+        return True
+
+    def remember(
+        self,
+        key: CloudAccountKey,
+        password: str,
+        client: object | None,
+        session: aiohttp.ClientSession | None,
+    ) -> None:
+        """Save the client's current session when a login has renewed it.
+
+        Cheap on every cycle: the cookie is only read and encrypted when
+        pylxpweb's expiry stamp differs from the saved one, i.e. after a login.
+        """
+        records = self._records
+        expires = _session_expiry(client)
+        if records is None or expires is None or session is None or session.closed:
+            return
+        record_id = _record_id(key)
+        stamp = expires.isoformat()
+        previous = records.get(record_id)
+        if isinstance(previous, dict) and previous.get("expires") == stamp:
+            return
+        cookie = read_session_cookie(session, key[1])
+        if cookie is None:
+            return
+        salt = os.urandom(16)
+        records[record_id] = {
+            "expires": stamp,
+            "salt": base64.b64encode(salt).decode(),
+            "token": _fernet(password, salt).encrypt(cookie.encode()).decode(),
+        }
+        self._schedule_save()
+
+    async def async_forget(self, key: CloudAccountKey) -> None:
+        """Drop an account's saved session (rejected credentials, removal)."""
+        records = await self._async_records()
+        if records.pop(_record_id(key), None) is not None:
+            self._schedule_save()
+
+
+def get_cloud_session_cache(hass: HomeAssistant) -> CloudSessionCache:
+    """Return the Home Assistant-scoped cloud session cache."""
+    cache = hass.data.get(_CLOUD_SESSION_CACHE)
+    if not isinstance(cache, CloudSessionCache):
+        cache = CloudSessionCache(hass)
+        hass.data[_CLOUD_SESSION_CACHE] = cache
+    return cache
@@ -38,8 +38,10 @@ from .config_keys import (
     # Configuration keys
     CONF_BASE_URL,
     CONF_CHARGE_CONTROL_MODE,
+    CONF_CLOUD_REQUEST_BUDGET,
     CONF_CONNECTION_TYPE,
     CONF_DATA_VALIDATION,
+    CONF_WIRE_TRACE,
     CONF_DISCHARGE_CONTROL_MODE,
     CONF_DONGLE_HOST,
     CONF_DONGLE_PORT,
@@ -92,6 +94,7 @@ from .config_keys import (
     HYBRID_LOCAL_DONGLE,
     HYBRID_LOCAL_MODBUS,
     # Default values
+    DEFAULT_CLOUD_REQUEST_BUDGET,
     DEFAULT_DONGLE_PORT,
     DEFAULT_DONGLE_TIMEOUT,
     DEFAULT_DONGLE_UPDATE_INTERVAL,
@@ -109,6 +112,7 @@ from .config_keys import (
     DEFAULT_SERIAL_TIMEOUT,
     DEFAULT_SENSOR_UPDATE_INTERVAL_HTTP,
     DEFAULT_SENSOR_UPDATE_INTERVAL_LOCAL,
+    MAX_CLOUD_REQUEST_BUDGET,
     MAX_DONGLE_UPDATE_INTERVAL,
     MAX_HTTP_POLLING_INTERVAL,
     MAX_MODBUS_UPDATE_INTERVAL,
@@ -357,8 +361,10 @@ __all__ = [
     "MANUFACTURER",
     # Configuration keys
     "CONF_BASE_URL",
+    "CONF_CLOUD_REQUEST_BUDGET",
     "CONF_CONNECTION_TYPE",
     "CONF_DATA_VALIDATION",
+    "CONF_WIRE_TRACE",
     "CONF_DONGLE_HOST",
     "CONF_DONGLE_PORT",
     "CONF_DONGLE_SERIAL",
@@ -401,6 +407,7 @@ __all__ = [
     "HYBRID_LOCAL_DONGLE",
     "HYBRID_LOCAL_MODBUS",
     # Default values
+    "DEFAULT_CLOUD_REQUEST_BUDGET",
     "DEFAULT_DONGLE_PORT",
     "DEFAULT_DONGLE_TIMEOUT",
     "DEFAULT_DONGLE_UPDATE_INTERVAL",
@@ -418,6 +425,7 @@ __all__ = [
     "DEFAULT_SERIAL_TIMEOUT",
     "DEFAULT_SENSOR_UPDATE_INTERVAL_HTTP",
     "DEFAULT_SENSOR_UPDATE_INTERVAL_LOCAL",
+    "MAX_CLOUD_REQUEST_BUDGET",
     "MAX_DONGLE_UPDATE_INTERVAL",
     "MAX_HTTP_POLLING_INTERVAL",
     "MAX_MODBUS_UPDATE_INTERVAL",
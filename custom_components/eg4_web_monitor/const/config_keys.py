@@ -21,6 +21,7 @@ CONF_PLANT_NAME = "plant_name"
 CONF_DST_SYNC = "dst_sync"
 CONF_LIBRARY_DEBUG = "library_debug"
 CONF_DATA_VALIDATION = "data_validation"
+CONF_WIRE_TRACE = "wire_trace"  # record raw device data per cycle (wire_trace.py)
 
 # Battery control regime: whether charge/discharge limits are governed by
 # State-of-Charge (closed-loop) or battery Voltage (open-loop). Backed by the
@@ -40,6 +41,7 @@ DEFAULT_CONTROL_MODE = CONTROL_MODE_SOC
 # Options flow configuration keys (configurable via UI after setup)
 CONF_SENSOR_UPDATE_INTERVAL = "sensor_update_interval"
 CONF_HTTP_POLLING_INTERVAL = "http_polling_interval"
+CONF_CLOUD_REQUEST_BUDGET = "cloud_request_budget"  # requests/hour, 0 = off
 CONF_PARAMETER_REFRESH_INTERVAL = "parameter_refresh_interval"
 CONF_INCLUDE_AC_COUPLE_PV = "include_ac_couple_pv"  # Add AC couple power to PV totals
 
@@ -153,6 +155,12 @@ DEFAULT_HTTP_POLLING_INTERVAL = 120  # seconds
 MIN_HTTP_POLLING_INTERVAL = 60  # seconds — prevent cloud over-polling
 MAX_HTTP_POLLING_INTERVAL = 600  # seconds (10 minutes)
 
+# Hourly cloud request budget per entry. When set, the HTTP polling interval
+# and supplemental side-fetch throttles stretch (up to MAX_HTTP_POLLING_INTERVAL)
+# as the client's last-hour request count nears it. 0 keeps the fixed interval.
+DEFAULT_CLOUD_REQUEST_BUDGET = 0
+MAX_CLOUD_REQUEST_BUDGET = 3600  # requests/hour
+
 # Modbus default values
 DEFAULT_MODBUS_PORT = 502
 DEFAULT_MODBUS_UNIT_ID = 1
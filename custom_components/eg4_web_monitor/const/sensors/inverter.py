@@ -2589,4 +2589,14 @@ SENSOR_TYPES = {
         "state_class": "measurement",
         "icon": "mdi:timer-sand",
     },
+    # Rolling p95 of the per-cycle poll time of one device. Sourced from the
+    # coordinator's cycle profiler — see EG4PollTimeSensor.
+    "poll_time": {
+        "name": "Poll Time (p95)",
+        "unit": UnitOfTime.MILLISECONDS,
+        "state_class": "measurement",
+        "icon": "mdi:timer-outline",
+        "entity_category": EntityCategory.DIAGNOSTIC,
+        "enabled_default": False,
+    },
 }
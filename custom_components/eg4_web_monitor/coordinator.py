@@ -6,7 +6,9 @@ from dataclasses import dataclass
 import logging
 import time
 from datetime import datetime, timedelta
+from pathlib import Path
 from collections.abc import Awaitable, Callable, Collection, Mapping
+from contextlib import AbstractContextManager, nullcontext
 from typing import TYPE_CHECKING, Any, NoReturn, cast
 
 import aiohttp
@@ -37,6 +39,7 @@ from .const import (
     BLOCK_SIZE_PRESET_REGISTERS,
     CONF_BASE_URL,
     CONF_CHARGE_CONTROL_MODE,
+    CONF_CLOUD_REQUEST_BUDGET,
     CONF_CONNECTION_TYPE,
     CONF_DATA_VALIDATION,
     CONF_DISCHARGE_CONTROL_MODE,
@@ -44,6 +47,7 @@ from .const import (
     CONF_MODBUS_BLOCK_SIZE,
     CONTROL_MODE_SOC,
     CONTROL_MODE_VOLTAGE,
+    DEFAULT_CLOUD_REQUEST_BUDGET,
     DEFAULT_CONTROL_MODE,
     DEFAULT_BASE_URL,
     DEFAULT_MODBUS_BLOCK_SIZE,
@@ -67,6 +71,7 @@ from .const import (
     CONF_PLANT_ID,
     CONF_SENSOR_UPDATE_INTERVAL,
     CONF_VERIFY_SSL,
+    CONF_WIRE_TRACE,
     CONNECTION_TYPE_DONGLE,
     CONNECTION_TYPE_HTTP,
     CONNECTION_TYPE_HYBRID,
@@ -86,19 +91,32 @@ from .const import (
     DOMAIN,
     HYBRID_LOCAL_DONGLE,
     HYBRID_LOCAL_MODBUS,
+    MAX_HTTP_POLLING_INTERVAL,
 )
+from .adaptive_polling import AdaptivePollingController
 from .battery_migration import async_migrate_battery_keys
+from .battery_record import BatteryRecord
 from .bus_eligibility import evaluate_bus_owner_eligibility
 from .cloud_requests import (
     CloudRequestLimiter,
+    SharedCloudAccount,
     SharedCloudRequestBudget,
     SharedFirmwareStatusFlight,
+    acquire_shared_cloud_account,
     acquire_shared_cloud_request_budget,
     acquire_shared_firmware_status,
+    cloud_account_key,
     install_cloud_request_limiter,
+    release_shared_cloud_account,
     release_shared_cloud_request_budget,
 )
-from .cloud_session import async_close_client_session
+from .cloud_session import (
+    CloudSessionCache,
+    async_close_client_session,
+    get_cloud_session_cache,
+    read_session_cookie,
+    write_session_cookie,
+)
 from .device_removal import (
     assess_discovery_completeness,
     record_provided_identifiers,
@@ -108,7 +126,12 @@ from .coordinator_mappings import (
     _derive_model_from_family,
 )
 from .coordinator_http import HTTPUpdateMixin
-from .coordinator_local import LocalTransportMixin
+from .coordinator_local import (
+    LocalTransportMixin,
+    _ParallelGroupMemo,
+    _ParallelMemberShare,
+    _TransportSensorMemo,
+)
 from .coordinator_mixins import (
     AC_COUPLE_SOC_STORE,
     SMART_LOAD_STORE,
@@ -122,11 +145,23 @@ from .coordinator_mixins import (
     is_transport_link_down as _device_transport_link_down,
 )
 from .const.sensors import SENSOR_TYPES
+from .cycle_profiler import (
+    COORDINATOR_SCOPE,
+    PHASE_CYCLE,
+    PHASE_DATA_DIFF,
+    PHASE_DEVICE_REMOVAL,
+    PHASE_LISTENER_FANOUT,
+    CycleProfiler,
+)
 from .endpoint_bus import (
     EndpointBusCapability,
     get_endpoint_bus_registry,
 )
+from .event_log import EventLogCache
+from .link_probe import LinkHealthProbe
+from .month_chart_cache import MonthChartCache
 from .utils import async_write_with_cloud_fallback
+from .wire_trace import WIRE_TRACE_FILE_NAME, WireTraceRecorder
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -282,6 +317,12 @@ def listener_changed_device_items(
     return [(serial, devices[serial]) for serial in sorted(changed_serials)]
 
 
+# Normalized interval-gate key -> (last-poll timestamp attr, interval attr).
+_POLL_GATE_ATTRS: dict[str, tuple[str, str]] = {
+    "modbus": ("_last_modbus_poll", "_modbus_interval"),
+    "wifi_dongle": ("_last_dongle_poll", "_dongle_interval"),
+}
+
 PV_STRING_LIFETIME_STORAGE_VERSION = 1
 PV_STRING_LIFETIME_STORAGE_KEY = f"{DOMAIN}_pv_string_lifetime"
 
@@ -319,6 +360,14 @@ class EG4DataUpdateCoordinator(
     - FirmwareUpdateMixin: Firmware update information extraction
     """
 
+    # Class-level defaults so coordinators built without __init__ (tests)
+    # record no cycle timings and no wire trace, and cache no month charts
+    # or event logs.
+    cycle_profiler: CycleProfiler | None = None
+    _wire_trace: WireTraceRecorder | None = None
+    month_chart_cache: MonthChartCache | None = None
+    event_log: EventLogCache | None = None
+
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize the coordinator."""
         self.entry = entry
@@ -342,6 +391,7 @@ class EG4DataUpdateCoordinator(
         self._cloud_request_limiter: CloudRequestLimiter | None = None
         self._cloud_request_budget: SharedCloudRequestBudget | None = None
         self._cloud_request_budget_released = True
+        self._shared_cloud_account: SharedCloudAccount | None = None
         self._cloud_session: aiohttp.ClientSession | None = None
         cloud_base_url = entry.data.get(CONF_BASE_URL, DEFAULT_BASE_URL)
         cloud_verify_ssl = entry.data.get(CONF_VERIFY_SSL, DEFAULT_VERIFY_SSL)
@@ -370,6 +420,18 @@ class EG4DataUpdateCoordinator(
                 self._cloud_session = None
                 raise
 
+        # Restart persistence for the authenticated portal session
+        # (cloud_session.CloudSessionCache). The saved cookie is restored once,
+        # at the start of the first update cycle, so setup stays free of
+        # storage I/O until the entry actually talks to the portal.
+        self._cloud_account_key = cloud_account_key(
+            str(entry.data.get(CONF_USERNAME, "")), cloud_base_url, cloud_verify_ssl
+        )
+        self._cloud_session_cache: CloudSessionCache | None = (
+            get_cloud_session_cache(hass) if self.client is not None else None
+        )
+        self._cloud_session_restore_pending = self.client is not None
+
         # Modbus input-register read block size (#254): preset option mapped
         # to pylxpweb's max registers per coalesced read. Conservative (40)
         # keeps the plain grouped reads; Fast (120) consolidates them on
@@ -384,6 +446,18 @@ class EG4DataUpdateCoordinator(
         self._endpoint_bus_registry = get_endpoint_bus_registry(hass)
         self._bus_capabilities: set[EndpointBusCapability] = set()
         self._bus_capability_configs: dict[EndpointBusCapability, TransportConfig] = {}
+        # Rolling per-phase cycle timings (Poll Time sensors, diagnostics).
+        self.cycle_profiler = CycleProfiler()
+        # Month-chart responses shared by the PV string side-fetch and the
+        # historical import.
+        self.month_chart_cache = MonthChartCache()
+        # Per-device event buffers behind Last Event and fetch_events.
+        self.event_log = EventLogCache(hass, entry.entry_id)
+        # Opt-in recording of each cycle's raw device data (wire_trace.py).
+        if entry.options.get(CONF_WIRE_TRACE, False):
+            self._wire_trace = WireTraceRecorder(
+                Path(hass.config.path(WIRE_TRACE_FILE_NAME))
+            )
 
         # Initialize local transports from local_transports list (new format)
         # or fall back to flat keys (old format for backward compatibility)
@@ -466,6 +540,10 @@ class EG4DataUpdateCoordinator(
         # Serials with an open transport_link_down Repairs issue (eg4-57g):
         # one-shot per down transition, cleared when the link recovers.
         self._link_down_notified: set[str] = set()
+        # Recovery probes for devices whose link is down, keyed by serial:
+        # a dead link gets a backed-off single-register read, not a full
+        # refresh, every cycle.
+        self._link_probes: dict[str, LinkHealthProbe] = {}
 
         # Parameter refresh tracking - read from options or use default
         self._last_parameter_refresh: datetime | None = None
@@ -561,6 +639,7 @@ class EG4DataUpdateCoordinator(
             f"{PV_STRING_LIFETIME_STORAGE_KEY}_{entry.entry_id}",
         )
         self._pv_string_lifetime_store_lock = asyncio.Lock()
+        self._pv_string_lifetime_dirty = False
 
         # Per-serial Quick Charge duration preference (minutes), set via the
         # Quick Charge Duration number entity. Defaults to
@@ -592,8 +671,9 @@ class EG4DataUpdateCoordinator(
         # fixed register slots (5002+) on each CAN bus poll.  We accumulate
         # readings keyed by battery serial so that all batteries eventually
         # appear as entities regardless of which slot they occupied.
-        # Outer key = inverter serial, inner key = battery serial.
-        self._battery_rr_cache: dict[str, dict[str, dict[str, Any]]] = {}
+        # Outer key = inverter serial, inner key = battery serial; values are
+        # compact BatteryRecords, shared with the published data.
+        self._battery_rr_cache: dict[str, dict[str, BatteryRecord]] = {}
         # Legacy positional key shadow: battery serial → "inverter-NN" key in
         # first-seen order — the exact assignment the pre-#252 LOCAL path used.
         # Kept only so existing registry entries can be migrated to the
@@ -642,6 +722,16 @@ class EG4DataUpdateCoordinator(
         # primary.  This set tracks serials we've already logged about (one-shot).
         self._shared_battery_logged: set[str] = set()
 
+        # Mapped transport sensors per inverter serial, reused while pylxpweb
+        # keeps serving the same runtime/energy/battery objects.
+        self._transport_sensor_memo: dict[str, _TransportSensorMemo] = {}
+
+        # Local parallel-group inputs: per-member shares keyed by serial and
+        # the inputs of each published group record, so groups whose members
+        # were not polled this tick are neither re-read nor rebuilt.
+        self._parallel_member_shares: dict[str, _ParallelMemberShare] = {}
+        self._parallel_group_memo: dict[str, _ParallelGroupMemo] = {}
+
         # Track whether local parameters have been loaded (deferred from first refresh
         # to avoid Modbus traffic overload during HA setup timeout window)
         self._local_parameters_loaded: bool = False
@@ -709,9 +799,39 @@ class EG4DataUpdateCoordinator(
         self._last_modbus_poll: float | None = None
         self._last_dongle_poll: float | None = None
 
+        # LOCAL wakes when the next transport gate is due instead of at a
+        # fixed fastest-transport cadence; ticks on which no gate is due
+        # skip the publish pipeline entirely (_local_tick_is_idle).  An
+        # unknown transport type has no gate and polls on every tick, so it
+        # keeps the fixed cadence.
+        self._local_tick_scheduling: bool = (
+            self.connection_type == CONNECTION_TYPE_LOCAL
+            and bool(self._local_transport_configs)
+            and all(
+                self._poll_gate_key(config.get("transport_type", "modbus_tcp"))
+                in _POLL_GATE_ATTRS
+                for config in self._local_transport_configs
+            )
+        )
+
         # Store HTTP polling interval for client cache alignment
         self._http_polling_interval: int = http_interval_seconds
 
+        # Budget-aware cadence (adaptive_polling): with an hourly request
+        # budget configured, the cloud interval and side-fetch throttles
+        # stretch as this client's last-hour request count nears it. The
+        # configured interval stays the floor.
+        cloud_request_budget = int(
+            entry.options.get(CONF_CLOUD_REQUEST_BUDGET, DEFAULT_CLOUD_REQUEST_BUDGET)
+        )
+        self._adaptive_polling: AdaptivePollingController | None = None
+        if self.client is not None and cloud_request_budget > 0:
+            self._adaptive_polling = AdaptivePollingController(
+                base_interval=http_interval_seconds,
+                max_interval=max(MAX_HTTP_POLLING_INTERVAL, http_interval_seconds),
+                budget=cloud_request_budget,
+            )
+
         # Daily API counter persistence — survives config entry reloads via
         # hass.data (client instance gets destroyed/recreated on reload).
         # On reload: offset = stored total, client starts at 0, coordinator
@@ -726,7 +846,8 @@ class EG4DataUpdateCoordinator(
 
         # Coordinator interval depends on connection type:
         # HTTP-only: runs at HTTP polling interval (no local transport)
-        # LOCAL with mixed transports: tick at fastest transport rate
+        # LOCAL with mixed transports: start at fastest transport rate; later
+        # ticks are rescheduled to the next due gate (_schedule_next_local_tick)
         # Other local modes: use sensor interval directly
         if self.connection_type == CONNECTION_TYPE_HTTP:
             update_interval = timedelta(seconds=http_interval_seconds)
@@ -780,6 +901,7 @@ class EG4DataUpdateCoordinator(
         # leaked an unreachable owner into hass.data after setup failed.
         if self.client is not None:
             budget: SharedCloudRequestBudget | None = None
+            account: SharedCloudAccount | None = None
             limiter: CloudRequestLimiter | None = None
             try:
                 firmware_endpoint = self.client.api.firmware
@@ -795,9 +917,28 @@ class EG4DataUpdateCoordinator(
                 # own nested gather() fanout. Bound the common request boundary
                 # so all plants on this exact account share three request
                 # chains across startup, parameters, and supplemental reads.
+                # Same-account entries also share one login and the plant
+                # listing it triggers; each keeps its private cookie jar and
+                # adopts a sibling's fresh session cookie instead of logging
+                # in again.
+                account = acquire_shared_cloud_account(
+                    hass,
+                    username=str(entry.data[CONF_USERNAME]),
+                    base_url=cloud_base_url,
+                    verify_ssl=cloud_verify_ssl,
+                )
+                account_session = cloud_session
+                account_base_url = self._cloud_account_key[1]
                 limiter = install_cloud_request_limiter(
                     self.client,
                     budget=budget,
+                    account=account,
+                    session_cookie=lambda: read_session_cookie(
+                        account_session, account_base_url
+                    ),
+                    adopt_session_cookie=lambda cookie: write_session_cookie(
+                        account_session, account_base_url, cookie
+                    ),
                 )
                 setattr(
                     firmware_endpoint,
@@ -816,6 +957,8 @@ class EG4DataUpdateCoordinator(
                     limiter.close()
                 if budget is not None:
                     release_shared_cloud_request_budget(hass, budget)
+                if account is not None:
+                    release_shared_cloud_account(hass, account)
                 remove_listener = self._shutdown_listener_remove
                 if remove_listener is not None:
                     try:
@@ -829,6 +972,7 @@ class EG4DataUpdateCoordinator(
             # This makes construction transactional without needing async
             # cleanup from this synchronous initializer.
             self._cloud_request_budget = budget
+            self._shared_cloud_account = account
             self._cloud_request_limiter = limiter
             self._cloud_request_budget_released = False
             self._firmware_status_flight = firmware_flight
@@ -856,14 +1000,45 @@ class EG4DataUpdateCoordinator(
             ConfigEntryAuthFailed: If authentication fails (always immediate).
             UpdateFailed: If connection or API errors occur after 3 consecutive failures.
         """
+        if self._local_tick_is_idle():
+            # No LOCAL transport gate is due: nothing can change, so skip the
+            # deep copy and diff of the whole plant and notify no one.
+            self._schedule_next_local_tick()
+            self._pending_listener_contexts = set()
+            return cast(dict[str, Any], self.data)
+        if self._wire_trace is not None:
+            # The previous cycle's records; written here so the file I/O
+            # never delays the listener fan-out of the cycle it describes.
+            await self._wire_trace.async_flush(self.hass)
+        profiler = self.cycle_profiler
+        if profiler is None:
+            return await self._async_run_update_cycle()
+        profiler.begin_cycle()
+        started = time.perf_counter()
+        try:
+            data = await self._async_run_update_cycle()
+        finally:
+            profiler.record(PHASE_CYCLE, time.perf_counter() - started)
+            profiler.end_cycle()
+        profiler.forget(set(data.get("devices", {})))
+        return data
+
+    async def _async_run_update_cycle(self) -> dict[str, Any]:
+        """Run one non-idle update cycle (see ``_async_update_data``)."""
+        diff_started = time.perf_counter()
         try:
             previous_data = deepcopy(self.data)
         except Exception:  # pragma: no cover - defensive for future opaque values
             previous_data = None
+        diff_seconds = time.perf_counter() - diff_started
         # Clear device_info caches at the start of each update cycle
         # so fresh data is used for any new entity registrations
         self.clear_device_info_caches()
 
+        if self._cloud_session_restore_pending:
+            self._cloud_session_restore_pending = False
+            await self._async_restore_cloud_session()
+
         try:
             data = await self._route_update_by_connection_type()
             # A write can be acknowledged after one endpoint's parameter read
@@ -871,6 +1046,8 @@ class EG4DataUpdateCoordinator(
             # retained seeds at the final no-await publish boundary too.
             self._overlay_parameter_write_seeds(data)
             self._consecutive_update_failures = 0
+            self._remember_cloud_session()
+            self._forget_departed_local_devices(data.get("devices", {}))
 
             # On startup (no prior cache), suppress 0 values for
             # total_increasing sensors.  These zeros are not real readings —
@@ -887,9 +1064,15 @@ class EG4DataUpdateCoordinator(
                         if key in sensors and sensors[key] == 0:
                             sensors[key] = None
 
+            diff_started = time.perf_counter()
             self._pending_listener_contexts = _listener_contexts_for_data_change(
                 previous_data, data
             )
+            if (profiler := self.cycle_profiler) is not None:
+                profiler.record(
+                    PHASE_DATA_DIFF,
+                    diff_seconds + time.perf_counter() - diff_started,
+                )
 
             # Stamp the per-device-removal observation ledger with this
             # cycle's provided identifiers, gated by whether discovery was
@@ -901,10 +1084,11 @@ class EG4DataUpdateCoordinator(
             # the data update every sensor depends on, and clearing the
             # clocks fails safe (deletion refused) rather than open.
             try:
-                device_list_ok, battery_ok = await assess_discovery_completeness(
-                    self, data
-                )
-                record_provided_identifiers(self, data, device_list_ok, battery_ok)
+                with self._profile_span(PHASE_DEVICE_REMOVAL):
+                    device_list_ok, battery_ok = await assess_discovery_completeness(
+                        self, data
+                    )
+                    record_provided_identifiers(self, data, device_list_ok, battery_ok)
             except Exception:  # noqa: BLE001
                 self._removal_device_observed_since = None
                 self._removal_battery_observed_since = None
@@ -917,6 +1101,8 @@ class EG4DataUpdateCoordinator(
 
             return data
         except ConfigEntryAuthFailed:
+            if self._cloud_session_cache is not None:
+                await self._cloud_session_cache.async_forget(self._cloud_account_key)
             raise
         except UpdateFailed as err:
             self._consecutive_update_failures += 1
@@ -959,13 +1145,14 @@ class EG4DataUpdateCoordinator(
         self._active_listener_contexts = None if notify_all else contexts
         selected_contexts = contexts if contexts is not None else set()
         try:
-            for update_callback, context in list(self._listeners.values()):
-                if (
-                    notify_all
-                    or not isinstance(context, _ListenerContext)
-                    or context in selected_contexts
-                ):
-                    update_callback()
+            with self._profile_span(PHASE_LISTENER_FANOUT, COORDINATOR_SCOPE):
+                for update_callback, context in list(self._listeners.values()):
+                    if (
+                        notify_all
+                        or not isinstance(context, _ListenerContext)
+                        or context in selected_contexts
+                    ):
+                        update_callback()
         finally:
             self._last_listener_update_success = self.last_update_success
             self._pending_listener_contexts = None
@@ -996,7 +1183,10 @@ class EG4DataUpdateCoordinator(
         if self.connection_type == CONNECTION_TYPE_HYBRID:
             return await self._async_update_hybrid_data()
         if self.connection_type == CONNECTION_TYPE_LOCAL:
-            return await self._async_update_local_data()
+            try:
+                return await self._async_update_local_data()
+            finally:
+                self._schedule_next_local_tick()
         # Default to HTTP
         return await self._async_update_http_data()
 
@@ -1069,8 +1259,63 @@ class EG4DataUpdateCoordinator(
             )
         return client
 
+    async def _async_restore_cloud_session(self) -> None:
+        """Resume the account's saved portal session instead of logging in.
+
+        Best-effort: any storage or decoding problem leaves the client to its
+        normal login, which is exactly the behaviour without a saved session.
+        """
+        cache = self._cloud_session_cache
+        if cache is None or self.client is None or self._cloud_session is None:
+            return
+        try:
+            await cache.async_restore(
+                self._cloud_account_key,
+                str(self.entry.data.get(CONF_PASSWORD, "")),
+                self.client,
+                self._cloud_session,
+            )
+        except Exception:  # noqa: BLE001
+            _LOGGER.debug("Could not restore saved cloud session", exc_info=True)
+
+    def _remember_cloud_session(self) -> None:
+        """Save a renewed portal session for the next restart or reload."""
+        cache = self._cloud_session_cache
+        if cache is None:
+            return
+        try:
+            cache.remember(
+                self._cloud_account_key,
+                str(self.entry.data.get(CONF_PASSWORD, "")),
+                self.client,
+                self._cloud_session,
+            )
+        except Exception:  # noqa: BLE001
+            _LOGGER.debug("Could not save cloud session", exc_info=True)
+
+    def _profile_span(
+        self, phase: str, device: str | None = None, *, exclude: str | None = None
+    ) -> AbstractContextManager[None]:
+        """Time ``phase`` for ``device`` (default: the current device scope)."""
+        profiler = self.cycle_profiler
+        if profiler is None:
+            return nullcontext()
+        return profiler.span(phase, device, exclude=exclude)
+
+    def _profile_wire(
+        self, device: str, transport: Any
+    ) -> AbstractContextManager[None]:
+        """Time a wire operation of ``device``, split into gate wait and read."""
+        profiler = self.cycle_profiler
+        if profiler is None:
+            return nullcontext()
+        return profiler.wire_span(device, transport)
+
     async def _async_close_cloud_session(self) -> None:
         """Stop dependency-owned work, then detach the injected session."""
+        # Capture the live cookie before detaching drops this private jar; a
+        # reload then resumes the same portal session instead of logging in.
+        self._remember_cloud_session()
         cloud_session = self._cloud_session
         self._cloud_session = None
         await async_close_client_session(self.client, cloud_session)
@@ -1080,14 +1325,34 @@ class EG4DataUpdateCoordinator(
         try:
             await super()._async_handle_shutdown(event)
         finally:
-            await self._async_close_cloud_session()
+            try:
+                await self._async_close_cloud_session()
+            finally:
+                await self._async_flush_pending_state()
 
     async def async_shutdown(self) -> None:
-        """Shut down the coordinator and release its cookie-bearing session."""
+        """Shut down the coordinator, release the session, flush pending state."""
         try:
             await super().async_shutdown()
         finally:
-            await self._async_close_cloud_session()
+            try:
+                await self._async_close_cloud_session()
+            finally:
+                await self._async_flush_pending_state()
+
+    async def _async_flush_pending_state(self) -> None:
+        """Write delayed-save state now instead of losing it on stop."""
+        try:
+            await self._async_flush_pv_string_lifetime_state()
+        finally:
+            try:
+                if self.event_log is not None:
+                    await self.event_log.async_flush()
+            finally:
+                if self._wire_trace is not None:
+                    # The last cycle's records are otherwise only written
+                    # at the start of the next cycle.
+                    await self._wire_trace.async_flush(self.hass)
 
     async def refresh_inverter_params_if_linked(self, serial: str) -> None:
         """Refresh a device's parameters after a cloud write, unless link is down.
@@ -1443,11 +1708,7 @@ class EG4DataUpdateCoordinator(
         Updates the timestamp when returning True.
         """
         gate_key = self._poll_gate_key(transport_type)
-        interval_map: dict[str, tuple[str, str]] = {
-            "modbus": ("_last_modbus_poll", "_modbus_interval"),
-            "wifi_dongle": ("_last_dongle_poll", "_dongle_interval"),
-        }
-        attrs = interval_map.get(gate_key)
+        attrs = _POLL_GATE_ATTRS.get(gate_key)
         if attrs is None:
             return True  # Unknown type: always poll
 
@@ -1462,6 +1723,31 @@ class EG4DataUpdateCoordinator(
         setattr(self, ts_attr, now)
         return True
 
+    def _seconds_until_transport_poll(self) -> float:
+        """Return seconds until the earliest configured transport gate opens.
+
+        Read-only counterpart of ``_should_poll_transport``: nothing is
+        stamped.  ``0.0`` means at least one gate is already due (including
+        a gate that has never fired).  Unknown transport types have no gate
+        and are skipped; they also keep ``_local_tick_scheduling`` off.
+        """
+        now = time.monotonic()
+        wait: float | None = None
+        for config in self._local_transport_configs:
+            gate_key = self._poll_gate_key(config.get("transport_type", "modbus_tcp"))
+            attrs = _POLL_GATE_ATTRS.get(gate_key)
+            if attrs is None:
+                continue
+            ts_attr, interval_attr = attrs
+            last_poll: float | None = getattr(self, ts_attr)
+            if last_poll is None:
+                return 0.0
+            gate_wait = last_poll + getattr(self, interval_attr) - now
+            if gate_wait <= 0:
+                return 0.0
+            wait = gate_wait if wait is None else min(wait, gate_wait)
+        return wait or 0.0
+
     def _suppress_battery_migration(
         self, inverter_serial: str, reason: str, *, level: int = logging.INFO
     ) -> None:
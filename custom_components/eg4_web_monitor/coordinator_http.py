@@ -31,6 +31,7 @@ from pylxpweb.exceptions import (
     LuxpowerConnectionError,
 )
 
+from .adaptive_polling import AdaptivePollingController
 from .const import (
     CONF_INCLUDE_AC_COUPLE_PV,
     CONNECTION_TYPE_HTTP,
@@ -50,6 +51,14 @@ from .coordinator_mixins import (
     compute_total_inverter_power_kw,
     is_transport_link_down,
 )
+from .cycle_profiler import (
+    COORDINATOR_SCOPE,
+    PHASE_MAPPING,
+    PHASE_PARALLEL_GROUPS,
+    PHASE_SIDE_FETCH,
+    PHASE_WIRE_READ,
+    CycleProfiler,
+)
 from .utils import battery_row_is_absent, cloud_battery_key
 
 _LOGGER = logging.getLogger(__name__)
@@ -111,6 +120,10 @@ def _maybe_bust_degraded_cloud_cache(
 class HTTPUpdateMixin(_MixinBase):
     """Mixin providing HTTP/cloud data update methods for the coordinator."""
 
+    # Class-level default so coordinators built without __init__ (tests) keep
+    # the fixed configured cadence.
+    _adaptive_polling: AdaptivePollingController | None = None
+
     def _align_client_cache_with_http_interval(self) -> None:
         """Set client cache TTLs to match HTTP polling interval.
 
@@ -132,6 +145,38 @@ class HTTPUpdateMixin(_MixinBase):
         ):
             self.client._cache_ttl_config[key] = http_ttl
 
+    def _adapt_http_polling_interval(self) -> None:
+        """Stretch or relax the cloud cadence against the hourly budget.
+
+        Applies the controller's interval to the coordinator (HTTP-only, where
+        the coordinator ticks at the cloud rate), to the client cache TTLs,
+        and — through ``_sidefetch_interval_scale`` — to the supplemental
+        side-fetch throttles.
+        """
+        controller = self._adaptive_polling
+        if controller is None or self.client is None:
+            return
+        open_until = self._sidefetch_open_until
+        interval = controller.update(
+            self.client.api_requests_last_hour,
+            breaker_open=open_until is not None and _time.monotonic() < open_until,
+        )
+        self._sidefetch_interval_scale = controller.scale
+        if interval == self._http_polling_interval:
+            return
+        _LOGGER.info(
+            "Cloud polling interval %ss -> %ss (%d requests in the last hour, "
+            "budget %d/hour)",
+            self._http_polling_interval,
+            interval,
+            self.client.api_requests_last_hour,
+            controller.budget,
+        )
+        self._http_polling_interval = interval
+        if self.connection_type == CONNECTION_TYPE_HTTP:
+            self.update_interval = timedelta(seconds=interval)
+        self._align_client_cache_with_http_interval()
+
     def _should_poll_hybrid_local(self) -> bool:
         """Check if the dongle transport interval has elapsed for MID refresh.
 
@@ -219,12 +264,13 @@ class HTTPUpdateMixin(_MixinBase):
 
         # Fast path: no local transports → concurrent HTTP is safe
         if not self._local_transports_attached:
-            if include_mid:
-                await self.station.refresh_all_data()
-            else:
-                tasks = [inv.refresh() for inv in self.station.all_inverters]
-                if tasks:
-                    await asyncio.gather(*tasks, return_exceptions=True)
+            with self._profile_span(PHASE_WIRE_READ, COORDINATOR_SCOPE):
+                if include_mid:
+                    await self.station.refresh_all_data()
+                else:
+                    tasks = [inv.refresh() for inv in self.station.all_inverters]
+                    if tasks:
+                        await asyncio.gather(*tasks, return_exceptions=True)
             return
 
         # Group devices by transport endpoint for serialized access
@@ -250,23 +296,32 @@ class HTTPUpdateMixin(_MixinBase):
         async def _refresh_group_sequentially(devices: list[Any]) -> None:
             """Refresh devices on the same endpoint one at a time.
 
-            A device whose attached transport link is DOWN (eg4-57g) still
-            refreshes every cycle — the refresh probes the dead link (so
-            recovery can happen) and falls back to the cloud inside
-            pylxpweb.  Its per-device cloud caches are busted (throttled to
-            the HTTP interval) so the fallback serves moving values instead
-            of interval-aligned stale cache.
+            A device whose attached transport link is DOWN (eg4-57g) falls
+            back to the cloud inside pylxpweb's refresh.  Its per-device
+            cloud caches are busted (throttled to the HTTP interval) so the
+            fallback serves moving values instead of interval-aligned stale
+            cache.  Between busts the refresh would only re-serve the same
+            cached cloud values while walking into the dead link, so it runs
+            only when the cache was busted or a backed-off single-register
+            link probe answered (recovery).
             """
             for device in devices:
                 try:
-                    if is_transport_link_down(device):
-                        _maybe_bust_degraded_cloud_cache(
-                            self.client,
-                            self._last_degraded_cloud_refresh,
-                            self._http_polling_interval,
-                            str(getattr(device, "serial_number", "?")),
-                        )
-                    await device.refresh()
+                    serial = str(getattr(device, "serial_number", "?"))
+                    busted = is_transport_link_down(
+                        device
+                    ) and _maybe_bust_degraded_cloud_cache(
+                        self.client,
+                        self._last_degraded_cloud_refresh,
+                        self._http_polling_interval,
+                        serial,
+                    )
+                    if not busted and not await self._link_probe_allows_refresh(
+                        serial, device
+                    ):
+                        continue
+                    with self._profile_wire(serial, device.transport):
+                        await device.refresh()
                 except Exception as exc:
                     _LOGGER.debug(
                         "Device %s refresh failed: %s",
@@ -313,7 +368,8 @@ class HTTPUpdateMixin(_MixinBase):
                         serial,
                     ):
                         return  # cached data stands until the cloud-safe window
-                await device.refresh()
+                with self._profile_wire(serial, None):
+                    await device.refresh()
             except Exception as exc:
                 _LOGGER.warning(
                     "Cloud refresh failed for %s (no local transport): %s",
@@ -760,6 +816,7 @@ class HTTPUpdateMixin(_MixinBase):
             processed["station"]["api_peak_request_rate"] = (
                 self.client.api_peak_rate_per_hour
             )
+            self._adapt_http_polling_interval()
 
             # Daily counter: offset (pre-reload total) + client's count since reload.
             # Persisted in hass.data to survive config entry reloads.
@@ -789,7 +846,11 @@ class HTTPUpdateMixin(_MixinBase):
             """Process a single inverter with semaphore protection."""
             async with self._api_semaphore:
                 try:
-                    result = await self._process_inverter_object(inv)
+                    with (
+                        CycleProfiler.device_scope(inv.serial_number),
+                        self._profile_span(PHASE_MAPPING, exclude=PHASE_SIDE_FETCH),
+                    ):
+                        result = await self._process_inverter_object(inv)
                     return (inv.serial_number, result)
                 except Exception as e:
                     _LOGGER.exception(
@@ -883,7 +944,10 @@ class HTTPUpdateMixin(_MixinBase):
                         group.today_yielding,
                     )
 
-                    group_data = await self._process_parallel_group_object(group)
+                    with self._profile_span(
+                        PHASE_PARALLEL_GROUPS, COORDINATOR_SCOPE
+                    ):
+                        group_data = await self._process_parallel_group_object(group)
                     _LOGGER.debug(
                         "Parallel group %s sensors: %s",
                         group.name,
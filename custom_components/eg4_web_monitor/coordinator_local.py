@@ -6,9 +6,12 @@ aggregation, and static entity creation.
 """
 
 import asyncio
+from collections.abc import Mapping
 import logging
 import time
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.helpers import device_registry as dr, issue_registry as ir
@@ -59,7 +62,15 @@ from .coordinator_mappings import (
     compute_bank_charge_rate,
     compute_parallel_group_charge_rate,
 )
+from .cycle_profiler import (
+    COORDINATOR_SCOPE,
+    PHASE_MAPPING,
+    PHASE_PARALLEL_GROUPS,
+    CycleProfiler,
+)
 from .endpoint_bus import EndpointBusCapability
+from .link_probe import LinkHealthProbe
+from .wire_trace import TRACE_KIND_INVERTER, TRACE_KIND_MIDBOX
 from .utils import (
     battery_row_is_absent,
     is_hybrid_family,
@@ -73,6 +84,8 @@ _LOGGER = logging.getLogger(__name__)
 if TYPE_CHECKING:
     from pylxpweb.transports.data import BatteryData
 
+    from .battery_record import BatteryRecord
+
 # Minimum battery serial length to consider valid.  Shorter serials are
 # likely truncated register reads from incomplete CAN bus transfers and
 # are skipped to avoid creating phantom battery entities.
@@ -98,6 +111,10 @@ _NO_SERIAL_EXPOSE_POLLS = 3
 # stale-TCP-slot window — typically 1-5 minutes — recovers promptly.
 ATTACH_RETRY_INTERVAL_SECONDS = 60.0
 
+# Added to the computed wait before the next LOCAL tick; see
+# LocalTransportMixin._schedule_next_local_tick.
+_LOCAL_TICK_SLACK_SECONDS = 1.0
+
 _LOCAL_TRANSPORT_LINK_DOWN_ERROR = "Local transport link down"
 _LOCAL_DATA_PROCESSING_ERROR = "Local data processing failed"
 
@@ -117,15 +134,342 @@ def _stale_parallel_member_error(
     return f"{reason} for member(s): {', '.join(serials)}"
 
 
+@dataclass(frozen=True, slots=True)
+class _TransportSensorMemo:
+    """One device's mapped transport sensors and the objects they came from.
+
+    pylxpweb replaces ``transport_runtime``/``transport_energy``/
+    ``transport_battery`` with new objects on every wire read and keeps
+    serving the same ones while its cache TTL holds, so object identity is
+    the read generation. The memo holds strong references, so an identity
+    can never be recycled while it is compared.
+    """
+
+    runtime: Any
+    energy: Any
+    battery: Any
+    three_phase: bool | None
+    sensors: dict[str, Any]
+
+
+# Member sensors summed into a local parallel group (battery_power is remapped
+# to parallel_battery_power).  PV string sensors (pv1/2/3) are excluded —
+# per-inverter detail is not useful at group level; pv_total_power covers the
+# aggregate.
+_PARALLEL_POWER_SENSORS = (
+    "pv_total_power",
+    "grid_power",
+    "grid_import_power",
+    "grid_export_power",
+    "consumption_power",
+    "eps_power",
+    "battery_power",
+    "ac_power",  # Inverter output power (matches HTTP mode)
+    "output_power",  # Split-phase total output
+)
+_PARALLEL_ENERGY_SENSORS = (
+    "yield",
+    "charging",
+    "discharging",
+    "grid_import",
+    "grid_export",
+    "consumption",
+    "yield_lifetime",
+    "charging_lifetime",
+    "discharging_lifetime",
+    "grid_import_lifetime",
+    "grid_export_lifetime",
+    "consumption_lifetime",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _ParallelMemberShare:
+    """One member inverter's contribution to its local parallel group.
+
+    Holds the device record and sensors dict it was read from: a member whose
+    record was carried forward by identity (not polled this tick) keeps its
+    share without being re-read.
+    """
+
+    record: dict[str, Any]
+    sensors: dict[str, Any]
+    sums: dict[str, float]
+    soc: float | None
+    voltage: float | None
+    battery_current: float | None
+    battery_count: int | float
+    max_capacity: float | None
+    current_capacity: float | None
+
+    @classmethod
+    def read(cls, record: dict[str, Any]) -> "_ParallelMemberShare":
+        """Read a member's contribution from its device record."""
+        sensors = record.get("sensors", {})
+        bat_count = sensors.get("battery_bank_count")
+        return cls(
+            record=record,
+            sensors=sensors,
+            sums={
+                key: float(value)
+                for key in _PARALLEL_POWER_SENSORS + _PARALLEL_ENERGY_SENSORS
+                if (value := sensors.get(key)) is not None
+            },
+            soc=_optional_float(sensors.get("state_of_charge")),
+            voltage=_optional_float(sensors.get("battery_voltage")),
+            battery_current=_optional_float(sensors.get("battery_bank_current")),
+            # Secondaries with battery_count=0 contribute nothing.
+            battery_count=bat_count if bat_count is not None and bat_count > 0 else 0,
+            max_capacity=_optional_float(sensors.get("battery_bank_max_capacity")),
+            current_capacity=_optional_float(
+                sensors.get("battery_bank_current_capacity")
+            ),
+        )
+
+    def is_current(self, record: dict[str, Any]) -> bool:
+        """Whether ``record`` is the unchanged record this share came from."""
+        return record is self.record and record.get("sensors", {}) is self.sensors
+
+
+def _add_computed_transport_sensors(
+    sensors: dict[str, Any], inverter: Any, features: dict[str, Any]
+) -> None:
+    """Add the sensors a local inverter derives from its mapped registers.
+
+    Computed powers come from the pylxpweb device properties (stable library
+    interfaces, consistent with the cloud path); the aggregate voltage alias
+    and the dead grid-leg drop then normalize the per-leg keys.
+    """
+    # Computed power sensors from pylxpweb library
+    if (val := inverter.consumption_power) is not None:
+        sensors["consumption_power"] = val
+    if (val := inverter.total_load_power) is not None:
+        sensors["total_load_power"] = val
+    if (val := inverter.battery_power) is not None:
+        sensors["battery_power"] = val
+    if (val := inverter.rectifier_power) is not None:
+        sensors["rectifier_power"] = val
+    if (val := inverter.power_to_user) is not None:
+        sensors["grid_import_power"] = val
+
+    # Derive phase-neutral aggregate voltages (grid_voltage, eps_voltage)
+    # from the R-phase registers for non-three-phase configs.  This active
+    # multi-transport poll path builds the sensor dict inline, unlike the
+    # deprecated single-device path (_build_local_device_data), so the alias
+    # must be applied here too.  Without it, split-phase models
+    # (18kPV/FlexBOSS) report "unknown" for the aggregate EPS/grid voltage
+    # even though the per-leg L1/L2 sensors populate correctly (issue #243).
+    if features:
+        alias_common_voltage_sensors(sensors, features)
+
+    # Drop per-inverter grid per-leg voltage when it reads 0/None.  EG4
+    # split-phase firmware leaves regs 193/194 at 0; the real per-leg grid
+    # voltage comes from the GridBOSS CTs (#243).
+    drop_dead_inverter_grid_legs(sensors)
+
+
+def _optional_float(value: Any) -> float | None:
+    """Return ``float(value)``, keeping None as None."""
+    return None if value is None else float(value)
+
+
+@dataclass(frozen=True, slots=True)
+class _ParallelGroupMemo:
+    """Inputs of a published local parallel-group record.
+
+    When a tick leaves every input identical, the published record itself is
+    kept, so its sensors (including ``parallel_group_last_polled``) do not
+    change and no listener wakes.
+    """
+
+    shares: tuple[_ParallelMemberShare, ...]
+    member_serials: tuple[str, ...]
+    first_serial: str
+    gridboss: dict[str, Any] | None
+    gridboss_sensors: dict[str, Any] | None
+    include_ac_couple: bool
+    error: str | None
+    device_data: dict[str, Any]
+
+
 class LocalTransportMixin(_MixinBase):
     """Mixin handling local transport operations for the coordinator."""
 
+    # Class-level defaults so coordinators built without __init__ (tests)
+    # keep the fixed fastest-transport cadence, always re-aggregate and
+    # always re-map and re-read parallel members, and run the full refresh
+    # against a down link.
+    _local_tick_scheduling: bool = False
+    _local_aggregate_error_serials: frozenset[str] | None = None
+    _transport_sensor_memo: dict[str, _TransportSensorMemo] | None = None
+    _parallel_member_shares: dict[str, _ParallelMemberShare] | None = None
+    _parallel_group_memo: dict[str, _ParallelGroupMemo] | None = None
+    _link_probes: dict[str, LinkHealthProbe] | None = None
+
+    async def _link_probe_allows_refresh(self, serial: str, device: Any) -> bool:
+        """Whether ``device``'s full refresh should run this cycle.
+
+        Always True while the device's link is up. Once pylxpweb declares
+        it down (eg4-57g), only a single-register probe touches the link,
+        spaced by exponential backoff, and the full refresh resumes once a
+        probe answers. The probe state is dropped as soon as the link is
+        reported up again.
+        """
+        probes = self._link_probes
+        if probes is None:
+            return True
+        if not is_transport_link_down(device):
+            probes.pop(serial, None)
+            return True
+        probe = probes.get(serial)
+        if probe is None:
+            probe = probes[serial] = LinkHealthProbe()
+        if await probe.async_check(device.transport):
+            _LOGGER.debug("Link probe for %s answered; running full refresh", serial)
+            return True
+        return False
+
+    def _map_transport_sensors(
+        self,
+        serial: str,
+        runtime: Any,
+        energy: Any,
+        battery: Any,
+        features: dict[str, Any] | None,
+    ) -> Mapping[str, Any]:
+        """Return a read-only view of the device's mapped transport sensors.
+
+        Runs the runtime/energy/battery-bank mapping pipeline only when one
+        of the underlying transport objects (or the phase context) changed
+        since the last cycle; otherwise the memoized mapping is served as is.
+        Only the mapping step is skipped: the poll path and replay copy the
+        view into the device's sensor dict to add per-cycle keys, so the
+        device data downstream is a new dict every cycle either way.
+        ``battery`` is None when no bank should be mapped.
+        """
+        three_phase = _supports_three_phase_context(features)
+        memo_table = self._transport_sensor_memo
+        memo = memo_table.get(serial) if memo_table is not None else None
+        if (
+            memo is not None
+            and memo.runtime is runtime
+            and memo.energy is energy
+            and memo.battery is battery
+            and memo.three_phase == three_phase
+        ):
+            return MappingProxyType(memo.sensors)
+
+        sensors = _build_runtime_sensor_mapping(
+            runtime, supports_three_phase=three_phase
+        )
+        if energy:
+            sensors.update(_build_energy_sensor_mapping(energy))
+        if battery:
+            sensors.update(_build_battery_bank_sensor_mapping(battery))
+            # Compute battery bank charge/discharge rate from merged sensor data
+            compute_bank_charge_rate(sensors)
+        if memo_table is not None:
+            memo_table[serial] = _TransportSensorMemo(
+                runtime, energy, battery, three_phase, sensors
+            )
+        return MappingProxyType(sensors)
+
+    def _forget_departed_local_devices(self, devices: Mapping[str, Any]) -> None:
+        """Drop memos and link probes of devices that left the plant.
+
+        A serial is kept while it is published in ``devices`` or still
+        configured as a local transport, so a device whose link is down
+        keeps its probe backoff.
+        """
+        keep = set(devices) | {
+            str(config.get("serial"))
+            for config in getattr(self, "_local_transport_configs", ())
+        }
+        for table in (self._transport_sensor_memo, self._link_probes):
+            if table is not None:
+                for serial in table.keys() - keep:
+                    del table[serial]
+
+    def _map_local_gridboss_sensors(self, mid_device: Any) -> dict[str, Any]:
+        """Return the sensors dict for a GridBOSS from its transport data."""
+        sensors = _build_gridboss_sensor_mapping(mid_device)
+        sensors = {k: v for k, v in sensors.items() if v is not None}
+        self._filter_unused_smart_port_sensors(sensors, mid_device)
+        self._calculate_gridboss_aggregates(sensors)
+        return sensors
+
+    def _local_tick_is_idle(self) -> bool:
+        """Whether a LOCAL tick would only carry every device forward.
+
+        True once real data has been published and no transport gate is
+        due.  Pending parameter-write seeds force the normal path so the
+        publish-boundary overlay still runs.
+        """
+        return (
+            self._local_tick_scheduling
+            and self._local_static_phase_done
+            and bool(self.data)
+            and bool(self.data.get("devices"))
+            and not self._parameter_write_seeds
+            and self._seconds_until_transport_poll() > 0
+        )
+
+    def _schedule_next_local_tick(self) -> None:
+        """Wake the coordinator when the next transport gate is due.
+
+        Each transport then refreshes at its own configured interval instead
+        of at the next multiple of the fastest one.  Home Assistant floors
+        the scheduled refresh to whole loop seconds, so one second of slack
+        keeps the wake-up from landing just before the gate opens.
+        """
+        if not self._local_tick_scheduling:
+            return
+        self.update_interval = timedelta(
+            seconds=self._seconds_until_transport_poll() + _LOCAL_TICK_SLACK_SECONDS
+        )
+
+    def _local_aggregates_stale(
+        self, processed: dict[str, Any], polled_serials: set[str]
+    ) -> bool:
+        """Whether this tick changed any input of the parallel-group views.
+
+        Parallel groups are derived from their member inverters, the
+        GridBOSS overlay and the members' error marks.  A tick that polled
+        none of those and left every error mark as it was would rebuild the
+        same aggregates, so the carried-forward groups are kept instead.
+        """
+        devices: dict[str, Any] = processed.get("devices", {})
+        error_serials = frozenset(
+            serial
+            for serial, device_data in devices.items()
+            if device_data.get("type") in ("inverter", "gridboss")
+            and "error" in device_data
+        )
+        previous_errors = self._local_aggregate_error_serials
+        self._local_aggregate_error_serials = error_serials
+        if error_serials != previous_errors:
+            return True
+
+        grouped_serials: set[str] = set()
+        for device_data in devices.values():
+            if device_data.get("type") == "parallel_group":
+                grouped_serials.update(device_data.get("member_serials") or ())
+        for serial in polled_serials:
+            device_data = devices.get(serial)
+            if device_data is None or serial in grouped_serials:
+                return True
+            if device_data.get("type") == "gridboss":
+                return True
+            if device_data.get("parallel_number", 0) != 0:
+                return True
+        return False
+
     def _merge_round_robin_batteries(
         self,
         inverter_serial: str,
         transport_batteries: list["BatteryData"],
         reported_count: int | None = None,
-    ) -> dict[str, dict[str, Any]]:
+    ) -> dict[str, "BatteryRecord"]:
         """Merge transport battery slot data into the round-robin cache.
 
         Some inverter firmware rotates which physical batteries appear in the
@@ -738,23 +1082,18 @@ class LocalTransportMixin(_MixinBase):
             "model": model,
             "serial": serial,
             "firmware_version": firmware_version,
-            "sensors": _build_runtime_sensor_mapping(
-                runtime,
-                supports_three_phase=_supports_three_phase_context(features),
+            "sensors": dict(
+                self._map_transport_sensors(
+                    serial,
+                    runtime,
+                    inverter.transport_energy,
+                    inverter.transport_battery,
+                    features,
+                )
             ),
             "batteries": {},
         }
 
-        if energy_data := inverter.transport_energy:
-            device_data["sensors"].update(_build_energy_sensor_mapping(energy_data))
-
-        if battery_data := inverter.transport_battery:
-            device_data["sensors"].update(
-                _build_battery_bank_sensor_mapping(battery_data)
-            )
-            # Compute battery bank charge/discharge rate from merged sensor data
-            compute_bank_charge_rate(device_data["sensors"])
-
         device_data["sensors"]["firmware_version"] = firmware_version
         device_data["sensors"]["connection_transport"] = _get_transport_label(
             connection_type
@@ -1021,11 +1360,12 @@ class LocalTransportMixin(_MixinBase):
         """
 
         for config in configs:
-            await self._process_single_local_device(
-                config,
-                processed,
-                device_availability,
-            )
+            with CycleProfiler.device_scope(config.get("serial", "")):
+                await self._process_single_local_device(
+                    config,
+                    processed,
+                    device_availability,
+                )
 
     def _register_pg_device(self, group_device_id: str, group_name: str) -> None:
         """Pre-register a parallel group in the HA device registry.
@@ -1162,11 +1502,17 @@ class LocalTransportMixin(_MixinBase):
             if is_gridboss:
                 mid_device = self._mid_device_cache[serial]
 
+                if not await self._link_probe_allows_refresh(serial, mid_device):
+                    raise TransportConnectionError(
+                        f"{_LOCAL_TRANSPORT_LINK_DOWN_ERROR}; recovery probe pending"
+                    )
+
                 transport = mid_device.transport
                 if isinstance(transport, EndpointBusCapability):
                     await transport.async_ensure_connected()
 
-                await mid_device.refresh()
+                with self._profile_wire(serial, transport):
+                    await mid_device.refresh()
 
                 if serial not in self._firmware_cache:
                     fw = "Unknown"
@@ -1181,10 +1527,15 @@ class LocalTransportMixin(_MixinBase):
                         f"Failed to read runtime data for GridBOSS {serial}"
                     )
 
-                sensors = _build_gridboss_sensor_mapping(mid_device)
-                sensors = {k: v for k, v in sensors.items() if v is not None}
-                self._filter_unused_smart_port_sensors(sensors, mid_device)
-                self._calculate_gridboss_aggregates(sensors)
+                if self._wire_trace is not None:
+                    self._wire_trace.record(
+                        TRACE_KIND_MIDBOX,
+                        serial,
+                        device=mid_device,
+                        runtime=getattr(mid_device, "_transport_runtime", None),
+                    )
+                with self._profile_span(PHASE_MAPPING, serial):
+                    sensors = self._map_local_gridboss_sensors(mid_device)
                 sensors["firmware_version"] = firmware_version
                 sensors["connection_transport"] = _get_transport_label(
                     "dongle" if transport_type == "wifi_dongle" else "modbus"
@@ -1216,6 +1567,11 @@ class LocalTransportMixin(_MixinBase):
             else:
                 inverter = self._inverter_cache[serial]
 
+                if not await self._link_probe_allows_refresh(serial, inverter):
+                    raise TransportConnectionError(
+                        f"{_LOCAL_TRANSPORT_LINK_DOWN_ERROR}; recovery probe pending"
+                    )
+
                 transport = inverter.transport
                 if isinstance(transport, EndpointBusCapability):
                     await transport.async_ensure_connected()
@@ -1224,7 +1580,8 @@ class LocalTransportMixin(_MixinBase):
                 # (or fall back to the direct check for the deprecated single-
                 # device path which doesn't set _include_params_this_cycle).
                 include_params = getattr(self, "_include_params_this_cycle", False)
-                await inverter.refresh(include_parameters=include_params)
+                with self._profile_wire(serial, transport):
+                    await inverter.refresh(include_parameters=include_params)
 
                 features: dict[str, Any] = {}
                 if hasattr(inverter, "detect_features"):
@@ -1307,15 +1664,48 @@ class LocalTransportMixin(_MixinBase):
                         else "config",
                     )
 
+                battery_data = inverter.transport_battery
+                # Skip battery bank creation when battery_count is 0.
+                # In parallel systems with shared batteries, the secondary
+                # inverter reports battery_count=0 at reg 96 because the
+                # CAN bus is wired only to the primary.  Per-inverter
+                # sensors (battery_voltage, battery_current, state_of_charge)
+                # from runtime registers still report accurate values.
+                # This matches CLOUD path behavior where the API returns
+                # totalNumber=0 for secondary inverters (issue #169).
+                bank_count = (battery_data.battery_count or 0) if battery_data else 0
+
+                if self._wire_trace is not None:
+                    self._wire_trace.record(
+                        TRACE_KIND_INVERTER,
+                        serial,
+                        device=inverter,
+                        runtime=runtime_data,
+                        energy=energy_data,
+                        battery=battery_data,
+                        features=features,
+                        parallel=[
+                            parallel_number,
+                            parallel_master_slave,
+                            parallel_phase,
+                        ],
+                    )
+                with self._profile_span(PHASE_MAPPING, serial):
+                    mapped_sensors = dict(
+                        self._map_transport_sensors(
+                            serial,
+                            runtime_data,
+                            energy_data,
+                            battery_data if bank_count else None,
+                            features,
+                        )
+                    )
                 device_data = {
                     "type": "inverter",
                     "model": model,
                     "serial": serial,
                     "firmware_version": firmware_version,
-                    "sensors": _build_runtime_sensor_mapping(
-                        runtime_data,
-                        supports_three_phase=_supports_three_phase_context(features),
-                    ),
+                    "sensors": mapped_sensors,
                     "batteries": {},
                     "features": features,
                     "parallel_number": parallel_number,
@@ -1323,23 +1713,7 @@ class LocalTransportMixin(_MixinBase):
                     "parallel_phase": parallel_phase,
                 }
 
-                if energy_data:
-                    device_data["sensors"].update(
-                        _build_energy_sensor_mapping(energy_data)
-                    )
-
-                battery_data = inverter.transport_battery
                 if battery_data:
-                    # Skip battery bank creation when battery_count is 0.
-                    # In parallel systems with shared batteries, the secondary
-                    # inverter reports battery_count=0 at reg 96 because the
-                    # CAN bus is wired only to the primary.  Per-inverter
-                    # sensors (battery_voltage, battery_current, state_of_charge)
-                    # from runtime registers still report accurate values.
-                    # This matches CLOUD path behavior where the API returns
-                    # totalNumber=0 for secondary inverters (issue #169).
-                    bank_count = battery_data.battery_count or 0
-
                     if bank_count == 0:
                         if serial not in self._shared_battery_logged:
                             _LOGGER.info(
@@ -1348,21 +1722,12 @@ class LocalTransportMixin(_MixinBase):
                                 serial,
                             )
                             self._shared_battery_logged.add(serial)
-                    else:
-                        device_data["sensors"].update(
-                            _build_battery_bank_sensor_mapping(battery_data)
-                        )
-                        # Compute battery bank charge/discharge rate
-                        compute_bank_charge_rate(device_data["sensors"])
-
-                        if (
-                            hasattr(battery_data, "batteries")
-                            and battery_data.batteries
-                        ):
-                            # Round-robin merge: some firmware rotates which
-                            # physical batteries appear in the fixed register
-                            # slots.  Accumulate by battery serial so all
-                            # batteries eventually appear as entities.
+                    elif hasattr(battery_data, "batteries") and battery_data.batteries:
+                        # Round-robin merge: some firmware rotates which
+                        # physical batteries appear in the fixed register
+                        # slots.  Accumulate by battery serial so all
+                        # batteries eventually appear as entities.
+                        with self._profile_span(PHASE_MAPPING, serial):
                             device_data["batteries"] = (
                                 self._merge_round_robin_batteries(
                                     serial,
@@ -1370,14 +1735,14 @@ class LocalTransportMixin(_MixinBase):
                                     battery_data.battery_count,
                                 )
                             )
-                            _LOGGER.debug(
-                                "LOCAL: %d individual batteries for %s "
-                                "(%d this poll, %d cached)",
-                                len(device_data["batteries"]),
-                                serial,
-                                len(battery_data.batteries),
-                                len(self._battery_rr_cache.get(serial, {})),
-                            )
+                        _LOGGER.debug(
+                            "LOCAL: %d individual batteries for %s "
+                            "(%d this poll, %d cached)",
+                            len(device_data["batteries"]),
+                            serial,
+                            len(battery_data.batteries),
+                            len(self._battery_rr_cache.get(serial, {})),
+                        )
                 if not device_data["batteries"] and (
                     cached_batteries := self._battery_rr_cache.get(serial)
                 ):
@@ -1411,21 +1776,8 @@ class LocalTransportMixin(_MixinBase):
                 )
                 device_data["sensors"]["transport_host"] = host
 
-                # Add computed sensors from inverter properties
-                # These use stable library interfaces for consistency
                 sensors = device_data["sensors"]
-
-                # Computed power sensors from pylxpweb library
-                if (val := inverter.consumption_power) is not None:
-                    sensors["consumption_power"] = val
-                if (val := inverter.total_load_power) is not None:
-                    sensors["total_load_power"] = val
-                if (val := inverter.battery_power) is not None:
-                    sensors["battery_power"] = val
-                if (val := inverter.rectifier_power) is not None:
-                    sensors["rectifier_power"] = val
-                if (val := inverter.power_to_user) is not None:
-                    sensors["grid_import_power"] = val
+                _add_computed_transport_sensors(sensors, inverter, features)
 
                 # Quick charge status from local registers 233/234 (throttled).
                 # Populates the same key the Quick Charge switch + remaining
@@ -1436,22 +1788,6 @@ class LocalTransportMixin(_MixinBase):
                 # (not just when it last changed)
                 sensors["last_polled"] = dt_util.utcnow()
 
-                # Derive phase-neutral aggregate voltages (grid_voltage,
-                # eps_voltage) from the R-phase registers for non-three-phase
-                # configs.  This active multi-transport poll path builds the
-                # sensor dict inline, unlike the deprecated single-device path
-                # (_build_local_device_data), so the alias must be applied here
-                # too.  Without it, split-phase models (18kPV/FlexBOSS) report
-                # "unknown" for the aggregate EPS/grid voltage even though the
-                # per-leg L1/L2 sensors populate correctly (issue #243).
-                if features:
-                    alias_common_voltage_sensors(sensors, features)
-
-                # Drop per-inverter grid per-leg voltage when it reads 0/None.
-                # EG4 split-phase firmware leaves regs 193/194 at 0; the real
-                # per-leg grid voltage comes from the GridBOSS CTs (#243).
-                drop_dead_inverter_grid_legs(sensors)
-
                 _LOGGER.debug(
                     "LOCAL: Computed sensors for %s: consumption=%s, total_load=%s, "
                     "battery=%s, rectifier=%s, grid_import=%s",
@@ -1488,12 +1824,13 @@ class LocalTransportMixin(_MixinBase):
                 if read_entity_params and param_transport:
                     self._param_attempted_this_cycle = True
                     parameter_read_generation = self._parameter_write_generation
-                    (
-                        param_data,
-                        param_read_complete,
-                    ) = await self._read_modbus_parameters(
-                        param_transport, device_data, device=inverter
-                    )
+                    with self._profile_wire(serial, param_transport):
+                        (
+                            param_data,
+                            param_read_complete,
+                        ) = await self._read_modbus_parameters(
+                            param_transport, device_data, device=inverter
+                        )
                     param_data = self._reconcile_parameter_read(
                         serial,
                         param_data,
@@ -2073,8 +2410,15 @@ class LocalTransportMixin(_MixinBase):
                 total_devices,
             )
 
-        # Process local parallel groups from device config
-        await self._process_local_parallel_groups(processed)
+        # Process local parallel groups from device config — only when this
+        # tick touched one of their inputs; otherwise the carried-forward
+        # groups are already current.
+        polled_serials = {
+            config["serial"] for config in configs_to_poll if config.get("serial")
+        }
+        if self._local_aggregates_stale(processed, polled_serials):
+            with self._profile_span(PHASE_PARALLEL_GROUPS, COORDINATOR_SCOPE):
+                await self._process_local_parallel_groups(processed)
 
         # Parameter throttle bookkeeping (#282 P1-A).  A DUE cycle stamps the
         # hourly throttle REGARDLESS of per-device outcomes — healthy devices
@@ -2174,13 +2518,49 @@ class LocalTransportMixin(_MixinBase):
             list(parallel_groups.keys()),
         )
 
+        # Only one MID device (GridBOSS) per system; its CTs overlay every
+        # group below.
+        gridboss_serial, gridboss_data = next(
+            (
+                (serial, device_data)
+                for serial, device_data in processed.get("devices", {}).items()
+                if device_data.get("type") == "gridboss"
+            ),
+            (None, None),
+        )
+        gridboss_sensors: dict[str, Any] | None = None
+        include_ac_couple = False
+        if gridboss_data is not None:
+            gridboss_sensors = gridboss_data.get("sensors", {})
+            include_ac_couple = self.entry.options.get(
+                CONF_INCLUDE_AC_COUPLE_PV,
+                self.entry.data.get(CONF_INCLUDE_AC_COUPLE_PV, False),
+            )
+
+        # Per-member shares are kept across ticks: only members whose device
+        # record changed (polled this tick) are read again.
+        share_cache = self._parallel_member_shares
+        group_memo = self._parallel_group_memo
+        if share_cache is not None:
+            grouped_serials = {
+                serial for members in parallel_groups.values() for serial, _ in members
+            }
+            for serial in [s for s in share_cache if s not in grouped_serials]:
+                del share_cache[serial]
+        if group_memo is not None:
+            group_ids = {
+                f"parallel_group_{chr(ord('a') + index)}"
+                for index in range(len(parallel_groups))
+            }
+            for group_id in group_memo.keys() - group_ids:
+                del group_memo[group_id]
+
         # Process each parallel group
         # Use enumerate to get sequential names (A, B, C...) regardless of parallel_number value
-        for group_index, (parallel_number, group_devices) in enumerate(
-            parallel_groups.items()
-        ):
+        for group_index, group_devices in enumerate(parallel_groups.values()):
             # Group name: 'A' for first group, 'B' for second, etc.
             group_name = chr(ord("A") + group_index)
+            group_device_id = f"parallel_group_{group_name.lower()}"
 
             # Find the master device (parallel_master_slave == 1)
             # If no master found, use the first device
@@ -2206,89 +2586,113 @@ class LocalTransportMixin(_MixinBase):
                 for member_serial, member_data in group_devices
                 if "error" in member_data
             )
+            # The GridBOSS CTs are authoritative contributors to the group's
+            # grid/consumption values — any stale/error-marked GridBOSS taints
+            # the aggregate the same way an inverter member does.
+            if (
+                gridboss_data is not None
+                and "error" in gridboss_data
+                and gridboss_serial not in stale_members
+            ):
+                stale_members.append(gridboss_serial)
+            stale_error = (
+                _stale_parallel_member_error(processed["devices"], stale_members)
+                if stale_members
+                else None
+            )
+
+            shares: list[_ParallelMemberShare] = []
+            for serial, device_data in group_devices:
+                share = share_cache.get(serial) if share_cache is not None else None
+                if share is None or not share.is_current(device_data):
+                    share = _ParallelMemberShare.read(device_data)
+                    if share_cache is not None:
+                        share_cache[serial] = share
+                    _LOGGER.debug(
+                        "LOCAL: Parallel group %s member %s: "
+                        "battery_power=%s, pv=%s, soc=%s",
+                        group_name,
+                        serial,
+                        share.sensors.get("battery_power"),
+                        share.sensors.get("pv_total_power"),
+                        share.sensors.get("state_of_charge"),
+                    )
+                shares.append(share)
+            member_serials = tuple(serial for serial, _ in group_devices)
+
+            # No input changed: keep the published record by identity, so
+            # the group's sensors (and its last-polled stamp) stay as they
+            # are and no listener wakes.
+            memo = group_memo.get(group_device_id) if group_memo is not None else None
+            if (
+                memo is not None
+                and processed["devices"].get(group_device_id) is memo.device_data
+                and memo.member_serials == member_serials
+                and all(
+                    old is new for old, new in zip(memo.shares, shares, strict=True)
+                )
+                and memo.first_serial == first_serial
+                and memo.gridboss is gridboss_data
+                and memo.gridboss_sensors is gridboss_sensors
+                and memo.include_ac_couple == include_ac_couple
+                and memo.error == stale_error
+                and memo.device_data.get("error") == stale_error
+            ):
+                _LOGGER.debug(
+                    "LOCAL: Parallel group %s inputs unchanged, keeping aggregate",
+                    group_name,
+                )
+                continue
 
             # Collect sensor data from all devices in the group
             group_sensors: dict[str, Any] = {}
-            device_count = 0
-
-            # Power sensors to sum (battery handled separately as parallel_battery_*)
-            # Note: PV string sensors (pv1/2/3) excluded — per-inverter detail
-            # is not useful at group level; pv_total_power covers the aggregate.
-            power_sensors = [
-                "pv_total_power",
-                "grid_power",
-                "grid_import_power",
-                "grid_export_power",
-                "consumption_power",
-                "eps_power",
-                "battery_power",
-                "ac_power",  # Inverter output power (matches HTTP mode)
-                "output_power",  # Split-phase total output
-            ]
-
-            # Energy sensors to sum
-            energy_sensors = [
-                "yield",
-                "charging",
-                "discharging",
-                "grid_import",
-                "grid_export",
-                "consumption",
-                "yield_lifetime",
-                "charging_lifetime",
-                "discharging_lifetime",
-                "grid_import_lifetime",
-                "grid_export_lifetime",
-                "consumption_lifetime",
-            ]
+            device_count = len(shares)
 
             # Battery sensors - need weighted average for SOC
             total_soc = 0.0
             soc_count = 0
             total_battery_voltage = 0.0
             voltage_count = 0
+            total_battery_current = 0.0
+            has_battery_current = False
+            total_batteries: int | float = 0
+            total_max_cap = 0.0
+            total_cur_cap = 0.0
 
-            for serial, device_data in group_devices:
-                device_count += 1
-                device_sensors = device_data.get("sensors", {})
-
-                # Sum power sensors
-                for sensor_key in power_sensors:
-                    value = device_sensors.get(sensor_key)
-                    if value is not None:
-                        group_sensors[sensor_key] = group_sensors.get(
-                            sensor_key, 0.0
-                        ) + float(value)
-
-                # Sum energy sensors
-                for sensor_key in energy_sensors:
-                    value = device_sensors.get(sensor_key)
-                    if value is not None:
-                        group_sensors[sensor_key] = group_sensors.get(
-                            sensor_key, 0.0
-                        ) + float(value)
-
-                # Collect SOC for averaging
-                soc = device_sensors.get("state_of_charge")
-                if soc is not None:
-                    total_soc += float(soc)
-                    soc_count += 1
+            for share in shares:
+                # Sum power and energy sensors
+                for sensor_key, value in share.sums.items():
+                    group_sensors[sensor_key] = (
+                        group_sensors.get(sensor_key, 0.0) + value
+                    )
 
-                # Collect voltage for averaging
-                voltage = device_sensors.get("battery_voltage")
-                if voltage is not None:
-                    total_battery_voltage += float(voltage)
+                # Collect SOC and voltage for averaging
+                if share.soc is not None:
+                    total_soc += share.soc
+                    soc_count += 1
+                if share.voltage is not None:
+                    total_battery_voltage += share.voltage
                     voltage_count += 1
 
-                _LOGGER.debug(
-                    "LOCAL: Parallel group %s member %s: "
-                    "battery_power=%s, pv=%s, soc=%s",
-                    group_name,
-                    serial,
-                    device_sensors.get("battery_power"),
-                    device_sensors.get("pv_total_power"),
-                    device_sensors.get("state_of_charge"),
-                )
+                # Aggregate battery_bank_current from member inverters.
+                # Secondaries with battery_count=0 have no battery_bank_*
+                # sensors, so they naturally contribute nothing to the sum.
+                if share.battery_current is not None:
+                    total_battery_current += share.battery_current
+                    has_battery_current = True
+
+                # Sum battery_bank_count from all member devices.  Use
+                # battery_bank_count from sensors (from Modbus register 96 or
+                # cloud batParallelNum) rather than counting batteries dict
+                # entries, which may be empty if CAN bus communication with
+                # battery BMS isn't established (common with LXP-EU devices)
+                total_batteries += share.battery_count
+
+                # Sum max/current capacity from inverter battery bank sensors
+                if share.max_capacity is not None:
+                    total_max_cap += share.max_capacity
+                if share.current_capacity is not None:
+                    total_cur_cap += share.current_capacity
 
             # Remap summed battery_power to parallel_battery_power for consistency
             # with cloud mode (which uses _process_parallel_group_object).
@@ -2311,42 +2715,11 @@ class LocalTransportMixin(_MixinBase):
                     total_battery_voltage / voltage_count, 1
                 )
 
-            # Aggregate battery_bank_current from member inverters.
-            # Secondaries with battery_count=0 have no battery_bank_* sensors,
-            # so they naturally contribute nothing to the sum.
-            total_battery_current = 0.0
-            has_battery_current = False
-            for _, dd in group_devices:
-                bat_current = dd.get("sensors", {}).get("battery_bank_current")
-                if bat_current is not None:
-                    total_battery_current += float(bat_current)
-                    has_battery_current = True
             if has_battery_current:
                 group_sensors["parallel_battery_current"] = total_battery_current
 
-            # Sum battery_bank_count from all member devices.
-            # Use battery_bank_count from sensors (from Modbus register 96 or cloud batParallelNum)
-            # rather than counting batteries dict entries, which may be empty if CAN bus
-            # communication with battery BMS isn't established (common with LXP-EU devices)
-            total_batteries = 0
-            for _, dd in group_devices:
-                ds = dd.get("sensors", {})
-                bat_count = ds.get("battery_bank_count")
-                if bat_count is not None and bat_count > 0:
-                    total_batteries += bat_count
             group_sensors["parallel_battery_count"] = total_batteries
 
-            # Sum max/current capacity from inverter battery bank sensors
-            total_max_cap = 0.0
-            total_cur_cap = 0.0
-            for _, dd in group_devices:
-                ds = dd.get("sensors", {})
-                max_cap = ds.get("battery_bank_max_capacity")
-                if max_cap is not None:
-                    total_max_cap += float(max_cap)
-                cur_cap = ds.get("battery_bank_current_capacity")
-                if cur_cap is not None:
-                    total_cur_cap += float(cur_cap)
             if total_max_cap > 0:
                 group_sensors["parallel_battery_max_capacity"] = total_max_cap
             if total_cur_cap > 0:
@@ -2355,49 +2728,28 @@ class LocalTransportMixin(_MixinBase):
             # Compute parallel group charge/discharge C-rates (%/h)
             compute_parallel_group_charge_rate(group_sensors)
 
-            # Override grid/load power, energy, and voltage with MID device
-            # (GridBOSS) data if available.  The MID device has grid CTs and is
-            # the authoritative source for grid interaction — inverters don't
-            # see the actual grid import/export.
-            has_mid_device = False
-            for serial, device_data in processed.get("devices", {}).items():
-                if device_data.get("type") != "gridboss":
-                    continue
-                has_mid_device = True
-                # The GridBOSS CTs are authoritative contributors to the
-                # group's grid/consumption values — any stale/error-marked
-                # GridBOSS taints the aggregate the same way an inverter
-                # member does.
-                if "error" in device_data and serial not in stale_members:
-                    stale_members.append(serial)
-                gb_sensors = device_data.get("sensors", {})
-
-                # Apply the canonical GridBOSS workflow to the parallel group.
-                # The MID device has grid CTs and is the authoritative source
-                # for grid interaction — inverters don't see actual grid
-                # import/export, so LOCAL recomputes consumption_power from the
-                # energy balance (recompute_consumption=True).  Shared with the
-                # HTTP/HYBRID path so the overlay/AC-couple sequence cannot
-                # diverge.  AC-couple PV inclusion is configurable via options.
-                include_ac_couple = self.entry.options.get(
-                    CONF_INCLUDE_AC_COUPLE_PV,
-                    self.entry.data.get(CONF_INCLUDE_AC_COUPLE_PV, False),
-                )
+            if gridboss_sensors is not None:
+                # Override grid/load power, energy, and voltage with MID
+                # device (GridBOSS) data.  Apply the canonical GridBOSS
+                # workflow to the parallel group.  The MID device has grid
+                # CTs and is the authoritative source for grid interaction —
+                # inverters don't see actual grid import/export, so LOCAL
+                # recomputes consumption_power from the energy balance
+                # (recompute_consumption=True).  Shared with the HTTP/HYBRID
+                # path so the overlay/AC-couple sequence cannot diverge.
+                # AC-couple PV inclusion is configurable via options.
                 apply_gridboss_to_parallel_group(
                     group_sensors,
-                    gb_sensors,
+                    gridboss_sensors,
                     group_name,
                     include_ac_couple=include_ac_couple,
                     recompute_consumption=True,
                 )
-
-                break  # Only one MID device per system
-
-            # Fallback: copy grid voltage from master inverter when no MID
-            # device is present.  MID devices provide authoritative grid
-            # voltage via the overlay above; inverter regs 193-194 return 0
-            # on 18kPV/FlexBOSS firmware so the overlay is preferred.
-            if not has_mid_device:
+            else:
+                # Fallback: copy grid voltage from master inverter when no MID
+                # device is present.  MID devices provide authoritative grid
+                # voltage via the overlay above; inverter regs 193-194 return 0
+                # on 18kPV/FlexBOSS firmware so the overlay is preferred.
                 for serial, dd in group_devices:
                     if serial == first_serial:
                         master_sensors = dd.get("sensors", {})
@@ -2407,8 +2759,6 @@ class LocalTransportMixin(_MixinBase):
                                 group_sensors[vkey] = val
                         break
 
-            group_device_id = f"parallel_group_{group_name.lower()}"
-
             if stale_members:
                 # Don't claim a fresh poll for an aggregate built from stale
                 # members — carry the previous stamp forward (if any) so it
@@ -2433,17 +2783,26 @@ class LocalTransportMixin(_MixinBase):
                 "group_name": group_name,
                 "first_device_serial": first_serial,
                 "member_count": device_count,
-                "member_serials": [serial for serial, _ in group_devices],
+                "member_serials": list(member_serials),
                 "sensors": group_sensors,
             }
-            if stale_members:
+            if stale_error is not None:
                 # Error key -> all PG sensor entities go unavailable
                 # (base_entity availability contract), exactly like the
                 # stale members themselves.
-                pg_device_data["error"] = _stale_parallel_member_error(
-                    processed["devices"], stale_members
-                )
+                pg_device_data["error"] = stale_error
             processed["devices"][group_device_id] = pg_device_data
+            if group_memo is not None:
+                group_memo[group_device_id] = _ParallelGroupMemo(
+                    shares=tuple(shares),
+                    member_serials=member_serials,
+                    first_serial=first_serial,
+                    gridboss=gridboss_data,
+                    gridboss_sensors=gridboss_sensors,
+                    include_ac_couple=include_ac_couple,
+                    error=stale_error,
+                    device_data=pg_device_data,
+                )
 
             self._register_pg_device(group_device_id, group_name)
 
@@ -2946,8 +3305,28 @@ class LocalTransportMixin(_MixinBase):
         maximum drain time (typically <60 s for a Waveshare with a few
         stale frames). Failures are expected and ignored; the regular poll
         cycle will populate _transport_runtime once reads succeed.
+
+        Inverters are drained per gateway: gateways drain concurrently, while
+        the unit IDs behind one gateway drain in turn (their owner serializes
+        the wire anyway), so a single dead gateway cannot stall the others
+        and its siblings fail fast through the owner's reconnect hold-off.
         """
         await asyncio.sleep(2)  # Let setup and first static refresh complete
+        gateways: dict[int, list[Any]] = {}
+        for inverter in inverters:
+            transport = inverter.transport
+            gateway = (
+                transport.status.owner_identity
+                if isinstance(transport, EndpointBusCapability)
+                else -id(inverter)
+            )
+            gateways.setdefault(gateway, []).append(inverter)
+        await asyncio.gather(
+            *(self._drain_gateway_buffers(group) for group in gateways.values())
+        )
+
+    async def _drain_gateway_buffers(self, inverters: list[Any]) -> None:
+        """Drain the stale buffers of the inverters behind one gateway."""
         for inverter in inverters:
             try:
                 _LOGGER.debug(
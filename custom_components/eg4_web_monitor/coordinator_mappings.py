@@ -8,12 +8,14 @@ key dictionaries used by Home Assistant entities.
 import dataclasses
 import inspect
 import logging
-from collections.abc import Callable
+import math
+from collections.abc import Callable, Iterable, MutableMapping
 from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Literal
 
 from homeassistant.util import dt as dt_util
 
+from .battery_record import BatteryRecord
 from .const import (
     BLOCK_SIZE_CONSERVATIVE,
     BLOCK_SIZE_PRESET_REGISTERS,
@@ -75,7 +77,7 @@ def _safe_float(value: Any) -> float | None:
 
 
 def _write_charge_rate(
-    sensors: dict[str, Any],
+    sensors: MutableMapping[str, Any],
     key: str,
     current: float | None,
     capacity_ah: float | None,
@@ -370,7 +372,9 @@ CLOUD_SUPPLEMENTAL_LOST_KEYS: frozenset[str] = frozenset(
 )
 
 
-def blank_lost_battery_measurements(battery_sensors: dict[str, Any]) -> None:
+def blank_lost_battery_measurements(
+    battery_sensors: MutableMapping[str, Any],
+) -> None:
     """Blank one battery's measurement values for a cloud-lost parent (#479).
 
     Same portal behavior one level down from the inverter: getBatteryInfo
@@ -1382,6 +1386,42 @@ def _compute_bank_power(
     return charge_discharge if charge_discharge is not None else api_power
 
 
+def bank_module_extremes(
+    modules: Iterable[Any], attrs: tuple[str, ...]
+) -> dict[str, tuple[float, float]]:
+    """Return ``(min, max)`` of each attribute across a bank's modules.
+
+    One pass over the modules gathers every requested attribute, so all
+    derived bank values come from the same module snapshot.  Each reading is
+    checked on its own: a lost or blanked module (None, NaN, non-numeric)
+    drops out of that statistic without hiding the rest of the bank.  An
+    attribute no module reports is absent from the result (never fabricate).
+
+    Args:
+        modules: Per-battery objects (pylxpweb ``Battery``/``BatteryData``).
+        attrs: Attribute names to aggregate.
+
+    Returns:
+        Mapping of attribute name to ``(min, max)`` for reported attributes.
+    """
+    lows = [math.inf] * len(attrs)
+    highs = [-math.inf] * len(attrs)
+    for module in modules:
+        for index, attr in enumerate(attrs):
+            value = _safe_float(getattr(module, attr, None))
+            if value is None or math.isnan(value):
+                continue
+            if value < lows[index]:
+                lows[index] = value
+            if value > highs[index]:
+                highs[index] = value
+    return {
+        attr: (lows[index], highs[index])
+        for index, attr in enumerate(attrs)
+        if lows[index] <= highs[index]
+    }
+
+
 def _derive_cloud_min_cell(bank: Any, sensors: dict[str, Any]) -> None:
     """Derive bank min cell temp/voltage from per-battery data (CLOUD only).
 
@@ -1390,17 +1430,14 @@ def _derive_cloud_min_cell(bank: Any, sensors: dict[str, Any]) -> None:
     per-battery object does.  Mirror LOCAL's battery_bank_min_cell_* sensors
     when CAN/per-battery data is available; otherwise omit (never fabricate).
     """
-    batteries = getattr(bank, "batteries", None) or []
-    min_cell_temps = [
-        t for b in batteries if (t := getattr(b, "min_cell_temp", None)) is not None
-    ]
-    if min_cell_temps:
-        sensors["battery_bank_min_cell_temp"] = min(min_cell_temps)
-    min_cell_voltages = [
-        v for b in batteries if (v := getattr(b, "min_cell_voltage", None)) is not None
-    ]
-    if min_cell_voltages:
-        sensors["battery_bank_min_cell_voltage"] = min(min_cell_voltages)
+    extremes = bank_module_extremes(
+        getattr(bank, "batteries", None) or [],
+        ("min_cell_temp", "min_cell_voltage"),
+    )
+    if "min_cell_temp" in extremes:
+        sensors["battery_bank_min_cell_temp"] = extremes["min_cell_temp"][0]
+    if "min_cell_voltage" in extremes:
+        sensors["battery_bank_min_cell_voltage"] = extremes["min_cell_voltage"][0]
 
 
 def _bms_permission_state(value: bool | None) -> str | None:
@@ -1550,7 +1587,7 @@ def _build_battery_bank_sensor_mapping(
 
 def _build_individual_battery_mapping(
     battery: "Battery | BatteryData",
-) -> dict[str, Any]:
+) -> BatteryRecord:
     """Build sensor mapping from a BatteryData or Battery object.
 
     Works with both pylxpweb transport BatteryData (LOCAL/HYBRID overlay)
@@ -1561,55 +1598,55 @@ def _build_individual_battery_mapping(
         battery: BatteryData (transport) or Battery (device) object.
 
     Returns:
-        Dictionary mapping sensor keys to values.
+        Compact ``BatteryRecord`` mapping sensor keys to values.
     """
-    sensors: dict[str, Any] = {
+    last_seen = getattr(battery, "last_seen", None)
+    sensors = BatteryRecord.from_fields(
         # Core battery metrics
-        "battery_real_voltage": battery.voltage,
-        "battery_real_current": battery.current,
-        "battery_real_power": battery.power,
-        "battery_rsoc": battery.soc,
-        "state_of_health": battery.soh,
+        battery_real_voltage=battery.voltage,
+        battery_real_current=battery.current,
+        battery_real_power=battery.power,
+        battery_rsoc=battery.soc,
+        state_of_health=battery.soh,
         # Temperature sensors
-        "battery_max_cell_temp": battery.max_cell_temperature,
-        "battery_min_cell_temp": battery.min_cell_temperature,
-        "battery_max_cell_temp_num": battery.max_cell_num_temp,
-        "battery_min_cell_temp_num": battery.min_cell_num_temp,
+        battery_max_cell_temp=battery.max_cell_temperature,
+        battery_min_cell_temp=battery.min_cell_temperature,
+        battery_max_cell_temp_num=battery.max_cell_num_temp,
+        battery_min_cell_temp_num=battery.min_cell_num_temp,
         # Cell voltage sensors
-        "battery_max_cell_voltage": battery.max_cell_voltage,
-        "battery_min_cell_voltage": battery.min_cell_voltage,
-        "battery_max_cell_voltage_num": battery.max_cell_num_voltage,
-        "battery_min_cell_voltage_num": battery.min_cell_num_voltage,
-        "battery_cell_voltage_delta": battery.cell_voltage_delta,
-        "battery_cell_temp_delta": battery.cell_temp_delta,
+        battery_max_cell_voltage=battery.max_cell_voltage,
+        battery_min_cell_voltage=battery.min_cell_voltage,
+        battery_max_cell_voltage_num=battery.max_cell_num_voltage,
+        battery_min_cell_voltage_num=battery.min_cell_num_voltage,
+        battery_cell_voltage_delta=battery.cell_voltage_delta,
+        battery_cell_temp_delta=battery.cell_temp_delta,
         # Capacity sensors
-        # Use remaining_capacity (computed: max_capacity * soc / 100) not current_capacity
-        # which returns 0 from Modbus individual battery registers
-        "battery_remaining_capacity": battery.remaining_capacity,
-        "battery_full_capacity": battery.max_capacity,
-        "battery_capacity_percentage": battery.capacity_percent,
+        # Use remaining_capacity (computed: max_capacity * soc / 100) not
+        # current_capacity, which returns 0 from Modbus individual battery
+        # registers
+        battery_remaining_capacity=battery.remaining_capacity,
+        battery_full_capacity=battery.max_capacity,
+        battery_capacity_percentage=battery.capacity_percent,
         # BMS limits
-        "battery_max_charge_current": battery.charge_current_limit,
-        "battery_charge_voltage_ref": battery.charge_voltage_ref,
+        battery_max_charge_current=battery.charge_current_limit,
+        battery_charge_voltage_ref=battery.charge_voltage_ref,
         # Lifecycle
-        "cycle_count": battery.cycle_count,
-        "battery_firmware_version": battery.firmware_version,
+        cycle_count=battery.cycle_count,
+        battery_firmware_version=battery.firmware_version,
         # Metadata
-        "battery_type": battery.battery_type,
-        "battery_type_text": battery.battery_type_text,
-        "battery_serial_number": battery.serial_number,
-        "battery_model": battery.model,
-        "battery_index": battery.battery_index,
+        battery_type=battery.battery_type,
+        battery_type_text=battery.battery_type_text,
+        battery_serial_number=battery.serial_number,
+        battery_model=battery.model,
+        battery_index=battery.battery_index,
         # Last polled timestamp for individual battery device
-        "battery_last_polled": dt_util.utcnow(),
-        # Last seen: when this battery's register data was actually read from
-        # the inverter (round-robin may serve stale cached data for >4 systems)
-        "battery_last_seen": (
-            dt_util.as_utc(last_seen)
-            if (last_seen := getattr(battery, "last_seen", None))
-            else dt_util.utcnow()
+        battery_last_polled=dt_util.utcnow(),
+        # When this battery's register data was actually read from the
+        # inverter (round-robin may serve stale cached data for >4 systems)
+        battery_last_seen=(
+            dt_util.as_utc(last_seen) if last_seen else dt_util.utcnow()
         ),
-    }
+    )
 
     # Signed C-rate as percentage of capacity per hour
     _write_charge_rate(
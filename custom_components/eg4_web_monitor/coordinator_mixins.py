@@ -32,7 +32,14 @@ if TYPE_CHECKING:
     from pylxpweb.transports.data import BatteryData, InverterEnergyData
     from pylxpweb.transports.config import TransportConfig
 
+    from contextlib import AbstractContextManager
+
+    from .battery_record import BatteryRecord
+    from .cycle_profiler import CycleProfiler
     from .endpoint_bus import EndpointBusCapability, EndpointBusRegistry
+    from .event_log import EventLogCache
+    from .month_chart_cache import MonthChartCache
+    from .wire_trace import WireTraceRecorder
 
     # The device objects accepted by the generic property mapper.
     _DeviceObject = BaseInverter | Battery | BatteryBank | MIDDevice | ParallelGroup
@@ -46,12 +53,16 @@ from .const import (
 )
 from .cloud_requests import (
     CloudRequestLimiter,
+    SharedCloudAccount,
     SharedCloudRequestBudget,
     SharedFirmwareStatusFlight,
+    release_shared_cloud_account,
     release_shared_cloud_request_budget,
     release_shared_firmware_status,
 )
+from .cycle_profiler import PHASE_SIDE_FETCH
 from .endpoint_bus import EndpointBusCapability
+from .event_log import EVENT_BUFFER_SIZE
 from .coordinator_mappings import (
     CLOUD_SUPPLEMENTAL_LOST_KEYS,
     SMART_PORT_VALIDATED_KEY,
@@ -78,6 +89,7 @@ from .utils import (
     is_offgrid_family,
     normalize_event_row,
 )
+from .wire_trace import TRACE_KIND_CLOUD_INVERTER
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -116,6 +128,10 @@ EVENT_LOG_CLOUD_TIMEOUT = 10.0
 PV_STRING_ENERGY_FETCH_INTERVAL = 300.0
 PV_STRING_LIFETIME_FETCH_INTERVAL = 3600.0
 PV_STRING_ENERGY_CLOUD_TIMEOUT = 10.0
+# Accepted lifetime floors are written through one delayed, coalesced Store
+# save (flushed on unload); a restart inside the window only loses a sharper
+# first validation, never a reading.
+PV_STRING_LIFETIME_SAVE_DELAY = 120
 
 # HA caps entity state strings at 255 chars; longer states are rejected
 # outright. The Last Event sensor state (event text) is truncated defensively.
@@ -773,6 +789,7 @@ if TYPE_CHECKING:
         # Declared as Any to avoid diamond-inheritance conflict with
         # DataUpdateCoordinator[dict[str, Any]].data in the final class.
         data: Any
+        update_interval: Any
         hass: HomeAssistant
         client: LuxpowerClient | None
         station: Station | None
@@ -789,6 +806,7 @@ if TYPE_CHECKING:
         _pv_string_lifetime_floors: dict[tuple[str, int], float]
         _pv_string_lifetime_store: Store[dict[str, list[float | int]]]
         _pv_string_lifetime_store_lock: asyncio.Lock
+        _pv_string_lifetime_dirty: bool
         _background_tasks: set[asyncio.Task[Any]]
         _api_semaphore: asyncio.Semaphore
         _missing_parameter_refresh_task: asyncio.Task[None] | None
@@ -798,12 +816,15 @@ if TYPE_CHECKING:
         _cloud_request_limiter: CloudRequestLimiter | None
         _cloud_request_budget: SharedCloudRequestBudget | None
         _cloud_request_budget_released: bool
+        _shared_cloud_account: SharedCloudAccount | None
         _firmware_status_flight: SharedFirmwareStatusFlight | None
         _firmware_status_owner: object | None
         _firmware_status_released: bool
         _firmware_prefetched_device_ids: set[int]
         _background_scheduling_stopped: bool
         _http_polling_interval: int
+        _sidefetch_open_until: float | None
+        _sidefetch_interval_scale: float
         _local_transport_configs: list[dict[str, Any]]
         _local_transports_attached: bool
         _endpoint_bus_registry: EndpointBusRegistry
@@ -942,6 +963,7 @@ if TYPE_CHECKING:
 
         # ── Per-transport interval methods (coordinator.py) ──
         def _should_poll_transport(self, transport_type: str) -> bool: ...
+        def _seconds_until_transport_poll(self) -> float: ...
         def _has_modbus_transport(self) -> bool: ...
         def _has_dongle_transport(self) -> bool: ...
         def _get_active_transport_intervals(self) -> list[int]: ...
@@ -969,7 +991,7 @@ if TYPE_CHECKING:
         ) -> None: ...
 
         # ── LocalTransportMixin attributes ──
-        _battery_rr_cache: dict[str, dict[str, dict[str, Any]]]
+        _battery_rr_cache: dict[str, dict[str, BatteryRecord]]
         _battery_serial_to_key: dict[str, dict[str, str]]
         _battery_next_index: dict[str, int]
         _shared_battery_logged: set[str]
@@ -980,6 +1002,22 @@ if TYPE_CHECKING:
         # ── LocalTransportMixin methods ──
         async def _attach_local_transports_to_station(self) -> None: ...
         async def _maybe_retry_failed_attaches(self) -> None: ...
+        async def _link_probe_allows_refresh(
+            self, serial: str, device: Any
+        ) -> bool: ...
+
+        # ── Coordinator-owned helpers (coordinator.py) ──
+        cycle_profiler: "CycleProfiler | None"
+        _wire_trace: "WireTraceRecorder | None"
+        month_chart_cache: "MonthChartCache | None"
+        event_log: "EventLogCache | None"
+
+        def _profile_span(
+            self, phase: str, device: str | None = ..., *, exclude: str | None = ...
+        ) -> "AbstractContextManager[None]": ...
+        def _profile_wire(
+            self, device: str, transport: Any
+        ) -> "AbstractContextManager[None]": ...
         async def _ensure_local_transports(self) -> None: ...
         def _configure_attached_devices(self) -> list[Any]: ...
         def _sync_transport_link_state(
@@ -1093,6 +1131,13 @@ class DeviceProcessingMixin(_MixinBase):
     # single connectivity failure in that state re-opens immediately (a real
     # half-open, not another three-strike round).
     _sidefetch_half_open: bool = False
+    # Multiplier on the cloud side-fetch throttles, set by the budget-aware
+    # cadence controller (adaptive_polling); 1.0 = the documented tiers.
+    _sidefetch_interval_scale: float = 1.0
+
+    def _sidefetch_interval(self, interval: float) -> float:
+        """Return a side-fetch throttle stretched to the current cadence."""
+        return interval * self._sidefetch_interval_scale
 
     def _sidefetch_note_reachable(self) -> None:
         """The portal answered: close the breaker fully.
@@ -1218,7 +1263,8 @@ class DeviceProcessingMixin(_MixinBase):
             self._sidefetch_half_open = True
         try:
             awaitable = call() if callable(call) else call
-            result = await asyncio.wait_for(awaitable, timeout=timeout)
+            with self._profile_span(PHASE_SIDE_FETCH):
+                result = await asyncio.wait_for(awaitable, timeout=timeout)
         except asyncio.CancelledError:
             # Cancellation says nothing about portal connectivity. A cancelled
             # half-open probe still needs a bounded state before propagating.
@@ -1607,17 +1653,39 @@ class DeviceProcessingMixin(_MixinBase):
                     encoded_key,
                 )
 
-    async def _async_save_pv_string_lifetime_state(self) -> None:
-        """Persist accepted cloud lifetime floors and year counts."""
+    def _pv_string_lifetime_payload(self) -> dict[str, list[float | int]]:
+        """Return the lifetime state to persist and mark it written."""
+        self._pv_string_lifetime_dirty = False
+        year_counts = self._pv_string_lifetime_year_counts
+        return {
+            f"{state_key[0]}:{state_key[1]}": [floor, year_counts[state_key]]
+            for state_key, floor in self._pv_string_lifetime_floors.items()
+            if state_key in year_counts
+        }
+
+    def _schedule_pv_string_lifetime_save(self) -> None:
+        """Coalesce lifetime state changes into one delayed write.
+
+        The payload is built when the write runs, so every change accepted
+        inside the delay lands in a single save.
+        """
+        self._pv_string_lifetime_dirty = True
+        self._pv_string_lifetime_store.async_delay_save(
+            self._pv_string_lifetime_payload, PV_STRING_LIFETIME_SAVE_DELAY
+        )
+
+    async def _async_flush_pv_string_lifetime_state(self) -> None:
+        """Write pending lifetime state now (unload and shutdown).
+
+        ``async_save`` also cancels the pending delayed write.
+        """
         async with self._pv_string_lifetime_store_lock:
-            year_counts = self._pv_string_lifetime_year_counts
-            payload = {
-                f"{state_key[0]}:{state_key[1]}": [floor, year_counts[state_key]]
-                for state_key, floor in self._pv_string_lifetime_floors.items()
-                if state_key in year_counts
-            }
+            if not self._pv_string_lifetime_dirty:
+                return
             try:
-                await self._pv_string_lifetime_store.async_save(payload)
+                await self._pv_string_lifetime_store.async_save(
+                    self._pv_string_lifetime_payload()
+                )
             except Exception as e:
                 _LOGGER.warning("Could not persist PV string lifetime state: %s", e)
 
@@ -1765,16 +1833,41 @@ class DeviceProcessingMixin(_MixinBase):
             last_daily_fetch = self._last_status_fetch.get(daily_key)
             if (
                 last_daily_fetch is not None
-                and now - last_daily_fetch < PV_STRING_ENERGY_FETCH_INTERVAL
+                and now - last_daily_fetch
+                < self._sidefetch_interval(PV_STRING_ENERGY_FETCH_INTERVAL)
             ):
                 pass
             else:
                 try:
                     local_now = dt_util.now(_resolve_chart_day_timezone(self))
-                    response = await self._breakered_cloud_call(
-                        fetch_daily(serial, local_now.year, local_now.month),
-                        timeout=PV_STRING_ENERGY_CLOUD_TIMEOUT,
+                    month_cache = self.month_chart_cache
+                    response = (
+                        month_cache.get(
+                            serial,
+                            local_now.year,
+                            local_now.month,
+                            now=now,
+                            max_age=self._sidefetch_interval(
+                                PV_STRING_ENERGY_FETCH_INTERVAL
+                            ),
+                        )
+                        if month_cache is not None
+                        else None
                     )
+                    if response is None:
+                        response = await self._breakered_cloud_call(
+                            fetch_daily(serial, local_now.year, local_now.month),
+                            timeout=PV_STRING_ENERGY_CLOUD_TIMEOUT,
+                        )
+                        if month_cache is not None:
+                            month_cache.put(
+                                serial,
+                                local_now.year,
+                                local_now.month,
+                                response,
+                                now=now,
+                                today=local_now.date(),
+                            )
                     today_entry = next(
                         (
                             entry
@@ -1802,7 +1895,9 @@ class DeviceProcessingMixin(_MixinBase):
                         e,
                     )
                     self._stamp_pv_string_energy_retry(
-                        daily_key, now, PV_STRING_ENERGY_FETCH_INTERVAL
+                        daily_key,
+                        now,
+                        self._sidefetch_interval(PV_STRING_ENERGY_FETCH_INTERVAL),
                     )
 
         if callable(fetch_lifetime) and missing_lifetime_strings:
@@ -1905,7 +2000,7 @@ class DeviceProcessingMixin(_MixinBase):
                         else:
                             self._last_status_fetch[lifetime_key] = now
                     if lifetime_state_changed:
-                        await self._async_save_pv_string_lifetime_state()
+                        self._schedule_pv_string_lifetime_save()
                     lifetime_values = parsed_lifetime_values
 
         sensors = target["sensors"]
@@ -1968,11 +2063,16 @@ class DeviceProcessingMixin(_MixinBase):
         # the sibling 30s quick-charge throttle masks the same pattern only
         # because no host reaches the fetch in under 30s of uptime.
         last_fetch = self._last_status_fetch.get(event_key)
-        if last_fetch is not None and now - last_fetch < EVENT_LOG_FETCH_INTERVAL:
+        if last_fetch is not None and now - last_fetch < self._sidefetch_interval(
+            EVENT_LOG_FETCH_INTERVAL
+        ):
             self._carry_forward_last_event(serial, target)
             return
 
+        event_log = self.event_log
         try:
+            if event_log is not None:
+                await event_log.async_load()
             response = await self._breakered_cloud_call(
                 fetch(serial, rows=1), timeout=EVENT_LOG_CLOUD_TIMEOUT
             )
@@ -2006,6 +2106,42 @@ class DeviceProcessingMixin(_MixinBase):
         )
         target["last_event_detail"] = event
         _LOGGER.debug("Last event for %s: %s", serial, event)
+        if event_log is not None:
+            await self._sync_event_log(
+                event_log, fetch, serial, event, response.get("total"), now
+            )
+
+    async def _sync_event_log(
+        self,
+        event_log: "EventLogCache",
+        fetch: Any,
+        serial: str,
+        newest: dict[str, Any],
+        total: Any,
+        now: float,
+    ) -> None:
+        """Bring a device's event buffer up to the 1-row poll's newest event.
+
+        The poll row is the whole delta when at most one event is new; a
+        larger delta costs one page of exactly the new events. A failed page
+        read leaves the buffer unsynced, so the service reads the cloud.
+        """
+        events = [newest]
+        missing = event_log.missing(serial, newest, total)
+        if missing > 1:
+            try:
+                response = await self._breakered_cloud_call(
+                    fetch(serial, rows=min(missing, EVENT_BUFFER_SIZE)),
+                    timeout=EVENT_LOG_CLOUD_TIMEOUT,
+                )
+                rows = response.get("rows") or []
+                page = [normalize_event_row(row) for row in rows]
+                total = response.get("total", total)
+            except Exception as e:
+                _LOGGER.debug("Could not sync event log for %s: %s", serial, e)
+                return
+            events = [event for event in page if event is not None] or events
+        event_log.merge(serial, events, total, now)
 
     async def is_quick_charge_active_live(self, serial: str) -> bool | None:
         """Return whether a quick charge is running *right now* for ``serial``.
@@ -2197,7 +2333,8 @@ class DeviceProcessingMixin(_MixinBase):
         last_fetch = self._last_status_fetch.get(key)
         if (
             last_fetch is not None
-            and now - last_fetch < CLOUD_PARAM_STORE_FETCH_INTERVAL
+            and now - last_fetch
+            < self._sidefetch_interval(CLOUD_PARAM_STORE_FETCH_INTERVAL)
         ):
             self._carry_forward_cloud_param_store(spec, serial, target)
             return
@@ -2333,7 +2470,8 @@ class DeviceProcessingMixin(_MixinBase):
             # and a device that genuinely lacks the params answers that way
             # every time — re-arming on it would poll them forever.
             self._last_status_fetch[key] = now - (
-                CLOUD_PARAM_STORE_FETCH_INTERVAL - CLOUD_PARAM_STORE_RETRY_FLOOR
+                self._sidefetch_interval(CLOUD_PARAM_STORE_FETCH_INTERVAL)
+                - CLOUD_PARAM_STORE_RETRY_FLOOR
             )
             self._carry_forward_cloud_param_store(spec, serial, target)
 
@@ -2388,7 +2526,9 @@ class DeviceProcessingMixin(_MixinBase):
         serial = inverter.serial_number
         key = f"bb_{serial}"
         last_fetch = self._last_status_fetch.get(key)
-        if last_fetch is not None and now - last_fetch < BATTERY_BACKUP_FETCH_INTERVAL:
+        if last_fetch is not None and now - last_fetch < self._sidefetch_interval(
+            BATTERY_BACKUP_FETCH_INTERVAL
+        ):
             if self.data and serial in self.data.get("devices", {}):
                 previous = self.data["devices"][serial].get("battery_backup_status")
                 if previous is not None:
@@ -2460,6 +2600,11 @@ class DeviceProcessingMixin(_MixinBase):
         if budget is not None:
             release_shared_cloud_request_budget(self.hass, budget)
 
+        account = self._shared_cloud_account
+        self._shared_cloud_account = None
+        if account is not None:
+            release_shared_cloud_account(self.hass, account)
+
     async def _prefetch_firmware_update_info(self, devices: Collection[Any]) -> None:
         """Align device firmware polls so account progress is fetched once."""
         firmware_devices = [
@@ -2639,6 +2784,17 @@ class DeviceProcessingMixin(_MixinBase):
             self._carry_forward_smart_load(inverter.serial_number, processed)
             return processed
 
+        if self._wire_trace is not None:
+            self._wire_trace.record(
+                TRACE_KIND_CLOUD_INVERTER,
+                inverter.serial_number,
+                device=inverter,
+                runtime=getattr(inverter, "_runtime", None),
+                energy=getattr(inverter, "_energy", None),
+                battery_bank=getattr(inverter, "_battery_bank", None),
+                features=features,
+            )
+
         # Map inverter properties to sensor keys
         property_map = self._get_inverter_property_map()
         processed["sensors"] = _map_device_properties(inverter, property_map)
@@ -0,0 +1,244 @@
+"""Per-phase timing of coordinator update cycles.
+
+A slow cycle says nothing about *where* the time went. ``CycleProfiler``
+collects wall-clock spans for the phases of one update cycle — endpoint gate
+wait, wire reads, sensor mapping, cloud side-fetches, parallel-group
+aggregation, the snapshot/diff that selects listeners, device-removal
+bookkeeping and listener fan-out — and keeps a rolling window of per-cycle
+totals for every phase and device. Rolling p50/p95/max back the opt-in
+"Poll Time" diagnostic sensors and the ``cycle_profile`` diagnostics
+section.
+
+Recording is a ``perf_counter`` pair and a dict update per span; nothing is
+sorted until a sensor or the diagnostics dump reads the statistics.
+
+Spans opened between ``begin_cycle()`` and ``end_cycle()`` are summed per
+phase and device, so a phase that runs several times in a cycle (two
+parameter ranges, one side-fetch per feature) contributes one sample. Spans
+recorded outside a cycle — listener fan-out runs after the update returns —
+are stored as their own samples. The device a span belongs to defaults to
+the one set by ``device_scope()``, which follows asyncio tasks through a
+context variable, so concurrent per-device work is attributed correctly.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+import math
+import time
+from typing import Any, Final
+
+from .endpoint_bus import EndpointBusCapability
+
+PHASE_CYCLE: Final = "cycle"
+PHASE_GATE_WAIT: Final = "gate_wait"
+PHASE_WIRE_READ: Final = "wire_read"
+PHASE_MAPPING: Final = "mapping"
+PHASE_SIDE_FETCH: Final = "side_fetch"
+PHASE_PARALLEL_GROUPS: Final = "parallel_groups"
+PHASE_DATA_DIFF: Final = "data_diff"
+PHASE_DEVICE_REMOVAL: Final = "device_removal"
+PHASE_LISTENER_FANOUT: Final = "listener_fanout"
+# Per-device sum of that device's phases in one cycle.
+PHASE_DEVICE_TOTAL: Final = "total"
+ALL_PHASES: Final = (
+    PHASE_CYCLE,
+    PHASE_GATE_WAIT,
+    PHASE_WIRE_READ,
+    PHASE_MAPPING,
+    PHASE_SIDE_FETCH,
+    PHASE_PARALLEL_GROUPS,
+    PHASE_DATA_DIFF,
+    PHASE_DEVICE_REMOVAL,
+    PHASE_LISTENER_FANOUT,
+    PHASE_DEVICE_TOTAL,
+)
+
+# Spans not attributed to a device.
+COORDINATOR_SCOPE: Final = "coordinator"
+
+# Cycles kept per phase and device.
+_WINDOW = 120
+
+_DEVICE: ContextVar[str] = ContextVar("eg4_profiled_device", default=COORDINATOR_SCOPE)
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending, non-empty list."""
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+class _Span:
+    """Time one phase for one device; an optional phase is subtracted.
+
+    ``exclude`` removes time the same device spent in another recorded
+    phase during this span (cloud side-fetches awaited inside mapping).
+    """
+
+    __slots__ = ("_device", "_exclude", "_excluded", "_phase", "_profiler", "_start")
+
+    def __init__(
+        self,
+        profiler: CycleProfiler,
+        phase: str,
+        device: str | None,
+        exclude: str | None,
+    ) -> None:
+        self._profiler = profiler
+        self._phase = phase
+        self._device = device
+        self._exclude = exclude
+        self._excluded = 0.0
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        if self._device is None:
+            self._device = _DEVICE.get()
+        if self._exclude is not None:
+            self._excluded = self._profiler.pending(self._exclude, self._device)
+        self._start = time.perf_counter()
+
+    def __exit__(self, *exc_info: object) -> None:
+        elapsed = time.perf_counter() - self._start
+        device = self._device
+        if self._exclude is not None:
+            elapsed -= self._profiler.pending(self._exclude, device) - self._excluded
+        self._profiler.record(self._phase, max(0.0, elapsed), device)
+
+
+class _WireSpan:
+    """Time a device's wire operation, split into gate wait and wire read."""
+
+    __slots__ = ("_capability", "_device", "_gate_before", "_profiler", "_start")
+
+    def __init__(self, profiler: CycleProfiler, device: str, transport: Any) -> None:
+        self._profiler = profiler
+        self._device = device
+        self._capability = (
+            transport if isinstance(transport, EndpointBusCapability) else None
+        )
+        self._gate_before = 0.0
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        if self._capability is not None:
+            self._gate_before = self._capability.gate_wait_seconds
+        self._start = time.perf_counter()
+
+    def __exit__(self, *exc_info: object) -> None:
+        elapsed = time.perf_counter() - self._start
+        gate_wait = 0.0
+        if self._capability is not None:
+            gate_wait = self._capability.gate_wait_seconds - self._gate_before
+            self._profiler.record(PHASE_GATE_WAIT, gate_wait, self._device)
+        self._profiler.record(
+            PHASE_WIRE_READ, max(0.0, elapsed - gate_wait), self._device
+        )
+
+
+class CycleProfiler:
+    """Rolling per-phase, per-device timings of coordinator cycles."""
+
+    __slots__ = ("_pending", "_samples")
+
+    def __init__(self) -> None:
+        self._samples: dict[tuple[str, str], deque[float]] = {}
+        # Open cycle's running totals; None outside a cycle.
+        self._pending: dict[tuple[str, str], float] | None = None
+
+    def begin_cycle(self) -> None:
+        """Start summing spans into one sample per phase and device."""
+        self._pending = {}
+
+    def end_cycle(self) -> None:
+        """Store the open cycle's totals, one sample per phase and device."""
+        pending = self._pending
+        if pending is None:
+            return
+        self._pending = None
+        totals: dict[str, float] = {}
+        for (phase, device), seconds in pending.items():
+            self._store(phase, device, seconds)
+            if device != COORDINATOR_SCOPE:
+                totals[device] = totals.get(device, 0.0) + seconds
+        for device, seconds in totals.items():
+            self._store(PHASE_DEVICE_TOTAL, device, seconds)
+
+    def record(self, phase: str, seconds: float, device: str | None = None) -> None:
+        """Add ``seconds`` to a phase of ``device`` (default: current scope)."""
+        key = (phase, _DEVICE.get() if device is None else device)
+        pending = self._pending
+        if pending is None:
+            self._store(*key, seconds)
+        else:
+            pending[key] = pending.get(key, 0.0) + seconds
+
+    def pending(self, phase: str, device: str) -> float:
+        """Seconds recorded so far this cycle for a phase of ``device``."""
+        if self._pending is None:
+            return 0.0
+        return self._pending.get((phase, device), 0.0)
+
+    def span(
+        self, phase: str, device: str | None = None, *, exclude: str | None = None
+    ) -> _Span:
+        """Return a context manager timing ``phase`` for ``device``."""
+        return _Span(self, phase, device, exclude)
+
+    def wire_span(self, device: str, transport: Any) -> _WireSpan:
+        """Return a context manager timing a wire operation on ``transport``.
+
+        For endpoint capabilities the time spent queued on the endpoint gate
+        is recorded as ``gate_wait`` and only the rest as ``wire_read``.
+        """
+        return _WireSpan(self, device, transport)
+
+    @staticmethod
+    @contextmanager
+    def device_scope(device: str) -> Iterator[None]:
+        """Attribute spans without an explicit device to ``device``."""
+        token = _DEVICE.set(device)
+        try:
+            yield
+        finally:
+            _DEVICE.reset(token)
+
+    def forget(self, keep: set[str]) -> None:
+        """Drop the windows of devices no longer in the plant."""
+        for key in [
+            key
+            for key in self._samples
+            if key[1] != COORDINATOR_SCOPE and key[1] not in keep
+        ]:
+            del self._samples[key]
+
+    def device_stats(self, device: str) -> dict[str, dict[str, float]]:
+        """Return ``{phase: {p50_ms, p95_ms, max_ms, samples}}`` for a device."""
+        stats: dict[str, dict[str, float]] = {}
+        for (phase, scope), window in self._samples.items():
+            if scope != device or not window:
+                continue
+            ordered = sorted(window)
+            stats[phase] = {
+                "p50_ms": round(_percentile(ordered, 0.5) * 1000, 1),
+                "p95_ms": round(_percentile(ordered, 0.95) * 1000, 1),
+                "max_ms": round(ordered[-1] * 1000, 1),
+                "samples": len(ordered),
+            }
+        return stats
+
+    def as_dict(self) -> dict[str, dict[str, dict[str, float]]]:
+        """Return the statistics of every device and the coordinator."""
+        return {
+            device: self.device_stats(device)
+            for device in sorted({scope for _, scope in self._samples})
+        }
+
+    def _store(self, phase: str, device: str, seconds: float) -> None:
+        window = self._samples.get((phase, device))
+        if window is None:
+            window = self._samples[(phase, device)] = deque(maxlen=_WINDOW)
+        window.append(seconds)
@@ -17,6 +17,7 @@ are added or removed between downloads.
 from __future__ import annotations
 
 import re
+from collections.abc import Mapping
 from importlib.metadata import PackageNotFoundError, version
 from typing import Any
 
@@ -78,7 +79,7 @@ def _walk_serials(obj: Any, serials: set[str]) -> None:
     is a serial regardless of where it sits (e.g. the
     ``battery_serial_number`` sensor value).
     """
-    if isinstance(obj, dict):
+    if isinstance(obj, Mapping):
         for key, value in obj.items():
             if isinstance(key, str):
                 lowered = key.lower()
@@ -163,7 +164,7 @@ def _alias_serials(
     """
     if pattern is None:
         return obj
-    if isinstance(obj, dict):
+    if isinstance(obj, Mapping):
         return {
             _alias_serials(key, aliases, pattern): _alias_serials(
                 value, aliases, pattern
@@ -189,7 +190,7 @@ def _jsonable(obj: Any) -> Any:
     aiohttp exception carrying the connection target), and nothing
     downstream could redact free-form repr text reliably.
     """
-    if isinstance(obj, dict):
+    if isinstance(obj, Mapping):
         return {str(key): _jsonable(value) for key, value in obj.items()}
     if isinstance(obj, (list, tuple, set, frozenset)):
         return [_jsonable(item) for item in obj]
@@ -265,5 +266,12 @@ async def async_get_config_entry_diagnostics(
             "provenance": coordinator._bus_owner_eligibility.provenance.value,
         },
         "data": _clean(coordinator.data or {}),
+        # Rolling p50/p95/max (ms) per cycle phase, per device and for the
+        # coordinator-wide phases.
+        "cycle_profile": _clean(
+            coordinator.cycle_profiler.as_dict()
+            if coordinator.cycle_profiler is not None
+            else {}
+        ),
     }
     return result
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from builtins import BaseExceptionGroup
 from collections.abc import AsyncIterator, Callable, Collection, Coroutine
 from contextlib import asynccontextmanager
@@ -13,6 +14,10 @@ from typing import Any, Protocol, cast
 from pylxpweb.transports import create_transport_from_config
 from pylxpweb.transports.capabilities import TransportCapabilities
 from pylxpweb.transports.config import TransportConfig, TransportType
+from pylxpweb.transports.exceptions import (
+    TransportConnectionError,
+    TransportTimeoutError,
+)
 
 from .bus_eligibility import LocalBusProvenance
 
@@ -103,6 +108,10 @@ RawTransportFactory = Callable[[TransportConfig], _RawLocalTransport]
 ENDPOINT_BUS_REGISTRY_DATA = "eg4_web_monitor_endpoint_bus_registry"
 MAX_ENDPOINT_WAITERS = 64
 ENDPOINT_ACQUIRE_TIMEOUT_SECONDS = 10.0
+# A failed connect is a gateway-level fact shared by every unit ID behind the
+# endpoint: sibling connects within this window fail fast instead of each
+# waiting out its own connect timeouts.
+ENDPOINT_RECONNECT_HOLDOFF_SECONDS = 10.0
 
 
 async def _await_settled(
@@ -214,10 +223,17 @@ class _TaskReentrantGate:
 class _CapabilityRecord:
     raw: _RawLocalTransport
     closing: bool = False
+    # Seconds this capability's operations spent queued for the endpoint.
+    gate_wait: float = 0.0
 
 
 class _EndpointBusOwner:
-    """Own every raw transport and operation for one physical endpoint."""
+    """Own every raw transport and operation for one physical endpoint.
+
+    Each unit ID behind a gateway keeps its own raw transport, but the
+    connect lifecycle is endpoint-scoped: one failed connect holds off its
+    siblings' attempts for ``ENDPOINT_RECONNECT_HOLDOFF_SECONDS``.
+    """
 
     def __init__(
         self,
@@ -232,6 +248,7 @@ class _EndpointBusOwner:
         self._records: dict[int, _CapabilityRecord] = {}
         self._next_token = 0
         self._wire_tasks: dict[asyncio.Task[Any], int] = {}
+        self._connect_failed_at: float | None = None
 
     def add(self, raw: _RawLocalTransport) -> EndpointBusCapability:
         """Retain a raw transport and issue its only public capability."""
@@ -255,6 +272,11 @@ class _EndpointBusOwner:
         """Read an explicitly admitted raw property within the owner."""
         return getattr(self._open_record(token).raw, name)
 
+    def gate_wait(self, token: int) -> float:
+        """Return the total time a capability's operations queued for the gate."""
+        record = self._records.get(token)
+        return 0.0 if record is None else record.gate_wait
+
     def set_property(self, token: int, name: str, value: Any) -> None:
         """Set an explicitly admitted raw configuration property."""
         setattr(self._open_record(token).raw, name, value)
@@ -272,23 +294,75 @@ class _EndpointBusOwner:
         token: int,
         method: str,
         *args: Any,
+        wire_timeout: float | None = None,
     ) -> Any:
-        """Serialize one operation and detach post-wire cancellation."""
+        """Serialize one operation and detach post-wire cancellation.
+
+        ``wire_timeout`` bounds only the wire phase, after the gate: an
+        overdue operation raises ``TransportTimeoutError`` but is left to
+        finish behind the gate rather than cancelled mid-frame.
+        """
         self._open_record(token)
+        connecting = method == "connect"
+        if connecting:
+            self._check_reconnect_holdoff()
+        queued = time.perf_counter()
         await self._gate.acquire()
         try:
+            gate_wait = time.perf_counter() - queued
             record = self._open_record(token)
+            record.gate_wait += gate_wait
+            if connecting:
+                # A sibling may have failed the gateway while this waited.
+                self._check_reconnect_holdoff()
             operation = cast(
                 Callable[..., Coroutine[Any, Any, Any]], getattr(record.raw, method)
             )
             wire_task = asyncio.create_task(operation(*args))
             self._wire_tasks[wire_task] = token
             wire_task.add_done_callback(self._wire_tasks.pop)
+            wire_task.add_done_callback(
+                self._connect_settled if connecting else self._wire_settled
+            )
             self._gate.hold_for_wire_task(wire_task)
-            return await asyncio.shield(wire_task)
+            if wire_timeout is None:
+                return await asyncio.shield(wire_task)
+            done, _pending = await asyncio.wait({wire_task}, timeout=wire_timeout)
+            if not done:
+                raise TransportTimeoutError(
+                    f"{method} did not answer within {wire_timeout:.1f}s"
+                )
+            return wire_task.result()
         finally:
             self._gate.release()
 
+    def _check_reconnect_holdoff(self) -> None:
+        """Fail a connect fast while the endpoint's last connect failure holds."""
+        failed_at = self._connect_failed_at
+        if failed_at is None:
+            return
+        if time.monotonic() - failed_at >= ENDPOINT_RECONNECT_HOLDOFF_SECONDS:
+            self._connect_failed_at = None
+            return
+        raise TransportConnectionError(
+            "Endpoint unreachable; reconnect held off after a sibling's "
+            "connect failure"
+        )
+
+    def _connect_settled(self, task: asyncio.Task[Any]) -> None:
+        """Record whether the endpoint accepted the latest connect."""
+        if task.cancelled():
+            return
+        if task.exception() is None:
+            self._connect_failed_at = None
+        else:
+            self._connect_failed_at = time.monotonic()
+
+    def _wire_settled(self, task: asyncio.Task[Any]) -> None:
+        """Any completed wire operation proves the endpoint reachable."""
+        if not task.cancelled() and task.exception() is None:
+            self._connect_failed_at = None
+
     @asynccontextmanager
     async def transaction(self, token: int) -> AsyncIterator[None]:
         """Keep nested capability operations in one indivisible transaction."""
@@ -396,6 +470,11 @@ class EndpointBusCapability:
     def status(self) -> EndpointBusStatus:
         return self._owner.status()
 
+    @property
+    def gate_wait_seconds(self) -> float:
+        """Total time this device's operations spent queued on the endpoint."""
+        return self._owner.gate_wait(self._token)
+
     @property
     def is_connected(self) -> bool:
         return bool(self._owner.get_property(self._token, "is_connected"))
@@ -446,6 +525,20 @@ class EndpointBusCapability:
     async def disconnect(self) -> None:
         await self._owner.invoke(self._token, "disconnect")
 
+    async def async_probe(self, timeout: float) -> int:
+        """Reconnect if needed and read the device type as a link check.
+
+        ``timeout`` bounds each wire operation once it holds the endpoint;
+        time queued behind siblings is not counted against it.
+        """
+        if not self.is_connected:
+            await self._owner.invoke(self._token, "connect", wire_timeout=timeout)
+        return int(
+            await self._owner.invoke(
+                self._token, "read_device_type", wire_timeout=timeout
+            )
+        )
+
     async def async_shutdown(self) -> None:
         if self._shutdown_task is None:
             self._owner.begin_shutdown(self._token)
@@ -0,0 +1,185 @@
+"""Per-device portal event-log buffer with a persisted sync cursor.
+
+The Last Event sensor polls ``analyze/event/list`` with ``rows=1`` and the
+``fetch_events`` service used to download up to 100 rows on every call. The
+endpoint has no "since" filter, but its ``total`` count and monotonic
+``recordId`` are enough to sync incrementally. ``EventLogCache`` keeps, per
+device, the newest events (newest first, at most ``EVENT_BUFFER_SIZE``)
+plus the ``total`` seen at the last sync:
+
+- the 1-row poll's newest record matching the buffer's newest record means
+  nothing new; the row replaces its buffered copy (status refresh);
+- otherwise ``total`` grew by ``n``: the poll row already is the new event
+  when ``n`` is 1, and one page of ``n`` rows fetches them otherwise. A page
+  joins the buffer when it overlaps the buffered newest record, or holds
+  exactly ``n`` records newer than it; any other page replaces the buffer.
+
+The service answers from the buffer while it was synced within the poll
+interval and covers the requested count. Older events still ACTIVE are not
+refreshed by the cursor sync, so a window containing one is read from the
+cloud instead.
+
+Buffers and totals persist in a per-entry ``Store`` through delayed,
+coalesced saves, so the first poll after a restart only needs the 1-row
+read when nothing happened in between.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+EVENT_LOG_STORAGE_VERSION = 1
+EVENT_LOG_STORAGE_KEY = f"{DOMAIN}_event_log"
+_EVENT_LOG_SAVE_DELAY = 120  # seconds
+
+# Matches the fetch_events service's maximum count.
+EVENT_BUFFER_SIZE = 100
+
+
+class _DeviceEvents:
+    """Buffered newest-first events of one device and the portal total."""
+
+    __slots__ = ("events", "synced", "total")
+
+    def __init__(self, events: list[dict[str, Any]], total: int | None) -> None:
+        self.events: deque[dict[str, Any]] = deque(events, maxlen=EVENT_BUFFER_SIZE)
+        self.total = total
+        # Monotonic time of the last sync; None until synced this run.
+        self.synced: float | None = None
+
+
+def _joins(
+    events: list[dict[str, Any]],
+    newest: dict[str, Any],
+    total: int | None,
+    buffered_total: int | None,
+) -> bool:
+    """Whether a newest-first page continues a buffer without a hole."""
+    newest_id = newest.get("record_id")
+    ids = [event.get("record_id") for event in events]
+    if newest_id in ids:
+        return True
+    return (
+        isinstance(newest_id, int)
+        and total is not None
+        and buffered_total is not None
+        and total - buffered_total == len(ids)
+        and all(isinstance(i, int) and i > newest_id for i in ids)
+    )
+
+
+class EventLogCache:
+    """Per-entry event buffers, synced from the 1-row Last Event poll."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store = Store[dict[str, dict[str, Any]]](
+            hass, EVENT_LOG_STORAGE_VERSION, f"{EVENT_LOG_STORAGE_KEY}_{entry_id}"
+        )
+        self._devices: dict[str, _DeviceEvents] | None = None
+        self._dirty = False
+        self._load_lock = asyncio.Lock()
+
+    async def async_load(self) -> None:
+        """Load the persisted buffers once per coordinator."""
+        async with self._load_lock:
+            if self._devices is not None:
+                return
+            devices: dict[str, _DeviceEvents] = {}
+            try:
+                stored = await self._store.async_load() or {}
+                for serial, state in stored.items():
+                    events = [e for e in state["events"] if isinstance(e, dict)]
+                    total = state.get("total")
+                    devices[serial] = _DeviceEvents(
+                        events, total if isinstance(total, int) else None
+                    )
+            except Exception as e:
+                _LOGGER.warning("Could not load persisted event log state: %s", e)
+            self._devices = devices
+
+    def missing(self, serial: str, newest: dict[str, Any], total: Any) -> int:
+        """Return how many events are newer than the buffer's newest one.
+
+        0 when ``newest`` is already buffered, or when the buffer holds
+        nothing to count from (it then starts from ``newest`` alone).
+        """
+        device = (self._devices or {}).get(serial)
+        if device is None or not device.events:
+            return 0
+        if device.events[0].get("record_id") == newest.get("record_id"):
+            return 0
+        if not isinstance(total, int) or device.total is None:
+            return 0
+        return max(0, total - device.total)
+
+    def merge(
+        self, serial: str, events: list[dict[str, Any]], total: Any, now: float
+    ) -> None:
+        """Add a newest-first page; keep the buffer only if the page joins it."""
+        if self._devices is None or not events:
+            return
+        total = total if isinstance(total, int) else None
+        device = self._devices.get(serial)
+        if device is None:
+            self._devices[serial] = device = _DeviceEvents([], total)
+        buffered = device.events
+        device.synced = now
+        if total == device.total and events == list(buffered)[: len(events)]:
+            return
+        joined = bool(buffered) and _joins(events, buffered[0], total, device.total)
+        if joined:
+            page_ids = {event.get("record_id") for event in events}
+            while buffered and buffered[0].get("record_id") in page_ids:
+                buffered.popleft()
+        else:
+            buffered.clear()
+        buffered.extendleft(reversed(events))
+        device.total = total
+        self._schedule_save()
+
+    def recent(
+        self, serial: str, count: int, *, now: float, max_age: float
+    ) -> tuple[list[dict[str, Any]], int | None] | None:
+        """Return ``(events, total)`` from the buffer, or None to ask the cloud."""
+        device = (self._devices or {}).get(serial)
+        if device is None or device.synced is None or now - device.synced >= max_age:
+            return None
+        events = list(device.events)[:count]
+        total = device.total
+        if len(events) < count and (total is None or len(events) < total):
+            return None
+        if any(event.get("status") == "ACTIVE" for event in events[1:]):
+            return None
+        return events, total
+
+    def _schedule_save(self) -> None:
+        self._dirty = True
+        self._store.async_delay_save(self._snapshot, _EVENT_LOG_SAVE_DELAY)
+
+    def _snapshot(self) -> dict[str, dict[str, Any]]:
+        self._dirty = False
+        return {
+            serial: {"total": device.total, "events": list(device.events)}
+            for serial, device in (self._devices or {}).items()
+        }
+
+    async def async_flush(self) -> None:
+        """Write pending buffers now (unload and shutdown)."""
+        if not self._dirty:
+            return
+        try:
+            await self._store.async_save(self._snapshot())
+        except Exception as e:
+            _LOGGER.warning("Could not persist event log state: %s", e)
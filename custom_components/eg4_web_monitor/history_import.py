@@ -8,7 +8,10 @@ Design notes:
 
 - Data source: ``LuxpowerClient.analytics.get_month_daily_energy()`` —
   one cloud request per calendar month per inverter/parallel group,
-  returning all daily energy series at once.
+  returning all daily energy series at once. Months are read through the
+  coordinator's ``MonthChartCache`` (shared with the PV string side-fetch),
+  so re-importing finished months, or the current month shortly after the
+  side-fetch read it, makes no cloud request.
 - Statistics are written as EXTERNAL statistics
   (``eg4_web_monitor:plant_{plant_id}_{series}``) via
   ``async_add_external_statistics``. External statistic IDs use a ``:``
@@ -59,6 +62,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import re
+import time
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from typing import TYPE_CHECKING, Any, TypedDict
@@ -90,6 +94,7 @@ from .const import (
     CONNECTION_TYPE_HYBRID,
     DOMAIN,
 )
+from .month_chart_cache import MonthChartCache
 from .utils import _resolve_statistics_timezone
 
 if TYPE_CHECKING:
@@ -102,7 +107,8 @@ SERVICE_IMPORT_HISTORICAL_DATA = "import_historical_data"
 # Hard bound on the requested range (two years, leap-safe).
 MAX_RANGE_DAYS = 731
 
-# Delay between cloud requests to stay gentle on the EG4 API.
+# Minimum spacing between the starts of consecutive cloud requests, to stay
+# gentle on the EG4 API. Time spent waiting for a response counts toward it.
 FETCH_DELAY_SECONDS = 0.5
 
 # Resolved timezone used by the last successful statistics write, keyed by
@@ -258,8 +264,13 @@ async def async_import_historical_data(
             dry_run,
         )
 
+        month_cache = getattr(coordinator, "month_chart_cache", None)
         day_values, api_calls = await _fetch_daily_values(
-            fetch_method, units, start_date, end_date
+            fetch_method,
+            units,
+            start_date,
+            end_date,
+            cache=month_cache if isinstance(month_cache, MonthChartCache) else None,
         )
 
         requested_days = (end_date - start_date).days + 1
@@ -486,12 +497,15 @@ async def _fetch_daily_values(
     units: list[tuple[str, bool]],
     start_date: date,
     end_date: date,
+    cache: MonthChartCache | None = None,
 ) -> tuple[dict[str, dict[date, float]], int]:
     """Fetch and accumulate per-day kWh values for every tracked attribute.
 
     Values are summed across query units (parallel groups + standalone
     inverters). Days outside the requested range, in the future, or with
-    no data for an attribute are omitted from that attribute's map.
+    no data for an attribute are omitted from that attribute's map. Requests
+    start at least ``FETCH_DELAY_SECONDS`` apart; months answered by
+    ``cache`` are neither fetched nor paced.
 
     Returns:
         Tuple of (attr -> {day -> kWh} maps, number of cloud calls made).
@@ -502,17 +516,40 @@ async def _fetch_daily_values(
     today = dt_util.now().date()
     months = _iter_months(start_date, end_date)
     api_calls = 0
+    next_request_at = 0.0
 
     for serial, parallel in units:
         for year, month in months:
-            try:
-                history = await fetch_method(serial, year, month, parallel=parallel)
-            except Exception as err:
-                raise HomeAssistantError(
-                    f"Failed to fetch energy history for {serial} "
-                    f"({year}-{month:02d}): {err}"
-                ) from err
-            api_calls += 1
+            history = None
+            if cache is not None:
+                history = cache.get(
+                    serial, year, month, now=time.monotonic(), parallel=parallel
+                )
+            if history is None:
+                delay = next_request_at - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                next_request_at = time.monotonic() + FETCH_DELAY_SECONDS
+                try:
+                    history = await fetch_method(
+                        serial, year, month, parallel=parallel
+                    )
+                except Exception as err:
+                    raise HomeAssistantError(
+                        f"Failed to fetch energy history for {serial} "
+                        f"({year}-{month:02d}): {err}"
+                    ) from err
+                api_calls += 1
+                if cache is not None:
+                    cache.put(
+                        serial,
+                        year,
+                        month,
+                        history,
+                        now=time.monotonic(),
+                        today=today,
+                        parallel=parallel,
+                    )
 
             for entry in getattr(history, "days", None) or []:
                 try:
@@ -539,8 +576,6 @@ async def _fetch_daily_values(
                     day_map = accumulated[attr]
                     day_map[day] = day_map.get(day, 0.0) + kwh
 
-            await asyncio.sleep(FETCH_DELAY_SECONDS)
-
     return accumulated, api_calls
 
 
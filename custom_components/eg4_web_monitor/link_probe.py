@@ -0,0 +1,95 @@
+"""Cheap recovery probing for local transports whose link is down.
+
+Once pylxpweb declares a device's attached link down (eg4-57g), the only way
+back is a read that succeeds. Running the full ``refresh()`` for that every
+cycle walks runtime, energy, battery and parameter ranges into the dead
+link; pymodbus reads cannot be interrupted, so each one waits out its own
+timeout while holding the endpoint gate against every sibling unit ID.
+
+A ``LinkHealthProbe`` replaces that with one single-register read (the
+device-type holding register) under a short timeout, spaced by exponential
+backoff. The coordinator only lets the full refresh run again once a probe
+has answered; that refresh is what clears pylxpweb's link-down flag.
+
+The probe goes through the device's endpoint capability like any other
+operation, so it still queues behind the gate and is paced on dongles. Its
+timeout is applied by the bus owner to the wire operation alone: time spent
+queued behind siblings never fails a probe, and an overdue read is left to
+finish behind the gate instead of being cancelled on a shared socket. An
+endpoint too busy to admit the probe defers it without counting a failure.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+import time
+from typing import Any
+
+from .endpoint_bus import EndpointAdmissionError, EndpointBusCapability
+
+_LOGGER = logging.getLogger(__name__)
+
+LINK_PROBE_TIMEOUT_SECONDS = 2.0
+
+# Spacing between failed probes (seconds): the first failure waits
+# _BACKOFF_FLOOR, later ones double up to _MAX_BACKOFF.
+_BACKOFF_FLOOR = 15.0
+_BACKOFF_FACTOR = 2.0
+_MAX_BACKOFF = 300.0
+
+
+@dataclass(slots=True)
+class LinkHealthProbe:
+    """Recovery probe state for one device with a down transport link.
+
+    Attributes:
+        backoff: Current spacing (seconds) between probes; 0 until the
+            first probe fails.
+        failures: Consecutive failed probes.
+    """
+
+    backoff: float = 0.0
+    failures: int = 0
+    _next_probe: float = 0.0
+
+    def due(self) -> bool:
+        """Whether the backoff window has elapsed."""
+        return time.monotonic() >= self._next_probe
+
+    async def async_check(self, transport: Any) -> bool:
+        """Probe the link if due; return whether a full refresh may run.
+
+        Only endpoint capabilities are probed; any other transport keeps
+        the full refresh. A successful probe leaves the backoff as it is:
+        if the refresh it unlocks still finds the link down, the next probe
+        waits the same spacing instead of hammering a flapping link.
+        """
+        if not isinstance(transport, EndpointBusCapability):
+            return True
+        if not self.due():
+            return False
+
+        try:
+            await transport.async_probe(LINK_PROBE_TIMEOUT_SECONDS)
+        except EndpointAdmissionError as err:
+            # The endpoint was too busy to admit the probe; that says nothing
+            # about this device's link, so retry next cycle.
+            _LOGGER.debug("Link probe deferred: %s", err)
+            return False
+        except Exception as err:  # noqa: BLE001 - any failure means still down
+            self.failures += 1
+            self.backoff = min(
+                _MAX_BACKOFF, max(_BACKOFF_FLOOR, self.backoff * _BACKOFF_FACTOR)
+            )
+            self._next_probe = time.monotonic() + self.backoff
+            _LOGGER.debug(
+                "Link probe failed (%d in a row, next in %.0fs): %s",
+                self.failures,
+                self.backoff,
+                err or type(err).__name__,
+            )
+            return False
+        self.failures = 0
+        self._next_probe = time.monotonic() + self.backoff
+        return True
@@ -0,0 +1,93 @@
+"""Per-coordinator cache of monthly daily-energy chart responses.
+
+``analytics.get_month_daily_energy()`` (the portal's monthColumn chart) is
+read by two consumers: the PV1-3 daily energy side-fetch asks for the current
+month of every inverter on its own throttle, and the historical import asks
+for a range of months per inverter or parallel group. Both now read through
+one ``MonthChartCache`` owned by the coordinator:
+
+- the current month is served for a short time (``CURRENT_MONTH_MAX_AGE``,
+  or the caller's own freshness bound) — its today row keeps growing;
+- a month that had ended at least a full day before it was fetched is final
+  and served for as long as the coordinator lives.
+
+Callers pass their own monotonic ``now``, so the cache ages entries on the
+same clock as the caller's throttles. A bounded number of months is kept; the
+oldest stored entry is dropped first.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any
+
+# Seconds a current-month response answers later reads (the PV string
+# side-fetch interval).
+CURRENT_MONTH_MAX_AGE = 300.0
+
+_MAX_ENTRIES = 256
+
+# (serial, year, month, parallel)
+_MonthKey = tuple[str, int, int, bool]
+
+
+@dataclass(frozen=True, slots=True)
+class _MonthEntry:
+    response: Any
+    fetched: float
+    final: bool
+
+
+class MonthChartCache:
+    """Month-chart responses keyed by serial, month and parallel flag."""
+
+    __slots__ = ("_entries",)
+
+    def __init__(self) -> None:
+        self._entries: dict[_MonthKey, _MonthEntry] = {}
+
+    def get(
+        self,
+        serial: str,
+        year: int,
+        month: int,
+        *,
+        now: float,
+        parallel: bool = False,
+        max_age: float = CURRENT_MONTH_MAX_AGE,
+    ) -> Any | None:
+        """Return a usable cached response, or None when one must be fetched.
+
+        ``max_age`` bounds how old a non-final response may be.
+        """
+        entry = self._entries.get((serial, year, month, parallel))
+        if entry is None:
+            return None
+        if entry.final or now - entry.fetched < max_age:
+            return entry.response
+        return None
+
+    def put(
+        self,
+        serial: str,
+        year: int,
+        month: int,
+        response: Any,
+        *,
+        now: float,
+        today: date,
+        parallel: bool = False,
+    ) -> None:
+        """Store a response fetched at ``now`` on ``today`` (plant-local)."""
+        settled = today - timedelta(days=1)
+        key = (serial, year, month, parallel)
+        entries = self._entries
+        entries.pop(key, None)
+        if len(entries) >= _MAX_ENTRIES:
+            del entries[next(iter(entries))]
+        entries[key] = _MonthEntry(
+            response,
+            now,
+            (year, month) < (settled.year, settled.month),
+        )
@@ -0,0 +1,168 @@
+"""Single-pass, versioned entity-registry migrations for config-entry setup.
+
+Setup used to walk ``er.async_entries_for_config_entry`` once per cleanup
+(stale local battery IDs, the ``power_output`` rename, retired sensor
+suffixes, family exclusions, smart ports).  With thousands of entities every
+walk costs noticeable event-loop time on each boot, even though most of those
+migrations only ever act once.
+
+This module indexes the entry's registry rows once and evaluates every rule
+against each row in a single pass.  Rules come in two kinds:
+
+- *versioned* rules are one-time migrations.  After a pass completes, their
+  versions are persisted per config entry, and later setups skip them;
+- *unversioned* rules (``version=None``) are evaluated on every pass that
+  includes them: purges of retired sensor suffixes, whose suffix sets grow
+  over time, and conditional rules that depend on refreshed coordinator data
+  (a resolved inverter family, authoritative smart-port status).
+
+Setup always includes unversioned rules, so the registry is still scanned
+once on every setup; what the pass saves is one walk per cleanup.  Only a
+pass with no pending rule at all returns without scanning.
+
+A rule that removes or renames a row *consumes* it; later rules in the same
+pass never see a row that no longer exists under its original identity.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Collection, Iterable
+from dataclasses import dataclass
+import logging
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+REGISTRY_MIGRATION_STORAGE_VERSION = 1
+REGISTRY_MIGRATION_STORAGE_KEY = f"{DOMAIN}_registry_migrations"
+
+# ``(registry, row) -> consumed``.  Returning True means the rule removed or
+# re-keyed the row, so no later rule may act on it in this pass.
+RegistryRule = Callable[[er.EntityRegistry, er.RegistryEntry], bool]
+
+
+@dataclass(frozen=True, slots=True)
+class RegistryMigration:
+    """One entity-registry rule evaluated during the shared setup pass.
+
+    Attributes:
+        name: Short identifier used in debug logging.
+        apply: Per-row rule; see ``RegistryRule``.
+        domain: Only rows of this entity domain are offered to the rule
+            (``None`` offers every row).
+        version: One-time migration version, persisted once applied.  ``None``
+            marks a conditional rule that runs on every pass.
+        finish: Optional callback run after the pass, e.g. to raise Repairs
+            issues for what the rule removed.
+    """
+
+    name: str
+    apply: RegistryRule
+    domain: str | None = "sensor"
+    version: int | None = None
+    finish: Callable[[], None] | None = None
+
+
+def _storage_key(entry_id: str) -> str:
+    """Return the per-entry Store key holding applied migration versions."""
+    return f"{REGISTRY_MIGRATION_STORAGE_KEY}_{entry_id}"
+
+
+async def async_load_applied_registry_migrations(
+    hass: HomeAssistant, entry_id: str
+) -> set[int]:
+    """Return the one-time migration versions already applied to an entry.
+
+    A missing or malformed store reads as "nothing applied": every one-time
+    rule is idempotent, so re-running them is always safe.
+    """
+    store = Store[dict[str, list[int]]](
+        hass, REGISTRY_MIGRATION_STORAGE_VERSION, _storage_key(entry_id)
+    )
+    stored = await store.async_load()
+    if not isinstance(stored, dict):
+        return set()
+    applied = stored.get("applied")
+    if not isinstance(applied, list):
+        return set()
+    return {version for version in applied if isinstance(version, int)}
+
+
+async def async_save_applied_registry_migrations(
+    hass: HomeAssistant, entry_id: str, applied: Iterable[int]
+) -> None:
+    """Persist the complete set of applied one-time migration versions."""
+    store = Store[dict[str, list[int]]](
+        hass, REGISTRY_MIGRATION_STORAGE_VERSION, _storage_key(entry_id)
+    )
+    await store.async_save({"applied": sorted(set(applied))})
+
+
+async def async_remove_registry_migration_state(
+    hass: HomeAssistant, entry_id: str
+) -> None:
+    """Delete an entry's migration ledger when the entry itself is removed."""
+    await Store(
+        hass, REGISTRY_MIGRATION_STORAGE_VERSION, _storage_key(entry_id)
+    ).async_remove()
+
+
+@callback
+def async_run_registry_migrations(
+    hass: HomeAssistant,
+    entry_id: str,
+    migrations: Iterable[RegistryMigration],
+    *,
+    applied: Collection[int] = (),
+) -> set[int]:
+    """Evaluate every pending rule against the entry's registry in one pass.
+
+    Args:
+        hass: Home Assistant instance.
+        entry_id: Config entry whose entity-registry rows are migrated.
+        migrations: Rules in evaluation order; the first rule that consumes a
+            row wins.
+        applied: One-time versions already recorded for this entry.
+
+    Returns:
+        Versions of the one-time rules completed by this pass.  The caller
+        persists them together with ``applied``.
+    """
+    pending = [
+        migration
+        for migration in migrations
+        if migration.version is None or migration.version not in applied
+    ]
+    if not pending:
+        return set()
+
+    entity_registry = er.async_get(hass)
+    rows = er.async_entries_for_config_entry(entity_registry, entry_id)
+    consumed = 0
+    for row in rows:
+        for migration in pending:
+            if migration.domain is not None and row.domain != migration.domain:
+                continue
+            if migration.apply(entity_registry, row):
+                consumed += 1
+                break
+
+    for migration in pending:
+        if migration.finish is not None:
+            migration.finish()
+
+    _LOGGER.debug(
+        "Registry migration pass for %s: %d rules over %d rows, %d rows changed",
+        entry_id,
+        len(pending),
+        len(rows),
+        consumed,
+    )
+    return {
+        migration.version for migration in pending if migration.version is not None
+    }
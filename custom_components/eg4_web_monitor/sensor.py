@@ -45,6 +45,7 @@ from .coordinator_mappings import (
     GRIDBOSS_SMART_PORT_DYNAMIC_KEYS,
     _supports_three_phase_context,
 )
+from .cycle_profiler import ALL_PHASES, PHASE_DEVICE_TOTAL
 from .utils import is_supported_control_model
 
 _LOGGER = logging.getLogger(__name__)
@@ -613,6 +614,8 @@ def _create_inverter_sensors(
             )
         )
 
+    inverter_entities.extend(_create_poll_time_sensor(coordinator, serial, "inverter"))
+
     # Create battery bank sensors (separate device, phase 2)
     # Battery bank is a parent device for individual batteries
     battery_bank_sensor_count = 0
@@ -668,7 +671,7 @@ def _create_simple_device_sensors(
     device_type: str,
 ) -> list[SensorEntity]:
     """Create sensor entities for a GridBOSS or Parallel Group device."""
-    return [
+    entities: list[SensorEntity] = [
         _device_sensor_class(sensor_key)(
             coordinator=coordinator,
             serial=serial,
@@ -678,6 +681,27 @@ def _create_simple_device_sensors(
         for sensor_key in device_data.get("sensors", {})
         if sensor_key in SENSOR_TYPES
     ]
+    if device_type == "gridboss":
+        entities.extend(_create_poll_time_sensor(coordinator, serial, device_type))
+    return entities
+
+
+def _create_poll_time_sensor(
+    coordinator: EG4DataUpdateCoordinator,
+    serial: str,
+    device_type: str,
+) -> list[SensorEntity]:
+    """Create the opt-in poll-time diagnostic sensor for a polled device."""
+    if coordinator.cycle_profiler is None:
+        return []
+    return [
+        EG4PollTimeSensor(
+            coordinator=coordinator,
+            serial=serial,
+            sensor_key="poll_time",
+            device_type=device_type,
+        )
+    ]
 
 
 class EG4InverterSensor(EG4BaseSensor, SensorEntity):
@@ -752,6 +776,53 @@ class EG4QuickChargeRemainingSensor(EG4InverterSensor):
         return remain if remain else 0
 
 
+# Per-phase statistics the Poll Time sensor exposes as attributes.
+_POLL_TIME_STATS = ("p50_ms", "p95_ms", "max_ms")
+
+
+class EG4PollTimeSensor(EG4InverterSensor):
+    """Rolling p95 of the time one update cycle spends on this device.
+
+    Sourced from the coordinator's cycle profiler, not the sensors dict. The
+    state is the p95 of the device's per-cycle total over the profiler's
+    window; the p50/p95/max of each phase (gate wait, wire read, mapping,
+    side-fetch) ride as attributes so a slow device can be pinned to the
+    step that is slow.
+
+    The attributes change every cycle and only the live view is useful, so
+    none of them are written to the recorder.
+    """
+
+    _unrecorded_attributes = frozenset(
+        {
+            "samples",
+            *(f"{phase}_{stat}" for phase in ALL_PHASES for stat in _POLL_TIME_STATS),
+        }
+    )
+
+    def _phase_stats(self) -> dict[str, dict[str, float]]:
+        profiler = self.coordinator.cycle_profiler
+        return {} if profiler is None else profiler.device_stats(self._serial)
+
+    def _get_raw_value(self) -> Any:
+        """Return the p95 per-cycle total in milliseconds."""
+        return self._phase_stats().get(PHASE_DEVICE_TOTAL, {}).get("p95_ms")
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return p50/p95/max per phase, flattened."""
+        stats = self._phase_stats()
+        if not stats:
+            return None
+        attributes: dict[str, Any] = {
+            "samples": stats.get(PHASE_DEVICE_TOTAL, {}).get("samples", 0)
+        }
+        for phase, phase_stats in sorted(stats.items()):
+            for stat in _POLL_TIME_STATS:
+                attributes[f"{phase}_{stat}"] = phase_stats[stat]
+        return attributes
+
+
 class EG4BatteryBankSensor(EG4BatteryBankEntity, SensorEntity):
     """Representation of an EG4 Battery Bank sensor (aggregate of all batteries).
 
@@ -9,6 +9,9 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import math
+import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
@@ -32,6 +35,7 @@ from .const import (
     CONNECTION_TYPE_HYBRID,
     DOMAIN,
 )
+from .coordinator_mixins import EVENT_LOG_FETCH_INTERVAL
 from .utils import _get_station_timezone, normalize_event_row
 
 if TYPE_CHECKING:
@@ -76,6 +80,12 @@ ENERGY_TYPE_MAPPING: dict[str, dict[str, str]] = {
 # Rate limit: delay between API calls (seconds)
 API_RATE_LIMIT_DELAY = 1.0
 
+# Day-breakdown requests reconcile keeps in flight at once. The account's
+# shared cloud limiter admits three, so polling always keeps a slot.
+_RECONCILE_CONCURRENT_REQUESTS = 2
+
+_ONE_HOUR = timedelta(hours=1)
+
 
 async def async_reconcile_history(
     hass: HomeAssistant,
@@ -200,6 +210,16 @@ async def async_reconcile_history(
     )
 
 
+@dataclass(frozen=True, slots=True)
+class _ReconcileTarget:
+    """One inverter energy statistic to reconcile against one cloud series."""
+
+    serial: str
+    entity_id: str
+    energy_type: str
+    description: str
+
+
 async def _reconcile_coordinator(
     hass: HomeAssistant,
     coordinator: EG4DataUpdateCoordinator,
@@ -208,6 +228,11 @@ async def _reconcile_coordinator(
 ) -> tuple[int, int]:
     """Reconcile history for a single coordinator.
 
+    Planning runs once per coordinator: one registry pass resolves every
+    target entity and one recorder query reads all of their existing
+    statistics. The cloud is then asked only for the days that hold gaps,
+    one pass per inverter over those days.
+
     Args:
         hass: Home Assistant instance
         coordinator: The coordinator to reconcile
@@ -225,22 +250,19 @@ async def _reconcile_coordinator(
         _LOGGER.debug("No device data available for %s", coordinator.entry.title)
         return 0, 0
 
-    entity_registry = er.async_get(hass)
+    entity_index = _energy_entity_index(
+        er.async_get(hass), coordinator.entry.entry_id
+    )
 
+    targets: list[_ReconcileTarget] = []
     for serial, device_data in coordinator.data["devices"].items():
         device_type = device_data.get("type")
         if device_type != "inverter":
             continue
 
-        _LOGGER.debug("Reconciling history for inverter %s", serial)
-
         for energy_type, mapping in ENERGY_TYPE_MAPPING.items():
             sensor_key = mapping["sensor_key"]
-
-            # Find the corresponding entity
-            entity_id = _find_energy_entity(
-                entity_registry, coordinator.entry.entry_id, serial, sensor_key
-            )
+            entity_id = _find_energy_entity(entity_index, serial, sensor_key)
             if not entity_id:
                 _LOGGER.debug(
                     "No entity found for %s sensor %s on inverter %s",
@@ -249,121 +271,122 @@ async def _reconcile_coordinator(
                     serial,
                 )
                 continue
-
-            try:
-                imported, gaps = await _reconcile_energy_sensor(
-                    hass,
-                    coordinator,
-                    serial,
-                    entity_id,
-                    energy_type,
-                    mapping["description"],
-                    start_date,
-                    end_date,
+            targets.append(
+                _ReconcileTarget(
+                    serial, entity_id, energy_type, mapping["description"]
                 )
-                total_imported += imported
-                total_gaps += gaps
+            )
 
-                # Rate limit API calls
-                await asyncio.sleep(API_RATE_LIMIT_DELAY)
+    if not targets:
+        return 0, 0
 
-            except Exception as err:
-                _LOGGER.warning(
-                    "Failed to reconcile %s for inverter %s: %s",
-                    mapping["description"],
-                    serial,
-                    err,
-                )
+    existing_by_id = await _get_existing_statistics(
+        hass, {target.entity_id for target in targets}, start_date, end_date
+    )
+    hour_grid = _hour_grid(start_date, end_date)
+
+    pending: list[tuple[_ReconcileTarget, dict[datetime, float], list[datetime]]] = []
+    # serial -> date string -> energy types with gaps on that day
+    day_types_by_serial: dict[str, dict[str, set[str]]] = {}
+    for target in targets:
+        existing_stats = existing_by_id.get(target.entity_id, {})
+        gap_hours = _find_gap_hours(existing_stats, hour_grid)
+        if not gap_hours:
+            _LOGGER.debug(
+                "No gaps found for %s (%s)", target.entity_id, target.description
+            )
+            continue
+        _LOGGER.info(
+            "Found %d gap hours for %s (%s), fetching from cloud",
+            len(gap_hours),
+            target.entity_id,
+            target.description,
+        )
+        pending.append((target, existing_stats, gap_hours))
+        day_types = day_types_by_serial.setdefault(target.serial, {})
+        for day in _group_gaps_by_day(gap_hours):
+            day_types.setdefault(day, set()).add(target.energy_type)
+
+    series_by_serial: dict[str, dict[str, dict[datetime, float]]] = {}
+    for serial, day_types in day_types_by_serial.items():
+        series_by_serial[serial] = await _fetch_cloud_data(
+            coordinator, serial, day_types
+        )
+
+    for target, existing_stats, gap_hours in pending:
+        hourly_data = series_by_serial[target.serial].get(target.energy_type, {})
+        try:
+            imported, gaps = await _reconcile_energy_sensor(
+                hass, target, existing_stats, gap_hours, hourly_data
+            )
+            total_imported += imported
+            total_gaps += gaps
+        except Exception as err:
+            _LOGGER.warning(
+                "Failed to reconcile %s for inverter %s: %s",
+                target.description,
+                target.serial,
+                err,
+            )
 
     return total_imported, total_gaps
 
 
-def _find_energy_entity(
+def _energy_entity_index(
     entity_registry: er.EntityRegistry,
     config_entry_id: str,
+) -> dict[str, str]:
+    """Map unique_id to entity_id for every entity of a config entry."""
+    return {
+        entity.unique_id: entity.entity_id
+        for entity in er.async_entries_for_config_entry(
+            entity_registry, config_entry_id
+        )
+    }
+
+
+def _find_energy_entity(
+    entity_index: dict[str, str],
     serial: str,
     sensor_key: str,
 ) -> str | None:
     """Find the entity ID for an energy sensor.
 
     Args:
-        entity_registry: HA entity registry
-        config_entry_id: Config entry ID
+        entity_index: unique_id -> entity_id map from _energy_entity_index
         serial: Inverter serial number
         sensor_key: Sensor key (e.g., "yield", "grid_import")
 
     Returns:
         Entity ID if found, None otherwise
     """
-    # Build expected unique_id pattern: {serial}_energy_{sensor_key}
-    expected_unique_id = f"{serial}_energy_{sensor_key}"
-
-    for entity in er.async_entries_for_config_entry(entity_registry, config_entry_id):
-        if entity.unique_id == expected_unique_id:
-            return entity.entity_id
-
-    # Also try without data_type prefix (some sensors might not have it)
-    expected_unique_id_alt = f"{serial}_{sensor_key}"
-    for entity in er.async_entries_for_config_entry(entity_registry, config_entry_id):
-        if entity.unique_id == expected_unique_id_alt:
-            return entity.entity_id
-
-    return None
+    # Expected unique_id pattern: {serial}_energy_{sensor_key}; some sensors
+    # have no data_type prefix.
+    return entity_index.get(f"{serial}_energy_{sensor_key}") or entity_index.get(
+        f"{serial}_{sensor_key}"
+    )
 
 
 async def _reconcile_energy_sensor(
     hass: HomeAssistant,
-    coordinator: EG4DataUpdateCoordinator,
-    serial: str,
-    entity_id: str,
-    energy_type: str,
-    description: str,
-    start_date: datetime,
-    end_date: datetime,
+    target: _ReconcileTarget,
+    existing_stats: dict[datetime, float],
+    gap_hours: list[datetime],
+    hourly_data: dict[datetime, float],
 ) -> tuple[int, int]:
-    """Reconcile history for a single energy sensor.
+    """Fill the gap hours of a single energy sensor from fetched cloud data.
 
     Args:
         hass: Home Assistant instance
-        coordinator: The coordinator with cloud client
-        serial: Inverter serial number
-        entity_id: HA entity ID for the sensor
-        energy_type: EG4 API energy type (e.g., "eInvDay")
-        description: Human-readable description
-        start_date: Start of reconciliation period
-        end_date: End of reconciliation period
+        target: The statistic and cloud series to reconcile
+        existing_stats: Existing statistics for the sensor (datetime -> sum)
+        gap_hours: Hours without statistics (UTC), ascending
+        hourly_data: Cloud series for the gap days (UTC datetime -> Wh)
 
     Returns:
         Tuple of (imported count, gaps found)
     """
-    statistic_id = entity_id
-
-    # Get existing statistics to find gaps
-    existing_stats = await _get_existing_statistics(
-        hass, statistic_id, start_date, end_date
-    )
-
-    # Find gap hours
-    gap_hours = _find_gap_hours(existing_stats, start_date, end_date)
-
-    if not gap_hours:
-        _LOGGER.debug("No gaps found for %s (%s)", entity_id, description)
-        return 0, 0
-
-    _LOGGER.info(
-        "Found %d gap hours for %s (%s), fetching from cloud",
-        len(gap_hours),
-        entity_id,
-        description,
-    )
-
-    # Group gaps by day for efficient API calls
-    days_to_fetch = _group_gaps_by_day(gap_hours)
-
-    # Fetch data from cloud API
-    hourly_data = await _fetch_cloud_data(
-        coordinator, serial, energy_type, days_to_fetch
-    )
+    statistic_id = entity_id = target.entity_id
 
     if not hourly_data:
         _LOGGER.debug("No cloud data available for gaps in %s", entity_id)
@@ -398,7 +421,7 @@ async def _reconcile_energy_sensor(
         "Imported %d statistics for %s (%s)",
         len(statistics),
         entity_id,
-        description,
+        target.description,
     )
 
     return len(statistics), len(gap_hours)
@@ -406,20 +429,20 @@ async def _reconcile_energy_sensor(
 
 async def _get_existing_statistics(
     hass: HomeAssistant,
-    statistic_id: str,
+    statistic_ids: set[str],
     start_date: datetime,
     end_date: datetime,
-) -> dict[datetime, float]:
-    """Get existing statistics for a sensor.
+) -> dict[str, dict[datetime, float]]:
+    """Get existing statistics for several sensors in one recorder query.
 
     Args:
         hass: Home Assistant instance
-        statistic_id: Statistics ID (typically entity_id)
+        statistic_ids: Statistics IDs (typically entity_ids)
         start_date: Start of period
         end_date: End of period
 
     Returns:
-        Dict mapping datetime to sum value
+        Dict mapping statistic ID to a dict of datetime -> sum value
     """
     recorder = get_instance(hass)
 
@@ -432,15 +455,16 @@ async def _get_existing_statistics(
         hass,
         start_utc,
         end_utc,
-        {statistic_id},
+        statistic_ids,
         "hour",
         None,
         {"sum"},
     )
 
-    existing: dict[datetime, float] = {}
-    if statistic_id in stats:
-        for stat in stats[statistic_id]:
+    existing_by_id: dict[str, dict[datetime, float]] = {}
+    for statistic_id, rows in stats.items():
+        existing = existing_by_id[statistic_id] = {}
+        for stat in rows:
             sum_value = stat.get("sum")
             start_time = stat.get("start")
             # stat["start"] is a Unix timestamp (float), convert to datetime
@@ -449,37 +473,33 @@ async def _get_existing_statistics(
                 start_dt = dt_util.utc_from_timestamp(start_time)
                 existing[start_dt] = float(sum_value)
 
-    return existing
+    return existing_by_id
+
+
+def _hour_grid(start_date: datetime, end_date: datetime) -> list[datetime]:
+    """List the UTC hour starts from ``start_date`` (floored) to ``end_date``."""
+    current_utc = dt_util.as_utc(start_date.replace(minute=0, second=0, microsecond=0))
+    end_utc = dt_util.as_utc(end_date)
+    if current_utc >= end_utc:
+        return []
+    count = math.ceil((end_utc - current_utc) / _ONE_HOUR)
+    return [current_utc + index * _ONE_HOUR for index in range(count)]
 
 
 def _find_gap_hours(
     existing_stats: dict[datetime, float],
-    start_date: datetime,
-    end_date: datetime,
+    hour_grid: list[datetime],
 ) -> list[datetime]:
     """Find hours without statistics data.
 
     Args:
         existing_stats: Dict of existing statistics (datetime -> sum)
-        start_date: Start of period
-        end_date: End of period
+        hour_grid: Hours of the period from _hour_grid, shared by all sensors
 
     Returns:
         List of datetime objects representing gap hours (in UTC)
     """
-    gaps: list[datetime] = []
-
-    # Round start to hour boundary
-    current = start_date.replace(minute=0, second=0, microsecond=0)
-    current_utc = dt_util.as_utc(current)
-    end_utc = dt_util.as_utc(end_date)
-
-    while current_utc < end_utc:
-        if current_utc not in existing_stats:
-            gaps.append(current_utc)
-        current_utc = current_utc + timedelta(hours=1)
-
-    return gaps
+    return [hour for hour in hour_grid if hour not in existing_stats]
 
 
 def _group_gaps_by_day(gap_hours: list[datetime]) -> set[str]:
@@ -500,136 +520,44 @@ def _group_gaps_by_day(gap_hours: list[datetime]) -> set[str]:
 async def _fetch_cloud_data(
     coordinator: EG4DataUpdateCoordinator,
     serial: str,
-    energy_type: str,
-    days: set[str],
-) -> dict[datetime, float]:
-    """Fetch hourly energy data from cloud API.
+    day_types: dict[str, set[str]],
+) -> dict[str, dict[datetime, float]]:
+    """Fetch hourly energy data from cloud API, one day at a time.
+
+    The cloud's day breakdown carries one energy type per request. A day's
+    energy types are requested in pairs, each pair followed by one
+    rate-limit pause, so reconcile never takes more than two of the
+    account's three shared request slots; only the days and energy types
+    that hold gaps are requested.
 
     Args:
         coordinator: Coordinator with cloud client
         serial: Inverter serial number
-        energy_type: EG4 API energy type
-        days: Set of date strings to fetch
+        day_types: Date string (YYYY-MM-DD) -> EG4 API energy types to fetch
 
     Returns:
-        Dict mapping UTC datetime to energy value (Wh)
+        Dict mapping energy type to a dict of UTC datetime -> energy (Wh)
     """
-    hourly_data: dict[datetime, float] = {}
+    series: dict[str, dict[datetime, float]] = {}
 
     # Verify client is available
     if coordinator.client is None:
         _LOGGER.warning("No cloud client available for coordinator")
-        return hourly_data
+        return series
 
-    for date_str in sorted(days):
+    analytics = coordinator.client.analytics
+    station_tz = _get_station_timezone(coordinator) or dt_util.DEFAULT_TIME_ZONE
+
+    async def _fetch_series(
+        date_str: str, date_obj: datetime, energy_type: str
+    ) -> None:
         try:
-            response = await coordinator.client.analytics.get_energy_day_breakdown(
-                serial,
-                date_str,
-                energy_type,
-                parallel=False,
+            response = await analytics.get_energy_day_breakdown(
+                serial, date_str, energy_type, parallel=False
             )
-
-            # Parse date
-            date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-
-            # Handle multiple possible API response formats:
-            # Format 1: data: [{hour: int, energy: int}] - observed in live testing
-            # Format 2: dataPoints: [{period: str, value: number}] - OpenAPI spec
-            # Format 3: data: {timestamps: [], values: []} - parallel arrays
-            data_points = response.get("data") or response.get("dataPoints") or []
-
-            # Log response format for debugging
-            _LOGGER.debug(
-                "Analytics response for %s on %s: keys=%s, data_type=%s",
-                serial,
-                date_str,
-                list(response.keys()),
-                type(data_points).__name__,
+            series.setdefault(energy_type, {}).update(
+                _parse_day_breakdown(response, date_obj, station_tz)
             )
-
-            # Process based on data structure
-            if isinstance(data_points, list):
-                # Format 1 or 2: list of objects
-                for point in data_points:
-                    if not isinstance(point, dict):
-                        continue
-
-                    # Try Format 1: {hour, energy}
-                    hour = point.get("hour")
-                    energy = point.get("energy")
-
-                    # Fallback to Format 2: {period, value}
-                    if hour is None and "period" in point:
-                        period = point.get("period", "")
-                        # Parse period like "00:00" or "01:00"
-                        if ":" in str(period):
-                            try:
-                                hour = int(str(period).split(":")[0])
-                            except (ValueError, IndexError):
-                                hour = 0
-                        else:
-                            hour = 0
-                    if energy is None:
-                        energy = point.get("value", 0)
-
-                    if hour is None:
-                        continue
-
-                    _LOGGER.debug("Processing point: hour=%s, energy=%s", hour, energy)
-
-                    # Create UTC datetime for this hour
-                    local_dt = date_obj.replace(
-                        hour=int(hour), minute=0, second=0, microsecond=0
-                    )
-
-                    # Get station timezone from coordinator if available
-                    station_tz = _get_station_timezone(coordinator)
-                    if station_tz:
-                        local_dt = local_dt.replace(tzinfo=station_tz)
-                    else:
-                        local_dt = local_dt.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
-
-                    utc_dt = dt_util.as_utc(local_dt)
-
-                    # Energy is in Wh, store as-is for now
-                    # Conversion to kWh happens during transformation
-                    if energy and float(energy) > 0:
-                        hourly_data[utc_dt] = float(energy)
-
-            elif isinstance(data_points, dict):
-                # Format 3: {timestamps: [], values: []}
-                timestamps = data_points.get("timestamps", [])
-                values = data_points.get("values", [])
-
-                for i, (ts, val) in enumerate(zip(timestamps, values)):
-                    # Parse timestamp like "00:00" or use index as hour
-                    if isinstance(ts, str) and ":" in ts:
-                        try:
-                            hour = int(ts.split(":")[0])
-                        except (ValueError, IndexError):
-                            hour = i
-                    else:
-                        hour = i
-
-                    local_dt = date_obj.replace(
-                        hour=hour, minute=0, second=0, microsecond=0
-                    )
-
-                    station_tz = _get_station_timezone(coordinator)
-                    if station_tz:
-                        local_dt = local_dt.replace(tzinfo=station_tz)
-                    else:
-                        local_dt = local_dt.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
-
-                    utc_dt = dt_util.as_utc(local_dt)
-
-                    if val and float(val) > 0:
-                        hourly_data[utc_dt] = float(val)
-
-            # Rate limit
-            await asyncio.sleep(API_RATE_LIMIT_DELAY)
-
         except Exception as err:
             _LOGGER.warning(
                 "Failed to fetch %s data for %s on %s: %s",
@@ -639,6 +567,120 @@ async def _fetch_cloud_data(
                 err,
             )
 
+    for date_str in sorted(day_types):
+        date_obj = datetime.strptime(date_str, "%Y-%m-%d")
+        energy_types = sorted(day_types[date_str])
+        for start in range(0, len(energy_types), _RECONCILE_CONCURRENT_REQUESTS):
+            await asyncio.gather(
+                *(
+                    _fetch_series(date_str, date_obj, energy_type)
+                    for energy_type in energy_types[
+                        start : start + _RECONCILE_CONCURRENT_REQUESTS
+                    ]
+                )
+            )
+
+            # Rate limit
+            await asyncio.sleep(API_RATE_LIMIT_DELAY)
+
+    return series
+
+
+def _parse_day_breakdown(
+    response: dict[str, Any],
+    date_obj: datetime,
+    station_tz: Any,
+) -> dict[datetime, float]:
+    """Parse one day-breakdown response into UTC hour -> energy (Wh).
+
+    Args:
+        response: Cloud day breakdown for one energy type
+        date_obj: The (naive) day the response covers
+        station_tz: Timezone the response hours are local to
+
+    Returns:
+        Dict mapping UTC datetime to energy value (Wh), positive values only
+    """
+    hourly_data: dict[datetime, float] = {}
+
+    # Handle multiple possible API response formats:
+    # Format 1: data: [{hour: int, energy: int}] - observed in live testing
+    # Format 2: dataPoints: [{period: str, value: number}] - OpenAPI spec
+    # Format 3: data: {timestamps: [], values: []} - parallel arrays
+    data_points = response.get("data") or response.get("dataPoints") or []
+
+    # Log response format for debugging
+    _LOGGER.debug(
+        "Analytics response for %s: keys=%s, data_type=%s",
+        date_obj.strftime("%Y-%m-%d"),
+        list(response.keys()),
+        type(data_points).__name__,
+    )
+
+    # Process based on data structure
+    if isinstance(data_points, list):
+        # Format 1 or 2: list of objects
+        for point in data_points:
+            if not isinstance(point, dict):
+                continue
+
+            # Try Format 1: {hour, energy}
+            hour = point.get("hour")
+            energy = point.get("energy")
+
+            # Fallback to Format 2: {period, value}
+            if hour is None and "period" in point:
+                period = point.get("period", "")
+                # Parse period like "00:00" or "01:00"
+                if ":" in str(period):
+                    try:
+                        hour = int(str(period).split(":")[0])
+                    except (ValueError, IndexError):
+                        hour = 0
+                else:
+                    hour = 0
+            if energy is None:
+                energy = point.get("value", 0)
+
+            if hour is None:
+                continue
+
+            _LOGGER.debug("Processing point: hour=%s, energy=%s", hour, energy)
+
+            # Create UTC datetime for this hour
+            local_dt = date_obj.replace(
+                hour=int(hour), minute=0, second=0, microsecond=0, tzinfo=station_tz
+            )
+            utc_dt = dt_util.as_utc(local_dt)
+
+            # Energy is in Wh, store as-is for now
+            # Conversion to kWh happens during transformation
+            if energy and float(energy) > 0:
+                hourly_data[utc_dt] = float(energy)
+
+    elif isinstance(data_points, dict):
+        # Format 3: {timestamps: [], values: []}
+        timestamps = data_points.get("timestamps", [])
+        values = data_points.get("values", [])
+
+        for i, (ts, val) in enumerate(zip(timestamps, values)):
+            # Parse timestamp like "00:00" or use index as hour
+            if isinstance(ts, str) and ":" in ts:
+                try:
+                    hour = int(ts.split(":")[0])
+                except (ValueError, IndexError):
+                    hour = i
+            else:
+                hour = i
+
+            local_dt = date_obj.replace(
+                hour=hour, minute=0, second=0, microsecond=0, tzinfo=station_tz
+            )
+            utc_dt = dt_util.as_utc(local_dt)
+
+            if val and float(val) > 0:
+                hourly_data[utc_dt] = float(val)
+
     return hourly_data
 
 
@@ -741,6 +783,8 @@ async def async_fetch_events(hass: HomeAssistant, call: ServiceCall) -> ServiceR
     Returns the recent portal event log (faults, warnings, notices) for one
     device or every inverter/GridBOSS in the config entry. Response-only
     (SupportsResponse.ONLY); requires cloud credentials (HTTP or Hybrid mode).
+    Devices whose event buffer was synced within the Last Event poll
+    interval are answered from it without a cloud call (event_log.py).
     """
     entry = _resolve_entry(hass, call.data["config_entry"])
     coordinator: EG4DataUpdateCoordinator = entry.runtime_data
@@ -794,8 +838,25 @@ async def async_fetch_events(hass: HomeAssistant, call: ServiceCall) -> ServiceR
         )
 
     count = call.data["count"]
+    event_log = coordinator.event_log
+    if event_log is not None:
+        await event_log.async_load()
     results: dict[str, Any] = {}
     for serial in serials:
+        if event_log is not None:
+            buffered = event_log.recent(
+                serial,
+                count,
+                now=time.monotonic(),
+                max_age=EVENT_LOG_FETCH_INTERVAL,
+            )
+            if buffered is not None:
+                events, total = buffered
+                results[serial] = {
+                    "total": total if total is not None else len(events),
+                    "events": events,
+                }
+                continue
         try:
             response = await fetch(serial, rows=count)
         except Exception as err:
@@ -813,6 +874,10 @@ async def async_fetch_events(hass: HomeAssistant, call: ServiceCall) -> ServiceR
                 _LOGGER.debug("Skipping malformed event row for %s: %r", serial, row)
                 continue
             events.append(event)
+        if event_log is not None:
+            # A short page joins the buffer like the poll's page does; only a
+            # page that leaves a gap starts the buffer over.
+            event_log.merge(serial, events, response.get("total"), time.monotonic())
         results[serial] = {
             "total": response.get("total", len(rows)),
             "events": events,
@@ -0,0 +1,445 @@
+"""Opt-in recording of each cycle's raw device data, and offline replay.
+
+Regressions in the mapping pipeline are usually reproduced by hand-building
+pylxpweb objects from a bug report. With the ``wire_trace`` option enabled
+the coordinator instead records what each cycle actually received — the
+transport ``InverterRuntimeData`` / ``InverterEnergyData`` / ``BatteryBankData``
+(with its ``BatteryData``), the GridBOSS ``MidboxRuntimeData`` and, for cloud
+inverters, the portal runtime/energy/battery responses — to a rotating,
+gzip-compressed JSONL file in the Home Assistant config directory.
+
+``async_replay_trace`` feeds such a recording back through a coordinator's
+mapping and local parallel-group aggregation as fast as it can, one recorded
+cycle at a time. It serves as a deterministic reproduction of a user's plant
+and as a throughput benchmark on real traffic (``tests/test_wire_trace.py``
+replays the file named by ``EG4_WIRE_TRACE`` and logs its cycles per second;
+``EG4_WIRE_TRACE_MIN_CPS`` turns that into a floor).
+
+Objects are encoded with their pylxpweb type so replay rebuilds the same
+classes. An object that is the very one recorded for the same field in the
+previous cycle (pylxpweb served it from cache) is written as a back-reference,
+which keeps files small and lets replay exercise the identity memos exactly
+as production did.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+import dataclasses
+from dataclasses import dataclass
+from datetime import date, datetime
+from enum import Enum
+import gzip
+import importlib
+import importlib.metadata
+import json
+import logging
+from pathlib import Path
+import time
+from typing import TYPE_CHECKING, Any, Final
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .coordinator import EG4DataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+WIRE_TRACE_FILE_NAME: Final = "eg4_web_monitor_wire_trace.jsonl.gz"
+
+TRACE_KIND_INVERTER: Final = "inverter"
+TRACE_KIND_MIDBOX: Final = "midbox"
+TRACE_KIND_CLOUD_INVERTER: Final = "cloud_inverter"
+
+# Rotate once the compressed file passes this size; keep this many older
+# files (``.1`` newest) next to it.
+_MAX_FILE_BYTES = 16 * 1024 * 1024
+_BACKUP_COUNT = 3
+
+# Only pylxpweb types are rebuilt from a recording.
+_TRUSTED_MODULE_PREFIX = "pylxpweb."
+
+# Record field that carries the recorded device's class, not its data.
+_DEVICE_FIELD = "device"
+
+
+def _installed_pylxpweb() -> str | None:
+    try:
+        return importlib.metadata.version("pylxpweb")
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+# Stamped on every recorded device. Replay fills pylxpweb's private data
+# attributes, which only the release that recorded a trace is known to have.
+_PYLXPWEB_VERSION: Final = _installed_pylxpweb()
+
+
+def _type_path(value: Any) -> str:
+    cls = type(value)
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def _resolve_type(path: str) -> Any:
+    module_name, _, qualname = path.partition(":")
+    if not module_name.startswith(_TRUSTED_MODULE_PREFIX):
+        raise ValueError(f"Refusing to rebuild untrusted type {path!r}")
+    target: Any = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        target = getattr(target, part)
+    return target
+
+
+def _encode(value: Any) -> Any:
+    """Return a JSON-compatible, type-tagged form of ``value``."""
+    if value is None or isinstance(value, bool | int | float | str):
+        return value
+    if isinstance(value, Enum):
+        return {"$type": _type_path(value), "$value": _encode(value.value)}
+    if isinstance(value, datetime):
+        return {"$datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"$date": value.isoformat()}
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            "$type": _type_path(value),
+            "$fields": {
+                field.name: _encode(getattr(value, field.name))
+                for field in dataclasses.fields(value)
+                if field.init
+            },
+        }
+    if hasattr(value, "model_dump"):
+        # pydantic cloud response models
+        return {
+            "$type": _type_path(value),
+            "$model": value.model_dump(mode="json", by_alias=True),
+        }
+    if isinstance(value, dict):
+        return {str(key): _encode(item) for key, item in value.items()}
+    if isinstance(value, list | tuple | set | frozenset):
+        return [_encode(item) for item in value]
+    return repr(value)
+
+
+def _decode(value: Any) -> Any:
+    """Rebuild a value written by ``_encode``."""
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if "$datetime" in value:
+        return datetime.fromisoformat(value["$datetime"])
+    if "$date" in value:
+        return date.fromisoformat(value["$date"])
+    if "$type" in value:
+        cls = _resolve_type(value["$type"])
+        if "$value" in value:
+            return cls(_decode(value["$value"]))
+        if "$model" in value:
+            return cls.model_validate(value["$model"])
+        return cls(**{name: _decode(item) for name, item in value["$fields"].items()})
+    return {key: _decode(item) for key, item in value.items()}
+
+
+class WireTraceRecorder:
+    """Buffer each cycle's device data and append it to the trace file.
+
+    ``record()`` only encodes into memory; ``async_flush()`` writes the
+    cycle's lines from the executor, rotating the file when it grows past
+    its size limit.
+    """
+
+    __slots__ = ("_backups", "_cycle", "_last", "_lines", "_max_bytes", "_path")
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        max_bytes: int = _MAX_FILE_BYTES,
+        backups: int = _BACKUP_COUNT,
+    ) -> None:
+        self._path = path
+        self._max_bytes = max_bytes
+        self._backups = backups
+        self._cycle = 0
+        self._lines: list[str] = []
+        # Object last recorded per (kind, serial, field); held so an
+        # unchanged object can be written as a back-reference.
+        self._last: dict[tuple[str, str, str], Any] = {}
+
+    @property
+    def path(self) -> Path:
+        """The file the trace is appended to."""
+        return self._path
+
+    def record(self, kind: str, serial: str, **objects: Any) -> None:
+        """Buffer one device's raw data for the current cycle.
+
+        ``device`` names the recorded pylxpweb device class (and model), so
+        replay can rebuild it around the recorded data; every other keyword
+        is stored as the object itself.
+        """
+        line: dict[str, Any] = {
+            "ts": time.time(),
+            "cycle": self._cycle,
+            "kind": kind,
+            "serial": serial,
+        }
+        fields: dict[str, Any] = {}
+        for name, value in objects.items():
+            if name == _DEVICE_FIELD:
+                line[_DEVICE_FIELD] = {
+                    "$type": _type_path(value),
+                    "model": getattr(value, "model", None),
+                    "pylxpweb": _PYLXPWEB_VERSION,
+                }
+                continue
+            key = (kind, serial, name)
+            if value is not None and self._last.get(key) is value:
+                fields[name] = {"$same": True}
+                continue
+            self._last[key] = value
+            fields[name] = _encode(value)
+        line["data"] = fields
+        self._lines.append(json.dumps(line, separators=(",", ":")))
+
+    async def async_flush(self, hass: HomeAssistant) -> None:
+        """Write the buffered cycle to disk and start the next cycle."""
+        self._cycle += 1
+        if not self._lines:
+            return
+        lines, self._lines = self._lines, []
+        try:
+            rotated = await hass.async_add_executor_job(self._write, lines)
+        except OSError as err:
+            _LOGGER.warning("Could not write wire trace %s: %s", self._path, err)
+            rotated = True
+        if rotated:
+            # The next file must replay on its own: no back-references
+            # into a rotated (or possibly unwritten) file.
+            self._last.clear()
+
+    def _write(self, lines: list[str]) -> bool:
+        with gzip.open(self._path, "at", encoding="utf-8") as file:
+            file.write("\n".join(lines) + "\n")
+        if self._path.stat().st_size <= self._max_bytes:
+            return False
+        self._rotate()
+        return True
+
+    def _rotate(self) -> None:
+        for index in range(self._backups, 0, -1):
+            source = (
+                self._path
+                if index == 1
+                else self._path.with_name(f"{self._path.name}.{index - 1}")
+            )
+            if source.exists():
+                source.replace(self._path.with_name(f"{self._path.name}.{index}"))
+        self._path.unlink(missing_ok=True)
+
+
+def iter_trace(path: Path) -> Iterator[dict[str, Any]]:
+    """Yield the records of a trace file with their objects rebuilt.
+
+    Back-references are resolved to the object decoded for the same field
+    in an earlier cycle (the identical instance, as in production).
+    """
+    last: dict[tuple[str, str, str], Any] = {}
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        for raw in file:
+            if not raw.strip():
+                continue
+            record = json.loads(raw)
+            kind, serial = record["kind"], record["serial"]
+            data: dict[str, Any] = {}
+            for name, value in record["data"].items():
+                key = (kind, serial, name)
+                if isinstance(value, dict) and value.get("$same"):
+                    data[name] = last[key]
+                else:
+                    data[name] = last[key] = _decode(value)
+            record["data"] = data
+            yield record
+
+
+@dataclass(slots=True)
+class ReplayStats:
+    """Outcome of replaying a trace."""
+
+    cycles: int = 0
+    records: int = 0
+    seconds: float = 0.0
+
+    @property
+    def cycles_per_second(self) -> float:
+        """Replay throughput."""
+        return self.cycles / self.seconds if self.seconds else 0.0
+
+
+def _rebuild_device(record: dict[str, Any], **transport: Any) -> Any:
+    """Rebuild the recorded pylxpweb device around its recorded data.
+
+    The device gets no client: replay only reads its data properties.
+    Raises ``ValueError`` when the installed pylxpweb no longer has one of
+    the private attributes the data is put into, instead of replaying an
+    empty device.
+    """
+    spec = record[_DEVICE_FIELD]
+    device = _resolve_type(spec["$type"])(None, record["serial"], spec["model"])
+    for attribute, value in transport.items():
+        if not hasattr(device, attribute):
+            raise ValueError(
+                f"{type(device).__qualname__} has no {attribute!r} in pylxpweb "
+                f"{_PYLXPWEB_VERSION}; the trace was recorded with pylxpweb "
+                f"{spec.get('pylxpweb')}"
+            )
+        setattr(device, attribute, value)
+    return device
+
+
+def _replay_inverter(
+    coordinator: EG4DataUpdateCoordinator, record: dict[str, Any]
+) -> dict[str, Any]:
+    from .coordinator_local import _add_computed_transport_sensors
+
+    serial = record["serial"]
+    data = record["data"]
+    runtime, energy, battery = data["runtime"], data["energy"], data["battery"]
+    features = data["features"] or {}
+    bank_count = (battery.battery_count or 0) if battery else 0
+    inverter = _rebuild_device(
+        record,
+        _transport_runtime=runtime,
+        _transport_energy=energy,
+        _transport_battery=battery,
+    )
+    sensors = dict(
+        coordinator._map_transport_sensors(
+            serial, runtime, energy, battery if bank_count else None, features
+        )
+    )
+    _add_computed_transport_sensors(sensors, inverter, features)
+    parallel_number, parallel_master_slave, parallel_phase = data["parallel"]
+    batteries: dict[str, Any] = {}
+    if bank_count and battery.batteries:
+        batteries = coordinator._merge_round_robin_batteries(
+            serial, list(battery.batteries), battery.battery_count
+        )
+    return {
+        "type": "inverter",
+        "model": record[_DEVICE_FIELD]["model"],
+        "serial": serial,
+        "sensors": sensors,
+        "batteries": batteries,
+        "features": features,
+        "parallel_number": parallel_number,
+        "parallel_master_slave": parallel_master_slave,
+        "parallel_phase": parallel_phase,
+    }
+
+
+def _replay_midbox(
+    coordinator: EG4DataUpdateCoordinator, record: dict[str, Any]
+) -> dict[str, Any]:
+    mid_device = _rebuild_device(
+        record, _transport_runtime=record["data"]["runtime"]
+    )
+    return {
+        "type": "gridboss",
+        "model": "GridBOSS",
+        "serial": record["serial"],
+        "sensors": coordinator._map_local_gridboss_sensors(mid_device),
+        "binary_sensors": {},
+    }
+
+
+def _replay_cloud_inverter(
+    coordinator: EG4DataUpdateCoordinator, record: dict[str, Any]
+) -> dict[str, Any]:
+    from .const import operating_state_slug
+    from .coordinator_mixins import _map_device_properties
+
+    data = record["data"]
+    inverter = _rebuild_device(
+        record,
+        _runtime=data["runtime"],
+        _energy=data["energy"],
+        _battery_bank=data["battery_bank"],
+    )
+    sensors = _map_device_properties(
+        inverter, coordinator._get_inverter_property_map()
+    )
+    sensors["operating_state"] = operating_state_slug(sensors.get("status_code"))
+    return {
+        "type": "inverter",
+        "model": record[_DEVICE_FIELD]["model"],
+        "serial": record["serial"],
+        "sensors": sensors,
+        "batteries": {},
+        "features": data["features"] or {},
+    }
+
+
+_REPLAYERS: Final[
+    dict[
+        str,
+        Callable[[EG4DataUpdateCoordinator, dict[str, Any]], dict[str, Any]],
+    ]
+] = {
+    TRACE_KIND_INVERTER: _replay_inverter,
+    TRACE_KIND_MIDBOX: _replay_midbox,
+    TRACE_KIND_CLOUD_INVERTER: _replay_cloud_inverter,
+}
+
+
+async def async_replay_trace(
+    coordinator: EG4DataUpdateCoordinator,
+    path: Path,
+    *,
+    on_cycle: Callable[[dict[str, Any]], None] | None = None,
+) -> ReplayStats:
+    """Replay a trace through ``coordinator``'s mapping and aggregation.
+
+    Each recorded cycle becomes one ``{"devices": ...}`` dict: devices are
+    mapped exactly as the poll path maps them, then local parallel groups
+    are aggregated. ``on_cycle`` receives every cycle's result. Reading and
+    decoding the file happens up front and is not part of the timing.
+    """
+    records = await coordinator.hass.async_add_executor_job(
+        lambda: list(iter_trace(path))
+    )
+    recorded_versions = {
+        record[_DEVICE_FIELD].get("pylxpweb")
+        for record in records
+        if _DEVICE_FIELD in record
+    }
+    if recorded_versions - {_PYLXPWEB_VERSION}:
+        _LOGGER.warning(
+            "Replaying %s recorded with pylxpweb %s on pylxpweb %s; results may "
+            "differ from the recording",
+            path,
+            ", ".join(sorted(str(version) for version in recorded_versions)),
+            _PYLXPWEB_VERSION,
+        )
+    cycles: list[list[dict[str, Any]]] = []
+    for record in records:
+        if not cycles or cycles[-1][0]["cycle"] != record["cycle"]:
+            cycles.append([])
+        cycles[-1].append(record)
+
+    stats = ReplayStats(records=len(records))
+    started = time.perf_counter()
+    for cycle in cycles:
+        processed: dict[str, Any] = {"devices": {}, "parameters": {}}
+        for record in cycle:
+            replay = _REPLAYERS.get(record["kind"])
+            if replay is not None:
+                processed["devices"][record["serial"]] = replay(coordinator, record)
+        await coordinator._process_local_parallel_groups(processed)
+        stats.cycles += 1
+        if on_cycle is not None:
+            on_cycle(processed)
+    stats.seconds = time.perf_counter() - started
+    return stats
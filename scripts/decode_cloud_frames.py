@@ -5,21 +5,25 @@ from __future__ import annotations
 
 import argparse
 import bisect
+import heapq
 import io
 import json
 import math
+import mmap
 import os
 import re
 import secrets
 import stat
 import sys
-from collections.abc import Buffer, Iterable, Iterator
+from array import array
+from collections.abc import Buffer, Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import suppress
 from dataclasses import dataclass, field
 from enum import StrEnum
 from importlib import import_module
 from pathlib import Path
-from typing import Any, BinaryIO, Final, Never, Protocol, cast
+from typing import Any, BinaryIO, Final, Never, Protocol, TypeVar, cast
 
 
 class _CaptureReader(Protocol):
@@ -120,6 +124,7 @@ DOCUMENTATION_DONGLE_ADDRESS: Final = "192.0.2.10"
 DOCUMENTATION_CLOUD_ADDRESS: Final = "198.51.100.20"
 SYNTHETIC_REGISTER_WORD: Final = "SYNTHETIC_A55A"
 MAX_SANITIZED_RECORDS: Final = 1024
+MAX_STREAM_WORKERS: Final = 64
 _SEQUENCE_MODULUS: Final = 1 << 32
 _SEQUENCE_HALF: Final = 1 << 31
 _PENDING_BYTE_MEMORY_CHARGE: Final = max(
@@ -197,6 +202,8 @@ class ParserPolicy:
     maximum_pending_bytes_per_flow: int = 16 * 1024
     maximum_reassembled_bytes_per_flow: int = 4 * 1024 * 1024
     maximum_aggregate_memory_bytes: int = 8 * 1024 * 1024
+    maximum_streamed_capture_bytes: int = 16 * 1024 * 1024 * 1024
+    maximum_streamed_packets: int = 100_000_000
 
     def __post_init__(self) -> None:
         bounded: tuple[tuple[int | float, int | float, int | float], ...] = (
@@ -211,6 +218,8 @@ class ParserPolicy:
             (self.maximum_pending_bytes_per_flow, 1, 1024 * 1024),
             (self.maximum_reassembled_bytes_per_flow, 1, 64 * 1024 * 1024),
             (self.maximum_aggregate_memory_bytes, 1, 64 * 1024 * 1024),
+            (self.maximum_streamed_capture_bytes, 1, 1024 * 1024 * 1024 * 1024),
+            (self.maximum_streamed_packets, 1, 1_000_000_000),
         )
         if any(
             not math.isfinite(value) or value < low or value > high
@@ -518,7 +527,13 @@ def _pending_run_end(run: _PendingRun) -> int:
 
 
 class TCPStreamReassembler:
-    """Bounded sequence window with complete byte-overlap validation."""
+    """Bounded sequence window with complete byte-overlap validation.
+
+    A window opens with the first segment that arrives while the stream is
+    fully assembled and closes once every gap is filled again. The per-flow
+    segment and reassembled-byte limits bound each window, not the whole
+    session, so a long healthy session is never rejected for its length.
+    """
 
     def __init__(
         self,
@@ -541,6 +556,7 @@ class TCPStreamReassembler:
         self._pending: list[_PendingRun] | None = None
         self._pending_bytes = 0
         self._segment_count = 0
+        self._window_start = 0
         self._started_at: float | None = None
         self._emitted_started_at: float | None = None
         self._last_captured_at: float | None = None
@@ -567,12 +583,20 @@ class TCPStreamReassembler:
         self._origin = sequence
 
     def _offset(self, sequence: int) -> int:
+        """Return the stream offset of ``sequence``, nearest the assembled edge.
+
+        Anchoring on the assembled edge rather than the origin keeps offsets
+        exact once a session carries more than 2 GiB.
+        """
         if self._origin is None:
             raise CaptureError(FailureReason.TRUNCATED)
         if not 0 <= sequence < _SEQUENCE_MODULUS:
             raise CaptureError(FailureReason.MALFORMED)
-        delta = (sequence - self._origin) % _SEQUENCE_MODULUS
-        return delta - _SEQUENCE_MODULUS if delta >= _SEQUENCE_HALF else delta
+        edge = self._origin + self._assembled_bytes
+        delta = (sequence - edge) % _SEQUENCE_MODULUS
+        if delta >= _SEQUENCE_HALF:
+            delta -= _SEQUENCE_MODULUS
+        return self._assembled_bytes + delta
 
     def push(
         self, sequence: int, payload: Buffer, *, captured_at: float
@@ -586,6 +610,8 @@ class TCPStreamReassembler:
             raise CaptureError(FailureReason.CAPACITY)
         if self._started_at is None:
             self._started_at = captured_at
+            self._segment_count = 0
+            self._window_start = self._assembled_bytes
         elif captured_at - self._started_at > self.policy.overall_frame_deadline:
             self._clear()
             raise CaptureError(FailureReason.TIMEOUT)
@@ -596,7 +622,7 @@ class TCPStreamReassembler:
         end = start + len(normalized)
         if start < self._history_start:
             raise CaptureError(FailureReason.MALFORMED)
-        if end > self.policy.maximum_reassembled_bytes_per_flow:
+        if end - self._window_start > self.policy.maximum_reassembled_bytes_per_flow:
             raise CaptureError(FailureReason.CAPACITY)
         assembled_overlap_end = min(end, self._assembled_bytes)
         if (
@@ -836,19 +862,16 @@ def _inner_function_name(function: int) -> str:
     return "read_holding" if function == 0x03 else "read_input"
 
 
-def _sanitize_frame(
-    frame: bytes,
-    direction: str,
-    session: _SessionState,
-    dongle_identities: dict[bytes, str],
-    inverter_identities: dict[bytes, str],
+def _decode_frame(
+    frame: bytes, direction: str, session: _SessionState
 ) -> dict[str, Any]:
+    """Return a frame's record with its identities still raw (unaliased)."""
     if len(frame) < 19 or 6 + int.from_bytes(frame[4:6], "little") != len(frame):
         raise CaptureError(FailureReason.MALFORMED)
     session.outer_identity = _bind_identity(session.outer_identity, frame[8:18])
     base: dict[str, Any] = {
         "direction": direction,
-        "identity": _alias(session.outer_identity, dongle_identities, "SYNTHDG"),
+        "identity": session.outer_identity,
     }
     function = frame[7]
     payload = frame[18:]
@@ -870,7 +893,7 @@ def _sanitize_frame(
     if inner[0] != frame[6]:
         raise CaptureError(FailureReason.IDENTITY)
     session.inner_identity = _bind_identity(session.inner_identity, inner[2:12])
-    inner_alias = _alias(session.inner_identity, inverter_identities, "SYNTHIV")
+    inner_identity = session.inner_identity
     start_register = int.from_bytes(inner[12:14], "little")
     if len(inner) == 18:
         register_count = int.from_bytes(inner[14:16], "little")
@@ -879,7 +902,7 @@ def _sanitize_frame(
         _validate_crc(inner)
         return base | {
             "function": "data_read_request",
-            "inner_identity": inner_alias,
+            "inner_identity": inner_identity,
             "inner_function": _inner_function_name(inner_function),
             "start_register": start_register,
             "register_count": register_count,
@@ -894,7 +917,7 @@ def _sanitize_frame(
     _validate_crc(inner)
     return base | {
         "function": "data_read_response",
-        "inner_identity": inner_alias,
+        "inner_identity": inner_identity,
         "inner_function": _inner_function_name(inner_function),
         "start_register": start_register,
         "register_count": register_count,
@@ -902,37 +925,83 @@ def _sanitize_frame(
     }
 
 
-def sanitize_segments(
-    segments: Iterable[CapturedSegment], policy: ParserPolicy | None = None
+def _alias_record(
+    record: dict[str, Any],
+    dongle_identities: dict[bytes, str],
+    inverter_identities: dict[bytes, str],
 ) -> dict[str, Any]:
-    active_policy = policy or ParserPolicy()
-    budget = _MemoryBudget(active_policy.maximum_aggregate_memory_bytes)
-    sessions: dict[int, _SessionState] = {}
-    records: list[dict[str, Any]] = []
-    record_keys: set[str] = set()
-    dongle_identities: dict[bytes, str] = {}
-    inverter_identities: dict[bytes, str] = {}
-    last_timestamp: dict[tuple[int, str], float] = {}
-    capture_timestamp: float | None = None
-    for segment in segments:
+    record["identity"] = _alias(record["identity"], dongle_identities, "SYNTHDG")
+    if "inner_identity" in record:
+        record["inner_identity"] = _alias(
+            record["inner_identity"], inverter_identities, "SYNTHIV"
+        )
+    return record
+
+
+def _sanitize_frame(
+    frame: bytes,
+    direction: str,
+    session: _SessionState,
+    dongle_identities: dict[bytes, str],
+    inverter_identities: dict[bytes, str],
+) -> dict[str, Any]:
+    return _alias_record(
+        _decode_frame(frame, direction, session),
+        dongle_identities,
+        inverter_identities,
+    )
+
+
+class _SegmentOrder:
+    """Capture-wide segment checks: time order, direction and the flow limit."""
+
+    def __init__(self, policy: ParserPolicy) -> None:
+        self._maximum_flows = policy.maximum_flows
+        self._stream_ids: set[int] = set()
+        self._timestamp: float | None = None
+
+    def check(self, segment: CapturedSegment) -> None:
         if not _is_finite_number(segment.captured_at) or (
-            capture_timestamp is not None and segment.captured_at < capture_timestamp
+            self._timestamp is not None and segment.captured_at < self._timestamp
         ):
             raise CaptureError(FailureReason.MALFORMED)
-        capture_timestamp = segment.captured_at
+        self._timestamp = segment.captured_at
         if segment.direction not in ("dongle_to_cloud", "cloud_to_dongle"):
             raise CaptureError(FailureReason.MALFORMED)
+        if segment.stream_id not in self._stream_ids:
+            if len(self._stream_ids) >= self._maximum_flows:
+                raise CaptureError(FailureReason.CAPACITY)
+            self._stream_ids.add(segment.stream_id)
+
+
+def _decoded_frames(
+    segments: Iterable[tuple[int, CapturedSegment]],
+    policy: ParserPolicy,
+    *,
+    close: bool = True,
+) -> Iterator[tuple[int, dict[str, Any]]]:
+    """Yield ``(segment index, raw record)`` for every frame in capture order.
+
+    ``segments`` pairs each segment with its index in the whole capture, so a
+    shard holding only some sessions still reports capture positions. With
+    ``close=False`` sessions are left open at the end, as an unsharded run
+    that failed later in the capture would never reach closing them.
+    """
+    budget = _MemoryBudget(policy.maximum_aggregate_memory_bytes)
+    order = _SegmentOrder(policy)
+    sessions: dict[int, _SessionState] = {}
+    last_timestamp: dict[tuple[int, str], float] = {}
+    for index, segment in segments:
+        order.check(segment)
         session = sessions.get(segment.stream_id)
         if session is None:
-            if len(sessions) >= active_policy.maximum_flows:
-                raise CaptureError(FailureReason.CAPACITY)
             session = _SessionState()
             sessions[segment.stream_id] = session
         state = session.directions.get(segment.direction)
         if state is None:
             state = _DirectionState(
-                TCPStreamReassembler(active_policy, budget),
-                StreamFrameDecoder(active_policy, budget),
+                TCPStreamReassembler(policy, budget),
+                StreamFrameDecoder(policy, budget),
             )
             session.directions[segment.direction] = state
         if segment.starts_stream:
@@ -948,37 +1017,67 @@ def sanitize_segments(
                 captured_at=decoder_timestamp,
                 observed_at=segment.captured_at,
             ):
-                record = _sanitize_frame(
-                    frame,
-                    segment.direction,
-                    session,
-                    dongle_identities,
-                    inverter_identities,
-                )
-                key = json.dumps(record, sort_keys=True, separators=(",", ":"))
-                if key in record_keys:
-                    continue
-                if len(records) >= MAX_SANITIZED_RECORDS:
-                    raise CaptureError(FailureReason.CAPACITY)
-                record_keys.add(key)
-                records.append(record)
+                yield index, _decode_frame(frame, segment.direction, session)
+    if not close:
+        return
     for stream_id, session in sessions.items():
         for direction, state in session.directions.items():
             state.reassembler.close()
             state.decoder.close(captured_at=last_timestamp[(stream_id, direction)])
-    if not records:
-        raise CaptureError(FailureReason.EMPTY)
-    result: dict[str, Any] = {
-        "schema_version": 1,
-        "capture": {
-            "source": "authorized_offline_input",
-            "dongle_address": DOCUMENTATION_DONGLE_ADDRESS,
-            "cloud_address": DOCUMENTATION_CLOUD_ADDRESS,
-        },
-        "frames": records,
-    }
-    _validate_synthetic_output(result)
-    return result
+
+
+def _record_key(record: dict[str, Any]) -> str:
+    return json.dumps(
+        record, sort_keys=True, separators=(",", ":"), default=bytes.hex
+    )
+
+
+class _SanitizedRecords:
+    """Aliases, deduplicates and bounds decoded records in capture order."""
+
+    def __init__(self) -> None:
+        self._records: list[dict[str, Any]] = []
+        self._record_keys: set[str] = set()
+        self._dongle_identities: dict[bytes, str] = {}
+        self._inverter_identities: dict[bytes, str] = {}
+
+    def add(self, record: dict[str, Any]) -> None:
+        record = _alias_record(
+            record, self._dongle_identities, self._inverter_identities
+        )
+        key = json.dumps(record, sort_keys=True, separators=(",", ":"))
+        if key in self._record_keys:
+            return
+        if len(self._records) >= MAX_SANITIZED_RECORDS:
+            raise CaptureError(FailureReason.CAPACITY)
+        self._record_keys.add(key)
+        self._records.append(record)
+
+    def result(self) -> dict[str, Any]:
+        if not self._records:
+            raise CaptureError(FailureReason.EMPTY)
+        result: dict[str, Any] = {
+            "schema_version": 1,
+            "capture": {
+                "source": "authorized_offline_input",
+                "dongle_address": DOCUMENTATION_DONGLE_ADDRESS,
+                "cloud_address": DOCUMENTATION_CLOUD_ADDRESS,
+            },
+            "frames": self._records,
+        }
+        _validate_synthetic_output(result)
+        return result
+
+
+def sanitize_segments(
+    segments: Iterable[CapturedSegment], policy: ParserPolicy | None = None
+) -> dict[str, Any]:
+    records = _SanitizedRecords()
+    for _index, record in _decoded_frames(
+        enumerate(segments), policy or ParserPolicy()
+    ):
+        records.add(record)
+    return records.result()
 
 
 def _exact_keys(value: object, expected: set[str]) -> dict[str, Any]:
@@ -1053,7 +1152,11 @@ def _validate_synthetic_output(value: object) -> None:
             raise CaptureError(FailureReason.SCHEMA)
 
 
-def _stat_signature(file_stat: os.stat_result) -> tuple[int, int, int, int, int, int]:
+_StatSignature = tuple[int, int, int, int, int, int]
+_T = TypeVar("_T")
+
+
+def _stat_signature(file_stat: os.stat_result) -> _StatSignature:
     return (
         file_stat.st_dev,
         file_stat.st_ino,
@@ -1113,6 +1216,77 @@ def _read_stable_capture(path: Path, policy: ParserPolicy) -> bytes:
     return capture
 
 
+def _with_mapped_capture(
+    path: Path,
+    policy: ParserPolicy,
+    consume: Callable[[BinaryIO], _T],
+    expected: _StatSignature | None = None,
+) -> tuple[_T, _StatSignature]:
+    """Run ``consume`` over a read-only mapping of a stable capture.
+
+    The kernel pages the capture in on demand and may drop clean pages again,
+    so resident memory no longer grows with the capture; decoding state stays
+    bounded by the policy's memory budget. The file must keep the identity
+    and size it had when mapped (and ``expected``, when given) until
+    ``consume`` returns.
+    """
+    flags = os.O_RDONLY | os.O_CLOEXEC | os.O_NONBLOCK | getattr(os, "O_NOFOLLOW", 0)
+    descriptor: int | None = None
+    with suppress(OSError):
+        descriptor = os.open(path, flags)
+    if descriptor is None:
+        raise CaptureError(FailureReason.INPUT_KIND)
+    failure: FailureReason | None = None
+    mapped: mmap.mmap | None = None
+    signature: _StatSignature | None = None
+    result: _T | None = None
+    try:
+        before = os.fstat(descriptor)
+        if not stat.S_ISREG(before.st_mode):
+            raise CaptureError(FailureReason.INPUT_KIND)
+        if before.st_size > policy.maximum_streamed_capture_bytes:
+            raise CaptureError(FailureReason.INPUT_SIZE)
+        signature = _stat_signature(before)
+        if expected is not None and signature != expected:
+            raise CaptureError(FailureReason.INPUT_CHANGED)
+        if before.st_size:
+            mapped = mmap.mmap(descriptor, 0, access=mmap.ACCESS_READ)
+    except CaptureError as error:
+        failure = error.reason
+    except (OSError, ValueError):
+        failure = FailureReason.INPUT_CHANGED
+    if failure is None:
+        capture = cast(BinaryIO, mapped if mapped is not None else io.BytesIO())
+        try:
+            result = consume(capture)
+        except CaptureError as error:
+            failure = error.reason
+        except Exception:
+            failure = FailureReason.MALFORMED
+    if failure is None:
+        try:
+            after = os.fstat(descriptor)
+            by_name = os.stat(path, follow_symlinks=False)
+            if signature != _stat_signature(after) or signature != _stat_signature(
+                by_name
+            ):
+                failure = FailureReason.INPUT_CHANGED
+        except OSError:
+            failure = FailureReason.INPUT_CHANGED
+    if mapped is not None:
+        with suppress(BufferError):
+            mapped.close()
+    try:
+        os.close(descriptor)
+    except OSError:
+        if failure is None:
+            failure = FailureReason.INPUT_CHANGED
+    if failure is not None:
+        raise CaptureError(failure)
+    assert signature is not None
+    return cast(_T, result), signature
+
+
 def _decode_link_packet(packet: bytes, link_type: int) -> _IPPacket | None:
     module = dpkt
     if module is None:
@@ -1164,14 +1338,16 @@ class _ObservedSession:
     reset_terminal: tuple[bool, int, int, int, bytes, bytes] | None = None
 
 
-def _pcap_segments(capture: bytes, policy: ParserPolicy) -> Iterable[CapturedSegment]:
+def _open_capture_reader(capture: bytes | BinaryIO) -> tuple[_CaptureReader, int]:
+    """Return a packet reader over ``capture`` and its supported link type."""
     module = dpkt
     if module is None:
         raise CaptureError(FailureReason.DEPENDENCY)
+    source = io.BytesIO(capture) if isinstance(capture, bytes) else capture
     reader: _CaptureReader | None = None
     link_type: int | None = None
     try:
-        reader = module.pcap.UniversalReader(io.BytesIO(capture))
+        reader = module.pcap.UniversalReader(source)
         link_type = reader.datalink()
     except Exception:
         pass
@@ -1184,6 +1360,68 @@ def _pcap_segments(capture: bytes, policy: ParserPolicy) -> Iterable[CapturedSeg
     }
     if link_type not in supported:
         raise CaptureError(FailureReason.UNSUPPORTED_LINK)
+    return reader, link_type
+
+
+class _LocatedReader:
+    """Capture reader that remembers where in the mapping each packet sits.
+
+    pcap records end with their packet; pcapng packet blocks carry it right
+    after a 28-byte block header. ``span`` is the ``(offset, length)`` of the
+    packet most recently yielded.
+    """
+
+    def __init__(self, reader: _CaptureReader, capture: mmap.mmap) -> None:
+        self._reader = reader
+        self._capture = capture
+        self.span = (0, 0)
+
+    def datalink(self) -> int:
+        return self._reader.datalink()
+
+    def __iter__(self) -> Iterator[tuple[float, Buffer]]:
+        start = self._capture.tell()
+        for timestamp, packet in self._reader:
+            end = self._capture.tell()
+            length = len(memoryview(packet))
+            for offset in (end - length, start + 28):
+                if (
+                    start <= offset <= end - length
+                    and self._capture[offset : offset + length] == bytes(packet)
+                ):
+                    break
+            else:
+                raise CaptureError(FailureReason.MALFORMED)
+            self.span = (offset, length)
+            start = end
+            yield timestamp, packet
+
+
+def _pcap_segments(
+    capture: bytes | BinaryIO,
+    policy: ParserPolicy,
+    maximum_packets: int | None = None,
+) -> Iterable[CapturedSegment]:
+    """Yield target TCP segments, reading packets from ``capture`` lazily."""
+    reader, link_type = _open_capture_reader(capture)
+    yield from _target_segments(
+        reader,
+        link_type,
+        policy,
+        policy.maximum_packets if maximum_packets is None else maximum_packets,
+    )
+
+
+def _target_segments(
+    reader: _CaptureReader,
+    link_type: int,
+    policy: ParserPolicy,
+    maximum_packets: int,
+) -> Iterator[CapturedSegment]:
+    """Yield the dongle-to-cloud TCP segments among ``reader``'s packets."""
+    module = dpkt
+    if module is None:
+        raise CaptureError(FailureReason.DEPENDENCY)
     sessions: dict[tuple[bytes, int, bytes, int], _ObservedSession] = {}
     next_stream_id = 0
     packet_count = 0
@@ -1198,7 +1436,7 @@ def _pcap_segments(capture: bytes, policy: ParserPolicy) -> Iterable[CapturedSeg
                 raise CaptureError(FailureReason.MALFORMED)
             last_timestamp = captured_at
             packet_count += 1
-            if packet_count > policy.maximum_packets:
+            if packet_count > maximum_packets:
                 raise CaptureError(FailureReason.CAPACITY)
             packet = bytes(raw_packet)
             if len(packet) > policy.maximum_packet_bytes:
@@ -1323,6 +1561,235 @@ def process_pcap(
     return sanitize_segments(_pcap_segments(capture, active_policy), active_policy)
 
 
+@dataclass(slots=True)
+class _ShardIndex:
+    """Where one shard's segments sit in the mapped capture.
+
+    Built by the parent's single validating pass, so a worker slices its
+    packets straight out of its own mapping instead of re-reading and
+    re-checking the whole capture. Columns are compact arrays so the index
+    stays small next to the capture it describes.
+    """
+
+    link_type: int
+    segment_indexes: array[int] = field(default_factory=lambda: array("q"))
+    packet_offsets: array[int] = field(default_factory=lambda: array("q"))
+    packet_lengths: array[int] = field(default_factory=lambda: array("q"))
+    sequences: array[int] = field(default_factory=lambda: array("q"))
+    captured_at: array[float] = field(default_factory=lambda: array("d"))
+    stream_ids: array[int] = field(default_factory=lambda: array("q"))
+    # Bit 0: cloud_to_dongle; bit 1: starts_stream.
+    flags: array[int] = field(default_factory=lambda: array("B"))
+
+    def __len__(self) -> int:
+        return len(self.segment_indexes)
+
+    def append(
+        self, index: int, segment: CapturedSegment, span: tuple[int, int]
+    ) -> None:
+        self.segment_indexes.append(index)
+        self.packet_offsets.append(span[0])
+        self.packet_lengths.append(span[1])
+        self.sequences.append(segment.sequence)
+        self.captured_at.append(segment.captured_at)
+        self.stream_ids.append(segment.stream_id)
+        self.flags.append(
+            (segment.direction == "cloud_to_dongle") | (segment.starts_stream << 1)
+        )
+
+    def segments(self, capture: mmap.mmap) -> Iterator[tuple[int, CapturedSegment]]:
+        """Yield ``(segment index, segment)``, re-reading payloads from the map."""
+        module = dpkt
+        if module is None:
+            raise CaptureError(FailureReason.DEPENDENCY)
+        for position, index in enumerate(self.segment_indexes):
+            offset = self.packet_offsets[position]
+            packet = capture[offset : offset + self.packet_lengths[position]]
+            ip_packet = _decode_link_packet(packet, self.link_type)
+            if ip_packet is None or not isinstance(ip_packet.data, module.tcp.TCP):
+                raise CaptureError(FailureReason.INPUT_CHANGED)
+            flags = self.flags[position]
+            yield (
+                index,
+                CapturedSegment(
+                    "cloud_to_dongle" if flags & 1 else "dongle_to_cloud",
+                    self.sequences[position],
+                    self.captured_at[position],
+                    bytes(cast(_TCPPacket, ip_packet.data).data),
+                    self.stream_ids[position],
+                    bool(flags & 2),
+                ),
+            )
+
+
+@dataclass(slots=True)
+class _CaptureIndex:
+    """Per-shard segment indexes and where the indexing pass failed, if it did.
+
+    ``failure_at`` uses the ``_ShardOutcome`` positions; indexing stops at the
+    failure, so shards only hold segments an unsharded run decodes first.
+    """
+
+    shards: list[_ShardIndex]
+    segment_count: int
+    failure_at: tuple[int, int] | None = None
+    failure: FailureReason | None = None
+
+
+def _index_capture(
+    capture: BinaryIO, policy: ParserPolicy, workers: int
+) -> _CaptureIndex:
+    """Validate the whole capture once and index each shard's segments."""
+    reader, link_type = _open_capture_reader(capture)
+    located = _LocatedReader(reader, cast(mmap.mmap, capture))
+    shards = [_ShardIndex(link_type) for _ in range(workers)]
+    order = _SegmentOrder(policy)
+    index = -1
+    checking = False
+    try:
+        for index, segment in enumerate(
+            _target_segments(
+                located, link_type, policy, policy.maximum_streamed_packets
+            )
+        ):
+            checking = True
+            order.check(segment)
+            checking = False
+            shards[segment.stream_id % workers].append(index, segment, located.span)
+    except CaptureError as error:
+        return _CaptureIndex(
+            shards, index + 1, (index, 0 if checking else 1), error.reason
+        )
+    return _CaptureIndex(shards, index + 1)
+
+
+@dataclass(frozen=True, slots=True)
+class _ShardOutcome:
+    """Unique raw records of one shard, and where in the capture it failed.
+
+    ``failure_at`` orders failures like an unsharded run would meet them:
+    ``(index, 0)`` while segment ``index`` was being checked or decoded (or,
+    with the segment count, while closing sessions at the end), ``(index, 1)``
+    when reading the segment after ``index`` failed.
+    """
+
+    records: list[tuple[int, dict[str, Any]]]
+    failure_at: tuple[int, int] | None = None
+    failure: FailureReason | None = None
+
+
+def _decode_shard(
+    path: Path,
+    policy: ParserPolicy,
+    signature: _StatSignature,
+    shard: _ShardIndex,
+    segment_count: int,
+    close: bool,
+) -> _ShardOutcome:
+    """Decode one shard's indexed segments of a mapped capture (worker process)."""
+    records: list[tuple[int, dict[str, Any]]] = []
+    record_keys: set[str] = set()
+    current = -1
+
+    def tracked(capture: mmap.mmap) -> Iterator[tuple[int, CapturedSegment]]:
+        nonlocal current
+        for current, segment in shard.segments(capture):
+            yield current, segment
+        current = segment_count
+
+    def consume(capture: BinaryIO) -> _ShardOutcome:
+        segments = tracked(cast(mmap.mmap, capture))
+        try:
+            for index, record in _decoded_frames(segments, policy, close=close):
+                key = _record_key(record)
+                if key in record_keys:
+                    continue
+                if len(records) >= MAX_SANITIZED_RECORDS:
+                    raise CaptureError(FailureReason.CAPACITY)
+                record_keys.add(key)
+                records.append((index, record))
+        except CaptureError as error:
+            return _ShardOutcome(records, (current, 0), error.reason)
+        return _ShardOutcome(records)
+
+    try:
+        outcome, _signature = _with_mapped_capture(path, policy, consume, signature)
+    except CaptureError as error:
+        return _ShardOutcome([], (-1, 0), error.reason)
+    return outcome
+
+
+def stream_pcap(
+    pcap_path: str | Path, policy: ParserPolicy | None = None, *, workers: int = 1
+) -> dict[str, Any]:
+    """Sanitize a capture read through a memory mapping, optionally in parallel.
+
+    Produces the same fixture as ``process_pcap`` without reading the capture
+    into memory, so captures up to ``maximum_streamed_capture_bytes`` are
+    accepted. With ``workers > 1`` the parent validates the capture once and
+    indexes where each session's packets sit; each worker process maps the
+    capture and decodes the sessions of one shard (stream id modulo
+    ``workers``) from that index. The parent merges their records back into
+    capture order before aliasing, so the output and the reported failure
+    match a single-process run. A worker process that crashes raises its
+    error unchanged.
+    """
+    if not 1 <= workers <= MAX_STREAM_WORKERS:
+        raise ValueError("worker count outside the internal contract")
+    active_policy = policy or ParserPolicy()
+    path = Path(pcap_path)
+    if workers == 1:
+        sanitized, _signature = _with_mapped_capture(
+            path,
+            active_policy,
+            lambda capture: sanitize_segments(
+                _pcap_segments(
+                    capture, active_policy, active_policy.maximum_streamed_packets
+                ),
+                active_policy,
+            ),
+        )
+        return sanitized
+    index, signature = _with_mapped_capture(
+        path,
+        active_policy,
+        lambda capture: _index_capture(capture, active_policy, workers),
+    )
+    shards = [shard for shard in index.shards if shard]
+    outcomes: list[_ShardOutcome] = []
+    if shards:
+        with ProcessPoolExecutor(max_workers=len(shards)) as executor:
+            outcomes = list(
+                executor.map(
+                    _decode_shard,
+                    [path] * len(shards),
+                    [active_policy] * len(shards),
+                    [signature] * len(shards),
+                    shards,
+                    [index.segment_count] * len(shards),
+                    [index.failure is None] * len(shards),
+                )
+            )
+    failures = [
+        (outcome.failure_at, outcome.failure)
+        for outcome in outcomes
+        if outcome.failure_at is not None and outcome.failure is not None
+    ]
+    if index.failure_at is not None and index.failure is not None:
+        failures.append((index.failure_at, index.failure))
+    first_failure = min(failures, key=lambda failure: failure[0], default=None)
+    records = _SanitizedRecords()
+    for segment_index, record in heapq.merge(
+        *(outcome.records for outcome in outcomes), key=lambda item: item[0]
+    ):
+        if first_failure is not None and (segment_index, 0) > first_failure[0]:
+            break
+        records.add(record)
+    if first_failure is not None:
+        raise CaptureError(first_failure[1])
+    return records.result()
+
+
 class _ArgumentParseFailure(Exception):
     pass
 
@@ -1346,11 +1813,23 @@ def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         required=True,
         help="confirm authorization and offline-only handling",
     )
-    try:
-        return parser.parse_args(argv)
-    except _ArgumentParseFailure:
-        pass
-    raise CaptureError(FailureReason.CLI)
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="read the capture through a memory mapping (large captures)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="decode sessions in this many processes (implies --stream)",
+    )
+    arguments: argparse.Namespace | None = None
+    with suppress(_ArgumentParseFailure):
+        arguments = parser.parse_args(argv)
+    if arguments is None or not 1 <= arguments.workers <= MAX_STREAM_WORKERS:
+        raise CaptureError(FailureReason.CLI)
+    return arguments
 
 
 def _serialize_output(value: object) -> bytes:
@@ -1496,7 +1975,10 @@ def _write_exclusive(path: Path, content: bytes) -> None:
 def main(argv: list[str] | None = None) -> int:
     try:
         arguments = _parse_args(argv)
-        sanitized = process_pcap(arguments.input)
+        if arguments.stream or arguments.workers > 1:
+            sanitized = stream_pcap(arguments.input, workers=arguments.workers)
+        else:
+            sanitized = process_pcap(arguments.input)
         serialized = _serialize_output(sanitized)
         _write_exclusive(arguments.output, serialized)
     except CaptureError as error:
@@ -1,17 +1,34 @@
 #!/usr/bin/env python3
 """Monitor EG4 entities for data spikes over time.
 
-Polls HA API every 30 seconds, records values for key sensors,
-and flags any readings that look like spikes (sudden large jumps).
+Subscribes to the HA WebSocket ``subscribe_entities`` stream for key sensors,
+so every state transition is checked as HA publishes it -- a spike shorter
+than a REST poll interval can no longer slip between two samples, and HA only
+sends the watched entities' changes instead of the whole state machine.
+Each entity keeps a short ring buffer of its recent readings; a jump larger
+than its SPIKE_THRESHOLDS entry between consecutive readings is flagged along
+with that recent history.
+
+``--record FILE`` appends every received transition to a JSONL file, and
+``--replay FILE`` re-runs the detection offline over such a recording (for
+example after tuning SPIKE_THRESHOLDS).
 """
 
+from __future__ import annotations
+
 import argparse
+import asyncio
+import json
 import os
 import sys
 import time
+from collections import deque
+from collections.abc import AsyncIterator, Iterable, Iterator
+from contextlib import nullcontext
 from datetime import datetime
+from typing import NamedTuple, TextIO
 
-import httpx
+import aiohttp
 
 # Force unbuffered output when the stream supports reconfiguration.
 if hasattr(sys.stdout, "reconfigure"):
@@ -72,11 +89,19 @@ SPIKE_THRESHOLDS = {
     "consumption_power": 10000,  # W
 }
 
-POLL_INTERVAL = 30  # seconds
+HISTORY_LENGTH = 8  # readings kept per entity and shown with each spike
+STATUS_INTERVAL = 300  # seconds of stream time between status lines
+RECONNECT_DELAY = 10  # seconds
+
+UNAVAILABLE_STATES = ("unavailable", "unknown")
+
+
+class Transition(NamedTuple):
+    """One entity state change as published by HA."""
 
-previous_values: dict[str, float] = {}
-spike_count = 0
-poll_count = 0
+    timestamp: float  # epoch seconds (HA last_updated)
+    entity_id: str
+    state: str | None
 
 
 def get_threshold(entity_id: str) -> float:
@@ -86,6 +111,57 @@ def get_threshold(entity_id: str) -> float:
     return 50000  # very permissive default
 
 
+class SpikeDetector:
+    """Per-entity ring buffers of numeric readings and the jump check."""
+
+    def __init__(self, watched: Iterable[str] | None = None) -> None:
+        self.watched = frozenset(watched) if watched is not None else None
+        self.history: dict[str, deque[tuple[float, float]]] = {}
+        self.thresholds: dict[str, float] = {}
+        self.unavailable: dict[str, str] = {}
+        self.spike_count = 0
+        self.transition_count = 0
+
+    def observe(self, transition: Transition) -> str | None:
+        """Record a transition; return a spike message when it jumps too far."""
+        entity_id = transition.entity_id
+        if self.watched is not None and entity_id not in self.watched:
+            return None
+        if transition.state in UNAVAILABLE_STATES:
+            self.unavailable[entity_id] = transition.state
+            return None
+        self.unavailable.pop(entity_id, None)
+        try:
+            value = float(transition.state)  # type: ignore[arg-type]
+        except (TypeError, ValueError):
+            return None
+
+        self.transition_count += 1
+        history = self.history.get(entity_id)
+        if history is None:
+            history = self.history[entity_id] = deque(maxlen=HISTORY_LENGTH)
+            self.thresholds[entity_id] = get_threshold(entity_id)
+        message = None
+        if history:
+            prev = history[-1][1]
+            delta = abs(value - prev)
+            threshold = self.thresholds[entity_id]
+            if delta > threshold:
+                self.spike_count += 1
+                recent = ", ".join(f"{reading:g}" for _, reading in history)
+                message = (
+                    f"SPIKE #{self.spike_count}: {_sensor_label(entity_id)}: "
+                    f"{prev} -> {value} (delta={delta:.1f}, "
+                    f"threshold={threshold}) | recent: [{recent}]"
+                )
+        history.append((transition.timestamp, value))
+        return message
+
+    def latest(self, entity_id: str) -> float | str:
+        history = self.history.get(entity_id)
+        return history[-1][1] if history else "?"
+
+
 def load_connection_config() -> tuple[str, str]:
     """Load HA connection settings from the established environment config."""
     token = os.environ.get("HA_LONG_LIVED_TOKEN", "")
@@ -103,16 +179,64 @@ def load_connection_config() -> tuple[str, str]:
     return token, base_url
 
 
-def fetch_states(token: str, base_url: str) -> dict[str, str]:
-    resp = httpx.get(
-        f"{base_url}/api/states",
-        headers={"Authorization": f"Bearer {token}"},
-        timeout=10,
-        follow_redirects=True,
-    )
-    resp.raise_for_status()
-    data = resp.json()
-    return {s["entity_id"]: s["state"] for s in data}
+def _compressed_timestamp(state: dict) -> float:
+    """Return a compressed state's last_updated (``lu``, else ``lc``)."""
+    return state.get("lu", state.get("lc", time.time()))
+
+
+async def stream_transitions(
+    token: str, base_url: str, entity_ids: Iterable[str]
+) -> AsyncIterator[Transition]:
+    """Yield every state change of ``entity_ids`` from HA's WebSocket API.
+
+    ``subscribe_entities`` first sends the current states (``a``), then
+    compressed diffs (``c``) for each change; attribute-only diffs carry no
+    ``s`` and are skipped.
+    """
+    ws_url = base_url.replace("http", "ws", 1).rstrip("/") + "/api/websocket"
+    async with (
+        aiohttp.ClientSession() as session,
+        session.ws_connect(ws_url, heartbeat=30) as ws,
+    ):
+        await ws.receive_json()  # auth_required
+        await ws.send_json({"type": "auth", "access_token": token})
+        auth = await ws.receive_json()
+        if auth.get("type") != "auth_ok":
+            raise RuntimeError(f"authentication failed: {auth.get('message', auth)}")
+        await ws.send_json(
+            {"id": 1, "type": "subscribe_entities", "entity_ids": list(entity_ids)}
+        )
+        async for message in ws:
+            if message.type != aiohttp.WSMsgType.TEXT:
+                break
+            payload = message.json()
+            if payload.get("type") == "result":
+                if not payload.get("success"):
+                    raise RuntimeError(f"subscribe failed: {payload.get('error')}")
+                continue
+            if payload.get("type") != "event":
+                continue
+            event = payload["event"]
+            for entity_id, state in event.get("a", {}).items():
+                yield Transition(
+                    _compressed_timestamp(state), entity_id, state.get("s")
+                )
+            for entity_id, diff in event.get("c", {}).items():
+                added = diff.get("+", {})
+                if "s" in added:
+                    yield Transition(
+                        _compressed_timestamp(added), entity_id, added["s"]
+                    )
+    raise ConnectionError("WebSocket closed")
+
+
+def read_recording(path: str) -> Iterator[Transition]:
+    """Yield the transitions of a ``--record`` JSONL file in order."""
+    with open(path) as file:
+        for line in file:
+            if line.strip():
+                record = json.loads(line)
+                yield Transition(record["t"], record["entity_id"], record["state"])
 
 
 def _sensor_label(sensor: str) -> str:
@@ -120,13 +244,11 @@ def _sensor_label(sensor: str) -> str:
     return sensor.split(".")[-1]
 
 
-def main(
-    duration_minutes: int,
-    serials: tuple[str, ...],
-    token: str,
-    base_url: str,
-) -> None:
-    global spike_count, poll_count
+def _clock(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp).strftime("%H:%M:%S")
+
+
+def spike_sensors_for(serials: tuple[str, ...]) -> list[str]:
     replacements = {
         "{gridboss_serial}": serials[0],
         "{primary_serial}": serials[1],
@@ -135,122 +257,207 @@ def main(
     spike_sensors = SPIKE_SENSOR_TEMPLATES
     for marker, serial in replacements.items():
         spike_sensors = [sensor.replace(marker, serial) for sensor in spike_sensors]
-
-    end_time = time.monotonic() + duration_minutes * 60
-    print("=== EG4 Spike Monitor ===")
-    print(f"Duration: {duration_minutes} minutes, interval: {POLL_INTERVAL}s")
-    print(f"Monitoring {len(spike_sensors)} sensors")
-    print(f"Started at {datetime.now().strftime('%H:%M:%S')}")
-    print("=" * 60)
-
-    while time.monotonic() < end_time:
-        poll_count += 1
-        now = datetime.now().strftime("%H:%M:%S")
-        try:
-            states = fetch_states(token, base_url)
-        except Exception as err:
-            print(f"[{now}] FETCH ERROR: {err}")
-            time.sleep(POLL_INTERVAL)
-            continue
-
-        spikes_this_poll: list[str] = []
-        unavail_this_poll: list[str] = []
-
-        for sensor in spike_sensors:
-            val_str = states.get(sensor, "missing")
-            if val_str in ("unavailable", "unknown", "missing"):
-                if val_str != "missing":
-                    unavail_this_poll.append(f"{_sensor_label(sensor)}={val_str}")
-                continue
-
-            try:
-                val = float(val_str)
-            except ValueError:
-                continue
-
-            if sensor in previous_values:
-                prev = previous_values[sensor]
-                delta = abs(val - prev)
-                threshold = get_threshold(sensor)
-                if delta > threshold:
-                    spike_count += 1
-                    short = _sensor_label(sensor)
-                    msg = f"SPIKE #{spike_count}: {short}: {prev} -> {val} (delta={delta:.1f}, threshold={threshold})"
-                    spikes_this_poll.append(msg)
-
-            previous_values[sensor] = val
-
-        elapsed = duration_minutes * 60 - (end_time - time.monotonic())
-        remaining = max(0, end_time - time.monotonic())
-
-        if spikes_this_poll:
-            print(f"\n[{now}] Poll #{poll_count} ({elapsed / 60:.1f}m elapsed)")
-            for sp in spikes_this_poll:
-                print(f"  *** {sp}")
-        elif poll_count % 10 == 0 or poll_count == 1:
-            # Periodic status every ~5 minutes
+    return spike_sensors
+
+
+class Monitor:
+    """Feeds transitions to the detector and prints spikes and status."""
+
+    def __init__(
+        self, detector: SpikeDetector, serials: tuple[str, ...] | None
+    ) -> None:
+        self.detector = detector
+        self.serials = serials
+        self.started: float | None = None
+        self.next_status: float | None = None
+        self.status_count = 0
+
+    def feed(self, transition: Transition) -> None:
+        if self.started is None:
+            self.started = transition.timestamp
+            self.next_status = transition.timestamp
+        message = self.detector.observe(transition)
+        if message is not None:
+            print(f"\n[{_clock(transition.timestamp)}] {message}")
+        if self.next_status is not None and transition.timestamp >= self.next_status:
+            self.next_status = transition.timestamp + STATUS_INTERVAL
+            self.print_status(transition.timestamp)
+
+    def print_status(self, timestamp: float) -> None:
+        detector = self.detector
+        self.status_count += 1
+        elapsed = timestamp - (self.started or timestamp)
+        line = (
+            f"[{_clock(timestamp)}] OK | {elapsed / 60:.1f}m streamed | "
+            f"transitions={detector.transition_count} | "
+            f"spikes={detector.spike_count} | unavail={len(detector.unavailable)}"
+        )
+        if self.serials is not None:
             key_sensors = (
-                ("grid_power", f"sensor.grid_boss_{serials[0]}_grid_power"),
+                ("grid_power", f"sensor.grid_boss_{self.serials[0]}_grid_power"),
                 (
                     "grid_voltage_l1",
-                    f"sensor.grid_boss_{serials[0]}_grid_voltage_l1",
+                    f"sensor.grid_boss_{self.serials[0]}_grid_voltage_l1",
                 ),
                 (
                     "battery_power",
-                    f"sensor.18kpv_{serials[1]}_battery_power",
+                    f"sensor.18kpv_{self.serials[1]}_battery_power",
                 ),
             )
             key_values = " | ".join(
-                f"{label}={previous_values.get(entity_id, '?')}"
+                f"{label}={detector.latest(entity_id)}"
                 for label, entity_id in key_sensors
             )
-            print(
-                f"[{now}] Poll #{poll_count} OK | {remaining / 60:.0f}m left | "
-                f"spikes={spike_count} | unavail={len(unavail_this_poll)} | "
-                f"{key_values}"
+            line = f"{line} | {key_values}"
+        print(line)
+        if detector.unavailable and self.status_count <= 3:
+            unavailable = ", ".join(
+                f"{_sensor_label(entity_id)}={state}"
+                for entity_id, state in detector.unavailable.items()
             )
+            print(f"  Unavailable: {unavailable}")
 
-        if unavail_this_poll and poll_count <= 3:
-            print(f"  Unavailable: {', '.join(unavail_this_poll)}")
-
-        time.sleep(POLL_INTERVAL)
 
+async def run_live(
+    monitor: Monitor,
+    entity_ids: list[str],
+    token: str,
+    base_url: str,
+    record: TextIO | None,
+) -> None:
+    """Stream transitions until cancelled, reconnecting after errors."""
+    while True:
+        try:
+            async for transition in stream_transitions(token, base_url, entity_ids):
+                if record is not None:
+                    record.write(
+                        json.dumps(
+                            {
+                                "t": transition.timestamp,
+                                "entity_id": transition.entity_id,
+                                "state": transition.state,
+                            }
+                        )
+                        + "\n"
+                    )
+                monitor.feed(transition)
+        except (aiohttp.ClientError, ConnectionError, RuntimeError) as err:
+            print(f"[{datetime.now().strftime('%H:%M:%S')}] STREAM ERROR: {err}")
+        await asyncio.sleep(RECONNECT_DELAY)
+
+
+def print_summary(detector: SpikeDetector, description: str) -> None:
     print("\n" + "=" * 60)
     print("=== MONITORING COMPLETE ===")
-    print(f"Duration: {duration_minutes} minutes")
-    print(f"Polls: {poll_count}")
-    print(f"Total spikes detected: {spike_count}")
-    if spike_count == 0:
+    print(description)
+    print(f"Transitions: {detector.transition_count}")
+    print(f"Total spikes detected: {detector.spike_count}")
+    if detector.spike_count == 0:
         print("RESULT: CLEAN — No data spikes detected")
     else:
-        print(f"RESULT: {spike_count} SPIKES DETECTED — Review above")
+        print(f"RESULT: {detector.spike_count} SPIKES DETECTED — Review above")
+    print("=" * 60)
+
+
+def main(
+    duration_minutes: int,
+    serials: tuple[str, ...],
+    token: str,
+    base_url: str,
+    record_path: str | None = None,
+) -> None:
+    spike_sensors = spike_sensors_for(serials)
+    detector = SpikeDetector(spike_sensors)
+    monitor = Monitor(detector, serials)
+
+    print("=== EG4 Spike Monitor ===")
+    print(f"Duration: {duration_minutes} minutes, streaming every transition")
+    print(f"Monitoring {len(spike_sensors)} sensors")
+    print(f"Started at {datetime.now().strftime('%H:%M:%S')}")
     print("=" * 60)
 
+    async def run(record: TextIO | None) -> None:
+        try:
+            await asyncio.wait_for(
+                run_live(monitor, spike_sensors, token, base_url, record),
+                timeout=duration_minutes * 60,
+            )
+        except TimeoutError:
+            pass
+
+    with open(record_path, "a") if record_path else nullcontext() as record:
+        asyncio.run(run(record))
+    print_summary(detector, f"Duration: {duration_minutes} minutes")
+
+
+def replay(path: str, serials: tuple[str, ...] | None) -> None:
+    """Re-run spike detection over a recorded transition stream."""
+    watched = spike_sensors_for(serials) if serials is not None else None
+    detector = SpikeDetector(watched)
+    monitor = Monitor(detector, serials)
+    print(f"=== EG4 Spike Monitor (replay of {path}) ===")
+    for transition in read_recording(path):
+        monitor.feed(transition)
+    print_summary(detector, f"Replayed: {path}")
+
 
 def parse_args() -> argparse.Namespace:
     """Parse explicit runtime device identities."""
-    parser = argparse.ArgumentParser(description=__doc__)
-    parser.add_argument("--gridboss-serial", required=True)
-    parser.add_argument("--primary-inverter-serial", required=True)
-    parser.add_argument("--secondary-inverter-serial", required=True)
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--gridboss-serial")
+    parser.add_argument("--primary-inverter-serial")
+    parser.add_argument("--secondary-inverter-serial")
     parser.add_argument("--duration-minutes", type=int, default=30)
-    return parser.parse_args()
+    parser.add_argument(
+        "--record", metavar="FILE", help="append every transition to a JSONL file"
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="FILE",
+        help="run detection over a --record file instead of live HA "
+        "(serials optional: without them every recorded entity is checked)",
+    )
+    args = parser.parse_args()
+    serial_args = (
+        args.gridboss_serial,
+        args.primary_inverter_serial,
+        args.secondary_inverter_serial,
+    )
+    if args.replay is None and not all(serial_args):
+        parser.error(
+            "--gridboss-serial, --primary-inverter-serial and "
+            "--secondary-inverter-serial are required for live monitoring"
+        )
+    if args.replay is not None and any(serial_args) and not all(serial_args):
+        parser.error("pass all three serials or none with --replay")
+    return args
 
 
 if __name__ == "__main__":
     args = parse_args()
+    runtime_serials = (
+        (
+            args.gridboss_serial.lower(),
+            args.primary_inverter_serial.lower(),
+            args.secondary_inverter_serial.lower(),
+        )
+        if args.gridboss_serial
+        else None
+    )
+    if args.replay is not None:
+        replay(args.replay, runtime_serials)
+        sys.exit(0)
     runtime_token, runtime_base_url = load_connection_config()
     if not runtime_token:
         print("ERROR: Home Assistant API credentials are not configured")
         sys.exit(1)
-    runtime_serials = (
-        args.gridboss_serial.lower(),
-        args.primary_inverter_serial.lower(),
-        args.secondary_inverter_serial.lower(),
-    )
+    assert runtime_serials is not None
     main(
         args.duration_minutes,
         runtime_serials,
         runtime_token,
         runtime_base_url,
+        args.record,
     )
@@ -0,0 +1,132 @@
+"""Tests for the budget-aware cloud polling cadence."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+import time
+from unittest.mock import patch
+
+import pytest
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.eg4_web_monitor.adaptive_polling import (
+    AdaptivePollingController,
+)
+from custom_components.eg4_web_monitor.const import (
+    CONF_CLOUD_REQUEST_BUDGET,
+    CONF_CONNECTION_TYPE,
+    CONF_DST_SYNC,
+    CONF_HTTP_POLLING_INTERVAL,
+    CONF_LIBRARY_DEBUG,
+    CONF_PLANT_ID,
+    CONNECTION_TYPE_HTTP,
+    DOMAIN,
+)
+from custom_components.eg4_web_monitor.coordinator import EG4DataUpdateCoordinator
+
+
+def _controller(base: int = 120, budget: int = 100) -> AdaptivePollingController:
+    return AdaptivePollingController(
+        base_interval=base, max_interval=600, budget=budget
+    )
+
+
+def test_stretches_under_pressure_up_to_the_maximum() -> None:
+    """Each hot cycle stretches by one bounded step, never past the cap."""
+    controller = _controller()
+    assert controller.update(95, breaker_open=False) == 180
+    assert controller.update(95, breaker_open=False) == 270
+    for _ in range(10):
+        controller.update(200, breaker_open=False)
+    assert controller.interval == 600
+
+
+def test_holds_in_band_and_relaxes_to_the_configured_floor() -> None:
+    """Hysteresis holds the cadence; headroom walks it back to the base."""
+    controller = _controller()
+    controller.update(95, breaker_open=False)
+    assert controller.update(75, breaker_open=False) == 180
+    assert controller.update(10, breaker_open=False) == 144
+    for _ in range(10):
+        controller.update(0, breaker_open=False)
+    assert controller.scale == 1.0
+    assert controller.interval == 120
+
+
+def test_open_breaker_never_relaxes() -> None:
+    """Skipped side-fetches make a low count meaningless."""
+    controller = _controller()
+    controller.update(95, breaker_open=False)
+    assert controller.update(0, breaker_open=True) == 180
+    assert controller.update(95, breaker_open=True) == 270
+
+
+def _entry(options: dict[str, int]) -> MockConfigEntry:
+    return MockConfigEntry(
+        domain=DOMAIN,
+        title="EG4 - Adaptive",
+        data={
+            CONF_USERNAME: "adaptive",
+            CONF_PASSWORD: "test",
+            CONF_CONNECTION_TYPE: CONNECTION_TYPE_HTTP,
+            CONF_PLANT_ID: "12345",
+            CONF_DST_SYNC: False,
+            CONF_LIBRARY_DEBUG: False,
+        },
+        options=options,
+        entry_id="adaptive_polling",
+    )
+
+
+@pytest.mark.asyncio
+@patch("custom_components.eg4_web_monitor.coordinator.LuxpowerClient")
+@patch("custom_components.eg4_web_monitor.coordinator.aiohttp_client")
+async def test_coordinator_applies_interval_and_sidefetch_scale(
+    mock_aiohttp, mock_client, hass
+) -> None:
+    """The cloud interval, cache TTLs and side-fetch tiers move together."""
+    entry = _entry({CONF_HTTP_POLLING_INTERVAL: 120, CONF_CLOUD_REQUEST_BUDGET: 100})
+    entry.add_to_hass(hass)
+    coordinator = EG4DataUpdateCoordinator(hass, entry)
+    client = coordinator.client
+    assert client is not None
+
+    client.api_requests_last_hour = 95
+    coordinator._adapt_http_polling_interval()
+
+    assert coordinator._http_polling_interval == 180
+    assert coordinator.update_interval == timedelta(seconds=180)
+    assert coordinator._sidefetch_interval(300.0) == 450.0
+    client._cache_ttl_config.__setitem__.assert_any_call(
+        "inverter_runtime", timedelta(seconds=180)
+    )
+
+    # An open breaker pins the stretched cadence even with no traffic.
+    client.api_requests_last_hour = 0
+    coordinator._sidefetch_open_until = time.monotonic() + 60
+    coordinator._adapt_http_polling_interval()
+    assert coordinator._http_polling_interval == 180
+
+    coordinator._sidefetch_open_until = None
+    coordinator._adapt_http_polling_interval()
+    assert coordinator._http_polling_interval == 144
+    assert coordinator.update_interval == timedelta(seconds=144)
+
+
+@pytest.mark.asyncio
+@patch("custom_components.eg4_web_monitor.coordinator.LuxpowerClient")
+@patch("custom_components.eg4_web_monitor.coordinator.aiohttp_client")
+async def test_no_budget_keeps_the_fixed_interval(
+    mock_aiohttp, mock_client, hass
+) -> None:
+    """Without a configured budget the cadence never adapts."""
+    entry = _entry({CONF_HTTP_POLLING_INTERVAL: 120})
+    entry.add_to_hass(hass)
+    coordinator = EG4DataUpdateCoordinator(hass, entry)
+    assert coordinator._adaptive_polling is None
+
+    coordinator._adapt_http_polling_interval()
+
+    assert coordinator._http_polling_interval == 120
+    assert coordinator._sidefetch_interval(300.0) == 300.0
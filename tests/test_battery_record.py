@@ -0,0 +1,163 @@
+"""Tests for the compact per-battery sensor record."""
+
+from __future__ import annotations
+
+from copy import deepcopy
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.eg4_web_monitor.base_entity import EG4BaseBatterySensor
+from custom_components.eg4_web_monitor.battery_record import (
+    BATTERY_RECORD_FIELDS,
+    BatteryRecord,
+    battery_field_index,
+)
+from custom_components.eg4_web_monitor.coordinator_mappings import (
+    _build_individual_battery_mapping,
+    blank_lost_battery_measurements,
+)
+
+
+def test_behaves_like_the_dict_it_replaces() -> None:
+    """Presence, None values, overflow keys and equality match a dict."""
+    source = {
+        "battery_rsoc": 95,
+        "battery_real_current": None,
+        "battery_serial_number": "Battery_ID_01",
+        "discharge_rate": 1.5,
+    }
+    record = BatteryRecord(source)
+
+    assert record == source
+    assert source == record
+    assert dict(record) == source
+    assert len(record) == 4
+    assert "battery_real_current" in record
+    assert "battery_real_voltage" not in record
+    assert record.get("battery_real_voltage", "absent") == "absent"
+    with pytest.raises(KeyError):
+        record["battery_real_voltage"]
+
+    del record["battery_real_current"]
+    del record["discharge_rate"]
+    assert set(record) == {"battery_rsoc", "battery_serial_number"}
+    with pytest.raises(KeyError):
+        del record["battery_real_current"]
+
+
+def test_from_fields_fills_named_slots() -> None:
+    """Fields are set by name; the rest stay absent and unknown names fail."""
+    record = BatteryRecord.from_fields(
+        battery_real_current=-3.0, battery_real_voltage=52.1
+    )
+
+    assert record == {"battery_real_voltage": 52.1, "battery_real_current": -3.0}
+    with pytest.raises(ValueError):
+        BatteryRecord.from_fields(battery_voltage=52.1)
+
+
+def test_individual_mapping_lands_each_value_in_its_named_field() -> None:
+    """Every battery attribute reaches its own sensor key."""
+    expected = {
+        "voltage": "battery_real_voltage",
+        "current": "battery_real_current",
+        "power": "battery_real_power",
+        "soc": "battery_rsoc",
+        "soh": "state_of_health",
+        "max_cell_temperature": "battery_max_cell_temp",
+        "min_cell_temperature": "battery_min_cell_temp",
+        "max_cell_num_temp": "battery_max_cell_temp_num",
+        "min_cell_num_temp": "battery_min_cell_temp_num",
+        "max_cell_voltage": "battery_max_cell_voltage",
+        "min_cell_voltage": "battery_min_cell_voltage",
+        "max_cell_num_voltage": "battery_max_cell_voltage_num",
+        "min_cell_num_voltage": "battery_min_cell_voltage_num",
+        "cell_voltage_delta": "battery_cell_voltage_delta",
+        "cell_temp_delta": "battery_cell_temp_delta",
+        "remaining_capacity": "battery_remaining_capacity",
+        "max_capacity": "battery_full_capacity",
+        "capacity_percent": "battery_capacity_percentage",
+        "charge_current_limit": "battery_max_charge_current",
+        "charge_voltage_ref": "battery_charge_voltage_ref",
+        "cycle_count": "cycle_count",
+        "firmware_version": "battery_firmware_version",
+        "battery_type": "battery_type",
+        "battery_type_text": "battery_type_text",
+        "serial_number": "battery_serial_number",
+        "model": "battery_model",
+        "battery_index": "battery_index",
+    }
+    last_seen = datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC)
+    battery = SimpleNamespace(
+        **{attribute: f"<{attribute}>" for attribute in expected},
+        last_seen=last_seen,
+    )
+    battery.current, battery.max_capacity = -10.0, 200.0
+
+    record = _build_individual_battery_mapping(battery)
+
+    for attribute, key in expected.items():
+        assert record[key] == getattr(battery, attribute), key
+    assert record["battery_last_seen"] == last_seen
+    assert record["battery_last_polled"] != last_seen
+    assert record["battery_charge_rate"] == -5.0
+    assert "battery_bms_model" not in record
+
+
+def test_copies_are_independent() -> None:
+    """Copies never share the slot list with the original."""
+    record = BatteryRecord({"battery_rsoc": 95, "battery_bms_model": "BMS"})
+    shallow = record.copy()
+    deep = deepcopy(record)
+    record["battery_rsoc"] = 10
+
+    assert shallow["battery_rsoc"] == 95
+    assert deep == shallow
+    assert deep != record
+
+
+def test_blanking_keeps_keys_present() -> None:
+    """Lost-battery blanking writes None in place while iterating."""
+    record = BatteryRecord(
+        {"battery_rsoc": 95, "battery_serial_number": "Battery_ID_01"}
+    )
+
+    blank_lost_battery_measurements(record)
+
+    assert "battery_rsoc" in record
+    assert record["battery_rsoc"] is None
+    assert record["battery_serial_number"] == "Battery_ID_01"
+
+
+def test_battery_sensor_reads_its_slot() -> None:
+    """Battery sensors read records by index and plain dicts by key."""
+    coordinator = MagicMock()
+    coordinator.data = {
+        "devices": {
+            "1234567890": {
+                "batteries": {
+                    "Battery_ID_01": BatteryRecord({"battery_rsoc": 95}),
+                    "Battery_ID_02": {"battery_rsoc": 93},
+                }
+            }
+        }
+    }
+    coordinator.get_battery_device_info = MagicMock(return_value=None)
+
+    record_sensor = EG4BaseBatterySensor(
+        coordinator, "1234567890", "Battery_ID_01", "battery_rsoc"
+    )
+    dict_sensor = EG4BaseBatterySensor(
+        coordinator, "1234567890", "Battery_ID_02", "battery_rsoc"
+    )
+    missing = EG4BaseBatterySensor(
+        coordinator, "1234567890", "Battery_ID_03", "battery_rsoc"
+    )
+
+    assert record_sensor._field_index == battery_field_index("battery_rsoc")
+    assert record_sensor._get_raw_value() == 95
+    assert dict_sensor._get_raw_value() == 93
+    assert missing._get_raw_value() is None
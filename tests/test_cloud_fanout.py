@@ -17,8 +17,10 @@ from pylxpweb.models import FirmwareUpdateInfo, FirmwareUpdateStatus
 
 import custom_components.eg4_web_monitor.coordinator as coordinator_module
 from custom_components.eg4_web_monitor.cloud_requests import (
+    acquire_shared_cloud_account,
     acquire_shared_cloud_request_budget,
     install_cloud_request_limiter,
+    release_shared_cloud_account,
     release_shared_cloud_request_budget,
 )
 from custom_components.eg4_web_monitor.const import (
@@ -1825,3 +1827,288 @@ async def test_firmware_singleflight_does_not_cross_cloud_accounts(hass):
                 for coordinator in coordinators
             )
         )
+
+
+class _SessionClient:
+    """Client double with a private single-cookie jar and a login counter."""
+
+    def __init__(self, calls: list[str], gate: asyncio.Event) -> None:
+        self.calls = calls
+        self.gate = gate
+        self.cookie: str | None = None
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        data: dict[str, Any] | None = None,
+        cache_key: str | None = None,
+        cache_endpoint: str | None = None,
+        _retry_count: int = 0,
+    ) -> dict[str, Any]:
+        del method, cache_key, cache_endpoint, _retry_count
+        self.calls.append(endpoint)
+        await self.gate.wait()
+        if endpoint == "/WManage/api/login":
+            self.cookie = f"session-{len(self.calls)}"
+            return {"success": True, "userId": 7}
+        return {"success": True, "rows": [dict(data or {})]}
+
+
+def _install_session_limiter(client: _SessionClient, account, budget):
+    def _adopt(cookie: str) -> None:
+        client.cookie = cookie
+
+    return install_cloud_request_limiter(  # type: ignore[arg-type]
+        client,
+        budget=budget,
+        account=account,
+        session_cookie=lambda: client.cookie,
+        adopt_session_cookie=_adopt,
+    )
+
+
+async def test_same_account_clients_share_one_login_and_plant_list(hass):
+    """Four plants on one account log in and list plants once, not four times."""
+    calls: list[str] = []
+    gate = asyncio.Event()
+    key = {
+        "username": "shared-login-account",
+        "base_url": "https://monitor.eg4electronics.com",
+        "verify_ssl": True,
+    }
+    budget = acquire_shared_cloud_request_budget(hass, **key, limit=3)
+    accounts = [acquire_shared_cloud_account(hass, **key) for _ in range(4)]
+    assert all(account is accounts[0] for account in accounts)
+    clients = [_SessionClient(calls, gate) for _ in range(4)]
+    limiters = [
+        _install_session_limiter(client, accounts[0], budget)
+        for client in clients
+    ]
+    try:
+        logins = [
+            asyncio.create_task(client._request("POST", "/WManage/api/login"))
+            for client in clients
+        ]
+        await asyncio.sleep(0)
+        gate.set()
+        assert await asyncio.gather(*logins) == [
+            {"success": True, "userId": 7}
+        ] * 4
+        assert calls == ["/WManage/api/login"]
+        assert {client.cookie for client in clients} == {"session-1"}
+
+        listings = await asyncio.gather(
+            *(
+                client._request(
+                    "POST",
+                    "/WManage/web/config/plant/list/viewer",
+                    data={"page": 1, "rows": 30},
+                )
+                for client in clients
+            )
+        )
+        assert calls.count("/WManage/web/config/plant/list/viewer") == 1
+        assert all(listing == listings[0] for listing in listings)
+
+        # A different body is a different read: a targeted lookup is not
+        # answered by the listing, and each plant's overview is its own.
+        await clients[0]._request(
+            "POST",
+            "/WManage/web/config/plant/list/viewer",
+            data={"page": 1, "rows": 30, "targetPlantId": 5},
+        )
+        await asyncio.gather(
+            *(
+                client._request(
+                    "POST",
+                    "/WManage/api/inverterOverview/list",
+                    data={"plantId": index},
+                )
+                for index, client in enumerate(clients)
+            )
+        )
+        assert calls.count("/WManage/web/config/plant/list/viewer") == 2
+        assert calls.count("/WManage/api/inverterOverview/list") == 4
+    finally:
+        for limiter in limiters:
+            limiter.close()
+        for account in accounts:
+            release_shared_cloud_account(hass, account)
+        release_shared_cloud_request_budget(hass, budget)
+    assert "eg4_web_monitor_cloud_accounts" not in hass.data
+
+
+async def test_shared_login_is_not_reused_for_the_cookie_that_failed(hass):
+    """A client renewing the shared session logs in itself and leads again."""
+    calls: list[str] = []
+    gate = asyncio.Event()
+    gate.set()
+    key = {
+        "username": "stale-login-account",
+        "base_url": "https://monitor.eg4electronics.com",
+        "verify_ssl": True,
+    }
+    budget = acquire_shared_cloud_request_budget(hass, **key, limit=3)
+    account = acquire_shared_cloud_account(hass, **key)
+    sibling_account = acquire_shared_cloud_account(hass, **key)
+    first, second = (_SessionClient(calls, gate) for _ in range(2))
+    limiters = [
+        _install_session_limiter(first, account, budget),
+        _install_session_limiter(second, sibling_account, budget),
+    ]
+    try:
+        await first._request("POST", "/WManage/api/login")
+        await second._request("POST", "/WManage/api/login")
+        assert calls == ["/WManage/api/login"]
+        assert second.cookie == first.cookie == "session-1"
+
+        # The portal rejected session-1, so pylxpweb renews: reusing it would
+        # replay the same failure.
+        await second._request("POST", "/WManage/api/login")
+        assert calls == ["/WManage/api/login"] * 2
+        assert second.cookie == "session-2"
+
+        await first._request("POST", "/WManage/api/login")
+        assert len(calls) == 2
+        assert first.cookie == "session-2"
+    finally:
+        for limiter in limiters:
+            limiter.close()
+        release_shared_cloud_account(hass, account)
+        release_shared_cloud_account(hass, sibling_account)
+        release_shared_cloud_request_budget(hass, budget)
+
+
+class _ReadClient:
+    """Client double counting wire reads, with an optional reauth replay."""
+
+    def __init__(self) -> None:
+        self.wire: list[tuple[str, Any]] = []
+        self.release = asyncio.Event()
+        self.replay_once = False
+        self.fail_next = False
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        data: dict[str, Any] | None = None,
+        cache_key: str | None = None,
+        cache_endpoint: str | None = None,
+        _retry_count: int = 0,
+    ) -> dict[str, Any]:
+        del cache_key, cache_endpoint
+        self.wire.append((endpoint, data))
+        await self.release.wait()
+        if self.fail_next:
+            self.fail_next = False
+            raise RuntimeError("portal unavailable")
+        if self.replay_once and _retry_count == 0:
+            # pylxpweb replays the original request after renewing a session.
+            self.replay_once = False
+            return await self._request(
+                method, endpoint, data=data, _retry_count=_retry_count + 1
+            )
+        return {"success": True, "serialNum": (data or {}).get("serialNum")}
+
+
+_RUNTIME = "/WManage/api/inverter/getInverterRuntime"
+
+
+async def test_identical_concurrent_reads_share_one_wire_request():
+    """Same method, endpoint and body coalesce; each caller gets its own copy."""
+    client = _ReadClient()
+    limiter = install_cloud_request_limiter(client, limit=3)  # type: ignore[arg-type]
+    try:
+        reads = [
+            asyncio.create_task(
+                client._request("POST", _RUNTIME, data={"serialNum": serial})
+            )
+            for serial in ("A", "A", "B", "A")
+        ]
+        await asyncio.sleep(0)
+        client.release.set()
+        results = await asyncio.gather(*reads)
+
+        assert [result["serialNum"] for result in results] == ["A", "A", "B", "A"]
+        assert client.wire == [
+            (_RUNTIME, {"serialNum": "A"}),
+            (_RUNTIME, {"serialNum": "B"}),
+        ]
+        results[0]["serialNum"] = "mutated"
+        assert results[1]["serialNum"] == "A"
+
+        # The short window answers an immediate repeat without the wire...
+        await client._request("POST", _RUNTIME, data={"serialNum": "A"})
+        assert len(client.wire) == 2
+
+        # ...an uncoalesced read (a chart, the event list) leaves it intact...
+        await client._request("POST", "/WManage/api/inverterChart/dayColumn")
+        await client._request("POST", _RUNTIME, data={"serialNum": "A"})
+        assert len(client.wire) == 3
+
+        # ...but a write invalidates it, so the read-back is fresh.
+        await client._request("POST", "/WManage/web/maintain/remoteSet/write")
+        await client._request("POST", _RUNTIME, data={"serialNum": "A"})
+        assert len(client.wire) == 5
+    finally:
+        limiter.close()
+
+
+async def test_unlisted_portal_posts_invalidate_coalesced_reads():
+    """Plant edits (DST switch) and parallel sync drop the plant listing."""
+    client = _ReadClient()
+    client.release.set()
+    limiter = install_cloud_request_limiter(client, limit=3)  # type: ignore[arg-type]
+    listing = "/WManage/web/config/plant/list/viewer"
+    try:
+        await client._request("POST", listing, data={"targetPlantId": "1"})
+        for write in (
+            "/WManage/web/config/plant/edit",
+            "/WManage/api/inverter/autoParallel",
+        ):
+            await client._request("POST", write, data={"plantId": "1"})
+            await client._request("POST", listing, data={"targetPlantId": "1"})
+
+        assert [endpoint for endpoint, _ in client.wire].count(listing) == 3
+
+        # A known read-only endpoint keeps the 60 s listing window.
+        await client._request("POST", "/WManage/api/analyze/event/list")
+        await client._request("POST", listing, data={"targetPlantId": "1"})
+        assert [endpoint for endpoint, _ in client.wire].count(listing) == 3
+    finally:
+        limiter.close()
+
+
+async def test_read_replay_and_failures_are_not_coalesced():
+    """A reauth replay reaches the wire and followers never share an error."""
+    client = _ReadClient()
+    client.release.set()
+    limiter = install_cloud_request_limiter(client, limit=3)  # type: ignore[arg-type]
+    try:
+        client.replay_once = True
+        result = await asyncio.wait_for(
+            client._request("POST", _RUNTIME, data={"serialNum": "A"}), timeout=1
+        )
+        assert result["serialNum"] == "A"
+        assert len(client.wire) == 2
+
+        client.release.clear()
+        client.fail_next = True
+        body = {"serialNum": "C"}
+        reads = [
+            asyncio.create_task(client._request("POST", _RUNTIME, data=body))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        client.release.set()
+        results = await asyncio.gather(*reads, return_exceptions=True)
+
+        assert isinstance(results[0], RuntimeError)
+        assert results[1] == {"success": True, "serialNum": "C"}
+        assert len(client.wire) == 4
+    finally:
+        limiter.close()
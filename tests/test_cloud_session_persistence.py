@@ -0,0 +1,113 @@
+"""Tests for restart persistence of authenticated cloud sessions."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from aiohttp import ClientSession
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import aiohttp_client
+from yarl import URL
+
+from custom_components.eg4_web_monitor.cloud_requests import cloud_account_key
+from custom_components.eg4_web_monitor.cloud_session import (
+    CloudSessionCache,
+    get_cloud_session_cache,
+)
+
+BASE_URL = "https://monitor.eg4electronics.com"
+COOKIE_NAME = "JSESSIONID"
+KEY = cloud_account_key("account-a", BASE_URL, True)
+
+
+def _session(hass: HomeAssistant, cookie: str | None = None) -> ClientSession:
+    session = aiohttp_client.async_create_clientsession(hass, auto_cleanup=True)
+    if cookie is not None:
+        session.cookie_jar.update_cookies(
+            {COOKIE_NAME: cookie}, response_url=URL(BASE_URL)
+        )
+    return session
+
+
+def _cookie(session: ClientSession) -> str | None:
+    morsel = session.cookie_jar.filter_cookies(URL(BASE_URL)).get(COOKIE_NAME)
+    return None if morsel is None else morsel.value
+
+
+async def _remembered(
+    hass: HomeAssistant, expires: datetime, *, password: str = "secret"
+) -> CloudSessionCache:
+    cache = CloudSessionCache(hass)
+    await cache.async_forget(KEY)  # loads the (empty) record set
+    client = SimpleNamespace(_session_expires=expires)
+    cache.remember(KEY, password, client, _session(hass, "live-cookie"))
+    return cache
+
+
+async def test_saved_session_restores_into_fresh_client(hass: HomeAssistant) -> None:
+    """A reload resumes the saved cookie and pylxpweb's expiry stamp."""
+    expires = datetime.now() + timedelta(hours=1)
+    cache = await _remembered(hass, expires)
+
+    fresh_client = SimpleNamespace(_session_expires=None)
+    fresh_session = _session(hass)
+    assert await cache.async_restore(KEY, "secret", fresh_client, fresh_session)
+
+    assert _cookie(fresh_session) == "live-cookie"
+    assert fresh_client._session_expires == expires
+
+
+async def test_saved_record_is_encrypted(hass: HomeAssistant) -> None:
+    """Neither the cookie nor the username is written in plaintext."""
+    cache = await _remembered(hass, datetime.now() + timedelta(hours=1))
+
+    stored = repr(cache._records)  # noqa: SLF001 - the exact Store payload
+    assert "live-cookie" not in stored
+    assert "account-a" not in stored
+    assert cache._store._private  # noqa: SLF001
+
+
+async def test_changed_password_or_expired_session_falls_back_to_login(
+    hass: HomeAssistant,
+) -> None:
+    """Undecryptable or stale records leave the client to log in normally."""
+    cache = await _remembered(hass, datetime.now() + timedelta(hours=1))
+    client = SimpleNamespace(_session_expires=None)
+    session = _session(hass)
+    assert not await cache.async_restore(KEY, "rotated", client, session)
+    assert client._session_expires is None
+    assert _cookie(session) is None
+
+    stale = await _remembered(hass, datetime.now() + timedelta(minutes=1))
+    assert not await stale.async_restore(KEY, "secret", client, session)
+    assert _cookie(session) is None
+
+
+async def test_unknown_client_shape_never_skips_login(hass: HomeAssistant) -> None:
+    """A pylxpweb without the expiry attribute is never seeded."""
+    cache = await _remembered(hass, datetime.now() + timedelta(hours=1))
+    session = _session(hass)
+    assert not await cache.async_restore(KEY, "secret", SimpleNamespace(), session)
+    assert _cookie(session) is None
+
+
+async def test_unchanged_session_is_not_rewritten(hass: HomeAssistant) -> None:
+    """Per-cycle remember() is a no-op until a login renews the session."""
+    expires = datetime.now() + timedelta(hours=1)
+    cache = await _remembered(hass, expires)
+    records = cache._records  # noqa: SLF001
+    assert records is not None
+    token = next(iter(records.values()))["token"]
+
+    client = SimpleNamespace(_session_expires=expires)
+    cache.remember(KEY, "secret", client, _session(hass, "other-cookie"))
+    assert next(iter(records.values()))["token"] == token
+
+    await cache.async_forget(KEY)
+    assert records == {}
+
+
+async def test_cache_is_shared_per_home_assistant(hass: HomeAssistant) -> None:
+    """Every entry on one HA instance reads the same cache."""
+    assert get_cloud_session_cache(hass) is get_cloud_session_cache(hass)
@@ -1343,6 +1343,32 @@ class TestParallelGroupAggregation:
         assert pg["sensors"]["pv_total_power"] == 3000.0
         assert pg["sensors"]["parallel_battery_power"] == 500.0
 
+    async def test_unchanged_members_keep_group_record(self, hass, mock_config_entry):
+        """Unpolled members leave the group record (and its stamp) untouched."""
+        mock_config_entry.add_to_hass(hass)
+        coordinator = EG4DataUpdateCoordinator(hass, mock_config_entry)
+        processed = self._two_inverter_processed()
+
+        await coordinator._process_local_parallel_groups(processed)
+        first = processed["devices"]["parallel_group_a"]
+        stamp = first["sensors"]["parallel_group_last_polled"]
+
+        # Next tick carries every record forward by identity.
+        await coordinator._process_local_parallel_groups(processed)
+        assert processed["devices"]["parallel_group_a"] is first
+        assert first["sensors"]["parallel_group_last_polled"] == stamp
+
+        # One member polled with a new value: only the group is rebuilt.
+        polled = dict(processed["devices"]["INV002"])
+        polled["sensors"] = {**polled["sensors"], "pv_total_power": 1500.0}
+        processed["devices"]["INV002"] = polled
+
+        await coordinator._process_local_parallel_groups(processed)
+        rebuilt = processed["devices"]["parallel_group_a"]
+        assert rebuilt is not first
+        assert rebuilt["sensors"]["pv_total_power"] == 4500.0  # 3000 + 1500
+        assert rebuilt["sensors"]["yield"] == 27.0
+
 
 class TestDeferredLocalParameters:
     """Test deferred parameter loading for local transport modes."""
@@ -4203,6 +4229,106 @@ class TestPerTransportIntervals:
         # (This is tested via the pre-population logic)
         assert coordinator._last_modbus_poll > 0.0  # Was attempted
 
+    def test_seconds_until_transport_poll_peeks_without_stamping(
+        self, hass, mixed_local_config_entry
+    ):
+        """The wake-up calculation never consumes a gate decision."""
+        mixed_local_config_entry.add_to_hass(hass)
+        coordinator = EG4DataUpdateCoordinator(hass, mixed_local_config_entry)
+        assert coordinator._seconds_until_transport_poll() == 0.0
+        assert coordinator._last_modbus_poll is None
+
+        now = time.monotonic()
+        coordinator._last_modbus_poll = now
+        coordinator._last_dongle_poll = now
+        wait = coordinator._seconds_until_transport_poll()
+        assert 0.0 < wait <= 5.0
+        assert coordinator._last_modbus_poll == now
+
+        # The dongle gate alone stays closed for its own, longer interval.
+        coordinator._last_modbus_poll = now - 100.0
+        assert coordinator._seconds_until_transport_poll() == 0.0
+
+    def test_unknown_transport_type_keeps_fixed_local_cadence(
+        self, hass, mixed_local_config_entry
+    ):
+        """A gateless transport is not reported due forever and disables wakes."""
+        transports = [
+            *mixed_local_config_entry.data[CONF_LOCAL_TRANSPORTS],
+            {
+                "serial": "3333333333",
+                "host": "192.168.1.300",
+                "transport_type": "future_transport",
+            },
+        ]
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            data={**mixed_local_config_entry.data, CONF_LOCAL_TRANSPORTS: transports},
+            entry_id="unknown_transport_test",
+        )
+        entry.add_to_hass(hass)
+        coordinator = EG4DataUpdateCoordinator(hass, entry)
+
+        assert coordinator._local_tick_scheduling is False
+        now = time.monotonic()
+        coordinator._last_modbus_poll = now
+        coordinator._last_dongle_poll = now
+        assert 0.0 < coordinator._seconds_until_transport_poll() <= 5.0
+        assert coordinator._local_tick_is_idle() is False
+
+    @pytest.mark.asyncio
+    async def test_idle_local_tick_skips_publish_pipeline(
+        self, hass, mixed_local_config_entry
+    ):
+        """A tick with no due gate returns the published data untouched."""
+        mixed_local_config_entry.add_to_hass(hass)
+        coordinator = EG4DataUpdateCoordinator(hass, mixed_local_config_entry)
+        coordinator._local_static_phase_done = True
+        coordinator.data = {
+            "devices": {"1111111111": {"type": "inverter", "sensors": {}}},
+            "parameters": {},
+        }
+        coordinator._last_modbus_poll = time.monotonic()
+        coordinator._last_dongle_poll = time.monotonic()
+
+        with patch.object(
+            coordinator, "_route_update_by_connection_type", new=AsyncMock()
+        ) as route:
+            result = await coordinator._async_update_data()
+
+        route.assert_not_awaited()
+        assert result is coordinator.data
+        assert coordinator._pending_listener_contexts == set()
+        # Woken again when the Modbus gate opens, not a fixed tick later.
+        assert timedelta(seconds=1) < coordinator.update_interval <= timedelta(
+            seconds=6
+        )
+
+    def test_parallel_groups_kept_when_tick_polls_no_member(
+        self, hass, mixed_local_config_entry
+    ):
+        """Only ticks that touch an aggregate input re-run the aggregation."""
+        mixed_local_config_entry.add_to_hass(hass)
+        coordinator = EG4DataUpdateCoordinator(hass, mixed_local_config_entry)
+        processed: dict[str, Any] = {
+            "devices": {
+                "1111111111": {"type": "inverter", "parallel_number": 1},
+                "2222222222": {"type": "inverter", "parallel_number": 0},
+                "parallel_group_a": {
+                    "type": "parallel_group",
+                    "member_serials": ["1111111111"],
+                },
+            }
+        }
+        # The first tick always aggregates.
+        assert coordinator._local_aggregates_stale(processed, {"2222222222"})
+        assert not coordinator._local_aggregates_stale(processed, {"2222222222"})
+        assert coordinator._local_aggregates_stale(processed, {"1111111111"})
+
+        # A member turning stale re-aggregates even when it was not polled.
+        processed["devices"]["1111111111"]["error"] = "Local transport link down"
+        assert coordinator._local_aggregates_stale(processed, {"2222222222"})
+
     def test_fallback_to_sensor_update_interval(self, hass):
         """No new keys in options: falls back to legacy sensor_update_interval."""
 
@@ -5237,6 +5363,19 @@ class TestCloudBatteryBankParity:
         assert result["battery_bank_min_cell_temp"] == pytest.approx(19.5)
         assert result["battery_bank_min_cell_voltage"] == pytest.approx(3.211)
 
+    def test_min_cell_values_skip_lost_module_readings(self):
+        """A blanked (None) or NaN reading drops out of that statistic only."""
+        bank = _FakeCloudBatteryBank(
+            batteries=[
+                _FakeCloudBattery(min_cell_temp=float("nan"), min_cell_voltage=3.3),
+                _FakeCloudBattery(min_cell_temp=22.0, min_cell_voltage=None),
+                _FakeCloudBattery(min_cell_temp=None, min_cell_voltage=3.25),
+            ]
+        )
+        result = self._extract(bank)
+        assert result["battery_bank_min_cell_temp"] == pytest.approx(22.0)
+        assert result["battery_bank_min_cell_voltage"] == pytest.approx(3.25)
+
     def test_min_cell_values_absent_without_per_battery_data(self):
         """min cell temp/voltage omitted (not AttributeError) when no batteries."""
         bank = _FakeCloudBatteryBank(batteries=[])
@@ -7792,6 +7931,8 @@ class TestCloudPVStringEnergy:
         ):
             await first_coordinator._fetch_pv_string_energy(self.SERIAL, first_target)
         assert first_target["sensors"]["pv1_yield_lifetime"] == 10.0
+        # Unload flushes the delayed save before a reload builds a new one.
+        await first_coordinator._async_flush_pv_string_lifetime_state()
 
         low_analytics = SimpleNamespace(
             get_energy_total_breakdown=AsyncMock(
@@ -7815,6 +7956,36 @@ class TestCloudPVStringEnergy:
 
         assert second_target["sensors"]["pv1_yield_lifetime"] == 10.0
 
+    async def test_lifetime_state_save_is_delayed_until_flush(
+        self, hass, mock_config_entry
+    ):
+        analytics = SimpleNamespace(
+            get_energy_total_breakdown=AsyncMock(
+                return_value={"data": [{"year": 2026, "energy": 100}]}
+            )
+        )
+        coordinator = self._coordinator(hass, mock_config_entry, analytics)
+        store = coordinator._pv_string_lifetime_store
+        target: dict[str, Any] = {"features": {"pv_string_count": 3}, "sensors": {}}
+        with (
+            patch.object(store, "async_save", wraps=store.async_save) as save,
+            patch(
+                "custom_components.eg4_web_monitor.coordinator_mixins.dt_util.now",
+                return_value=self.TODAY,
+            ),
+        ):
+            await coordinator._fetch_pv_string_energy(self.SERIAL, target)
+            save.assert_not_called()
+            assert coordinator._pv_string_lifetime_dirty
+
+            await coordinator._async_flush_pv_string_lifetime_state()
+            await coordinator._async_flush_pv_string_lifetime_state()
+
+        save.assert_awaited_once_with(
+            {f"{self.SERIAL}:{n}": [10.0, 1] for n in (1, 2, 3)}
+        )
+        assert not coordinator._pv_string_lifetime_dirty
+
     async def test_lifetime_year_count_persists_with_new_coordinator(
         self, hass, mock_config_entry
     ):
@@ -7840,6 +8011,7 @@ class TestCloudPVStringEnergy:
             return_value=self.TODAY,
         ):
             await first_coordinator._fetch_pv_string_energy(self.SERIAL, first_target)
+        await first_coordinator._async_flush_pv_string_lifetime_state()
 
         truncated_analytics = SimpleNamespace(
             get_energy_total_breakdown=AsyncMock(
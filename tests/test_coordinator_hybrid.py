@@ -6,6 +6,7 @@ are attached to HTTP-discovered Station devices using CONF_LOCAL_TRANSPORTS.
 
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -1196,11 +1197,24 @@ class TestTransportLinkDown:
         )
         inv.refresh.assert_awaited_once()
 
+    @staticmethod
+    def _with_link_probes(mock_self: MagicMock) -> MagicMock:
+        """Route a bare hybrid coordinator through the real link probe gate."""
+        from custom_components.eg4_web_monitor.coordinator import (
+            EG4DataUpdateCoordinator,
+        )
+
+        mock_self._link_probes = {}
+        mock_self._link_probe_allows_refresh = partial(
+            EG4DataUpdateCoordinator._link_probe_allows_refresh, mock_self
+        )
+        return mock_self
+
     @pytest.mark.asyncio
     async def test_link_down_bust_throttled_refresh_still_probes(self) -> None:
-        """Inside the throttle window the bust is skipped but the refresh
-        STILL runs — the local probe must fire every cycle for recovery
-        (unlike the no-transport degraded path, which skips entirely)."""
+        """Inside the throttle window the bust is skipped but a transport
+        outside the endpoint bus STILL refreshes — there is no cheap probe
+        for it, so the refresh is the recovery path."""
         import time as time_mod
 
         from custom_components.eg4_web_monitor.coordinator import (
@@ -1220,6 +1234,7 @@ class TestTransportLinkDown:
         mock_self._last_degraded_cloud_refresh = {
             "1111111111": time_mod.monotonic()  # busted moments ago
         }
+        self._with_link_probes(mock_self)
 
         await EG4DataUpdateCoordinator._refresh_station_devices(
             mock_self, include_mid=True
@@ -1228,6 +1243,57 @@ class TestTransportLinkDown:
         mock_self.client.invalidate_cache_for_device.assert_not_called()
         inv.refresh.assert_awaited_once()
 
+    @pytest.mark.asyncio
+    async def test_link_down_bus_device_skips_refresh_until_probe_answers(
+        self,
+    ) -> None:
+        """Between cache busts a link-down endpoint-bus device is not refreshed;
+        a failed probe backs off, and an answered probe lets the refresh run."""
+        import time as time_mod
+
+        from pylxpweb.transports.exceptions import TransportTimeoutError
+
+        from custom_components.eg4_web_monitor.coordinator import (
+            EG4DataUpdateCoordinator,
+        )
+        from custom_components.eg4_web_monitor.endpoint_bus import (
+            EndpointBusCapability,
+        )
+
+        transport = MagicMock(spec=EndpointBusCapability)
+        transport.status = MagicMock(owner_identity=1)
+        transport.async_probe.side_effect = TransportTimeoutError("no answer")
+        inv = self._device("1111111111", link_down=True, transport=transport)
+
+        mock_self = MagicMock()
+        mock_self._local_transports_attached = True
+        mock_self._local_transport_configs = [{"serial": "1111111111"}]
+        mock_self.station = MagicMock()
+        mock_self.station.all_inverters = [inv]
+        mock_self.station.all_mid_devices = []
+        mock_self.client = MagicMock()
+        mock_self._http_polling_interval = 60
+        mock_self._last_degraded_cloud_refresh = {
+            "1111111111": time_mod.monotonic()  # busted moments ago
+        }
+        self._with_link_probes(mock_self)
+
+        await EG4DataUpdateCoordinator._refresh_station_devices(
+            mock_self, include_mid=True
+        )
+
+        transport.async_probe.assert_awaited_once()
+        inv.refresh.assert_not_awaited()
+        assert mock_self._link_probes["1111111111"].failures == 1
+
+        transport.async_probe.side_effect = None
+        mock_self._link_probes["1111111111"]._next_probe = 0.0
+        await EG4DataUpdateCoordinator._refresh_station_devices(
+            mock_self, include_mid=True
+        )
+
+        inv.refresh.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_healthy_attached_device_not_busted(self) -> None:
         """A healthy local device never has its cloud caches invalidated."""
@@ -1246,6 +1312,7 @@ class TestTransportLinkDown:
         mock_self.client = MagicMock()
         mock_self._http_polling_interval = 60
         mock_self._last_degraded_cloud_refresh = {}
+        self._with_link_probes(mock_self)
 
         await EG4DataUpdateCoordinator._refresh_station_devices(
             mock_self, include_mid=True
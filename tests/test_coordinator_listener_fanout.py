@@ -40,6 +40,9 @@ def _bare_coordinator(data: dict | None = None) -> EG4DataUpdateCoordinator:
     coordinator._removal_device_observed_since = None
     coordinator._removal_battery_observed_since = None
     coordinator._removal_battery_parent_since = {}
+    # Cloud session persistence is restored/saved around the update path.
+    coordinator._cloud_session_cache = None
+    coordinator._cloud_session_restore_pending = False
     return coordinator
 
 
@@ -1516,6 +1516,82 @@ class TestBuildLocalDeviceData:
         # grid_import_power sensor is sourced from inverter.power_to_user (load_power)
         assert result["sensors"]["grid_import_power"] == 500
 
+    async def test_unchanged_transport_data_skips_remapping(
+        self, hass, local_config_entry
+    ):
+        """The same pylxpweb data objects are mapped once, then copied."""
+        local_config_entry.add_to_hass(hass)
+        coordinator = EG4DataUpdateCoordinator(hass, local_config_entry)
+
+        inverter = make_real_inverter(
+            "INV001", "FlexBOSS21", runtime=InverterRuntimeData()
+        )
+        inverter._transport_battery = None
+        inverter._transport = None
+
+        def _build() -> dict:
+            return coordinator._build_local_device_data(
+                inverter=inverter,
+                serial="INV001",
+                model="FlexBOSS21",
+                firmware_version="ARM-1.0",
+                connection_type="modbus",
+            )
+
+        with patch(
+            "custom_components.eg4_web_monitor.coordinator_local._build_runtime_sensor_mapping",
+            side_effect=lambda *_args, **_kwargs: {"pv_total_power": 5000},
+        ) as mapping:
+            first = _build()
+            second = _build()
+            assert mapping.call_count == 1
+
+            # Per-cycle keys added to one cycle's dict never leak into the memo.
+            assert first["sensors"] is not second["sensors"]
+            first["sensors"]["pv_total_power"] = 0
+            assert _build()["sensors"]["pv_total_power"] == 5000
+            assert mapping.call_count == 1
+
+            # A fresh read replaces the runtime object: map again.
+            inverter._transport_runtime = InverterRuntimeData()
+            _build()
+            assert mapping.call_count == 2
+
+    async def test_transport_sensor_memo_is_read_only_and_pruned(
+        self, hass, local_config_entry
+    ):
+        """The memo is served as a read-only view; departed serials are dropped."""
+        from custom_components.eg4_web_monitor.link_probe import LinkHealthProbe
+
+        local_config_entry.add_to_hass(hass)
+        coordinator = EG4DataUpdateCoordinator(hass, local_config_entry)
+        runtime = InverterRuntimeData()
+
+        with patch(
+            "custom_components.eg4_web_monitor.coordinator_local._build_runtime_sensor_mapping",
+            side_effect=lambda *_args, **_kwargs: {"pv_total_power": 5000},
+        ):
+            view = coordinator._map_transport_sensors(
+                "INV001", runtime, None, None, None
+            )
+            again = coordinator._map_transport_sensors(
+                "INV001", runtime, None, None, None
+            )
+            coordinator._map_transport_sensors(
+                "REMOVED01", InverterRuntimeData(), None, None, None
+            )
+        with pytest.raises(TypeError):
+            view["pv_total_power"] = 0  # type: ignore[index]
+        assert again == {"pv_total_power": 5000}
+
+        coordinator._link_probes["REMOVED01"] = LinkHealthProbe()
+        coordinator._link_probes["INV001"] = LinkHealthProbe()
+        # INV001 is still configured, so it keeps its memo and probe even
+        # while it is absent from the published devices.
+        coordinator._forget_departed_local_devices({})
+        assert set(coordinator._transport_sensor_memo) == {"INV001"}
+        assert set(coordinator._link_probes) == {"INV001"}
+
 
 # ── grid_power net-flow semantics (eg4-9wf) ──────────────────────────
 
@@ -4297,6 +4373,73 @@ class TestLocalLinkDownFlow:
         }
         assert coordinator._link_down_notified == {"SYNTH10013"}
 
+    async def test_failed_link_probe_skips_refresh_and_marks_error(self, hass):
+        """Behind an endpoint capability, a down link is only probed: a failed
+        probe skips the full refresh, raises the link-down connection error
+        for the device and backs off before the next probe."""
+        from pylxpweb.transports.exceptions import TransportTimeoutError
+
+        from custom_components.eg4_web_monitor.endpoint_bus import (
+            EndpointBusCapability,
+        )
+
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            title="EG4 - Link Probe",
+            data={
+                CONF_CONNECTION_TYPE: CONNECTION_TYPE_LOCAL,
+                CONF_DST_SYNC: False,
+                CONF_LIBRARY_DEBUG: False,
+                CONF_LOCAL_TRANSPORTS: [
+                    {
+                        "serial": "SYNTH10013",
+                        "host": "192.168.1.60",
+                        "port": 502,
+                        "transport_type": "modbus_tcp",
+                        "inverter_family": "EG4_HYBRID",
+                    },
+                ],
+            },
+            entry_id="link_probe_flow_test",
+        )
+        entry.add_to_hass(hass)
+        coordinator = EG4DataUpdateCoordinator(hass, entry)
+        coordinator._local_static_phase_done = True
+        coordinator._local_parameters_loaded = False
+        coordinator.data = {
+            "devices": {
+                "SYNTH10013": {
+                    "type": "inverter",
+                    "sensors": {"battery_voltage": 53.2},
+                }
+            },
+            "parameters": {},
+        }
+
+        transport = MagicMock(spec=EndpointBusCapability)
+        transport.async_probe.side_effect = TransportTimeoutError("no answer")
+        inverter = MagicMock(
+            spec=["transport", "transport_link_down", "refresh", "serial_number"]
+        )
+        inverter.serial_number = "SYNTH10013"
+        inverter.transport = transport
+        inverter.transport_link_down = True
+        inverter.refresh = AsyncMock()
+        coordinator._inverter_cache["SYNTH10013"] = inverter
+
+        with pytest.raises(UpdateFailed, match="All 1 local transports failed"):
+            await coordinator._async_update_local_data()
+
+        transport.async_probe.assert_awaited_once()
+        inverter.refresh.assert_not_awaited()
+        assert (
+            coordinator.data["devices"]["SYNTH10013"]["error"]
+            == "Local transport link down"
+        )
+        probe = coordinator._link_probes["SYNTH10013"]
+        assert probe.failures == 1
+        assert probe.due() is False
+
     async def test_recovery_clears_repairs_issue(self, hass):
         """When the link comes back, the Repairs issue is deleted."""
         from homeassistant.helpers import issue_registry as ir
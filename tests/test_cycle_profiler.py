@@ -0,0 +1,108 @@
+"""Tests for the per-phase coordinator cycle profiler."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from custom_components.eg4_web_monitor.cycle_profiler import (
+    COORDINATOR_SCOPE,
+    PHASE_DEVICE_TOTAL,
+    PHASE_GATE_WAIT,
+    PHASE_LISTENER_FANOUT,
+    PHASE_MAPPING,
+    PHASE_SIDE_FETCH,
+    PHASE_WIRE_READ,
+    CycleProfiler,
+)
+from custom_components.eg4_web_monitor.endpoint_bus import EndpointBusCapability
+from custom_components.eg4_web_monitor.sensor import EG4PollTimeSensor
+
+
+def test_cycle_sums_spans_per_phase_and_device() -> None:
+    """Repeated spans in one cycle form one sample; devices get a total."""
+    profiler = CycleProfiler()
+    profiler.begin_cycle()
+    profiler.record(PHASE_WIRE_READ, 0.2, "1234567890")
+    profiler.record(PHASE_WIRE_READ, 0.3, "1234567890")
+    profiler.record(PHASE_MAPPING, 0.1, "1234567890")
+    profiler.record(PHASE_LISTENER_FANOUT, 0.05, COORDINATOR_SCOPE)
+    profiler.end_cycle()
+
+    stats = profiler.device_stats("1234567890")
+    assert stats[PHASE_WIRE_READ] == {
+        "p50_ms": 500.0,
+        "p95_ms": 500.0,
+        "max_ms": 500.0,
+        "samples": 1,
+    }
+    assert stats[PHASE_DEVICE_TOTAL]["max_ms"] == 600.0
+    assert PHASE_DEVICE_TOTAL not in profiler.device_stats(COORDINATOR_SCOPE)
+
+
+def test_records_outside_a_cycle_are_separate_samples() -> None:
+    """Listener fan-out after the update returns keeps one sample per call."""
+    profiler = CycleProfiler()
+    for seconds in (0.01, 0.02, 0.03, 0.04):
+        profiler.record(PHASE_LISTENER_FANOUT, seconds, COORDINATOR_SCOPE)
+
+    stats = profiler.device_stats(COORDINATOR_SCOPE)[PHASE_LISTENER_FANOUT]
+    assert stats == {"p50_ms": 20.0, "p95_ms": 40.0, "max_ms": 40.0, "samples": 4}
+
+
+def test_device_scope_attributes_and_exclude_subtracts() -> None:
+    """Spans default to the scoped device; excluded phases are not counted."""
+    profiler = CycleProfiler()
+    profiler.begin_cycle()
+    with CycleProfiler.device_scope("1234567890"):
+        with profiler.span(PHASE_MAPPING, exclude=PHASE_SIDE_FETCH):
+            profiler.record(PHASE_SIDE_FETCH, 5.0)
+    profiler.end_cycle()
+
+    stats = profiler.device_stats("1234567890")
+    assert stats[PHASE_SIDE_FETCH]["max_ms"] == 5000.0
+    assert stats[PHASE_MAPPING]["max_ms"] < 1000.0
+
+
+def test_wire_span_splits_gate_wait_from_wire_read() -> None:
+    """Time queued on the endpoint gate is reported as gate wait."""
+    profiler = CycleProfiler()
+    capability = MagicMock(spec=EndpointBusCapability)
+    capability.gate_wait_seconds = 1.0
+
+    profiler.begin_cycle()
+    with profiler.wire_span("1234567890", capability):
+        capability.gate_wait_seconds = 1.25
+    profiler.end_cycle()
+
+    stats = profiler.device_stats("1234567890")
+    assert stats[PHASE_GATE_WAIT]["max_ms"] == 250.0
+    assert stats[PHASE_WIRE_READ]["max_ms"] == 0.0
+
+
+def test_forget_drops_removed_devices_only() -> None:
+    """Removed devices lose their windows; coordinator phases stay."""
+    profiler = CycleProfiler()
+    profiler.record(PHASE_WIRE_READ, 0.1, "1234567890")
+    profiler.record(PHASE_WIRE_READ, 0.1, "0987654321")
+    profiler.record(PHASE_LISTENER_FANOUT, 0.1, COORDINATOR_SCOPE)
+
+    profiler.forget({"1234567890"})
+
+    assert set(profiler.as_dict()) == {COORDINATOR_SCOPE, "1234567890"}
+
+
+def test_poll_time_attributes_are_kept_out_of_the_recorder() -> None:
+    """Every attribute the Poll Time sensor can expose is unrecorded."""
+    profiler = CycleProfiler()
+    profiler.begin_cycle()
+    for phase in (PHASE_GATE_WAIT, PHASE_WIRE_READ, PHASE_MAPPING, PHASE_SIDE_FETCH):
+        profiler.record(phase, 0.01, "1234567890")
+    profiler.end_cycle()
+    sensor = EG4PollTimeSensor.__new__(EG4PollTimeSensor)
+    sensor.coordinator = MagicMock(cycle_profiler=profiler)
+    sensor._serial = "1234567890"
+
+    attributes = sensor.extra_state_attributes
+
+    assert attributes
+    assert set(attributes) <= EG4PollTimeSensor._unrecorded_attributes
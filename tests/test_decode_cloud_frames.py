@@ -659,6 +659,14 @@ def test_offline_pcap_adapter_and_cli_never_report_source_metadata(
         ["--unknown-option", "TOKEN-CANARY"],
         ["SYNTHETIC_CANARY_INPUT", "--output"],
         ["SYNTHETIC_CANARY_INPUT"],
+        [
+            "SYNTHETIC_CANARY_INPUT",
+            "--output",
+            "SYNTHETIC_CANARY_OUTPUT",
+            "--authorized-offline-input",
+            "--workers",
+            "0",
+        ],
     ],
 )
 def test_cli_parse_failures_are_closed_redacted_errors(
@@ -708,6 +716,173 @@ def test_pcap_reconnect_on_same_flow_starts_a_new_stream(tmp_path: Path) -> None
     assert [frame["start_register"] for frame in sanitized["frames"]] == [7, 42]
 
 
+def _write_sessions(capture_path: Path, sessions: list[list[bytes]]) -> None:
+    """Write one client session (SYN, then one ACK per payload) per entry."""
+    packet_module = _dpkt()
+    packets: list[tuple[float, bytes]] = []
+    for index, payloads in enumerate(sessions):
+        sequence = 1000 * (index + 1)
+        timestamp = float(index + 1)
+        packets.append(
+            (
+                timestamp,
+                _ethernet_packet(
+                    b"", sequence=sequence, flags=packet_module.tcp.TH_SYN
+                ),
+            )
+        )
+        sequence += 1
+        for payload in payloads:
+            timestamp += 0.1
+            packets.append(
+                (
+                    timestamp,
+                    _ethernet_packet(
+                        payload, sequence=sequence, flags=packet_module.tcp.TH_ACK
+                    ),
+                )
+            )
+            sequence += len(payload)
+    _write_capture(capture_path, packets)
+
+
+@pytest.mark.parametrize("workers", [1, 2, 3])
+def test_stream_pcap_matches_process_pcap_for_every_worker_count(
+    tmp_path: Path, workers: int
+) -> None:
+    capture_path = tmp_path / "synthetic-sessions.pcap"
+    second_dongle = b"CANARYDG02"
+    _write_sessions(
+        capture_path,
+        [
+            [_c2(_read_response(start=7)), _c2(_read_response(start=7))],
+            [_c2(_read_response(start=42), identity=second_dongle)],
+            [_c2(_read_request(start=7)), _cloud_frame(0xC1, b"\x01")],
+            [_c2(_read_response(start=7)), _c2(_read_response(start=99))],
+        ],
+    )
+
+    streamed = decoder_module.stream_pcap(capture_path, workers=workers)
+
+    assert streamed == process_pcap(capture_path)
+    assert [frame["identity"] for frame in streamed["frames"]][:2] == [
+        "SYNTHDG001",
+        "SYNTHDG002",
+    ]
+
+
+def test_stream_pcap_workers_report_the_first_failure_in_capture_order(
+    tmp_path: Path,
+) -> None:
+    capture_path = tmp_path / "synthetic-failures.pcap"
+    bad_crc = _read_response(start=7)[:-2] + b"\x00\x00"
+    _write_sessions(
+        capture_path,
+        [
+            [_c2(_read_response(start=7))],
+            [_c2(bad_crc)],
+            [_cloud_frame(0xC3, b"\x01")],
+        ],
+    )
+
+    with pytest.raises(CaptureError) as single:
+        process_pcap(capture_path)
+    with pytest.raises(CaptureError) as sharded:
+        decoder_module.stream_pcap(capture_path, workers=2)
+
+    assert single.value.reason is FailureReason.CRC
+    assert sharded.value.reason is FailureReason.CRC
+    assert sharded.value.__context__ is None
+
+
+class _InProcessExecutor:
+    """Runs ``map`` in this process so tests can observe worker calls."""
+
+    def __init__(self, max_workers: int) -> None:
+        self.max_workers = max_workers
+
+    def __enter__(self) -> _InProcessExecutor:
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        return None
+
+    def map(self, function: Callable[..., Any], *iterables: Any) -> Any:
+        return map(function, *iterables)
+
+
+@pytest.mark.parametrize("pcapng", [False, True])
+def test_stream_pcap_indexes_the_capture_once_for_all_workers(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, pcapng: bool
+) -> None:
+    capture_path = tmp_path / "synthetic-sessions.pcap"
+    sessions = [
+        [_c2(_read_response(start=7))],
+        [_c2(_read_response(start=42), identity=b"CANARYDG02")],
+        [_c2(_read_response(start=99))],
+    ]
+    _write_sessions(capture_path, sessions)
+    if pcapng:
+        with capture_path.open("rb") as source:
+            packets = [
+                (timestamp, bytes(packet))
+                for timestamp, packet in _dpkt().pcap.Reader(source)
+            ]
+        _write_capture(capture_path, packets, pcapng=True)
+    expected = process_pcap(capture_path)
+
+    passes = 0
+    original = decoder_module._target_segments
+
+    def counting(*args: Any) -> Any:
+        nonlocal passes
+        passes += 1
+        return original(*args)
+
+    monkeypatch.setattr(decoder_module, "_target_segments", counting)
+    monkeypatch.setattr(decoder_module, "ProcessPoolExecutor", _InProcessExecutor)
+
+    assert decoder_module.stream_pcap(capture_path, workers=3) == expected
+    assert passes == 1
+
+
+def test_stream_pcap_surfaces_worker_crashes_unchanged(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    capture_path = tmp_path / "synthetic-sessions.pcap"
+    _write_sessions(
+        capture_path,
+        [[_c2(_read_response(start=7))], [_c2(_read_response(start=42))]],
+    )
+
+    def crashed(*_args: Any) -> Any:
+        raise MemoryError("worker died")
+
+    monkeypatch.setattr(decoder_module, "_decode_shard", crashed)
+    monkeypatch.setattr(decoder_module, "ProcessPoolExecutor", _InProcessExecutor)
+
+    with pytest.raises(MemoryError, match="worker died"):
+        decoder_module.stream_pcap(capture_path, workers=2)
+
+
+def test_stream_pcap_bounds_capture_size_by_the_streamed_limit(
+    tmp_path: Path,
+) -> None:
+    capture_path = tmp_path / "capture"
+    capture_path.write_bytes(b"abcd")
+    with pytest.raises(CaptureError) as unbounded_read:
+        decoder_module.stream_pcap(
+            capture_path, ParserPolicy(maximum_capture_bytes=3)
+        )
+    assert unbounded_read.value.reason is FailureReason.MALFORMED
+
+    with pytest.raises(CaptureError) as overflow:
+        decoder_module.stream_pcap(
+            capture_path, ParserPolicy(maximum_streamed_capture_bytes=3)
+        )
+    assert overflow.value.reason is FailureReason.INPUT_SIZE
+
+
 def test_pcap_handshake_retransmissions_are_exact_in_both_directions(
     tmp_path: Path,
 ) -> None:
@@ -1190,14 +1365,51 @@ def test_tcp_reassembler_validates_duplicate_with_bounded_history_slices(
 def test_tcp_reassembler_rejects_one_segment_over_limit() -> None:
     reassembler = TCPStreamReassembler(ParserPolicy(maximum_segments_per_flow=1))
     reassembler.start(10)
-    reassembler.push(10, b"a", captured_at=1.0)
+    reassembler.push(11, b"b", captured_at=1.0)
 
     with pytest.raises(CaptureError) as caught:
-        reassembler.push(11, b"b", captured_at=1.1)
+        reassembler.push(12, b"c", captured_at=1.1)
+
+    assert caught.value.reason is FailureReason.CAPACITY
+
 
+def test_tcp_reassembler_limits_apply_per_window_not_per_session() -> None:
+    policy = ParserPolicy(
+        maximum_segments_per_flow=2,
+        maximum_reassembled_bytes_per_flow=8,
+    )
+    reassembler = TCPStreamReassembler(policy)
+    origin = (1 << 32) - 3
+    reassembler.start(origin)
+
+    # A long in-order session: every segment closes its own window, so neither
+    # the segment count nor the stream offset accumulates towards the limits.
+    emitted = bytearray()
+    for offset in range(0, 64, 4):
+        for _captured_at, chunk in reassembler.push(
+            (origin + offset) % (1 << 32), bytes((offset,)) * 4, captured_at=1.0
+        ):
+            emitted += chunk
+    assert emitted == b"".join(bytes((offset,)) * 4 for offset in range(0, 64, 4))
+
+    # A gap keeps one window open until it is filled, which is what is bounded.
+    reassembler.push((origin + 68) % (1 << 32), b"yyyy", captured_at=1.1)
+    with pytest.raises(CaptureError) as caught:
+        reassembler.push((origin + 72) % (1 << 32), b"z", captured_at=1.2)
     assert caught.value.reason is FailureReason.CAPACITY
 
 
+def test_tcp_reassembler_offsets_stay_exact_past_two_gibibytes() -> None:
+    reassembler = TCPStreamReassembler()
+    reassembler.start(0)
+    # Jump the assembled edge as a multi-GiB session would have moved it.
+    reassembler._assembled_bytes = reassembler._history_start = 3 << 30
+    edge = (3 << 30) % (1 << 32)
+
+    assert reassembler.push(edge + 4, b"efgh", captured_at=1.0) == []
+    assert reassembler.push(edge, b"abcd", captured_at=1.1) == [(1.1, b"abcdefgh")]
+
+
 @pytest.mark.parametrize(
     ("first_sequence", "first", "second_sequence", "second", "expected"),
     [
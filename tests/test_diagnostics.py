@@ -162,6 +162,7 @@ async def test_structure_and_versions(hass, entry):
     json.dumps(result)  # must not raise
     assert result["coordinator"]["connection_type"] == "http"
     assert result["coordinator"]["device_count"] == 1
+    assert result["coordinator"]["cycle_profile"] == {}
     assert result["versions"]["pylxpweb"] not in ("", None)
     assert result["entry"]["options"] == {"sensor_update_interval": 20}
 
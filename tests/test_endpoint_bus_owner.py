@@ -16,6 +16,10 @@ from pylxpweb.devices.inverters.base import BaseInverter
 from pylxpweb.transports import TerminalInverterTransport
 from pylxpweb.transports.capabilities import TransportCapabilities
 from pylxpweb.transports.config import TransportConfig, TransportType
+from pylxpweb.transports.exceptions import (
+    TransportConnectionError,
+    TransportTimeoutError,
+)
 
 from custom_components.eg4_web_monitor.bus_eligibility import (
     BusEligibilityReason,
@@ -268,6 +272,71 @@ async def test_serializes_shared_endpoint_and_allows_independent_endpoints() ->
     assert registry.owner_count == 2
 
 
+@pytest.mark.asyncio
+async def test_failed_connect_holds_off_sibling_unit_ids() -> None:
+    gateway = _WireProbe()
+    independent = _WireProbe()
+    registry = _registry(
+        {"gateway.example.invalid": gateway, "other.example.invalid": independent}
+    )
+    first = registry.create_capability(_config("SYNTH00001"))
+    second = registry.create_capability(_config("SYNTH00002"))
+    other = registry.create_capability(
+        _config("SYNTH00003", host="other.example.invalid")
+    )
+
+    async def refused(name: str, *args: Any) -> Any:
+        gateway.operations.append((name, args))
+        raise TransportConnectionError("refused")
+
+    gateway.run = refused  # type: ignore[method-assign]
+    with pytest.raises(TransportConnectionError, match="refused"):
+        await first.connect()
+    with pytest.raises(TransportConnectionError, match="held off"):
+        await second.connect()
+    assert gateway.operations == [("connect", ())]
+
+    # Another physical endpoint keeps its own connect lifecycle.
+    await other.connect()
+    assert other.is_connected
+
+    # Any successful wire operation proves the gateway reachable again.
+    del gateway.run
+    await first.read_runtime()
+    await second.connect()
+    assert second.is_connected
+
+
+@pytest.mark.asyncio
+async def test_probe_times_only_the_wire_and_never_cancels_it() -> None:
+    gateway = _WireProbe()
+    registry = _registry({"gateway.example.invalid": gateway})
+    busy = registry.create_capability(_config("SYNTH00001"))
+    probed = registry.create_capability(_config("SYNTH00002"))
+    await probed.connect()
+
+    gateway.release.clear()
+    read = asyncio.create_task(busy.read_runtime())
+    await gateway.started.wait()
+    probe = asyncio.create_task(probed.async_probe(0.05))
+    await asyncio.sleep(0.1)
+    # Queued behind a sibling's read past its timeout, the probe has not failed.
+    assert not probe.done()
+    gateway.release.set()
+    assert await probe == 0
+    await read
+
+    gateway.release.clear()
+    with pytest.raises(TransportTimeoutError):
+        await probed.async_probe(0.05)
+    # The overdue read keeps the endpoint and finishes instead of being cancelled.
+    assert gateway.in_flight == 1
+    gateway.release.set()
+    await registry.async_wait_idle()
+    assert gateway.cancelled == 0
+    assert gateway.max_in_flight == 1
+
+
 @pytest.mark.asyncio
 async def test_coordinator_poll_control_reconnect_across_entries_and_endpoints() -> (
     None
@@ -28,6 +28,7 @@ from custom_components.eg4_web_monitor.const import (
 )
 from custom_components.eg4_web_monitor.history_import import (
     SERVICE_IMPORT_HISTORICAL_DATA,
+    _fetch_daily_values,
     _iter_months,
     _merge_and_write,
     _load_existing_rows,
@@ -35,6 +36,7 @@ from custom_components.eg4_web_monitor.history_import import (
     _validate_range,
     async_import_historical_data,
 )
+from custom_components.eg4_web_monitor.month_chart_cache import MonthChartCache
 
 SERIAL = "1111111111"
 SERIAL_2 = "2222222222"
@@ -750,6 +752,60 @@ class TestStatisticsWrites:
                 )
         mock_add.assert_not_called()
 
+    async def test_finished_months_come_from_the_month_chart_cache(
+        self, hass: HomeAssistant, mock_config_entry, mock_coordinator
+    ):
+        """Re-importing a finished month reuses the coordinator's cached chart."""
+        mock_coordinator.month_chart_cache = MonthChartCache()
+        await _setup_loaded_entry(hass, mock_config_entry, mock_coordinator)
+
+        fetch = mock_coordinator.client.analytics.get_month_daily_energy
+        fetch.return_value = _month_history(2025, 1, [_day_entry(1, inverter_kwh=7.0)])
+        call = _call(
+            {
+                "config_entry": "test_entry_id",
+                "start_date": date(2025, 1, 1),
+                "end_date": date(2025, 1, 1),
+            }
+        )
+
+        add_patch, load_patch, delay_patch, drain_patch = _patch_stats()
+        with add_patch, load_patch, delay_patch, drain_patch:
+            first = await async_import_historical_data(hass, call)
+            second = await async_import_historical_data(hass, call)
+
+        assert (first["api_calls"], second["api_calls"]) == (1, 0)
+        assert fetch.await_count == 1
+        assert second["series"]["yield"]["total_kwh"] == 7.0
+
+    async def test_requests_are_paced_start_to_start(self):
+        """Response time counts toward the gap; no pause follows the last call."""
+        clock = [100.0]
+
+        async def fetch(serial, year, month, *, parallel=False):
+            clock[0] += 0.3
+            return _month_history(year, month, [])
+
+        with (
+            patch(
+                "custom_components.eg4_web_monitor.history_import.time.monotonic",
+                side_effect=lambda: clock[0],
+            ),
+            patch(
+                "custom_components.eg4_web_monitor.history_import.asyncio.sleep",
+                new=AsyncMock(),
+            ) as sleep,
+        ):
+            _, api_calls = await _fetch_daily_values(
+                fetch, [(SERIAL, True)], date(2025, 1, 1), date(2025, 3, 31)
+            )
+
+        assert api_calls == 3
+        assert [call.args[0] for call in sleep.await_args_list] == [
+            pytest.approx(0.2),
+            pytest.approx(0.2),
+        ]
+
 
 class TestMergeAndIdempotency:
     """Sum reconstruction across existing and new rows."""
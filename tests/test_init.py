@@ -5,7 +5,7 @@ import logging
 from types import SimpleNamespace
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import homeassistant.helpers.device_registry as dr
 import homeassistant.helpers.entity_registry as er
@@ -24,6 +24,7 @@ from custom_components.eg4_web_monitor import (
     async_setup_entry,
     async_unload_entry,
 )
+from custom_components.eg4_web_monitor.cloud_requests import cloud_account_key
 from custom_components.eg4_web_monitor.coordinator_mappings import (
     GRIDBOSS_STATIC_ENTITY_KEYS,
     SMART_PORT_VALIDATED_KEY,
@@ -1297,10 +1298,10 @@ class TestAsyncUnloadEntry:
 class TestAsyncRemoveEntry:
     """Test config-entry removal cleanup."""
 
-    async def test_remove_entry_deletes_pv_lifetime_store(
+    async def test_remove_entry_deletes_per_entry_stores(
         self, hass: HomeAssistant, mock_config_entry
     ):
-        """Deleting an entry removes its persisted cloud lifetime floors."""
+        """Deleting an entry removes its lifetime floors and event-log buffer."""
         mock_config_entry.add_to_hass(hass)
         store = MagicMock()
         store.async_remove = AsyncMock()
@@ -1310,12 +1311,56 @@ class TestAsyncRemoveEntry:
         ) as store_class:
             await async_remove_entry(hass, mock_config_entry)
 
-        store_class.assert_called_once_with(
-            hass,
-            1,
-            "eg4_web_monitor_pv_string_lifetime_test_entry_id",
+        assert store_class.call_args_list == [
+            call(hass, 1, "eg4_web_monitor_pv_string_lifetime_test_entry_id"),
+            call(hass, 1, "eg4_web_monitor_event_log_test_entry_id"),
+        ]
+        assert store.async_remove.await_count == 2
+
+    async def test_remove_last_account_entry_forgets_cloud_session(
+        self, hass: HomeAssistant, mock_config_entry
+    ):
+        """The saved portal session goes with the account's last entry."""
+        mock_config_entry.add_to_hass(hass)
+        cache = MagicMock()
+        cache.async_forget = AsyncMock()
+
+        with (
+            patch("custom_components.eg4_web_monitor.Store"),
+            patch(
+                "custom_components.eg4_web_monitor.get_cloud_session_cache",
+                return_value=cache,
+            ),
+        ):
+            await async_remove_entry(hass, mock_config_entry)
+
+        cache.async_forget.assert_awaited_once_with(
+            cloud_account_key("test_user", "https://monitor.eg4electronics.com", True)
         )
-        store.async_remove.assert_awaited_once_with()
+
+    async def test_remove_shared_account_entry_keeps_cloud_session(
+        self, hass: HomeAssistant, mock_config_entry
+    ):
+        """Another entry on the same account keeps the saved session alive."""
+        mock_config_entry.add_to_hass(hass)
+        MockConfigEntry(
+            domain=DOMAIN,
+            data={**mock_config_entry.data, CONF_PLANT_ID: "67890"},
+            entry_id="other_entry_id",
+        ).add_to_hass(hass)
+        cache = MagicMock()
+        cache.async_forget = AsyncMock()
+
+        with (
+            patch("custom_components.eg4_web_monitor.Store"),
+            patch(
+                "custom_components.eg4_web_monitor.get_cloud_session_cache",
+                return_value=cache,
+            ),
+        ):
+            await async_remove_entry(hass, mock_config_entry)
+
+        cache.async_forget.assert_not_awaited()
 
 
 class TestAsyncMigrateEntry:
@@ -12,6 +12,7 @@ pushed to the cloud out-of-band). These tests cover:
   and ServiceValidationError paths (pure LOCAL, unknown serial).
 """
 
+import time
 from types import SimpleNamespace
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -353,6 +354,43 @@ class TestFetchLastEvent:
         assert target["sensors"]["last_event"] == "Bus voltage high"
         assert coordinator._last_status_fetch[f"events_{INVERTER_SERIAL}"] == 10.0
 
+    async def test_new_events_since_last_poll_fetched_in_one_page(
+        self, hass, mock_config_entry
+    ):
+        """The poll's ``total`` delta is the cursor: one new event needs no
+        extra read, several are fetched as one page joined to the buffer."""
+        mock_config_entry.add_to_hass(hass)
+        coordinator = _coordinator_with_events(hass, mock_config_entry, [FAULT_ROW])
+        fetch = coordinator.client.analytics.get_event_list
+        newer = [
+            {**FAULT_ROW, "recordId": FAULT_ROW["recordId"] + n} for n in (3, 2, 1)
+        ]
+
+        await coordinator._fetch_last_event(INVERTER_SERIAL, {"sensors": {}})
+        coordinator._last_status_fetch.clear()
+        fetch.return_value = _event_response(newer[2:], total=2)
+        await coordinator._fetch_last_event(INVERTER_SERIAL, {"sensors": {}})
+        assert fetch.await_count == 2
+
+        coordinator._last_status_fetch.clear()
+        fetch.side_effect = [
+            _event_response(newer[:1], total=4),
+            _event_response(newer[:2], total=4),
+        ]
+        await coordinator._fetch_last_event(INVERTER_SERIAL, {"sensors": {}})
+
+        fetch.assert_awaited_with(INVERTER_SERIAL, rows=2)
+        assert fetch.await_count == 4
+        buffered = coordinator.event_log.recent(
+            INVERTER_SERIAL, 30, now=time.monotonic(), max_age=300
+        )
+        assert buffered is not None
+        events, total = buffered
+        assert total == 4
+        assert [event["record_id"] for event in events] == [
+            row["recordId"] for row in [*newer, FAULT_ROW]
+        ]
+
 
 # ── Sensor entity ────────────────────────────────────────────────────
 
@@ -490,6 +528,7 @@ def _cloud_entry_with_devices(
     coordinator.entry = MagicMock()
     coordinator.entry.data = {CONF_CONNECTION_TYPE: CONNECTION_TYPE_HTTP}
     coordinator.data = {"devices": devices}
+    coordinator.event_log = None
     client = MagicMock()
 
     async def fake_get_event_list(serial: str, rows: int = 30) -> dict:
@@ -574,6 +613,74 @@ class TestFetchEventsService:
             GRIDBOSS_SERIAL, rows=30
         )
 
+    async def test_synced_buffer_answers_without_cloud_call(
+        self, hass: HomeAssistant, mock_config_entry
+    ):
+        """A buffer the Last Event poll just synced covers the whole log, so
+        the service answers from it without another cloud read."""
+        mock_config_entry.add_to_hass(hass)
+        mock_config_entry.mock_state(hass, ConfigEntryState.LOADED)
+        coordinator = _coordinator_with_events(hass, mock_config_entry, [FAULT_ROW])
+        coordinator.data = {"devices": {INVERTER_SERIAL: {"type": "inverter"}}}
+        mock_config_entry.runtime_data = coordinator
+        await coordinator._fetch_last_event(INVERTER_SERIAL, {"sensors": {}})
+
+        response = await async_fetch_events(
+            hass, _service_call({"config_entry": mock_config_entry.entry_id})
+        )
+
+        coordinator.client.analytics.get_event_list.assert_awaited_once_with(
+            INVERTER_SERIAL, rows=1
+        )
+        device = response["devices"][INVERTER_SERIAL]
+        assert device["total"] == 1
+        assert device["events"][0]["record_id"] == FAULT_ROW["recordId"]
+
+    async def test_short_page_merges_into_the_buffer(
+        self, hass: HomeAssistant, mock_config_entry
+    ):
+        """A service page shorter than the buffer adds its new events and
+        keeps the older buffered ones instead of replacing them."""
+        mock_config_entry.add_to_hass(hass)
+        mock_config_entry.mock_state(hass, ConfigEntryState.LOADED)
+        rows = [
+            {**FAULT_ROW, "recordId": FAULT_ROW["recordId"] + n} for n in (3, 2, 1, 0)
+        ]
+        coordinator = _coordinator_with_events(hass, mock_config_entry, [])
+        coordinator.data = {"devices": {INVERTER_SERIAL: {"type": "inverter"}}}
+        mock_config_entry.runtime_data = coordinator
+        event_log = coordinator.event_log
+        await event_log.async_load()
+        # Synced long ago, so the service has to read the portal.
+        event_log.merge(
+            INVERTER_SERIAL,
+            [normalize_event_row(row) for row in rows[1:]],
+            3,
+            now=time.monotonic() - 3600,
+        )
+        coordinator.client.analytics.get_event_list.return_value = _event_response(
+            rows[:1], total=4
+        )
+
+        response = await async_fetch_events(
+            hass,
+            _service_call({"config_entry": mock_config_entry.entry_id, "count": 1}),
+        )
+
+        device = response["devices"][INVERTER_SERIAL]
+        assert [event["record_id"] for event in device["events"]] == [
+            rows[0]["recordId"]
+        ]
+        buffered = event_log.recent(
+            INVERTER_SERIAL, 30, now=time.monotonic(), max_age=300
+        )
+        assert buffered is not None
+        events, total = buffered
+        assert total == 4
+        assert [event["record_id"] for event in events] == [
+            row["recordId"] for row in rows
+        ]
+
     async def test_unknown_serial_raises(self, hass: HomeAssistant):
         """A serial not in the plant raises ServiceValidationError."""
         _cloud_entry_with_devices(hass, devices={INVERTER_SERIAL: {"type": "inverter"}})
@@ -0,0 +1,69 @@
+"""Tests for the backed-off link-health probe of down local transports."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from pylxpweb.transports.exceptions import TransportTimeoutError
+
+from custom_components.eg4_web_monitor.endpoint_bus import (
+    EndpointAdmissionError,
+    EndpointBusCapability,
+)
+from custom_components.eg4_web_monitor.link_probe import LinkHealthProbe
+
+
+def _capability() -> MagicMock:
+    capability = MagicMock(spec=EndpointBusCapability)
+    capability.async_probe.side_effect = TransportTimeoutError("no answer")
+    return capability
+
+
+async def test_failed_probes_back_off_exponentially() -> None:
+    """Each failure doubles the spacing; inside it the link is not touched."""
+    probe = LinkHealthProbe()
+    capability = _capability()
+
+    assert await probe.async_check(capability) is False
+    assert probe.backoff == 15.0
+    assert await probe.async_check(capability) is False
+    assert capability.async_probe.await_count == 1
+
+    for expected in (30.0, 60.0, 120.0, 240.0, 300.0, 300.0):
+        probe._next_probe = 0.0
+        assert await probe.async_check(capability) is False
+        assert probe.backoff == expected
+    assert probe.failures == 7
+
+
+async def test_answered_probe_unlocks_refresh_and_keeps_spacing() -> None:
+    """A probe that answers allows one refresh, then waits out the backoff."""
+    probe = LinkHealthProbe()
+    capability = _capability()
+    assert await probe.async_check(capability) is False
+
+    capability.async_probe.side_effect = None
+    capability.async_probe.return_value = 2092
+    probe._next_probe = 0.0
+    assert await probe.async_check(capability) is True
+    capability.async_probe.assert_awaited_with(2.0)
+    assert probe.failures == 0
+    assert probe.backoff == 15.0
+    assert probe.due() is False
+
+
+async def test_busy_endpoint_defers_probe_without_backoff() -> None:
+    """An admission timeout on a busy endpoint is not a link verdict."""
+    probe = LinkHealthProbe()
+    capability = _capability()
+    capability.async_probe.side_effect = EndpointAdmissionError("busy")
+
+    assert await probe.async_check(capability) is False
+    assert probe.failures == 0
+    assert probe.backoff == 0.0
+    assert probe.due() is True
+
+
+async def test_transport_outside_the_bus_keeps_full_refresh() -> None:
+    """Only endpoint capabilities are probed."""
+    assert await LinkHealthProbe().async_check(MagicMock()) is True
@@ -0,0 +1,178 @@
+"""Tests for the single-pass, versioned entity-registry migration engine."""
+
+from __future__ import annotations
+
+import homeassistant.helpers.entity_registry as er
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.eg4_web_monitor import (
+    _ONE_TIME_REGISTRY_MIGRATIONS,
+    _RETIRED_SENSOR_CLEANUPS,
+)
+from custom_components.eg4_web_monitor.const import DOMAIN
+from custom_components.eg4_web_monitor.registry_migrations import (
+    RegistryMigration,
+    async_load_applied_registry_migrations,
+    async_remove_registry_migration_state,
+    async_run_registry_migrations,
+    async_save_applied_registry_migrations,
+)
+
+
+def _entry(hass: HomeAssistant, entry_id: str) -> MockConfigEntry:
+    entry = MockConfigEntry(domain=DOMAIN, entry_id=entry_id)
+    entry.add_to_hass(hass)
+    return entry
+
+
+async def test_one_time_versions_are_unique_and_permanent() -> None:
+    """Version numbers identify migrations in persisted ledgers."""
+    versions = [migration.version for migration in _ONE_TIME_REGISTRY_MIGRATIONS]
+    assert None not in versions
+    assert len(versions) == len(set(versions))
+    assert versions == sorted(versions)
+    # Retired versions of the suffix purges are never reused.
+    assert not {3, 4} & set(versions)
+    assert all(cleanup.version is None for cleanup in _RETIRED_SENSOR_CLEANUPS)
+
+
+async def test_single_pass_runs_every_rule_and_consumes_rows(
+    hass: HomeAssistant,
+) -> None:
+    """A consumed row is never offered to a later rule in the same pass."""
+    entry = _entry(hass, "registry_pass")
+    registry = er.async_get(hass)
+    serial = "1234567890"
+    stale_battery = registry.async_get_or_create(
+        "sensor", DOMAIN, f"{serial}_1_battery_charge_power", config_entry=entry
+    )
+    renamed = registry.async_get_or_create(
+        "sensor", DOMAIN, f"{serial}_power_output", config_entry=entry
+    )
+    deprecated = registry.async_get_or_create(
+        "sensor", DOMAIN, f"{serial}_battery_bank_charge_power", config_entry=entry
+    )
+    duplicate = registry.async_get_or_create(
+        "sensor", DOMAIN, f"{serial}_inverter_has_runtime_data", config_entry=entry
+    )
+    survivor = registry.async_get_or_create(
+        "sensor", DOMAIN, f"{serial}_battery_power", config_entry=entry
+    )
+
+    offered: list[str] = []
+
+    def _spy(_registry: er.EntityRegistry, entity: er.RegistryEntry) -> bool:
+        offered.append(entity.unique_id)
+        return False
+
+    applied = async_run_registry_migrations(
+        hass,
+        entry.entry_id,
+        [
+            *_ONE_TIME_REGISTRY_MIGRATIONS,
+            *_RETIRED_SENSOR_CLEANUPS,
+            RegistryMigration("spy", _spy),
+        ],
+    )
+
+    assert applied == {1, 2}
+    assert registry.async_get(stale_battery.entity_id) is None
+    assert registry.async_get(deprecated.entity_id) is None
+    assert registry.async_get(duplicate.entity_id) is None
+    assert registry.async_get(survivor.entity_id) is not None
+    migrated = registry.async_get(renamed.entity_id)
+    assert migrated is not None
+    assert migrated.unique_id == f"{serial}_output_power"
+    # Only the untouched row reaches the trailing rule.
+    assert offered == [f"{serial}_battery_power"]
+
+
+async def test_applied_versions_skip_the_registry_scan(hass: HomeAssistant) -> None:
+    """Later setups skip recorded one-time rules; conditional rules still run."""
+    entry = _entry(hass, "registry_skip")
+    registry = er.async_get(hass)
+    registry.async_get_or_create(
+        "sensor", DOMAIN, "1234567890_power_output", config_entry=entry
+    )
+    calls: list[str] = []
+
+    def _one_time(_registry: er.EntityRegistry, entity: er.RegistryEntry) -> bool:
+        calls.append(f"one_time:{entity.unique_id}")
+        return False
+
+    def _conditional(_registry: er.EntityRegistry, entity: er.RegistryEntry) -> bool:
+        calls.append(f"conditional:{entity.unique_id}")
+        return False
+
+    one_time = RegistryMigration("one_time", _one_time, version=7)
+    assert async_run_registry_migrations(hass, entry.entry_id, [one_time]) == {7}
+    assert calls == ["one_time:1234567890_power_output"]
+
+    calls.clear()
+    assert (
+        async_run_registry_migrations(hass, entry.entry_id, [one_time], applied={7})
+        == set()
+    )
+    assert calls == []
+
+    finished: list[bool] = []
+    conditional = RegistryMigration(
+        "conditional", _conditional, finish=lambda: finished.append(True)
+    )
+    assert (
+        async_run_registry_migrations(
+            hass, entry.entry_id, [one_time, conditional], applied={7}
+        )
+        == set()
+    )
+    assert calls == ["conditional:1234567890_power_output"]
+    assert finished == [True]
+
+
+async def test_domain_filter_limits_rows(hass: HomeAssistant) -> None:
+    """Rules see only rows of their own entity domain."""
+    entry = _entry(hass, "registry_domain")
+    registry = er.async_get(hass)
+    switch = registry.async_get_or_create(
+        "switch", DOMAIN, "1234567890_battery_bank_charge_power", config_entry=entry
+    )
+
+    async_run_registry_migrations(hass, entry.entry_id, _RETIRED_SENSOR_CLEANUPS)
+
+    assert registry.async_get(switch.entity_id) is not None
+
+
+async def test_retired_suffix_purges_run_after_every_version_is_applied(
+    hass: HomeAssistant,
+) -> None:
+    """A suffix retired after an entry's ledger was written is still purged."""
+    entry = _entry(hass, "registry_retired")
+    registry = er.async_get(hass)
+    retired = registry.async_get_or_create(
+        "sensor", DOMAIN, "1234567890_eps_load_power_l1", config_entry=entry
+    )
+
+    applied = async_run_registry_migrations(
+        hass,
+        entry.entry_id,
+        [*_ONE_TIME_REGISTRY_MIGRATIONS, *_RETIRED_SENSOR_CLEANUPS],
+        applied={1, 2, 3, 4},
+    )
+
+    assert applied == set()
+    assert registry.async_get(retired.entity_id) is None
+
+
+async def test_applied_ledger_round_trip(hass: HomeAssistant, hass_storage) -> None:
+    """The per-entry ledger persists, tolerates corruption and is removable."""
+    assert await async_load_applied_registry_migrations(hass, "ledger") == set()
+
+    await async_save_applied_registry_migrations(hass, "ledger", [3, 1, 1])
+    assert await async_load_applied_registry_migrations(hass, "ledger") == {1, 3}
+
+    hass_storage[f"{DOMAIN}_registry_migrations_ledger"]["data"] = {"applied": "x"}
+    assert await async_load_applied_registry_migrations(hass, "ledger") == set()
+
+    await async_remove_registry_migration_state(hass, "ledger")
+    assert f"{DOMAIN}_registry_migrations_ledger" not in hass_storage
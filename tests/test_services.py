@@ -1,5 +1,6 @@
 """Tests for services.py (history reconciliation) in EG4 Web Monitor integration."""
 
+import asyncio
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -25,7 +26,11 @@ from custom_components.eg4_web_monitor.services import (
     ENERGY_TYPE_MAPPING,
     _find_energy_entity,
     _find_gap_hours,
+    _energy_entity_index,
+    _fetch_cloud_data,
     _group_gaps_by_day,
+    _hour_grid,
+    _reconcile_coordinator,
     _transform_to_statistics,
 )
 
@@ -223,7 +228,7 @@ class TestGapDetection:
         start = datetime(2025, 1, 1, 0, 0, tzinfo=dt_util.UTC)
         end = datetime(2025, 1, 1, 5, 0, tzinfo=dt_util.UTC)
 
-        gaps = _find_gap_hours(existing_stats, start, end)
+        gaps = _find_gap_hours(existing_stats, _hour_grid(start, end))
 
         assert len(gaps) == 5
         assert gaps[0] == datetime(2025, 1, 1, 0, 0, tzinfo=dt_util.UTC)
@@ -238,7 +243,7 @@ class TestGapDetection:
         start = datetime(2025, 1, 1, 0, 0, tzinfo=dt_util.UTC)
         end = datetime(2025, 1, 1, 5, 0, tzinfo=dt_util.UTC)
 
-        gaps = _find_gap_hours(existing_stats, start, end)
+        gaps = _find_gap_hours(existing_stats, _hour_grid(start, end))
 
         assert len(gaps) == 3
         assert datetime(2025, 1, 1, 0, 0, tzinfo=dt_util.UTC) in gaps
@@ -255,7 +260,7 @@ class TestGapDetection:
             datetime(2025, 1, 1, 2, 0, tzinfo=dt_util.UTC): 30.0,
         }
 
-        gaps = _find_gap_hours(existing_stats, start, end)
+        gaps = _find_gap_hours(existing_stats, _hour_grid(start, end))
 
         assert len(gaps) == 0
 
@@ -369,53 +374,169 @@ class TestTransformToStatistics:
 class TestFindEnergyEntity:
     """Test entity finding logic."""
 
+    @staticmethod
+    def _index(*entities):
+        with patch(
+            "custom_components.eg4_web_monitor.services.er.async_entries_for_config_entry",
+            return_value=list(entities),
+        ):
+            return _energy_entity_index(MagicMock(), "test_entry_id")
+
     def test_find_entity_with_energy_prefix(self):
         """Test finding entity with energy_ data type prefix."""
-        mock_registry = MagicMock()
         mock_entity = MagicMock()
         mock_entity.unique_id = "1234567890_energy_yield"
         mock_entity.entity_id = "sensor.eg4_18kpv_1234567890_yield"
 
-        with patch(
-            "custom_components.eg4_web_monitor.services.er.async_entries_for_config_entry",
-            return_value=[mock_entity],
-        ):
-            result = _find_energy_entity(
-                mock_registry, "test_entry_id", "1234567890", "yield"
-            )
+        result = _find_energy_entity(self._index(mock_entity), "1234567890", "yield")
 
         assert result == "sensor.eg4_18kpv_1234567890_yield"
 
     def test_find_entity_without_prefix(self):
         """Test finding entity without data type prefix."""
-        mock_registry = MagicMock()
         mock_entity = MagicMock()
         mock_entity.unique_id = "1234567890_yield"
         mock_entity.entity_id = "sensor.eg4_18kpv_1234567890_yield"
 
-        with patch(
-            "custom_components.eg4_web_monitor.services.er.async_entries_for_config_entry",
-            return_value=[mock_entity],
-        ):
-            result = _find_energy_entity(
-                mock_registry, "test_entry_id", "1234567890", "yield"
-            )
+        result = _find_energy_entity(self._index(mock_entity), "1234567890", "yield")
 
         assert result == "sensor.eg4_18kpv_1234567890_yield"
 
     def test_find_entity_not_found(self):
         """Test when entity is not found."""
-        mock_registry = MagicMock()
+        result = _find_energy_entity(self._index(), "1234567890", "yield")
+
+        assert result is None
+
+
+class TestReconcilePlanning:
+    """Test the per-coordinator planning phase."""
+
+    async def test_one_registry_pass_and_one_recorder_query(
+        self, hass: HomeAssistant, mock_coordinator
+    ):
+        """All targets share one registry index and one statistics query."""
+        serials = ("1234567890", "0987654321")
+        mock_coordinator.data["devices"] = {
+            serial: {"type": "inverter"} for serial in serials
+        }
+        entities = []
+        for serial in serials:
+            entity = MagicMock()
+            entity.unique_id = f"{serial}_energy_yield"
+            entity.entity_id = f"sensor.{serial}_yield"
+            entities.append(entity)
+
+        start = datetime(2025, 1, 1, 0, 0, tzinfo=dt_util.UTC)
+        end = datetime(2025, 1, 1, 3, 0, tzinfo=dt_util.UTC)
+        complete = {
+            datetime(2025, 1, 1, hour, 0, tzinfo=dt_util.UTC): float(hour)
+            for hour in range(3)
+        }
+        with (
+            patch(
+                "custom_components.eg4_web_monitor.services.er."
+                "async_entries_for_config_entry",
+                return_value=entities,
+            ) as entries,
+            patch(
+                "custom_components.eg4_web_monitor.services._get_existing_statistics",
+                new=AsyncMock(
+                    return_value={
+                        "sensor.1234567890_yield": complete,
+                        "sensor.0987654321_yield": {},
+                    }
+                ),
+            ) as existing,
+            patch(
+                "custom_components.eg4_web_monitor.services._fetch_cloud_data",
+                new=AsyncMock(return_value={}),
+            ) as fetch,
+            patch(
+                "custom_components.eg4_web_monitor.services._reconcile_energy_sensor",
+                new=AsyncMock(return_value=(3, 3)),
+            ) as reconcile,
+        ):
+            imported, gaps = await _reconcile_coordinator(
+                hass, mock_coordinator, start, end
+            )
+
+        assert entries.call_count == 1
+        existing.assert_awaited_once()
+        assert existing.await_args.args[1] == {
+            "sensor.1234567890_yield",
+            "sensor.0987654321_yield",
+        }
+        # Only the inverter with gaps reaches the cloud fetch phase.
+        fetch.assert_awaited_once_with(
+            mock_coordinator, "0987654321", {"2025-01-01": {"eInvDay"}}
+        )
+        reconcile.assert_awaited_once()
+        target = reconcile.await_args.args[1]
+        assert target.serial == "0987654321"
+        assert len(reconcile.await_args.args[3]) == 3
+        assert (imported, gaps) == (3, 3)
+
+
+class TestFetchCloudData:
+    """Test the day-major cloud fetch."""
+
+    async def test_requests_run_in_paced_pairs(self, mock_coordinator):
+        """At most two series requests of a day overlap, then the rate limit."""
+        calls: list[str] = []
+        in_flight = 0
+        peak = 0
+        breakdown = mock_coordinator.client.analytics.get_energy_day_breakdown
+
+        async def fetch(serial, day, energy_type, parallel):
+            nonlocal in_flight, peak
+            calls.append(f"fetch {day} {energy_type}")
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            energy = 500 if energy_type == "eInvDay" else 0
+            return {"data": [{"hour": 10, "energy": energy}]}
+
+        real_sleep = asyncio.sleep
+
+        async def pause(delay):
+            if delay:
+                calls.append(f"sleep {delay}")
+            else:
+                await real_sleep(0)
+
+        breakdown.side_effect = fetch
 
         with patch(
-            "custom_components.eg4_web_monitor.services.er.async_entries_for_config_entry",
-            return_value=[],
+            "custom_components.eg4_web_monitor.services.asyncio.sleep",
+            new=AsyncMock(side_effect=pause),
         ):
-            result = _find_energy_entity(
-                mock_registry, "test_entry_id", "1234567890", "yield"
+            series = await _fetch_cloud_data(
+                mock_coordinator,
+                "1234567890",
+                {
+                    "2025-01-01": {"eInvDay", "eToGridDay", "eBatChargeDay"},
+                    "2025-01-02": {"eInvDay"},
+                },
             )
 
-        assert result is None
+        assert calls == [
+            "fetch 2025-01-01 eBatChargeDay",
+            "fetch 2025-01-01 eInvDay",
+            "sleep 1.0",
+            "fetch 2025-01-01 eToGridDay",
+            "sleep 1.0",
+            "fetch 2025-01-02 eInvDay",
+            "sleep 1.0",
+        ]
+        assert peak == 2
+        # Station timezone "GMT -8": 10:00 local is 18:00 UTC.
+        assert series["eInvDay"] == {
+            datetime(2025, 1, 1, 18, 0, tzinfo=dt_util.UTC): 500.0,
+            datetime(2025, 1, 2, 18, 0, tzinfo=dt_util.UTC): 500.0,
+        }
+        assert series["eToGridDay"] == {}
 
 
 class TestEnergyTypeMapping:
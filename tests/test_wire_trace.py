@@ -0,0 +1,225 @@
+"""Tests for the wire-trace recorder and its offline replay."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import os
+from pathlib import Path
+
+import pytest
+from pylxpweb.transports.data import (
+    BatteryBankData,
+    BatteryData,
+    InverterEnergyData,
+    InverterRuntimeData,
+    MidboxRuntimeData,
+)
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from tests.conftest import make_real_inverter, make_real_mid
+
+from custom_components.eg4_web_monitor.const import (
+    CONF_CONNECTION_TYPE,
+    CONF_LOCAL_TRANSPORTS,
+    CONNECTION_TYPE_LOCAL,
+    DOMAIN,
+)
+from custom_components.eg4_web_monitor import wire_trace
+from custom_components.eg4_web_monitor.coordinator import EG4DataUpdateCoordinator
+from custom_components.eg4_web_monitor.wire_trace import (
+    TRACE_KIND_INVERTER,
+    TRACE_KIND_MIDBOX,
+    WireTraceRecorder,
+    _rebuild_device,
+    async_replay_trace,
+    iter_trace,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@pytest.fixture
+def coordinator(hass) -> EG4DataUpdateCoordinator:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="EG4 - Replay",
+        data={
+            CONF_CONNECTION_TYPE: CONNECTION_TYPE_LOCAL,
+            CONF_LOCAL_TRANSPORTS: [],
+        },
+        options={},
+        entry_id="wire_trace_test",
+    )
+    entry.add_to_hass(hass)
+    return EG4DataUpdateCoordinator(hass, entry)
+
+
+def _record_inverter(
+    recorder: WireTraceRecorder,
+    serial: str,
+    runtime: InverterRuntimeData,
+    battery: BatteryBankData | None = None,
+) -> None:
+    recorder.record(
+        TRACE_KIND_INVERTER,
+        serial,
+        device=make_real_inverter(serial, runtime=runtime),
+        runtime=runtime,
+        energy=InverterEnergyData(),
+        battery=battery,
+        features={},
+        parallel=[1, 1, 0],
+    )
+
+
+async def test_objects_round_trip_with_back_references(hass, tmp_path: Path) -> None:
+    """Dataclasses come back as equal objects; unchanged ones stay shared."""
+    recorder = WireTraceRecorder(tmp_path / "trace.jsonl.gz")
+    runtime = InverterRuntimeData(pv_total_power=4200.0, battery_soc=87)
+    bank = BatteryBankData(
+        battery_count=1, batteries=[BatteryData(soc=87, voltage=53.1)]
+    )
+    _record_inverter(recorder, "1234567890", runtime, bank)
+    await recorder.async_flush(hass)
+    _record_inverter(recorder, "1234567890", runtime, bank)
+    await recorder.async_flush(hass)
+
+    with gzip.open(recorder.path, "rt") as file:
+        second = json.loads(file.read().splitlines()[1])
+    assert second["data"]["runtime"] == {"$same": True}
+
+    first, repeat = list(iter_trace(recorder.path))
+    assert (first["cycle"], repeat["cycle"]) == (0, 1)
+    assert first["data"]["runtime"] == runtime
+    assert first["data"]["battery"].batteries[0] == bank.batteries[0]
+    assert repeat["data"]["runtime"] is first["data"]["runtime"]
+
+
+async def test_file_rotates_past_its_size_limit(hass, tmp_path: Path) -> None:
+    """A full file moves to ``.1`` and recording starts a fresh one."""
+    recorder = WireTraceRecorder(tmp_path / "trace.jsonl.gz", max_bytes=1, backups=2)
+    for soc in (10, 20, 30):
+        _record_inverter(recorder, "1234567890", InverterRuntimeData(battery_soc=soc))
+        await recorder.async_flush(hass)
+
+    assert not recorder.path.exists()
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "trace.jsonl.gz.1",
+        "trace.jsonl.gz.2",
+    ]
+    (newest,) = iter_trace(tmp_path / "trace.jsonl.gz.1")
+    assert newest["data"]["runtime"].battery_soc == 30
+
+
+async def test_replay_maps_and_aggregates_recorded_cycles(
+    hass, tmp_path: Path, coordinator: EG4DataUpdateCoordinator
+) -> None:
+    """Replay rebuilds devices, maps them and aggregates their group."""
+    recorder = WireTraceRecorder(tmp_path / "trace.jsonl.gz")
+    for cycle in range(3):
+        _record_inverter(
+            recorder, "1234567890", InverterRuntimeData(pv_total_power=1000.0 + cycle)
+        )
+        _record_inverter(
+            recorder, "0987654321", InverterRuntimeData(pv_total_power=2000.0)
+        )
+        runtime = MidboxRuntimeData()
+        recorder.record(
+            TRACE_KIND_MIDBOX,
+            "5555555555",
+            device=make_real_mid("5555555555", runtime=runtime),
+            runtime=runtime,
+        )
+        await recorder.async_flush(hass)
+
+    results: list[dict] = []
+    stats = await async_replay_trace(
+        coordinator, recorder.path, on_cycle=results.append
+    )
+
+    assert (stats.cycles, stats.records) == (3, 9)
+    devices = results[-1]["devices"]
+    assert devices["1234567890"]["sensors"]["pv_total_power"] == 1002.0
+    assert devices["5555555555"]["type"] == "gridboss"
+    group = next(
+        device for device in devices.values() if device["type"] == "parallel_group"
+    )
+    assert group["sensors"]["pv_total_power"] == 3002.0
+
+
+async def test_replay_refuses_a_device_without_a_recorded_slot(
+    hass, tmp_path: Path
+) -> None:
+    """A pylxpweb release without the data attribute fails loudly."""
+    recorder = WireTraceRecorder(tmp_path / "trace.jsonl.gz")
+    _record_inverter(recorder, "1234567890", InverterRuntimeData())
+    await recorder.async_flush(hass)
+    (record,) = iter_trace(recorder.path)
+
+    with pytest.raises(ValueError, match="_renamed_runtime"):
+        _rebuild_device(record, _renamed_runtime=record["data"]["runtime"])
+
+
+async def test_replay_warns_about_a_different_pylxpweb(
+    hass,
+    tmp_path: Path,
+    coordinator: EG4DataUpdateCoordinator,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Replaying on another pylxpweb release than recorded is flagged."""
+    recorder = WireTraceRecorder(tmp_path / "trace.jsonl.gz")
+    _record_inverter(recorder, "1234567890", InverterRuntimeData())
+    await recorder.async_flush(hass)
+    monkeypatch.setattr(wire_trace, "_PYLXPWEB_VERSION", "0.0.0")
+
+    await async_replay_trace(coordinator, recorder.path)
+
+    assert "on pylxpweb 0.0.0" in caplog.text
+
+
+async def test_shutdown_writes_the_buffered_cycle(
+    tmp_path: Path, coordinator: EG4DataUpdateCoordinator
+) -> None:
+    """The last cycle's records reach the file when the coordinator stops."""
+    coordinator._wire_trace = WireTraceRecorder(tmp_path / "trace.jsonl.gz")
+    _record_inverter(coordinator._wire_trace, "1234567890", InverterRuntimeData())
+
+    await coordinator._async_flush_pending_state()
+
+    (record,) = iter_trace(coordinator._wire_trace.path)
+    assert record["serial"] == "1234567890"
+
+
+@pytest.mark.skipif(
+    "EG4_WIRE_TRACE" not in os.environ,
+    reason="set EG4_WIRE_TRACE to a recorded trace to replay it",
+)
+async def test_replay_recorded_trace(coordinator: EG4DataUpdateCoordinator) -> None:
+    """Replay a production recording; EG4_WIRE_TRACE_MIN_CPS sets a floor."""
+    path = Path(os.environ["EG4_WIRE_TRACE"])
+    # Cycle numbers restart with each Home Assistant run appended to a file.
+    cycle_numbers = [record["cycle"] for record in iter_trace(path)]
+    recorded_cycles = sum(
+        1
+        for index, cycle in enumerate(cycle_numbers)
+        if index == 0 or cycle != cycle_numbers[index - 1]
+    )
+    results: list[dict] = []
+
+    stats = await async_replay_trace(coordinator, path, on_cycle=results.append)
+
+    _LOGGER.info(
+        "Replayed %d cycles (%d records) in %.3fs: %.1f cycles/s",
+        stats.cycles,
+        stats.records,
+        stats.seconds,
+        stats.cycles_per_second,
+    )
+    assert stats.cycles == recorded_cycles > 0
+    assert all(result["devices"] for result in results)
+    assert stats.cycles_per_second >= float(
+        os.environ.get("EG4_WIRE_TRACE_MIN_CPS", "0")
+    )